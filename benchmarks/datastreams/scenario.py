@@ -0,0 +1,54 @@
+from typing import Callable
+from typing import Generator
+
+import bm
+
+from ddtrace.internal.datastreams.processor import DataStreamsProcessor
+
+
+class DataStreamsCheckpoint(bm.Scenario):
+    direction = bm.var(type=str)
+    ntopics = bm.var(type=int)
+    batch_size = bm.var(type=int)
+
+    def run(self):
+        # type: () -> Generator[Callable[[int], None], None, None]
+        processor = DataStreamsProcessor("http://localhost:8126")
+        # Only the checkpoints are measured, the stats are never flushed
+        processor.stop()
+
+        upstream = processor.new_pathway()
+        upstream.set_checkpoint(["direction:out", "topic:upstream", "type:kafka"])
+        pathway = upstream.encode()
+        topics = ["topic:topic%d" % i for i in range(self.ntopics)]
+
+        if self.direction == "in" and self.batch_size > 1:
+            pathways = [pathway] * self.batch_size
+
+            def _(loops):
+                # type: (int) -> None
+                for i in range(0, loops, self.batch_size):
+                    # Checkpoint the messages of a consume call at once
+                    processor.set_checkpoints(
+                        pathways, ["direction:in", "group:group1", topics[i % self.ntopics], "type:kafka"]
+                    )
+
+        elif self.direction == "in":
+
+            def _(loops):
+                # type: (int) -> None
+                for i in range(loops):
+                    # Decode the pathway of each consumed message and checkpoint it
+                    ctx = processor.decode_pathway(pathway)
+                    ctx.set_checkpoint(["direction:in", "group:group1", topics[i % self.ntopics], "type:kafka"])
+
+        else:
+
+            def _(loops):
+                # type: (int) -> None
+                for i in range(loops):
+                    # Checkpoint each produced message and encode its pathway
+                    ctx = processor.set_checkpoint(["direction:out", topics[i % self.ntopics], "type:kafka"])
+                    ctx.encode()
+
+        yield _
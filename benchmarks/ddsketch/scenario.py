@@ -0,0 +1,66 @@
+import random
+from typing import Callable
+from typing import Generator
+
+import bm
+from ddsketch import LogCollapsingLowestDenseDDSketch as PyLogCollapsingLowestDenseDDSketch
+from ddsketch.pb.proto import DDSketchProto
+
+from ddtrace.internal._ddsketch import LogCollapsingLowestDenseDDSketch
+
+
+class DDSketch(bm.Scenario):
+    operation = bm.var(type=str)
+    nvalues = bm.var(type=int)
+    native = bm.var_bool()
+
+    def new_sketch(self, values=()):
+        cls = LogCollapsingLowestDenseDDSketch if self.native else PyLogCollapsingLowestDenseDDSketch
+        sketch = cls(0.00775, bin_limit=2048)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    def run(self):
+        # type: () -> Generator[Callable[[int], None], None, None]
+        rng = random.Random(0)
+        # Span durations in nanoseconds, between 10us and 1s
+        values = [int(10 ** rng.uniform(4, 9)) for _ in range(self.nvalues)]
+
+        if self.operation == "add":
+
+            def _(loops):
+                # type: (int) -> None
+                for _ in range(loops):
+                    sketch = self.new_sketch()
+                    for value in values:
+                        sketch.add(value)
+
+        elif self.operation == "merge":
+            sketches = [self.new_sketch(values[i::10]) for i in range(10)]
+
+            def _(loops):
+                # type: (int) -> None
+                for _ in range(loops):
+                    merged = self.new_sketch()
+                    for sketch in sketches:
+                        merged.merge(sketch)
+
+        elif self.operation == "serialize":
+            sketch = self.new_sketch(values)
+            if self.native:
+                serialize = sketch.serialize
+            else:
+
+                def serialize():
+                    return DDSketchProto.to_proto(sketch).SerializeToString()
+
+            def _(loops):
+                # type: (int) -> None
+                for _ in range(loops):
+                    serialize()
+
+        else:
+            raise ValueError("Unknown operation %r" % self.operation)
+
+        yield _
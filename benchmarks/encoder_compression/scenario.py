@@ -0,0 +1,41 @@
+import random
+
+import bm
+import bm.utils as utils
+
+from ddtrace.internal.compression import get_compressor
+from ddtrace.internal.encoding import MSGPACK_ENCODERS
+
+
+class EncoderCompression(bm.Scenario):
+    ntraces = bm.var(type=int)
+    nspans = bm.var(type=int)
+    ntags = bm.var(type=int)
+    ltags = bm.var(type=int)
+    encoding = bm.var(type=str)
+    compression = bm.var(type=str)
+    level = bm.var(type=int)
+
+    def run(self):
+        random.seed(1)
+        encoder = MSGPACK_ENCODERS[self.encoding](8 << 20, 8 << 20)
+        # Repeat the same tag values across spans like real traces do, so
+        # that compression ratios are representative.
+        tags = utils.gen_tags(self)
+        for _ in range(self.ntraces):
+            trace = []
+            for i in range(self.nspans):
+                span = utils.gen_span(str(i % 16))
+                span.set_tags(tags)
+                span.finish()
+                trace.append(span)
+            encoder.put(trace)
+        payload = encoder.encode()
+
+        compress = get_compressor(self.compression, self.level) or bytes
+
+        def _(loops):
+            for _ in range(loops):
+                compress(payload)
+
+        yield _
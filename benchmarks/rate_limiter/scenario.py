@@ -0,0 +1,35 @@
+import concurrent.futures
+from typing import Callable
+from typing import Generator
+
+import bm
+
+from ddtrace.internal import compat
+from ddtrace.internal.rate_limiter import PerThreadRateLimiter
+from ddtrace.internal.rate_limiter import RateLimiter
+
+
+class RateLimiterContention(bm.Scenario):
+    nthreads = bm.var(type=int)
+    ncalls = bm.var(type=int)
+    rate_limit = bm.var(type=int)
+    per_thread = bm.var_bool()
+
+    def check(self, limiter):
+        # type: (RateLimiter) -> None
+        for _ in range(self.ncalls):
+            limiter.is_allowed(compat.monotonic_ns())
+
+    def run(self):
+        # type: () -> Generator[Callable[[int], None], None, None]
+        limiter = (PerThreadRateLimiter if self.per_thread else RateLimiter)(self.rate_limit)
+
+        def _(loops):
+            # type: (int) -> None
+            for _ in range(loops):
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.nthreads) as executor:
+                    tasks = {executor.submit(self.check, limiter) for _ in range(self.nthreads)}
+                    for task in concurrent.futures.as_completed(tasks):
+                        task.result()
+
+        yield _
@@ -5,6 +5,7 @@ import string
 import bm
 
 from ddtrace import Span
+from ddtrace.sampler import DatadogSampler
 from ddtrace.sampler import SamplingRule
 
 
@@ -23,12 +24,19 @@ def iter_n(items, n):
             i = 0
 
 
+def create_span(service, name, resource, tag):
+    span = Span(service=service, name=name, resource=resource)
+    span.set_tag(tag, tag)
+    return span
+
+
 class SamplingRules(bm.Scenario):
     num_iterations = bm.var(type=int)
     num_services = bm.var(type=int)
     num_operations = bm.var(type=int)
     num_resources = bm.var(type=int)
     num_tags = bm.var(type=int)
+    num_rules = bm.var(type=int)
 
     def run(self):
         # Generate random service and operation names for the counts we requested
@@ -39,23 +47,45 @@ class SamplingRules(bm.Scenario):
 
         # Generate all possible permutations of service and operation names
         spans = [
-            Span(service=service, name=name, resource=resource, tags={tag: tag})
+            create_span(service, name, resource, tag)
             for service, name, resource, tag in itertools.product(services, operation_names, resource_names, tag_names)
         ]
 
-        # Create a single rule to use for all matches
-        # Pick a random service/operation name
-        rule = SamplingRule(
-            service=random.choice(services),
-            name=random.choice(operation_names),
-            resource=random.choice(resource_names),
-            tags=random.choice(tag_names),
-            sample_rate=1.0,
-        )
-
-        def _(loops):
-            for _ in range(loops):
-                for span in iter_n(spans, n=self.num_iterations):
-                    rule.matches(span)
+        if self.num_rules == 1:
+            # Create a single rule to use for all matches
+            # Pick a random service/operation name
+            rule = SamplingRule(
+                service=random.choice(services),
+                name=random.choice(operation_names),
+                resource=random.choice(resource_names),
+                tags={random.choice(tag_names): "*"},
+                sample_rate=1.0,
+            )
+
+            def _(loops):
+                for _ in range(loops):
+                    for span in iter_n(spans, n=self.num_iterations):
+                        rule.matches(span)
+
+        else:
+            # Create a sampler with a large rule set, as pushed by a remote
+            # configuration, where the rules for the last services come last.
+            rules = []
+            for service in itertools.islice(itertools.cycle(services), self.num_rules - 1):
+                rules.append(
+                    SamplingRule(
+                        service=service,
+                        name=random.choice(operation_names),
+                        tags={random.choice(tag_names): rands(3) + "*"},
+                        sample_rate=0.5,
+                    )
+                )
+            rules.append(SamplingRule(service=services[-1], name=operation_names[-1], sample_rate=1.0))
+            sampler = DatadogSampler(rules=rules, rate_limit=-1)
+
+            def _(loops):
+                for _ in range(loops):
+                    for span in iter_n(spans, n=self.num_iterations):
+                        sampler.sample(span)
 
         yield _
@@ -0,0 +1,33 @@
+import bm
+import bm.utils as utils
+
+from ddtrace import config
+from ddtrace.tracer import Tracer
+
+
+class SpanPool(bm.Scenario):
+    ntraces = bm.var(type=int)
+    nspans = bm.var(type=int)
+    ntags = bm.var(type=int)
+    ltags = bm.var(type=int)
+    pool_size = bm.var(type=int)
+
+    def run(self):
+        tags = utils.gen_tags(self)
+
+        # The span pool is set up when the tracer is created
+        config._span_pool_size = self.pool_size
+        tracer = Tracer()
+        utils.drop_traces(tracer)
+        utils.drop_telemetry_events()
+
+        def _(loops):
+            for _ in range(loops):
+                for _ in range(self.ntraces):
+                    with tracer.trace("root") as root:
+                        root.set_tags(tags)
+                        for _ in range(self.nspans - 1):
+                            with tracer.trace("child") as span:
+                                span.set_tags(tags)
+
+        yield _
@@ -4,6 +4,7 @@ import bm.utils as utils
 
 class Tracer(bm.Scenario):
     depth = bm.var(type=int)
+    start_span_hook = bm.var_bool()
 
     def run(self):
         # configure global tracer to drop traces rather than encoded and sent to
@@ -13,6 +14,10 @@ class Tracer(bm.Scenario):
         utils.drop_traces(tracer)
         utils.drop_telemetry_events()
 
+        if self.start_span_hook:
+            # A start_span hook disables the compiled fast path for child spans
+            tracer.on_start_span(lambda span: None)
+
         def _(loops):
             for _ in range(loops):
                 spans = []
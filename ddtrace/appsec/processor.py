@@ -34,6 +34,7 @@ from ddtrace.internal import core
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.processor import SpanProcessor
 from ddtrace.internal.rate_limiter import RateLimiter
+from ddtrace.internal.rate_limiter import new_rate_limiter
 
 
 try:
@@ -133,7 +134,7 @@ def _set_headers(span, headers, kind):
 
 def _get_rate_limiter():
     # type: () -> RateLimiter
-    return RateLimiter(int(os.getenv("DD_APPSEC_TRACE_RATE_LIMIT", DEFAULT.TRACE_RATE_LIMIT)))
+    return new_rate_limiter(int(os.getenv("DD_APPSEC_TRACE_RATE_LIMIT", DEFAULT.TRACE_RATE_LIMIT)))
 
 
 @attr.s(eq=False)
@@ -18,6 +18,7 @@ from .internal.utils.http import w3c_get_dd_list_member as _w3c_get_dd_list_memb
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Dict
     from typing import Tuple
 
     from .span import Span
@@ -37,6 +38,30 @@ _DD_ORIGIN_INVALID_CHARS_REGEX = re.compile(r"[^\x20-\x7E]+")
 log = get_logger(__name__)
 
 
+class _PropagationCache(object):
+    """Values of the propagation headers shared by the contexts of a trace.
+
+    The values are only valid for the state of the trace they were computed
+    from: they are reset when this state, as given by its key, changes.
+    """
+
+    __slots__ = ["_state"]
+
+    def __init__(self):
+        # type: () -> None
+        self._state = (None, {})  # type: Tuple[Any, Dict[Any, Any]]
+
+    def values(self, key):
+        # type: (Any) -> Dict[Any, Any]
+        state_key, values = self._state
+        if state_key != key:
+            # DEV: Replace the state at once so that concurrent callers never
+            # see values computed for another key
+            values = {}
+            self._state = (key, values)
+        return values
+
+
 class Context(object):
     """Represents the state required to propagate a trace across execution
     boundaries.
@@ -48,6 +73,7 @@ class Context(object):
         "_lock",
         "_meta",
         "_metrics",
+        "_propagation_cache",
     ]
 
     def __init__(
@@ -59,6 +85,7 @@ class Context(object):
         meta=None,  # type: Optional[_MetaDictType]
         metrics=None,  # type: Optional[_MetricDictType]
         lock=None,  # type: Optional[threading.RLock]
+        _propagation_cache=None,  # type: Optional[_PropagationCache]
     ):
         self._meta = meta if meta is not None else {}  # type: _MetaDictType
         self._metrics = metrics if metrics is not None else {}  # type: _MetricDictType
@@ -79,6 +106,10 @@ class Context(object):
             # https://github.com/DataDog/dd-trace-py/blob/a1932e8ddb704d259ea8a3188d30bf542f59fd8d/ddtrace/tracer.py#L489-L508
             self._lock = threading.RLock()
 
+        self._propagation_cache = (
+            _propagation_cache if _propagation_cache is not None else _PropagationCache()
+        )  # type: _PropagationCache
+
     def __getstate__(self):
         # type: () -> _ContextState
         return (
@@ -94,12 +125,30 @@ class Context(object):
         self.trace_id, self.span_id, self._meta, self._metrics = state
         # We cannot serialize and lock, so we must recreate it unless we already have one
         self._lock = threading.RLock()
+        self._propagation_cache = _PropagationCache()
 
     def _with_span(self, span):
         # type: (Span) -> Context
         """Return a shallow copy of the context with the given span."""
         return self.__class__(
-            trace_id=span.trace_id, span_id=span.span_id, meta=self._meta, metrics=self._metrics, lock=self._lock
+            trace_id=span.trace_id,
+            span_id=span.span_id,
+            meta=self._meta,
+            metrics=self._metrics,
+            lock=self._lock,
+            _propagation_cache=self._propagation_cache,
+        )
+
+    def _propagation_values(self):
+        # type: () -> Dict[Any, Any]
+        """Return the cached values of the propagation headers of the trace.
+
+        The values do not depend on the span id, so they are shared by the
+        contexts of the spans of the trace. They are reset when the trace id,
+        the sampling priority, the origin or the propagated tags change.
+        """
+        return self._propagation_cache.values(
+            (self.trace_id, self._metrics.get(SAMPLING_PRIORITY_KEY), tuple(self._meta.items()))
         )
 
     def _update_tags(self, span):
@@ -135,19 +184,30 @@ class Context(object):
             # if we don't have a span id or trace id value we can't build a valid traceparent
             return tp or ""
 
-        # determine the trace_id value
-        if tp:
-            # grab the original traceparent trace id, not the converted value
-            trace_id = tp.split("-")[1]
-        else:
-            trace_id = "{:032x}".format(self.trace_id)
+        values = self._propagation_values()
+        try:
+            prefix, suffix = values[W3C_TRACEPARENT_KEY]
+        except KeyError:
+            # determine the trace_id value
+            if tp:
+                # grab the original traceparent trace id, not the converted value
+                trace_id = tp.split("-")[1]
+            else:
+                trace_id = "{:032x}".format(self.trace_id)
 
-        sampled = 1 if self.sampling_priority and self.sampling_priority > 0 else 0
-        return "00-{}-{:016x}-{:02x}".format(trace_id, self.span_id, sampled)
+            sampled = 1 if self.sampling_priority and self.sampling_priority > 0 else 0
+            prefix, suffix = values[W3C_TRACEPARENT_KEY] = ("00-{}-".format(trace_id), "-{:02x}".format(sampled))
+        return "{}{:016x}{}".format(prefix, self.span_id, suffix)
 
     @property
     def _tracestate(self):
         # type: () -> str
+        values = self._propagation_values()
+        try:
+            return values[W3C_TRACESTATE_KEY]
+        except KeyError:
+            pass
+
         dd_list_member = _w3c_get_dd_list_member(self)
 
         # if there's a preexisting tracestate we need to update it to preserve other vendor data
@@ -162,6 +222,7 @@ class Context(object):
         # if there is no original tracestate value then tracestate is just the dd list member we created
         elif dd_list_member:
             ts = "dd={}".format(dd_list_member)
+        values[W3C_TRACESTATE_KEY] = ts
         return ts
 
     @property
@@ -75,6 +75,9 @@ class TracedConsumer(confluent_kafka.Consumer):
     def poll(self, timeout=None):
         return super(TracedConsumer, self).poll(timeout)
 
+    def consume(self, *args, **kwargs):
+        return super(TracedConsumer, self).consume(*args, **kwargs)
+
     def commit(self, message=None, *args, **kwargs):
         return super(TracedConsumer, self).commit(message, args, kwargs)
 
@@ -93,6 +96,7 @@ def patch():
 
     trace_utils.wrap(TracedProducer, "produce", traced_produce)
     trace_utils.wrap(TracedConsumer, "poll", traced_poll)
+    trace_utils.wrap(TracedConsumer, "consume", traced_consume)
     trace_utils.wrap(TracedConsumer, "commit", traced_commit)
     Pin().onto(confluent_kafka.Producer)
     Pin().onto(confluent_kafka.Consumer)
@@ -106,6 +110,8 @@ def unpatch():
         trace_utils.unwrap(TracedProducer, "produce")
     if trace_utils.iswrapped(TracedConsumer.poll):
         trace_utils.unwrap(TracedConsumer, "poll")
+    if trace_utils.iswrapped(TracedConsumer.consume):
+        trace_utils.unwrap(TracedConsumer, "consume")
     if trace_utils.iswrapped(TracedConsumer.commit):
         trace_utils.unwrap(TracedConsumer, "commit")
 
@@ -224,6 +230,28 @@ def traced_poll(func, instance, args, kwargs):
         return message
 
 
+def traced_consume(func, instance, args, kwargs):
+    pin = Pin.get_from(instance)
+    if not pin or not pin.enabled() or not config._data_streams_enabled:
+        return func(*args, **kwargs)
+
+    messages = func(*args, **kwargs)
+    if messages:
+        core.dispatch("kafka.consume_messages.start", [instance, messages])
+        if instance._auto_commit:
+            # it's not exactly true, but if auto commit is enabled, we consider that a message is acknowledged
+            # when it's read.
+            offsets = {}
+            for message in messages:
+                if message.error() is None:
+                    key = (message.topic(), message.partition())
+                    offsets[key] = max(offsets.get(key, -1), message.offset() or -1)
+            now = time.time()
+            for (topic, partition), offset in offsets.items():
+                pin.tracer.data_streams_processor.track_kafka_commit(instance._group_id, topic, partition, offset, now)
+    return messages
+
+
 def traced_commit(func, instance, args, kwargs):
     pin = Pin.get_from(instance)
     if not pin or not pin.enabled():
@@ -69,8 +69,9 @@ class LogsIntakeUploaderV1(AwakeablePeriodicService):
                     headers=self._headers,
                 )
                 resp = compat.get_connection_response(conn)
+                body = resp.read()
                 if not (200 <= resp.status < 300):
-                    log.error("Failed to upload payload: [%d] %r", resp.status, resp.read())
+                    log.error("Failed to upload payload: [%d] %r", resp.status, body)
                     meter.increment("upload.error", tags={"status": str(resp.status)})
                 else:
                     meter.increment("upload.success")
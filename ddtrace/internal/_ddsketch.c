@@ -0,0 +1,11537 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "language": "c",
+        "name": "ddtrace.internal._ddsketch",
+        "sources": [
+            "ddtrace/internal/_ddsketch.pyx"
+        ]
+    },
+    "module_name": "ddtrace.internal._ddsketch"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__ddtrace__internal___ddsketch
+#define __PYX_HAVE_API__ddtrace__internal___ddsketch
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include <float.h>
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "ddtrace/internal/_ddsketch.pyx",
+  "stringsource",
+  "type.pxd",
+};
+
+/*--- Type declarations ---*/
+struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add;
+
+/* "ddtrace/internal/_ddsketch.pyx":345
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+ * 
+ *     cpdef add(self, double val, double weight=1.0):             # <<<<<<<<<<<<<<
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:
+ */
+struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add {
+  int __pyx_n;
+  double weight;
+};
+
+/* "ddtrace/internal/_ddsketch.pyx":47
+ * 
+ * 
+ * cdef class _CollapsingLowestDenseStore(object):             # <<<<<<<<<<<<<<
+ *     """Dense store of bins that collapses its lowest bins beyond the bin limit."""
+ * 
+ */
+struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_vtab;
+  double *bins;
+  int64_t length;
+  int64_t offset;
+  int64_t min_key;
+  int64_t max_key;
+  int64_t bin_limit;
+  double count;
+  int is_collapsed;
+};
+
+
+/* "ddtrace/internal/_ddsketch.pyx":291
+ * 
+ * 
+ * cdef class LogCollapsingLowestDenseDDSketch(object):             # <<<<<<<<<<<<<<
+ *     """DDSketch with a logarithmic mapping whose lowest bins are collapsed
+ *     when the number of bins exceeds ``bin_limit``.
+ */
+struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_vtab;
+  double relative_accuracy;
+  double gamma;
+  double _multiplier;
+  double _min_possible;
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *_store;
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *_negative_store;
+  double _zero_count;
+  double _count;
+  double _sum;
+  double _min;
+  double _max;
+};
+
+
+
+/* "ddtrace/internal/_ddsketch.pyx":47
+ * 
+ * 
+ * cdef class _CollapsingLowestDenseStore(object):             # <<<<<<<<<<<<<<
+ *     """Dense store of bins that collapses its lowest bins beyond the bin limit."""
+ * 
+ */
+
+struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore {
+  void (*clear)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *);
+  int (*_resize)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t);
+  int64_t (*_new_length)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t);
+  void (*_shift_bins)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t);
+  void (*_center_bins)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t);
+  void (*_adjust)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t);
+  int (*_extend_range)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t);
+  int (*add)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, double);
+  int (*copy)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *);
+  int (*merge)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *);
+  int64_t (*key_at_rank)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, double, int);
+};
+static struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_vtabptr_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+
+
+/* "ddtrace/internal/_ddsketch.pyx":291
+ * 
+ * 
+ * cdef class LogCollapsingLowestDenseDDSketch(object):             # <<<<<<<<<<<<<<
+ *     """DDSketch with a logarithmic mapping whose lowest bins are collapsed
+ *     when the number of bins exceeds ``bin_limit``.
+ */
+
+struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch {
+  int64_t (*_key)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, double);
+  double (*_value)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int64_t);
+  PyObject *(*add)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add *__pyx_optional_args);
+  PyObject *(*clear)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch);
+  PyObject *(*merge)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch);
+  PyObject *(*serialize)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_vtabptr_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, double);
+static CYTHON_INLINE double __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int64_t);
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* DivInt[int64_t].proto */
+static CYTHON_INLINE int64_t __Pyx_div_int64_t(int64_t, int64_t);
+
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* pyobject_as_double.proto */
+static double __Pyx__PyObject_AsDouble(PyObject* obj);
+#if CYTHON_COMPILING_IN_PYPY
+#define __Pyx_PyObject_AsDouble(obj)\
+(likely(PyFloat_CheckExact(obj)) ? PyFloat_AS_DOUBLE(obj) :\
+ likely(PyInt_CheckExact(obj)) ?\
+ PyFloat_AsDouble(obj) : __Pyx__PyObject_AsDouble(obj))
+#else
+#define __Pyx_PyObject_AsDouble(obj)\
+((likely(PyFloat_CheckExact(obj))) ?\
+ PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
+#endif
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self); /* proto*/
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__resize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_length); /* proto*/
+static int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__new_length(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key); /* proto*/
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__shift_bins(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_shift); /* proto*/
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__center_bins(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key); /* proto*/
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__adjust(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key); /* proto*/
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__extend_range(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_key, int64_t __pyx_v_second_key); /* proto*/
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_key, double __pyx_v_weight); /* proto*/
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_copy(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store); /* proto*/
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store); /* proto*/
+static int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_key_at_rank(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, double __pyx_v_rank, int __pyx_v_lower); /* proto*/
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_value); /* proto*/
+static CYTHON_INLINE double __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int64_t __pyx_v_key); /* proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_val, int __pyx_skip_dispatch, struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add *__pyx_optional_args); /* proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_sketch, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_serialize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'libc.float' */
+
+/* Module declarations from 'libc.math' */
+
+/* Module declarations from 'libc.stdint' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'ddtrace.internal._ddsketch' */
+static PyTypeObject *__pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore = 0;
+static PyTypeObject *__pyx_ptype_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch = 0;
+static int64_t __pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE;
+static int64_t __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MIN_KEY;
+static int64_t __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MAX_KEY;
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch__min3(int64_t, int64_t, int64_t); /*proto*/
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch__max3(int64_t, int64_t, int64_t); /*proto*/
+static CYTHON_INLINE size_t __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size(uint64_t); /*proto*/
+static CYTHON_INLINE char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_varint(char *, uint64_t); /*proto*/
+static CYTHON_INLINE char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_double(char *, double); /*proto*/
+static CYTHON_INLINE uint32_t __pyx_f_7ddtrace_8internal_9_ddsketch__zigzag32(int64_t); /*proto*/
+static size_t __pyx_f_7ddtrace_8internal_9_ddsketch__store_proto_size(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *); /*proto*/
+static char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_store_proto(char *, char, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *); /*proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "ddtrace.internal._ddsketch"
+extern int __pyx_module_is_main_ddtrace__internal___ddsketch;
+int __pyx_module_is_main_ddtrace__internal___ddsketch = 0;
+
+/* Implementation of 'ddtrace.internal._ddsketch' */
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
+static const char __pyx_k_add[] = "add";
+static const char __pyx_k_inf[] = "+inf";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_val[] = "val";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_clear[] = "clear";
+static const char __pyx_k_inf_2[] = "-inf";
+static const char __pyx_k_merge[] = "merge";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_weight[] = "weight";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_bin_limit[] = "bin_limit";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_serialize[] = "serialize";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_relative_accuracy[] = "relative_accuracy";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_CollapsingLowestDenseStore[] = "_CollapsingLowestDenseStore";
+static const char __pyx_k_ddtrace_internal__ddsketch[] = "ddtrace.internal._ddsketch";
+static const char __pyx_k_pyx_unpickle_LogCollapsingLowe[] = "__pyx_unpickle_LogCollapsingLowestDenseDDSketch";
+static const char __pyx_k_weight_must_be_a_positive_float[] = "weight must be a positive float, got %r";
+static const char __pyx_k_Cannot_merge_two_DDSketches_with[] = "Cannot merge two DDSketches with different parameters, got %r and %r";
+static const char __pyx_k_Compiled_implementation_of_the_D[] = "Compiled implementation of the DDSketch used for the stats computed by the tracer.\n\n``LogCollapsingLowestDenseDDSketch`` mirrors the class of the same name from\nthe ``ddsketch`` package: it uses the same logarithmic mapping, the same dense\nstore collapsing its lowest bins and the same growth policy, so that adding\nthe same values to both sketches results in the same bins. The sketch is\nserialized directly to the ``DDSketch`` protobuf message, byte for byte as\n``DDSketchProto.to_proto(sketch).SerializeToString()`` would.\n";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))";
+static const char __pyx_k_LogCollapsingLowestDenseDDSketch[] = "LogCollapsingLowestDenseDDSketch";
+static const char __pyx_k_Relative_accuracy_must_be_betwee[] = "Relative accuracy must be between 0 and 1, got %r";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static PyObject *__pyx_kp_s_Cannot_merge_two_DDSketches_with;
+static PyObject *__pyx_n_s_CollapsingLowestDenseStore;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_LogCollapsingLowestDenseDDSketch;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_kp_s_Relative_accuracy_must_be_betwee;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_add;
+static PyObject *__pyx_n_s_bin_limit;
+static PyObject *__pyx_n_s_clear;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_ddtrace_internal__ddsketch;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_kp_s_inf;
+static PyObject *__pyx_kp_s_inf_2;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_merge;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_LogCollapsingLowe;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_relative_accuracy;
+static PyObject *__pyx_n_s_serialize;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_val;
+static PyObject *__pyx_n_s_weight;
+static PyObject *__pyx_kp_s_weight_must_be_a_positive_float;
+static int __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore___cinit__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_bin_limit); /* proto */
+static void __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_2__dealloc__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch___init__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_relative_accuracy, int __pyx_v_bin_limit); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_2add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_val, double __pyx_v_weight); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_sketch); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_8get_quantile_value(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_quantile); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_10serialize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_12__reduce_cython__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_14__setstate_cython__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_17030330;
+static PyObject *__pyx_int_31403026;
+static PyObject *__pyx_int_267530379;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_codeobj__5;
+/* Late includes */
+
+/* "ddtrace/internal/_ddsketch.pyx":35
+ * 
+ * 
+ * cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):             # <<<<<<<<<<<<<<
+ *     if b < a:
+ *         a = b
+ */
+
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch__min3(int64_t __pyx_v_a, int64_t __pyx_v_b, int64_t __pyx_v_c) {
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int64_t __pyx_t_2;
+  __Pyx_RefNannySetupContext("_min3", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":36
+ * 
+ * cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):
+ *     if b < a:             # <<<<<<<<<<<<<<
+ *         a = b
+ *     return c if c < a else a
+ */
+  __pyx_t_1 = ((__pyx_v_b < __pyx_v_a) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":37
+ * cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):
+ *     if b < a:
+ *         a = b             # <<<<<<<<<<<<<<
+ *     return c if c < a else a
+ * 
+ */
+    __pyx_v_a = __pyx_v_b;
+
+    /* "ddtrace/internal/_ddsketch.pyx":36
+ * 
+ * cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):
+ *     if b < a:             # <<<<<<<<<<<<<<
+ *         a = b
+ *     return c if c < a else a
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":38
+ *     if b < a:
+ *         a = b
+ *     return c if c < a else a             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (((__pyx_v_c < __pyx_v_a) != 0)) {
+    __pyx_t_2 = __pyx_v_c;
+  } else {
+    __pyx_t_2 = __pyx_v_a;
+  }
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":35
+ * 
+ * 
+ * cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):             # <<<<<<<<<<<<<<
+ *     if b < a:
+ *         a = b
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":41
+ * 
+ * 
+ * cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):             # <<<<<<<<<<<<<<
+ *     if b > a:
+ *         a = b
+ */
+
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch__max3(int64_t __pyx_v_a, int64_t __pyx_v_b, int64_t __pyx_v_c) {
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int64_t __pyx_t_2;
+  __Pyx_RefNannySetupContext("_max3", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":42
+ * 
+ * cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):
+ *     if b > a:             # <<<<<<<<<<<<<<
+ *         a = b
+ *     return c if c > a else a
+ */
+  __pyx_t_1 = ((__pyx_v_b > __pyx_v_a) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":43
+ * cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):
+ *     if b > a:
+ *         a = b             # <<<<<<<<<<<<<<
+ *     return c if c > a else a
+ * 
+ */
+    __pyx_v_a = __pyx_v_b;
+
+    /* "ddtrace/internal/_ddsketch.pyx":42
+ * 
+ * cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):
+ *     if b > a:             # <<<<<<<<<<<<<<
+ *         a = b
+ *     return c if c > a else a
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":44
+ *     if b > a:
+ *         a = b
+ *     return c if c > a else a             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (((__pyx_v_c > __pyx_v_a) != 0)) {
+    __pyx_t_2 = __pyx_v_c;
+  } else {
+    __pyx_t_2 = __pyx_v_a;
+  }
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":41
+ * 
+ * 
+ * cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):             # <<<<<<<<<<<<<<
+ *     if b > a:
+ *         a = b
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":59
+ *     cdef bint is_collapsed
+ * 
+ *     def __cinit__(self, int64_t bin_limit):             # <<<<<<<<<<<<<<
+ *         self.bins = NULL
+ *         self.length = 0
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int64_t __pyx_v_bin_limit;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bin_limit,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bin_limit)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 59, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_bin_limit = __Pyx_PyInt_As_int64_t(values[0]); if (unlikely((__pyx_v_bin_limit == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 59, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore___cinit__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self), __pyx_v_bin_limit);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore___cinit__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_bin_limit) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":60
+ * 
+ *     def __cinit__(self, int64_t bin_limit):
+ *         self.bins = NULL             # <<<<<<<<<<<<<<
+ *         self.length = 0
+ *         self.offset = 0
+ */
+  __pyx_v_self->bins = NULL;
+
+  /* "ddtrace/internal/_ddsketch.pyx":61
+ *     def __cinit__(self, int64_t bin_limit):
+ *         self.bins = NULL
+ *         self.length = 0             # <<<<<<<<<<<<<<
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY
+ */
+  __pyx_v_self->length = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":62
+ *         self.bins = NULL
+ *         self.length = 0
+ *         self.offset = 0             # <<<<<<<<<<<<<<
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY
+ */
+  __pyx_v_self->offset = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":63
+ *         self.length = 0
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY             # <<<<<<<<<<<<<<
+ *         self.max_key = NO_MAX_KEY
+ *         self.bin_limit = bin_limit
+ */
+  __pyx_v_self->min_key = __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MIN_KEY;
+
+  /* "ddtrace/internal/_ddsketch.pyx":64
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY             # <<<<<<<<<<<<<<
+ *         self.bin_limit = bin_limit
+ *         self.count = 0.0
+ */
+  __pyx_v_self->max_key = __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MAX_KEY;
+
+  /* "ddtrace/internal/_ddsketch.pyx":65
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY
+ *         self.bin_limit = bin_limit             # <<<<<<<<<<<<<<
+ *         self.count = 0.0
+ *         self.is_collapsed = False
+ */
+  __pyx_v_self->bin_limit = __pyx_v_bin_limit;
+
+  /* "ddtrace/internal/_ddsketch.pyx":66
+ *         self.max_key = NO_MAX_KEY
+ *         self.bin_limit = bin_limit
+ *         self.count = 0.0             # <<<<<<<<<<<<<<
+ *         self.is_collapsed = False
+ * 
+ */
+  __pyx_v_self->count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":67
+ *         self.bin_limit = bin_limit
+ *         self.count = 0.0
+ *         self.is_collapsed = False             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_v_self->is_collapsed = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":59
+ *     cdef bint is_collapsed
+ * 
+ *     def __cinit__(self, int64_t bin_limit):             # <<<<<<<<<<<<<<
+ *         self.bins = NULL
+ *         self.length = 0
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":69
+ *         self.is_collapsed = False
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.bins)
+ * 
+ */
+
+/* Python wrapper */
+static void __pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_3__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_2__dealloc__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_2__dealloc__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":70
+ * 
+ *     def __dealloc__(self):
+ *         free(self.bins)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void clear(self):
+ */
+  free(__pyx_v_self->bins);
+
+  /* "ddtrace/internal/_ddsketch.pyx":69
+ *         self.is_collapsed = False
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.bins)
+ * 
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":72
+ *         free(self.bins)
+ * 
+ *     cdef void clear(self):             # <<<<<<<<<<<<<<
+ *         # Keep the bins allocated, they are reallocated when the store grows
+ *         # again.
+ */
+
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("clear", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":75
+ *         # Keep the bins allocated, they are reallocated when the store grows
+ *         # again.
+ *         self.length = 0             # <<<<<<<<<<<<<<
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY
+ */
+  __pyx_v_self->length = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":76
+ *         # again.
+ *         self.length = 0
+ *         self.offset = 0             # <<<<<<<<<<<<<<
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY
+ */
+  __pyx_v_self->offset = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":77
+ *         self.length = 0
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY             # <<<<<<<<<<<<<<
+ *         self.max_key = NO_MAX_KEY
+ *         self.count = 0.0
+ */
+  __pyx_v_self->min_key = __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MIN_KEY;
+
+  /* "ddtrace/internal/_ddsketch.pyx":78
+ *         self.offset = 0
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY             # <<<<<<<<<<<<<<
+ *         self.count = 0.0
+ *         self.is_collapsed = False
+ */
+  __pyx_v_self->max_key = __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MAX_KEY;
+
+  /* "ddtrace/internal/_ddsketch.pyx":79
+ *         self.min_key = NO_MIN_KEY
+ *         self.max_key = NO_MAX_KEY
+ *         self.count = 0.0             # <<<<<<<<<<<<<<
+ *         self.is_collapsed = False
+ * 
+ */
+  __pyx_v_self->count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":80
+ *         self.max_key = NO_MAX_KEY
+ *         self.count = 0.0
+ *         self.is_collapsed = False             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _resize(self, int64_t length) except -1:
+ */
+  __pyx_v_self->is_collapsed = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":72
+ *         free(self.bins)
+ * 
+ *     cdef void clear(self):             # <<<<<<<<<<<<<<
+ *         # Keep the bins allocated, they are reallocated when the store grows
+ *         # again.
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":82
+ *         self.is_collapsed = False
+ * 
+ *     cdef int _resize(self, int64_t length) except -1:             # <<<<<<<<<<<<<<
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+ *         if bins == NULL:
+ */
+
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__resize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_length) {
+  double *__pyx_v_bins;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_resize", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":83
+ * 
+ *     cdef int _resize(self, int64_t length) except -1:
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))             # <<<<<<<<<<<<<<
+ *         if bins == NULL:
+ *             raise MemoryError()
+ */
+  __pyx_v_bins = ((double *)realloc(__pyx_v_self->bins, (__pyx_v_length * (sizeof(double)))));
+
+  /* "ddtrace/internal/_ddsketch.pyx":84
+ *     cdef int _resize(self, int64_t length) except -1:
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+ *         if bins == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+ */
+  __pyx_t_1 = ((__pyx_v_bins == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":85
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+ *         if bins == NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+ *         self.bins = bins
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 85, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":84
+ *     cdef int _resize(self, int64_t length) except -1:
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+ *         if bins == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":86
+ *         if bins == NULL:
+ *             raise MemoryError()
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))             # <<<<<<<<<<<<<<
+ *         self.bins = bins
+ *         self.length = length
+ */
+  (void)(memset((__pyx_v_bins + __pyx_v_self->length), 0, ((__pyx_v_length - __pyx_v_self->length) * (sizeof(double)))));
+
+  /* "ddtrace/internal/_ddsketch.pyx":87
+ *             raise MemoryError()
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+ *         self.bins = bins             # <<<<<<<<<<<<<<
+ *         self.length = length
+ *         return 0
+ */
+  __pyx_v_self->bins = __pyx_v_bins;
+
+  /* "ddtrace/internal/_ddsketch.pyx":88
+ *         memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+ *         self.bins = bins
+ *         self.length = length             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->length = __pyx_v_length;
+
+  /* "ddtrace/internal/_ddsketch.pyx":89
+ *         self.bins = bins
+ *         self.length = length
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":82
+ *         self.is_collapsed = False
+ * 
+ *     cdef int _resize(self, int64_t length) except -1:             # <<<<<<<<<<<<<<
+ *         cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+ *         if bins == NULL:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore._resize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":91
+ *         return 0
+ * 
+ *     cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t length = (new_max_key - new_min_key + CHUNK_SIZE) // CHUNK_SIZE * CHUNK_SIZE
+ *         return length if length < self.bin_limit else self.bin_limit
+ */
+
+static int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__new_length(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key) {
+  int64_t __pyx_v_length;
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int64_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_new_length", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":92
+ * 
+ *     cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):
+ *         cdef int64_t length = (new_max_key - new_min_key + CHUNK_SIZE) // CHUNK_SIZE * CHUNK_SIZE             # <<<<<<<<<<<<<<
+ *         return length if length < self.bin_limit else self.bin_limit
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_new_max_key - __pyx_v_new_min_key) + __pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE);
+  if (unlikely(__pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __PYX_ERR(0, 92, __pyx_L1_error)
+  }
+  else if (sizeof(int64_t) == sizeof(long) && (!(((int64_t)-1) > 0)) && unlikely(__pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE == (int64_t)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_t_1))) {
+    PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+    __PYX_ERR(0, 92, __pyx_L1_error)
+  }
+  __pyx_v_length = (__Pyx_div_int64_t(__pyx_t_1, __pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE) * __pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE);
+
+  /* "ddtrace/internal/_ddsketch.pyx":93
+ *     cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):
+ *         cdef int64_t length = (new_max_key - new_min_key + CHUNK_SIZE) // CHUNK_SIZE * CHUNK_SIZE
+ *         return length if length < self.bin_limit else self.bin_limit             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _shift_bins(self, int64_t shift):
+ */
+  if (((__pyx_v_length < __pyx_v_self->bin_limit) != 0)) {
+    __pyx_t_1 = __pyx_v_length;
+  } else {
+    __pyx_t_1 = __pyx_v_self->bin_limit;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":91
+ *         return 0
+ * 
+ *     cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t length = (new_max_key - new_min_key + CHUNK_SIZE) // CHUNK_SIZE * CHUNK_SIZE
+ *         return length if length < self.bin_limit else self.bin_limit
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("ddtrace.internal._ddsketch._CollapsingLowestDenseStore._new_length", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":95
+ *         return length if length < self.bin_limit else self.bin_limit
+ * 
+ *     cdef void _shift_bins(self, int64_t shift):             # <<<<<<<<<<<<<<
+ *         if shift > 0:
+ *             if shift < self.length:
+ */
+
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__shift_bins(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_shift) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_shift_bins", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":96
+ * 
+ *     cdef void _shift_bins(self, int64_t shift):
+ *         if shift > 0:             # <<<<<<<<<<<<<<
+ *             if shift < self.length:
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+ */
+  __pyx_t_1 = ((__pyx_v_shift > 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":97
+ *     cdef void _shift_bins(self, int64_t shift):
+ *         if shift > 0:
+ *             if shift < self.length:             # <<<<<<<<<<<<<<
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+ *                 memset(self.bins, 0, shift * sizeof(double))
+ */
+    __pyx_t_1 = ((__pyx_v_shift < __pyx_v_self->length) != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":98
+ *         if shift > 0:
+ *             if shift < self.length:
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))             # <<<<<<<<<<<<<<
+ *                 memset(self.bins, 0, shift * sizeof(double))
+ *             else:
+ */
+      (void)(memmove((__pyx_v_self->bins + __pyx_v_shift), __pyx_v_self->bins, ((__pyx_v_self->length - __pyx_v_shift) * (sizeof(double)))));
+
+      /* "ddtrace/internal/_ddsketch.pyx":99
+ *             if shift < self.length:
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+ *                 memset(self.bins, 0, shift * sizeof(double))             # <<<<<<<<<<<<<<
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ */
+      (void)(memset(__pyx_v_self->bins, 0, (__pyx_v_shift * (sizeof(double)))));
+
+      /* "ddtrace/internal/_ddsketch.pyx":97
+ *     cdef void _shift_bins(self, int64_t shift):
+ *         if shift > 0:
+ *             if shift < self.length:             # <<<<<<<<<<<<<<
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+ *                 memset(self.bins, 0, shift * sizeof(double))
+ */
+      goto __pyx_L4;
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":101
+ *                 memset(self.bins, 0, shift * sizeof(double))
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))             # <<<<<<<<<<<<<<
+ *         elif shift < 0:
+ *             if -shift < self.length:
+ */
+    /*else*/ {
+      (void)(memset(__pyx_v_self->bins, 0, (__pyx_v_self->length * (sizeof(double)))));
+    }
+    __pyx_L4:;
+
+    /* "ddtrace/internal/_ddsketch.pyx":96
+ * 
+ *     cdef void _shift_bins(self, int64_t shift):
+ *         if shift > 0:             # <<<<<<<<<<<<<<
+ *             if shift < self.length:
+ *                 memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+ */
+    goto __pyx_L3;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":102
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *         elif shift < 0:             # <<<<<<<<<<<<<<
+ *             if -shift < self.length:
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+ */
+  __pyx_t_1 = ((__pyx_v_shift < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":103
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *         elif shift < 0:
+ *             if -shift < self.length:             # <<<<<<<<<<<<<<
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+ *                 memset(self.bins + self.length + shift, 0, -shift * sizeof(double))
+ */
+    __pyx_t_1 = (((-__pyx_v_shift) < __pyx_v_self->length) != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":104
+ *         elif shift < 0:
+ *             if -shift < self.length:
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))             # <<<<<<<<<<<<<<
+ *                 memset(self.bins + self.length + shift, 0, -shift * sizeof(double))
+ *             else:
+ */
+      (void)(memmove(__pyx_v_self->bins, (__pyx_v_self->bins - __pyx_v_shift), ((__pyx_v_self->length + __pyx_v_shift) * (sizeof(double)))));
+
+      /* "ddtrace/internal/_ddsketch.pyx":105
+ *             if -shift < self.length:
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+ *                 memset(self.bins + self.length + shift, 0, -shift * sizeof(double))             # <<<<<<<<<<<<<<
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ */
+      (void)(memset(((__pyx_v_self->bins + __pyx_v_self->length) + __pyx_v_shift), 0, ((-__pyx_v_shift) * (sizeof(double)))));
+
+      /* "ddtrace/internal/_ddsketch.pyx":103
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *         elif shift < 0:
+ *             if -shift < self.length:             # <<<<<<<<<<<<<<
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+ *                 memset(self.bins + self.length + shift, 0, -shift * sizeof(double))
+ */
+      goto __pyx_L5;
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":107
+ *                 memset(self.bins + self.length + shift, 0, -shift * sizeof(double))
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))             # <<<<<<<<<<<<<<
+ *         self.offset -= shift
+ * 
+ */
+    /*else*/ {
+      (void)(memset(__pyx_v_self->bins, 0, (__pyx_v_self->length * (sizeof(double)))));
+    }
+    __pyx_L5:;
+
+    /* "ddtrace/internal/_ddsketch.pyx":102
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *         elif shift < 0:             # <<<<<<<<<<<<<<
+ *             if -shift < self.length:
+ *                 memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+ */
+  }
+  __pyx_L3:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":108
+ *             else:
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *         self.offset -= shift             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):
+ */
+  __pyx_v_self->offset = (__pyx_v_self->offset - __pyx_v_shift);
+
+  /* "ddtrace/internal/_ddsketch.pyx":95
+ *         return length if length < self.bin_limit else self.bin_limit
+ * 
+ *     cdef void _shift_bins(self, int64_t shift):             # <<<<<<<<<<<<<<
+ *         if shift > 0:
+ *             if shift < self.length:
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":110
+ *         self.offset -= shift
+ * 
+ *     cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t middle_key = new_min_key + (new_max_key - new_min_key + 1) // 2
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)
+ */
+
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__center_bins(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key) {
+  int64_t __pyx_v_middle_key;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_center_bins", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":111
+ * 
+ *     cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):
+ *         cdef int64_t middle_key = new_min_key + (new_max_key - new_min_key + 1) // 2             # <<<<<<<<<<<<<<
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)
+ * 
+ */
+  __pyx_v_middle_key = (__pyx_v_new_min_key + __Pyx_div_int64_t(((__pyx_v_new_max_key - __pyx_v_new_min_key) + 1), 2));
+
+  /* "ddtrace/internal/_ddsketch.pyx":112
+ *     cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):
+ *         cdef int64_t middle_key = new_min_key + (new_max_key - new_min_key + 1) // 2
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _adjust(self, int64_t new_min_key, int64_t new_max_key):
+ */
+  ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_shift_bins(__pyx_v_self, ((__pyx_v_self->offset + __Pyx_div_int64_t(__pyx_v_self->length, 2)) - __pyx_v_middle_key));
+
+  /* "ddtrace/internal/_ddsketch.pyx":110
+ *         self.offset -= shift
+ * 
+ *     cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t middle_key = new_min_key + (new_max_key - new_min_key + 1) // 2
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":114
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)
+ * 
+ *     cdef void _adjust(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t shift, start, end, i
+ *         cdef double collapsed_count
+ */
+
+static void __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__adjust(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_new_min_key, int64_t __pyx_v_new_max_key) {
+  int64_t __pyx_v_shift;
+  int64_t __pyx_v_start;
+  int64_t __pyx_v_end;
+  int64_t __pyx_v_i;
+  double __pyx_v_collapsed_count;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  double __pyx_t_2;
+  int64_t __pyx_t_3;
+  int64_t __pyx_t_4;
+  int64_t __pyx_t_5;
+  __Pyx_RefNannySetupContext("_adjust", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":118
+ *         cdef double collapsed_count
+ * 
+ *         if new_max_key - new_min_key + 1 > self.length:             # <<<<<<<<<<<<<<
+ *             # The range of keys is too wide, the lowest bins need to be collapsed.
+ *             new_min_key = new_max_key - self.length + 1
+ */
+  __pyx_t_1 = ((((__pyx_v_new_max_key - __pyx_v_new_min_key) + 1) > __pyx_v_self->length) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":120
+ *         if new_max_key - new_min_key + 1 > self.length:
+ *             # The range of keys is too wide, the lowest bins need to be collapsed.
+ *             new_min_key = new_max_key - self.length + 1             # <<<<<<<<<<<<<<
+ *             if new_min_key >= self.max_key:
+ *                 # Put everything in the first bin
+ */
+    __pyx_v_new_min_key = ((__pyx_v_new_max_key - __pyx_v_self->length) + 1);
+
+    /* "ddtrace/internal/_ddsketch.pyx":121
+ *             # The range of keys is too wide, the lowest bins need to be collapsed.
+ *             new_min_key = new_max_key - self.length + 1
+ *             if new_min_key >= self.max_key:             # <<<<<<<<<<<<<<
+ *                 # Put everything in the first bin
+ *                 self.offset = new_min_key
+ */
+    __pyx_t_1 = ((__pyx_v_new_min_key >= __pyx_v_self->max_key) != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":123
+ *             if new_min_key >= self.max_key:
+ *                 # Put everything in the first bin
+ *                 self.offset = new_min_key             # <<<<<<<<<<<<<<
+ *                 self.min_key = new_min_key
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ */
+      __pyx_v_self->offset = __pyx_v_new_min_key;
+
+      /* "ddtrace/internal/_ddsketch.pyx":124
+ *                 # Put everything in the first bin
+ *                 self.offset = new_min_key
+ *                 self.min_key = new_min_key             # <<<<<<<<<<<<<<
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *                 self.bins[0] = self.count
+ */
+      __pyx_v_self->min_key = __pyx_v_new_min_key;
+
+      /* "ddtrace/internal/_ddsketch.pyx":125
+ *                 self.offset = new_min_key
+ *                 self.min_key = new_min_key
+ *                 memset(self.bins, 0, self.length * sizeof(double))             # <<<<<<<<<<<<<<
+ *                 self.bins[0] = self.count
+ *             else:
+ */
+      (void)(memset(__pyx_v_self->bins, 0, (__pyx_v_self->length * (sizeof(double)))));
+
+      /* "ddtrace/internal/_ddsketch.pyx":126
+ *                 self.min_key = new_min_key
+ *                 memset(self.bins, 0, self.length * sizeof(double))
+ *                 self.bins[0] = self.count             # <<<<<<<<<<<<<<
+ *             else:
+ *                 shift = self.offset - new_min_key
+ */
+      __pyx_t_2 = __pyx_v_self->count;
+      (__pyx_v_self->bins[0]) = __pyx_t_2;
+
+      /* "ddtrace/internal/_ddsketch.pyx":121
+ *             # The range of keys is too wide, the lowest bins need to be collapsed.
+ *             new_min_key = new_max_key - self.length + 1
+ *             if new_min_key >= self.max_key:             # <<<<<<<<<<<<<<
+ *                 # Put everything in the first bin
+ *                 self.offset = new_min_key
+ */
+      goto __pyx_L4;
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":128
+ *                 self.bins[0] = self.count
+ *             else:
+ *                 shift = self.offset - new_min_key             # <<<<<<<<<<<<<<
+ *                 if shift < 0:
+ *                     start = self.min_key - self.offset
+ */
+    /*else*/ {
+      __pyx_v_shift = (__pyx_v_self->offset - __pyx_v_new_min_key);
+
+      /* "ddtrace/internal/_ddsketch.pyx":129
+ *             else:
+ *                 shift = self.offset - new_min_key
+ *                 if shift < 0:             # <<<<<<<<<<<<<<
+ *                     start = self.min_key - self.offset
+ *                     end = new_min_key - self.offset
+ */
+      __pyx_t_1 = ((__pyx_v_shift < 0) != 0);
+      if (__pyx_t_1) {
+
+        /* "ddtrace/internal/_ddsketch.pyx":130
+ *                 shift = self.offset - new_min_key
+ *                 if shift < 0:
+ *                     start = self.min_key - self.offset             # <<<<<<<<<<<<<<
+ *                     end = new_min_key - self.offset
+ *                     collapsed_count = 0.0
+ */
+        __pyx_v_start = (__pyx_v_self->min_key - __pyx_v_self->offset);
+
+        /* "ddtrace/internal/_ddsketch.pyx":131
+ *                 if shift < 0:
+ *                     start = self.min_key - self.offset
+ *                     end = new_min_key - self.offset             # <<<<<<<<<<<<<<
+ *                     collapsed_count = 0.0
+ *                     for i in range(start, end):
+ */
+        __pyx_v_end = (__pyx_v_new_min_key - __pyx_v_self->offset);
+
+        /* "ddtrace/internal/_ddsketch.pyx":132
+ *                     start = self.min_key - self.offset
+ *                     end = new_min_key - self.offset
+ *                     collapsed_count = 0.0             # <<<<<<<<<<<<<<
+ *                     for i in range(start, end):
+ *                         collapsed_count += self.bins[i]
+ */
+        __pyx_v_collapsed_count = 0.0;
+
+        /* "ddtrace/internal/_ddsketch.pyx":133
+ *                     end = new_min_key - self.offset
+ *                     collapsed_count = 0.0
+ *                     for i in range(start, end):             # <<<<<<<<<<<<<<
+ *                         collapsed_count += self.bins[i]
+ *                         self.bins[i] = 0.0
+ */
+        __pyx_t_3 = __pyx_v_end;
+        __pyx_t_4 = __pyx_t_3;
+        for (__pyx_t_5 = __pyx_v_start; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+          __pyx_v_i = __pyx_t_5;
+
+          /* "ddtrace/internal/_ddsketch.pyx":134
+ *                     collapsed_count = 0.0
+ *                     for i in range(start, end):
+ *                         collapsed_count += self.bins[i]             # <<<<<<<<<<<<<<
+ *                         self.bins[i] = 0.0
+ *                     self.bins[end] += collapsed_count
+ */
+          __pyx_v_collapsed_count = (__pyx_v_collapsed_count + (__pyx_v_self->bins[__pyx_v_i]));
+
+          /* "ddtrace/internal/_ddsketch.pyx":135
+ *                     for i in range(start, end):
+ *                         collapsed_count += self.bins[i]
+ *                         self.bins[i] = 0.0             # <<<<<<<<<<<<<<
+ *                     self.bins[end] += collapsed_count
+ *                 self.min_key = new_min_key
+ */
+          (__pyx_v_self->bins[__pyx_v_i]) = 0.0;
+        }
+
+        /* "ddtrace/internal/_ddsketch.pyx":136
+ *                         collapsed_count += self.bins[i]
+ *                         self.bins[i] = 0.0
+ *                     self.bins[end] += collapsed_count             # <<<<<<<<<<<<<<
+ *                 self.min_key = new_min_key
+ *                 self._shift_bins(shift)
+ */
+        __pyx_t_3 = __pyx_v_end;
+        (__pyx_v_self->bins[__pyx_t_3]) = ((__pyx_v_self->bins[__pyx_t_3]) + __pyx_v_collapsed_count);
+
+        /* "ddtrace/internal/_ddsketch.pyx":129
+ *             else:
+ *                 shift = self.offset - new_min_key
+ *                 if shift < 0:             # <<<<<<<<<<<<<<
+ *                     start = self.min_key - self.offset
+ *                     end = new_min_key - self.offset
+ */
+      }
+
+      /* "ddtrace/internal/_ddsketch.pyx":137
+ *                         self.bins[i] = 0.0
+ *                     self.bins[end] += collapsed_count
+ *                 self.min_key = new_min_key             # <<<<<<<<<<<<<<
+ *                 self._shift_bins(shift)
+ *             self.max_key = new_max_key
+ */
+      __pyx_v_self->min_key = __pyx_v_new_min_key;
+
+      /* "ddtrace/internal/_ddsketch.pyx":138
+ *                     self.bins[end] += collapsed_count
+ *                 self.min_key = new_min_key
+ *                 self._shift_bins(shift)             # <<<<<<<<<<<<<<
+ *             self.max_key = new_max_key
+ *             self.is_collapsed = True
+ */
+      ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_shift_bins(__pyx_v_self, __pyx_v_shift);
+    }
+    __pyx_L4:;
+
+    /* "ddtrace/internal/_ddsketch.pyx":139
+ *                 self.min_key = new_min_key
+ *                 self._shift_bins(shift)
+ *             self.max_key = new_max_key             # <<<<<<<<<<<<<<
+ *             self.is_collapsed = True
+ *         else:
+ */
+    __pyx_v_self->max_key = __pyx_v_new_max_key;
+
+    /* "ddtrace/internal/_ddsketch.pyx":140
+ *                 self._shift_bins(shift)
+ *             self.max_key = new_max_key
+ *             self.is_collapsed = True             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._center_bins(new_min_key, new_max_key)
+ */
+    __pyx_v_self->is_collapsed = 1;
+
+    /* "ddtrace/internal/_ddsketch.pyx":118
+ *         cdef double collapsed_count
+ * 
+ *         if new_max_key - new_min_key + 1 > self.length:             # <<<<<<<<<<<<<<
+ *             # The range of keys is too wide, the lowest bins need to be collapsed.
+ *             new_min_key = new_max_key - self.length + 1
+ */
+    goto __pyx_L3;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":142
+ *             self.is_collapsed = True
+ *         else:
+ *             self._center_bins(new_min_key, new_max_key)             # <<<<<<<<<<<<<<
+ *             self.min_key = new_min_key
+ *             self.max_key = new_max_key
+ */
+  /*else*/ {
+    ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_center_bins(__pyx_v_self, __pyx_v_new_min_key, __pyx_v_new_max_key);
+
+    /* "ddtrace/internal/_ddsketch.pyx":143
+ *         else:
+ *             self._center_bins(new_min_key, new_max_key)
+ *             self.min_key = new_min_key             # <<<<<<<<<<<<<<
+ *             self.max_key = new_max_key
+ * 
+ */
+    __pyx_v_self->min_key = __pyx_v_new_min_key;
+
+    /* "ddtrace/internal/_ddsketch.pyx":144
+ *             self._center_bins(new_min_key, new_max_key)
+ *             self.min_key = new_min_key
+ *             self.max_key = new_max_key             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:
+ */
+    __pyx_v_self->max_key = __pyx_v_new_max_key;
+  }
+  __pyx_L3:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":114
+ *         self._shift_bins(self.offset + self.length // 2 - middle_key)
+ * 
+ *     cdef void _adjust(self, int64_t new_min_key, int64_t new_max_key):             # <<<<<<<<<<<<<<
+ *         cdef int64_t shift, start, end, i
+ *         cdef double collapsed_count
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":146
+ *             self.max_key = new_max_key
+ * 
+ *     cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t new_min_key = _min3(key, second_key, self.min_key)
+ *         cdef int64_t new_max_key = _max3(key, second_key, self.max_key)
+ */
+
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__extend_range(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_key, int64_t __pyx_v_second_key) {
+  int64_t __pyx_v_new_min_key;
+  int64_t __pyx_v_new_max_key;
+  int64_t __pyx_v_new_length;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_extend_range", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":147
+ * 
+ *     cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:
+ *         cdef int64_t new_min_key = _min3(key, second_key, self.min_key)             # <<<<<<<<<<<<<<
+ *         cdef int64_t new_max_key = _max3(key, second_key, self.max_key)
+ *         cdef int64_t new_length
+ */
+  __pyx_v_new_min_key = __pyx_f_7ddtrace_8internal_9_ddsketch__min3(__pyx_v_key, __pyx_v_second_key, __pyx_v_self->min_key);
+
+  /* "ddtrace/internal/_ddsketch.pyx":148
+ *     cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:
+ *         cdef int64_t new_min_key = _min3(key, second_key, self.min_key)
+ *         cdef int64_t new_max_key = _max3(key, second_key, self.max_key)             # <<<<<<<<<<<<<<
+ *         cdef int64_t new_length
+ * 
+ */
+  __pyx_v_new_max_key = __pyx_f_7ddtrace_8internal_9_ddsketch__max3(__pyx_v_key, __pyx_v_second_key, __pyx_v_self->max_key);
+
+  /* "ddtrace/internal/_ddsketch.pyx":151
+ *         cdef int64_t new_length
+ * 
+ *         if self.length == 0:             # <<<<<<<<<<<<<<
+ *             self._resize(self._new_length(new_min_key, new_max_key))
+ *             self.offset = new_min_key
+ */
+  __pyx_t_1 = ((__pyx_v_self->length == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":152
+ * 
+ *         if self.length == 0:
+ *             self._resize(self._new_length(new_min_key, new_max_key))             # <<<<<<<<<<<<<<
+ *             self.offset = new_min_key
+ *             self._adjust(new_min_key, new_max_key)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_resize(__pyx_v_self, ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_new_length(__pyx_v_self, __pyx_v_new_min_key, __pyx_v_new_max_key)); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 152, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":153
+ *         if self.length == 0:
+ *             self._resize(self._new_length(new_min_key, new_max_key))
+ *             self.offset = new_min_key             # <<<<<<<<<<<<<<
+ *             self._adjust(new_min_key, new_max_key)
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:
+ */
+    __pyx_v_self->offset = __pyx_v_new_min_key;
+
+    /* "ddtrace/internal/_ddsketch.pyx":154
+ *             self._resize(self._new_length(new_min_key, new_max_key))
+ *             self.offset = new_min_key
+ *             self._adjust(new_min_key, new_max_key)             # <<<<<<<<<<<<<<
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:
+ *             self.min_key = new_min_key
+ */
+    ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_adjust(__pyx_v_self, __pyx_v_new_min_key, __pyx_v_new_max_key);
+
+    /* "ddtrace/internal/_ddsketch.pyx":151
+ *         cdef int64_t new_length
+ * 
+ *         if self.length == 0:             # <<<<<<<<<<<<<<
+ *             self._resize(self._new_length(new_min_key, new_max_key))
+ *             self.offset = new_min_key
+ */
+    goto __pyx_L3;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":155
+ *             self.offset = new_min_key
+ *             self._adjust(new_min_key, new_max_key)
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:             # <<<<<<<<<<<<<<
+ *             self.min_key = new_min_key
+ *             self.max_key = new_max_key
+ */
+  __pyx_t_3 = ((__pyx_v_new_min_key >= __pyx_v_self->min_key) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_new_max_key < (__pyx_v_self->offset + __pyx_v_self->length)) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":156
+ *             self._adjust(new_min_key, new_max_key)
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:
+ *             self.min_key = new_min_key             # <<<<<<<<<<<<<<
+ *             self.max_key = new_max_key
+ *         else:
+ */
+    __pyx_v_self->min_key = __pyx_v_new_min_key;
+
+    /* "ddtrace/internal/_ddsketch.pyx":157
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:
+ *             self.min_key = new_min_key
+ *             self.max_key = new_max_key             # <<<<<<<<<<<<<<
+ *         else:
+ *             new_length = self._new_length(new_min_key, new_max_key)
+ */
+    __pyx_v_self->max_key = __pyx_v_new_max_key;
+
+    /* "ddtrace/internal/_ddsketch.pyx":155
+ *             self.offset = new_min_key
+ *             self._adjust(new_min_key, new_max_key)
+ *         elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:             # <<<<<<<<<<<<<<
+ *             self.min_key = new_min_key
+ *             self.max_key = new_max_key
+ */
+    goto __pyx_L3;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":159
+ *             self.max_key = new_max_key
+ *         else:
+ *             new_length = self._new_length(new_min_key, new_max_key)             # <<<<<<<<<<<<<<
+ *             if new_length > self.length:
+ *                 self._resize(new_length)
+ */
+  /*else*/ {
+    __pyx_v_new_length = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_new_length(__pyx_v_self, __pyx_v_new_min_key, __pyx_v_new_max_key);
+
+    /* "ddtrace/internal/_ddsketch.pyx":160
+ *         else:
+ *             new_length = self._new_length(new_min_key, new_max_key)
+ *             if new_length > self.length:             # <<<<<<<<<<<<<<
+ *                 self._resize(new_length)
+ *             self._adjust(new_min_key, new_max_key)
+ */
+    __pyx_t_1 = ((__pyx_v_new_length > __pyx_v_self->length) != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":161
+ *             new_length = self._new_length(new_min_key, new_max_key)
+ *             if new_length > self.length:
+ *                 self._resize(new_length)             # <<<<<<<<<<<<<<
+ *             self._adjust(new_min_key, new_max_key)
+ *         return 0
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_resize(__pyx_v_self, __pyx_v_new_length); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 161, __pyx_L1_error)
+
+      /* "ddtrace/internal/_ddsketch.pyx":160
+ *         else:
+ *             new_length = self._new_length(new_min_key, new_max_key)
+ *             if new_length > self.length:             # <<<<<<<<<<<<<<
+ *                 self._resize(new_length)
+ *             self._adjust(new_min_key, new_max_key)
+ */
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":162
+ *             if new_length > self.length:
+ *                 self._resize(new_length)
+ *             self._adjust(new_min_key, new_max_key)             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_adjust(__pyx_v_self, __pyx_v_new_min_key, __pyx_v_new_max_key);
+  }
+  __pyx_L3:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":163
+ *                 self._resize(new_length)
+ *             self._adjust(new_min_key, new_max_key)
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int add(self, int64_t key, double weight) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":146
+ *             self.max_key = new_max_key
+ * 
+ *     cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t new_min_key = _min3(key, second_key, self.min_key)
+ *         cdef int64_t new_max_key = _max3(key, second_key, self.max_key)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore._extend_range", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":165
+ *         return 0
+ * 
+ *     cdef int add(self, int64_t key, double weight) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t index
+ *         if key < self.min_key:
+ */
+
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, int64_t __pyx_v_key, double __pyx_v_weight) {
+  int64_t __pyx_v_index;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int64_t __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":167
+ *     cdef int add(self, int64_t key, double weight) except -1:
+ *         cdef int64_t index
+ *         if key < self.min_key:             # <<<<<<<<<<<<<<
+ *             if self.is_collapsed:
+ *                 index = 0
+ */
+  __pyx_t_1 = ((__pyx_v_key < __pyx_v_self->min_key) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":168
+ *         cdef int64_t index
+ *         if key < self.min_key:
+ *             if self.is_collapsed:             # <<<<<<<<<<<<<<
+ *                 index = 0
+ *             else:
+ */
+    __pyx_t_1 = (__pyx_v_self->is_collapsed != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":169
+ *         if key < self.min_key:
+ *             if self.is_collapsed:
+ *                 index = 0             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._extend_range(key, key)
+ */
+      __pyx_v_index = 0;
+
+      /* "ddtrace/internal/_ddsketch.pyx":168
+ *         cdef int64_t index
+ *         if key < self.min_key:
+ *             if self.is_collapsed:             # <<<<<<<<<<<<<<
+ *                 index = 0
+ *             else:
+ */
+      goto __pyx_L4;
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":171
+ *                 index = 0
+ *             else:
+ *                 self._extend_range(key, key)             # <<<<<<<<<<<<<<
+ *                 index = 0 if self.is_collapsed else key - self.offset
+ *         else:
+ */
+    /*else*/ {
+      __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_extend_range(__pyx_v_self, __pyx_v_key, __pyx_v_key); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 171, __pyx_L1_error)
+
+      /* "ddtrace/internal/_ddsketch.pyx":172
+ *             else:
+ *                 self._extend_range(key, key)
+ *                 index = 0 if self.is_collapsed else key - self.offset             # <<<<<<<<<<<<<<
+ *         else:
+ *             if key > self.max_key:
+ */
+      if ((__pyx_v_self->is_collapsed != 0)) {
+        __pyx_t_3 = 0;
+      } else {
+        __pyx_t_3 = (__pyx_v_key - __pyx_v_self->offset);
+      }
+      __pyx_v_index = __pyx_t_3;
+    }
+    __pyx_L4:;
+
+    /* "ddtrace/internal/_ddsketch.pyx":167
+ *     cdef int add(self, int64_t key, double weight) except -1:
+ *         cdef int64_t index
+ *         if key < self.min_key:             # <<<<<<<<<<<<<<
+ *             if self.is_collapsed:
+ *                 index = 0
+ */
+    goto __pyx_L3;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":174
+ *                 index = 0 if self.is_collapsed else key - self.offset
+ *         else:
+ *             if key > self.max_key:             # <<<<<<<<<<<<<<
+ *                 self._extend_range(key, key)
+ *             index = key - self.offset
+ */
+  /*else*/ {
+    __pyx_t_1 = ((__pyx_v_key > __pyx_v_self->max_key) != 0);
+    if (__pyx_t_1) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":175
+ *         else:
+ *             if key > self.max_key:
+ *                 self._extend_range(key, key)             # <<<<<<<<<<<<<<
+ *             index = key - self.offset
+ *         self.bins[index] += weight
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_extend_range(__pyx_v_self, __pyx_v_key, __pyx_v_key); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 175, __pyx_L1_error)
+
+      /* "ddtrace/internal/_ddsketch.pyx":174
+ *                 index = 0 if self.is_collapsed else key - self.offset
+ *         else:
+ *             if key > self.max_key:             # <<<<<<<<<<<<<<
+ *                 self._extend_range(key, key)
+ *             index = key - self.offset
+ */
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":176
+ *             if key > self.max_key:
+ *                 self._extend_range(key, key)
+ *             index = key - self.offset             # <<<<<<<<<<<<<<
+ *         self.bins[index] += weight
+ *         self.count += weight
+ */
+    __pyx_v_index = (__pyx_v_key - __pyx_v_self->offset);
+  }
+  __pyx_L3:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":177
+ *                 self._extend_range(key, key)
+ *             index = key - self.offset
+ *         self.bins[index] += weight             # <<<<<<<<<<<<<<
+ *         self.count += weight
+ *         return 0
+ */
+  __pyx_t_3 = __pyx_v_index;
+  (__pyx_v_self->bins[__pyx_t_3]) = ((__pyx_v_self->bins[__pyx_t_3]) + __pyx_v_weight);
+
+  /* "ddtrace/internal/_ddsketch.pyx":178
+ *             index = key - self.offset
+ *         self.bins[index] += weight
+ *         self.count += weight             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->count = (__pyx_v_self->count + __pyx_v_weight);
+
+  /* "ddtrace/internal/_ddsketch.pyx":179
+ *         self.bins[index] += weight
+ *         self.count += weight
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":165
+ *         return 0
+ * 
+ *     cdef int add(self, int64_t key, double weight) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t index
+ *         if key < self.min_key:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.add", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":181
+ *         return 0
+ * 
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:             # <<<<<<<<<<<<<<
+ *         if store.length > self.length:
+ *             self._resize(store.length)
+ */
+
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_copy(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int64_t __pyx_t_3;
+  double __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("copy", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":182
+ * 
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:
+ *         if store.length > self.length:             # <<<<<<<<<<<<<<
+ *             self._resize(store.length)
+ *         if store.length:
+ */
+  __pyx_t_1 = ((__pyx_v_store->length > __pyx_v_self->length) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":183
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:
+ *         if store.length > self.length:
+ *             self._resize(store.length)             # <<<<<<<<<<<<<<
+ *         if store.length:
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_resize(__pyx_v_self, __pyx_v_store->length); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":182
+ * 
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:
+ *         if store.length > self.length:             # <<<<<<<<<<<<<<
+ *             self._resize(store.length)
+ *         if store.length:
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":184
+ *         if store.length > self.length:
+ *             self._resize(store.length)
+ *         if store.length:             # <<<<<<<<<<<<<<
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))
+ *         self.length = store.length
+ */
+  __pyx_t_1 = (__pyx_v_store->length != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":185
+ *             self._resize(store.length)
+ *         if store.length:
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))             # <<<<<<<<<<<<<<
+ *         self.length = store.length
+ *         self.offset = store.offset
+ */
+    (void)(memcpy(__pyx_v_self->bins, __pyx_v_store->bins, (__pyx_v_store->length * (sizeof(double)))));
+
+    /* "ddtrace/internal/_ddsketch.pyx":184
+ *         if store.length > self.length:
+ *             self._resize(store.length)
+ *         if store.length:             # <<<<<<<<<<<<<<
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))
+ *         self.length = store.length
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":186
+ *         if store.length:
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))
+ *         self.length = store.length             # <<<<<<<<<<<<<<
+ *         self.offset = store.offset
+ *         self.min_key = store.min_key
+ */
+  __pyx_t_3 = __pyx_v_store->length;
+  __pyx_v_self->length = __pyx_t_3;
+
+  /* "ddtrace/internal/_ddsketch.pyx":187
+ *             memcpy(self.bins, store.bins, store.length * sizeof(double))
+ *         self.length = store.length
+ *         self.offset = store.offset             # <<<<<<<<<<<<<<
+ *         self.min_key = store.min_key
+ *         self.max_key = store.max_key
+ */
+  __pyx_t_3 = __pyx_v_store->offset;
+  __pyx_v_self->offset = __pyx_t_3;
+
+  /* "ddtrace/internal/_ddsketch.pyx":188
+ *         self.length = store.length
+ *         self.offset = store.offset
+ *         self.min_key = store.min_key             # <<<<<<<<<<<<<<
+ *         self.max_key = store.max_key
+ *         self.bin_limit = store.bin_limit
+ */
+  __pyx_t_3 = __pyx_v_store->min_key;
+  __pyx_v_self->min_key = __pyx_t_3;
+
+  /* "ddtrace/internal/_ddsketch.pyx":189
+ *         self.offset = store.offset
+ *         self.min_key = store.min_key
+ *         self.max_key = store.max_key             # <<<<<<<<<<<<<<
+ *         self.bin_limit = store.bin_limit
+ *         self.count = store.count
+ */
+  __pyx_t_3 = __pyx_v_store->max_key;
+  __pyx_v_self->max_key = __pyx_t_3;
+
+  /* "ddtrace/internal/_ddsketch.pyx":190
+ *         self.min_key = store.min_key
+ *         self.max_key = store.max_key
+ *         self.bin_limit = store.bin_limit             # <<<<<<<<<<<<<<
+ *         self.count = store.count
+ *         self.is_collapsed = store.is_collapsed
+ */
+  __pyx_t_3 = __pyx_v_store->bin_limit;
+  __pyx_v_self->bin_limit = __pyx_t_3;
+
+  /* "ddtrace/internal/_ddsketch.pyx":191
+ *         self.max_key = store.max_key
+ *         self.bin_limit = store.bin_limit
+ *         self.count = store.count             # <<<<<<<<<<<<<<
+ *         self.is_collapsed = store.is_collapsed
+ *         return 0
+ */
+  __pyx_t_4 = __pyx_v_store->count;
+  __pyx_v_self->count = __pyx_t_4;
+
+  /* "ddtrace/internal/_ddsketch.pyx":192
+ *         self.bin_limit = store.bin_limit
+ *         self.count = store.count
+ *         self.is_collapsed = store.is_collapsed             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_t_1 = __pyx_v_store->is_collapsed;
+  __pyx_v_self->is_collapsed = __pyx_t_1;
+
+  /* "ddtrace/internal/_ddsketch.pyx":193
+ *         self.count = store.count
+ *         self.is_collapsed = store.is_collapsed
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int merge(self, _CollapsingLowestDenseStore store) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":181
+ *         return 0
+ * 
+ *     cdef int copy(self, _CollapsingLowestDenseStore store) except -1:             # <<<<<<<<<<<<<<
+ *         if store.length > self.length:
+ *             self._resize(store.length)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.copy", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":195
+ *         return 0
+ * 
+ *     cdef int merge(self, _CollapsingLowestDenseStore store) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t start, end, key
+ *         cdef double collapsed_count
+ */
+
+static int __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store) {
+  int64_t __pyx_v_start;
+  int64_t __pyx_v_end;
+  int64_t __pyx_v_key;
+  double __pyx_v_collapsed_count;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int64_t __pyx_t_4;
+  int64_t __pyx_t_5;
+  int64_t __pyx_t_6;
+  long __pyx_t_7;
+  int64_t __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("merge", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":199
+ *         cdef double collapsed_count
+ * 
+ *         if store.count == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         if self.count == 0:
+ */
+  __pyx_t_1 = ((__pyx_v_store->count == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":200
+ * 
+ *         if store.count == 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         if self.count == 0:
+ *             return self.copy(store)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":199
+ *         cdef double collapsed_count
+ * 
+ *         if store.count == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         if self.count == 0:
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":201
+ *         if store.count == 0:
+ *             return 0
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             return self.copy(store)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_self->count == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":202
+ *             return 0
+ *         if self.count == 0:
+ *             return self.copy(store)             # <<<<<<<<<<<<<<
+ * 
+ *         if store.min_key < self.min_key or store.max_key > self.max_key:
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->copy(__pyx_v_self, __pyx_v_store); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 202, __pyx_L1_error)
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":201
+ *         if store.count == 0:
+ *             return 0
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             return self.copy(store)
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":204
+ *             return self.copy(store)
+ * 
+ *         if store.min_key < self.min_key or store.max_key > self.max_key:             # <<<<<<<<<<<<<<
+ *             self._extend_range(store.min_key, store.max_key)
+ * 
+ */
+  __pyx_t_3 = ((__pyx_v_store->min_key < __pyx_v_self->min_key) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_store->max_key > __pyx_v_self->max_key) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":205
+ * 
+ *         if store.min_key < self.min_key or store.max_key > self.max_key:
+ *             self._extend_range(store.min_key, store.max_key)             # <<<<<<<<<<<<<<
+ * 
+ *         start = store.min_key - store.offset
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->__pyx_vtab)->_extend_range(__pyx_v_self, __pyx_v_store->min_key, __pyx_v_store->max_key); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 205, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":204
+ *             return self.copy(store)
+ * 
+ *         if store.min_key < self.min_key or store.max_key > self.max_key:             # <<<<<<<<<<<<<<
+ *             self._extend_range(store.min_key, store.max_key)
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":207
+ *             self._extend_range(store.min_key, store.max_key)
+ * 
+ *         start = store.min_key - store.offset             # <<<<<<<<<<<<<<
+ *         end = min(self.min_key, store.max_key + 1) - store.offset
+ *         if end > start:
+ */
+  __pyx_v_start = (__pyx_v_store->min_key - __pyx_v_store->offset);
+
+  /* "ddtrace/internal/_ddsketch.pyx":208
+ * 
+ *         start = store.min_key - store.offset
+ *         end = min(self.min_key, store.max_key + 1) - store.offset             # <<<<<<<<<<<<<<
+ *         if end > start:
+ *             collapsed_count = 0.0
+ */
+  __pyx_t_4 = (__pyx_v_store->max_key + 1);
+  __pyx_t_5 = __pyx_v_self->min_key;
+  if (((__pyx_t_4 < __pyx_t_5) != 0)) {
+    __pyx_t_6 = __pyx_t_4;
+  } else {
+    __pyx_t_6 = __pyx_t_5;
+  }
+  __pyx_v_end = (__pyx_t_6 - __pyx_v_store->offset);
+
+  /* "ddtrace/internal/_ddsketch.pyx":209
+ *         start = store.min_key - store.offset
+ *         end = min(self.min_key, store.max_key + 1) - store.offset
+ *         if end > start:             # <<<<<<<<<<<<<<
+ *             collapsed_count = 0.0
+ *             for key in range(start, end):
+ */
+  __pyx_t_1 = ((__pyx_v_end > __pyx_v_start) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":210
+ *         end = min(self.min_key, store.max_key + 1) - store.offset
+ *         if end > start:
+ *             collapsed_count = 0.0             # <<<<<<<<<<<<<<
+ *             for key in range(start, end):
+ *                 collapsed_count += store.bins[key]
+ */
+    __pyx_v_collapsed_count = 0.0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":211
+ *         if end > start:
+ *             collapsed_count = 0.0
+ *             for key in range(start, end):             # <<<<<<<<<<<<<<
+ *                 collapsed_count += store.bins[key]
+ *             self.bins[0] += collapsed_count
+ */
+    __pyx_t_6 = __pyx_v_end;
+    __pyx_t_4 = __pyx_t_6;
+    for (__pyx_t_5 = __pyx_v_start; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_key = __pyx_t_5;
+
+      /* "ddtrace/internal/_ddsketch.pyx":212
+ *             collapsed_count = 0.0
+ *             for key in range(start, end):
+ *                 collapsed_count += store.bins[key]             # <<<<<<<<<<<<<<
+ *             self.bins[0] += collapsed_count
+ *         else:
+ */
+      __pyx_v_collapsed_count = (__pyx_v_collapsed_count + (__pyx_v_store->bins[__pyx_v_key]));
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":213
+ *             for key in range(start, end):
+ *                 collapsed_count += store.bins[key]
+ *             self.bins[0] += collapsed_count             # <<<<<<<<<<<<<<
+ *         else:
+ *             end = start
+ */
+    __pyx_t_7 = 0;
+    (__pyx_v_self->bins[__pyx_t_7]) = ((__pyx_v_self->bins[__pyx_t_7]) + __pyx_v_collapsed_count);
+
+    /* "ddtrace/internal/_ddsketch.pyx":209
+ *         start = store.min_key - store.offset
+ *         end = min(self.min_key, store.max_key + 1) - store.offset
+ *         if end > start:             # <<<<<<<<<<<<<<
+ *             collapsed_count = 0.0
+ *             for key in range(start, end):
+ */
+    goto __pyx_L8;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":215
+ *             self.bins[0] += collapsed_count
+ *         else:
+ *             end = start             # <<<<<<<<<<<<<<
+ * 
+ *         for key in range(end + store.offset, store.max_key + 1):
+ */
+  /*else*/ {
+    __pyx_v_end = __pyx_v_start;
+  }
+  __pyx_L8:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":217
+ *             end = start
+ * 
+ *         for key in range(end + store.offset, store.max_key + 1):             # <<<<<<<<<<<<<<
+ *             self.bins[key - self.offset] += store.bins[key - store.offset]
+ * 
+ */
+  __pyx_t_6 = (__pyx_v_store->max_key + 1);
+  __pyx_t_4 = __pyx_t_6;
+  for (__pyx_t_5 = (__pyx_v_end + __pyx_v_store->offset); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_key = __pyx_t_5;
+
+    /* "ddtrace/internal/_ddsketch.pyx":218
+ * 
+ *         for key in range(end + store.offset, store.max_key + 1):
+ *             self.bins[key - self.offset] += store.bins[key - store.offset]             # <<<<<<<<<<<<<<
+ * 
+ *         self.count += store.count
+ */
+    __pyx_t_8 = (__pyx_v_key - __pyx_v_self->offset);
+    (__pyx_v_self->bins[__pyx_t_8]) = ((__pyx_v_self->bins[__pyx_t_8]) + (__pyx_v_store->bins[(__pyx_v_key - __pyx_v_store->offset)]));
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":220
+ *             self.bins[key - self.offset] += store.bins[key - store.offset]
+ * 
+ *         self.count += store.count             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->count = (__pyx_v_self->count + __pyx_v_store->count);
+
+  /* "ddtrace/internal/_ddsketch.pyx":221
+ * 
+ *         self.count += store.count
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int64_t key_at_rank(self, double rank, bint lower):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":195
+ *         return 0
+ * 
+ *     cdef int merge(self, _CollapsingLowestDenseStore store) except -1:             # <<<<<<<<<<<<<<
+ *         cdef int64_t start, end, key
+ *         cdef double collapsed_count
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.merge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":223
+ *         return 0
+ * 
+ *     cdef int64_t key_at_rank(self, double rank, bint lower):             # <<<<<<<<<<<<<<
+ *         cdef double running_count = 0.0
+ *         cdef int64_t i
+ */
+
+static int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_key_at_rank(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, double __pyx_v_rank, int __pyx_v_lower) {
+  double __pyx_v_running_count;
+  int64_t __pyx_v_i;
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int64_t __pyx_t_1;
+  int64_t __pyx_t_2;
+  int64_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("key_at_rank", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":224
+ * 
+ *     cdef int64_t key_at_rank(self, double rank, bint lower):
+ *         cdef double running_count = 0.0             # <<<<<<<<<<<<<<
+ *         cdef int64_t i
+ *         for i in range(self.length):
+ */
+  __pyx_v_running_count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":226
+ *         cdef double running_count = 0.0
+ *         cdef int64_t i
+ *         for i in range(self.length):             # <<<<<<<<<<<<<<
+ *             running_count += self.bins[i]
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):
+ */
+  __pyx_t_1 = __pyx_v_self->length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "ddtrace/internal/_ddsketch.pyx":227
+ *         cdef int64_t i
+ *         for i in range(self.length):
+ *             running_count += self.bins[i]             # <<<<<<<<<<<<<<
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):
+ *                 return i + self.offset
+ */
+    __pyx_v_running_count = (__pyx_v_running_count + (__pyx_v_self->bins[__pyx_v_i]));
+
+    /* "ddtrace/internal/_ddsketch.pyx":228
+ *         for i in range(self.length):
+ *             running_count += self.bins[i]
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):             # <<<<<<<<<<<<<<
+ *                 return i + self.offset
+ *         return self.max_key
+ */
+    __pyx_t_5 = (__pyx_v_lower != 0);
+    if (!__pyx_t_5) {
+      goto __pyx_L7_next_or;
+    } else {
+    }
+    __pyx_t_5 = ((__pyx_v_running_count > __pyx_v_rank) != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_L7_next_or:;
+    __pyx_t_5 = ((!(__pyx_v_lower != 0)) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = ((__pyx_v_running_count >= (__pyx_v_rank + 1.0)) != 0);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":229
+ *             running_count += self.bins[i]
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):
+ *                 return i + self.offset             # <<<<<<<<<<<<<<
+ *         return self.max_key
+ * 
+ */
+      __pyx_r = (__pyx_v_i + __pyx_v_self->offset);
+      goto __pyx_L0;
+
+      /* "ddtrace/internal/_ddsketch.pyx":228
+ *         for i in range(self.length):
+ *             running_count += self.bins[i]
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):             # <<<<<<<<<<<<<<
+ *                 return i + self.offset
+ *         return self.max_key
+ */
+    }
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":230
+ *             if (lower and running_count > rank) or (not lower and running_count >= rank + 1):
+ *                 return i + self.offset
+ *         return self.max_key             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_self->max_key;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":223
+ *         return 0
+ * 
+ *     cdef int64_t key_at_rank(self, double rank, bint lower):             # <<<<<<<<<<<<<<
+ *         cdef double running_count = 0.0
+ *         cdef int64_t i
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_4__reduce_cython__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_6__setstate_cython__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch._CollapsingLowestDenseStore.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":233
+ * 
+ * 
+ * cdef inline size_t _varint_size(uint64_t value):             # <<<<<<<<<<<<<<
+ *     cdef size_t size = 1
+ *     while value >= 0x80:
+ */
+
+static CYTHON_INLINE size_t __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size(uint64_t __pyx_v_value) {
+  size_t __pyx_v_size;
+  size_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_varint_size", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":234
+ * 
+ * cdef inline size_t _varint_size(uint64_t value):
+ *     cdef size_t size = 1             # <<<<<<<<<<<<<<
+ *     while value >= 0x80:
+ *         value >>= 7
+ */
+  __pyx_v_size = 1;
+
+  /* "ddtrace/internal/_ddsketch.pyx":235
+ * cdef inline size_t _varint_size(uint64_t value):
+ *     cdef size_t size = 1
+ *     while value >= 0x80:             # <<<<<<<<<<<<<<
+ *         value >>= 7
+ *         size += 1
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_value >= 0x80) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "ddtrace/internal/_ddsketch.pyx":236
+ *     cdef size_t size = 1
+ *     while value >= 0x80:
+ *         value >>= 7             # <<<<<<<<<<<<<<
+ *         size += 1
+ *     return size
+ */
+    __pyx_v_value = (__pyx_v_value >> 7);
+
+    /* "ddtrace/internal/_ddsketch.pyx":237
+ *     while value >= 0x80:
+ *         value >>= 7
+ *         size += 1             # <<<<<<<<<<<<<<
+ *     return size
+ * 
+ */
+    __pyx_v_size = (__pyx_v_size + 1);
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":238
+ *         value >>= 7
+ *         size += 1
+ *     return size             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_size;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":233
+ * 
+ * 
+ * cdef inline size_t _varint_size(uint64_t value):             # <<<<<<<<<<<<<<
+ *     cdef size_t size = 1
+ *     while value >= 0x80:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":241
+ * 
+ * 
+ * cdef inline char *_write_varint(char *buf, uint64_t value):             # <<<<<<<<<<<<<<
+ *     while value >= 0x80:
+ *         buf[0] = <char>((value & 0x7F) | 0x80)
+ */
+
+static CYTHON_INLINE char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_varint(char *__pyx_v_buf, uint64_t __pyx_v_value) {
+  char *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_write_varint", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":242
+ * 
+ * cdef inline char *_write_varint(char *buf, uint64_t value):
+ *     while value >= 0x80:             # <<<<<<<<<<<<<<
+ *         buf[0] = <char>((value & 0x7F) | 0x80)
+ *         value >>= 7
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_value >= 0x80) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "ddtrace/internal/_ddsketch.pyx":243
+ * cdef inline char *_write_varint(char *buf, uint64_t value):
+ *     while value >= 0x80:
+ *         buf[0] = <char>((value & 0x7F) | 0x80)             # <<<<<<<<<<<<<<
+ *         value >>= 7
+ *         buf += 1
+ */
+    (__pyx_v_buf[0]) = ((char)((__pyx_v_value & 0x7F) | 0x80));
+
+    /* "ddtrace/internal/_ddsketch.pyx":244
+ *     while value >= 0x80:
+ *         buf[0] = <char>((value & 0x7F) | 0x80)
+ *         value >>= 7             # <<<<<<<<<<<<<<
+ *         buf += 1
+ *     buf[0] = <char>value
+ */
+    __pyx_v_value = (__pyx_v_value >> 7);
+
+    /* "ddtrace/internal/_ddsketch.pyx":245
+ *         buf[0] = <char>((value & 0x7F) | 0x80)
+ *         value >>= 7
+ *         buf += 1             # <<<<<<<<<<<<<<
+ *     buf[0] = <char>value
+ *     return buf + 1
+ */
+    __pyx_v_buf = (__pyx_v_buf + 1);
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":246
+ *         value >>= 7
+ *         buf += 1
+ *     buf[0] = <char>value             # <<<<<<<<<<<<<<
+ *     return buf + 1
+ * 
+ */
+  (__pyx_v_buf[0]) = ((char)__pyx_v_value);
+
+  /* "ddtrace/internal/_ddsketch.pyx":247
+ *         buf += 1
+ *     buf[0] = <char>value
+ *     return buf + 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_buf + 1);
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":241
+ * 
+ * 
+ * cdef inline char *_write_varint(char *buf, uint64_t value):             # <<<<<<<<<<<<<<
+ *     while value >= 0x80:
+ *         buf[0] = <char>((value & 0x7F) | 0x80)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":250
+ * 
+ * 
+ * cdef inline char *_write_double(char *buf, double value):             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     cdef int i
+ */
+
+static CYTHON_INLINE char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_double(char *__pyx_v_buf, double __pyx_v_value) {
+  uint64_t __pyx_v_bits;
+  int __pyx_v_i;
+  char *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_write_double", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":253
+ *     cdef uint64_t bits
+ *     cdef int i
+ *     memcpy(&bits, &value, sizeof(double))             # <<<<<<<<<<<<<<
+ *     for i in range(8):
+ *         buf[i] = <char>((bits >> (8 * i)) & 0xFF)
+ */
+  (void)(memcpy((&__pyx_v_bits), (&__pyx_v_value), (sizeof(double))));
+
+  /* "ddtrace/internal/_ddsketch.pyx":254
+ *     cdef int i
+ *     memcpy(&bits, &value, sizeof(double))
+ *     for i in range(8):             # <<<<<<<<<<<<<<
+ *         buf[i] = <char>((bits >> (8 * i)) & 0xFF)
+ *     return buf + 8
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 8; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "ddtrace/internal/_ddsketch.pyx":255
+ *     memcpy(&bits, &value, sizeof(double))
+ *     for i in range(8):
+ *         buf[i] = <char>((bits >> (8 * i)) & 0xFF)             # <<<<<<<<<<<<<<
+ *     return buf + 8
+ * 
+ */
+    (__pyx_v_buf[__pyx_v_i]) = ((char)((__pyx_v_bits >> (8 * __pyx_v_i)) & 0xFF));
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":256
+ *     for i in range(8):
+ *         buf[i] = <char>((bits >> (8 * i)) & 0xFF)
+ *     return buf + 8             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (__pyx_v_buf + 8);
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":250
+ * 
+ * 
+ * cdef inline char *_write_double(char *buf, double value):             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     cdef int i
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":259
+ * 
+ * 
+ * cdef inline uint32_t _zigzag32(int64_t value):             # <<<<<<<<<<<<<<
+ *     cdef int32_t n = <int32_t>value
+ *     return <uint32_t>((n << 1) ^ (n >> 31))
+ */
+
+static CYTHON_INLINE uint32_t __pyx_f_7ddtrace_8internal_9_ddsketch__zigzag32(int64_t __pyx_v_value) {
+  int32_t __pyx_v_n;
+  uint32_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_zigzag32", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":260
+ * 
+ * cdef inline uint32_t _zigzag32(int64_t value):
+ *     cdef int32_t n = <int32_t>value             # <<<<<<<<<<<<<<
+ *     return <uint32_t>((n << 1) ^ (n >> 31))
+ * 
+ */
+  __pyx_v_n = ((int32_t)__pyx_v_value);
+
+  /* "ddtrace/internal/_ddsketch.pyx":261
+ * cdef inline uint32_t _zigzag32(int64_t value):
+ *     cdef int32_t n = <int32_t>value
+ *     return <uint32_t>((n << 1) ^ (n >> 31))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((uint32_t)((__pyx_v_n << 1) ^ (__pyx_v_n >> 31)));
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":259
+ * 
+ * 
+ * cdef inline uint32_t _zigzag32(int64_t value):             # <<<<<<<<<<<<<<
+ *     cdef int32_t n = <int32_t>value
+ *     return <uint32_t>((n << 1) ^ (n >> 31))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":264
+ * 
+ * 
+ * cdef size_t _store_proto_size(_CollapsingLowestDenseStore store):             # <<<<<<<<<<<<<<
+ *     """Return the size of the ``Store`` protobuf message of the store."""
+ *     cdef size_t size = 0
+ */
+
+static size_t __pyx_f_7ddtrace_8internal_9_ddsketch__store_proto_size(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store) {
+  size_t __pyx_v_size;
+  size_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_store_proto_size", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":266
+ * cdef size_t _store_proto_size(_CollapsingLowestDenseStore store):
+ *     """Return the size of the ``Store`` protobuf message of the store."""
+ *     cdef size_t size = 0             # <<<<<<<<<<<<<<
+ *     if store.length:
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ */
+  __pyx_v_size = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":267
+ *     """Return the size of the ``Store`` protobuf message of the store."""
+ *     cdef size_t size = 0
+ *     if store.length:             # <<<<<<<<<<<<<<
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ *         size += 1 + _varint_size(8 * store.length) + 8 * store.length
+ */
+  __pyx_t_1 = (__pyx_v_store->length != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":269
+ *     if store.length:
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ *         size += 1 + _varint_size(8 * store.length) + 8 * store.length             # <<<<<<<<<<<<<<
+ *     if store.offset:
+ *         # contiguousBinIndexOffset (sint32, field 3)
+ */
+    __pyx_v_size = (__pyx_v_size + ((1 + __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size((8 * __pyx_v_store->length))) + (8 * __pyx_v_store->length)));
+
+    /* "ddtrace/internal/_ddsketch.pyx":267
+ *     """Return the size of the ``Store`` protobuf message of the store."""
+ *     cdef size_t size = 0
+ *     if store.length:             # <<<<<<<<<<<<<<
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ *         size += 1 + _varint_size(8 * store.length) + 8 * store.length
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":270
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ *         size += 1 + _varint_size(8 * store.length) + 8 * store.length
+ *     if store.offset:             # <<<<<<<<<<<<<<
+ *         # contiguousBinIndexOffset (sint32, field 3)
+ *         size += 1 + _varint_size(_zigzag32(store.offset))
+ */
+  __pyx_t_1 = (__pyx_v_store->offset != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":272
+ *     if store.offset:
+ *         # contiguousBinIndexOffset (sint32, field 3)
+ *         size += 1 + _varint_size(_zigzag32(store.offset))             # <<<<<<<<<<<<<<
+ *     return size
+ * 
+ */
+    __pyx_v_size = (__pyx_v_size + (1 + __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size(__pyx_f_7ddtrace_8internal_9_ddsketch__zigzag32(__pyx_v_store->offset))));
+
+    /* "ddtrace/internal/_ddsketch.pyx":270
+ *         # contiguousBinCounts (packed repeated double, field 2)
+ *         size += 1 + _varint_size(8 * store.length) + 8 * store.length
+ *     if store.offset:             # <<<<<<<<<<<<<<
+ *         # contiguousBinIndexOffset (sint32, field 3)
+ *         size += 1 + _varint_size(_zigzag32(store.offset))
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":273
+ *         # contiguousBinIndexOffset (sint32, field 3)
+ *         size += 1 + _varint_size(_zigzag32(store.offset))
+ *     return size             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_size;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":264
+ * 
+ * 
+ * cdef size_t _store_proto_size(_CollapsingLowestDenseStore store):             # <<<<<<<<<<<<<<
+ *     """Return the size of the ``Store`` protobuf message of the store."""
+ *     cdef size_t size = 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":276
+ * 
+ * 
+ * cdef char *_write_store_proto(char *buf, char tag, _CollapsingLowestDenseStore store):             # <<<<<<<<<<<<<<
+ *     cdef int64_t i
+ *     buf[0] = tag
+ */
+
+static char *__pyx_f_7ddtrace_8internal_9_ddsketch__write_store_proto(char *__pyx_v_buf, char __pyx_v_tag, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *__pyx_v_store) {
+  int64_t __pyx_v_i;
+  char *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int64_t __pyx_t_2;
+  int64_t __pyx_t_3;
+  int64_t __pyx_t_4;
+  __Pyx_RefNannySetupContext("_write_store_proto", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":278
+ * cdef char *_write_store_proto(char *buf, char tag, _CollapsingLowestDenseStore store):
+ *     cdef int64_t i
+ *     buf[0] = tag             # <<<<<<<<<<<<<<
+ *     buf = _write_varint(buf + 1, _store_proto_size(store))
+ *     if store.length:
+ */
+  (__pyx_v_buf[0]) = __pyx_v_tag;
+
+  /* "ddtrace/internal/_ddsketch.pyx":279
+ *     cdef int64_t i
+ *     buf[0] = tag
+ *     buf = _write_varint(buf + 1, _store_proto_size(store))             # <<<<<<<<<<<<<<
+ *     if store.length:
+ *         buf[0] = 0x12
+ */
+  __pyx_v_buf = __pyx_f_7ddtrace_8internal_9_ddsketch__write_varint((__pyx_v_buf + 1), __pyx_f_7ddtrace_8internal_9_ddsketch__store_proto_size(__pyx_v_store));
+
+  /* "ddtrace/internal/_ddsketch.pyx":280
+ *     buf[0] = tag
+ *     buf = _write_varint(buf + 1, _store_proto_size(store))
+ *     if store.length:             # <<<<<<<<<<<<<<
+ *         buf[0] = 0x12
+ *         buf = _write_varint(buf + 1, 8 * store.length)
+ */
+  __pyx_t_1 = (__pyx_v_store->length != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":281
+ *     buf = _write_varint(buf + 1, _store_proto_size(store))
+ *     if store.length:
+ *         buf[0] = 0x12             # <<<<<<<<<<<<<<
+ *         buf = _write_varint(buf + 1, 8 * store.length)
+ *         for i in range(store.length):
+ */
+    (__pyx_v_buf[0]) = 0x12;
+
+    /* "ddtrace/internal/_ddsketch.pyx":282
+ *     if store.length:
+ *         buf[0] = 0x12
+ *         buf = _write_varint(buf + 1, 8 * store.length)             # <<<<<<<<<<<<<<
+ *         for i in range(store.length):
+ *             buf = _write_double(buf, store.bins[i])
+ */
+    __pyx_v_buf = __pyx_f_7ddtrace_8internal_9_ddsketch__write_varint((__pyx_v_buf + 1), (8 * __pyx_v_store->length));
+
+    /* "ddtrace/internal/_ddsketch.pyx":283
+ *         buf[0] = 0x12
+ *         buf = _write_varint(buf + 1, 8 * store.length)
+ *         for i in range(store.length):             # <<<<<<<<<<<<<<
+ *             buf = _write_double(buf, store.bins[i])
+ *     if store.offset:
+ */
+    __pyx_t_2 = __pyx_v_store->length;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_i = __pyx_t_4;
+
+      /* "ddtrace/internal/_ddsketch.pyx":284
+ *         buf = _write_varint(buf + 1, 8 * store.length)
+ *         for i in range(store.length):
+ *             buf = _write_double(buf, store.bins[i])             # <<<<<<<<<<<<<<
+ *     if store.offset:
+ *         buf[0] = 0x18
+ */
+      __pyx_v_buf = __pyx_f_7ddtrace_8internal_9_ddsketch__write_double(__pyx_v_buf, (__pyx_v_store->bins[__pyx_v_i]));
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":280
+ *     buf[0] = tag
+ *     buf = _write_varint(buf + 1, _store_proto_size(store))
+ *     if store.length:             # <<<<<<<<<<<<<<
+ *         buf[0] = 0x12
+ *         buf = _write_varint(buf + 1, 8 * store.length)
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":285
+ *         for i in range(store.length):
+ *             buf = _write_double(buf, store.bins[i])
+ *     if store.offset:             # <<<<<<<<<<<<<<
+ *         buf[0] = 0x18
+ *         buf = _write_varint(buf + 1, _zigzag32(store.offset))
+ */
+  __pyx_t_1 = (__pyx_v_store->offset != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":286
+ *             buf = _write_double(buf, store.bins[i])
+ *     if store.offset:
+ *         buf[0] = 0x18             # <<<<<<<<<<<<<<
+ *         buf = _write_varint(buf + 1, _zigzag32(store.offset))
+ *     return buf
+ */
+    (__pyx_v_buf[0]) = 0x18;
+
+    /* "ddtrace/internal/_ddsketch.pyx":287
+ *     if store.offset:
+ *         buf[0] = 0x18
+ *         buf = _write_varint(buf + 1, _zigzag32(store.offset))             # <<<<<<<<<<<<<<
+ *     return buf
+ * 
+ */
+    __pyx_v_buf = __pyx_f_7ddtrace_8internal_9_ddsketch__write_varint((__pyx_v_buf + 1), __pyx_f_7ddtrace_8internal_9_ddsketch__zigzag32(__pyx_v_store->offset));
+
+    /* "ddtrace/internal/_ddsketch.pyx":285
+ *         for i in range(store.length):
+ *             buf = _write_double(buf, store.bins[i])
+ *     if store.offset:             # <<<<<<<<<<<<<<
+ *         buf[0] = 0x18
+ *         buf = _write_varint(buf + 1, _zigzag32(store.offset))
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":288
+ *         buf[0] = 0x18
+ *         buf = _write_varint(buf + 1, _zigzag32(store.offset))
+ *     return buf             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_buf;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":276
+ * 
+ * 
+ * cdef char *_write_store_proto(char *buf, char tag, _CollapsingLowestDenseStore store):             # <<<<<<<<<<<<<<
+ *     cdef int64_t i
+ *     buf[0] = tag
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":308
+ *     cdef readonly double _max
+ * 
+ *     def __init__(self, double relative_accuracy, int bin_limit):             # <<<<<<<<<<<<<<
+ *         cdef double gamma_mantissa
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_relative_accuracy;
+  int __pyx_v_bin_limit;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_relative_accuracy,&__pyx_n_s_bin_limit,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_relative_accuracy)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bin_limit)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 308, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 308, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_relative_accuracy = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_relative_accuracy == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L3_error)
+    __pyx_v_bin_limit = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_bin_limit == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 308, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch___init__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self), __pyx_v_relative_accuracy, __pyx_v_bin_limit);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch___init__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_relative_accuracy, int __pyx_v_bin_limit) {
+  double __pyx_v_gamma_mantissa;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  double __pyx_t_5;
+  double __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":311
+ *         cdef double gamma_mantissa
+ * 
+ *         if relative_accuracy <= 0 or relative_accuracy >= 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Relative accuracy must be between 0 and 1, got %r" % relative_accuracy)
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_relative_accuracy <= 0.0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_relative_accuracy >= 1.0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":312
+ * 
+ *         if relative_accuracy <= 0 or relative_accuracy >= 1:
+ *             raise ValueError("Relative accuracy must be between 0 and 1, got %r" % relative_accuracy)             # <<<<<<<<<<<<<<
+ * 
+ *         gamma_mantissa = 2 * relative_accuracy / (1 - relative_accuracy)
+ */
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_relative_accuracy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Relative_accuracy_must_be_betwee, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 312, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":311
+ *         cdef double gamma_mantissa
+ * 
+ *         if relative_accuracy <= 0 or relative_accuracy >= 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Relative accuracy must be between 0 and 1, got %r" % relative_accuracy)
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":314
+ *             raise ValueError("Relative accuracy must be between 0 and 1, got %r" % relative_accuracy)
+ * 
+ *         gamma_mantissa = 2 * relative_accuracy / (1 - relative_accuracy)             # <<<<<<<<<<<<<<
+ *         self.relative_accuracy = relative_accuracy
+ *         self.gamma = 1 + gamma_mantissa
+ */
+  __pyx_t_5 = (2.0 * __pyx_v_relative_accuracy);
+  __pyx_t_6 = (1.0 - __pyx_v_relative_accuracy);
+  if (unlikely(__pyx_t_6 == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 314, __pyx_L1_error)
+  }
+  __pyx_v_gamma_mantissa = (__pyx_t_5 / __pyx_t_6);
+
+  /* "ddtrace/internal/_ddsketch.pyx":315
+ * 
+ *         gamma_mantissa = 2 * relative_accuracy / (1 - relative_accuracy)
+ *         self.relative_accuracy = relative_accuracy             # <<<<<<<<<<<<<<
+ *         self.gamma = 1 + gamma_mantissa
+ *         self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)
+ */
+  __pyx_v_self->relative_accuracy = __pyx_v_relative_accuracy;
+
+  /* "ddtrace/internal/_ddsketch.pyx":316
+ *         gamma_mantissa = 2 * relative_accuracy / (1 - relative_accuracy)
+ *         self.relative_accuracy = relative_accuracy
+ *         self.gamma = 1 + gamma_mantissa             # <<<<<<<<<<<<<<
+ *         self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)
+ *         self._min_possible = DBL_MIN * self.gamma
+ */
+  __pyx_v_self->gamma = (1.0 + __pyx_v_gamma_mantissa);
+
+  /* "ddtrace/internal/_ddsketch.pyx":317
+ *         self.relative_accuracy = relative_accuracy
+ *         self.gamma = 1 + gamma_mantissa
+ *         self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)             # <<<<<<<<<<<<<<
+ *         self._min_possible = DBL_MIN * self.gamma
+ *         self._store = _CollapsingLowestDenseStore(bin_limit)
+ */
+  __pyx_t_6 = log1p(__pyx_v_gamma_mantissa);
+  if (unlikely(__pyx_t_6 == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 317, __pyx_L1_error)
+  }
+  __pyx_v_self->_multiplier = ((1.0 / __pyx_t_6) * log(2.0));
+
+  /* "ddtrace/internal/_ddsketch.pyx":318
+ *         self.gamma = 1 + gamma_mantissa
+ *         self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)
+ *         self._min_possible = DBL_MIN * self.gamma             # <<<<<<<<<<<<<<
+ *         self._store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._negative_store = _CollapsingLowestDenseStore(bin_limit)
+ */
+  __pyx_v_self->_min_possible = (DBL_MIN * __pyx_v_self->gamma);
+
+  /* "ddtrace/internal/_ddsketch.pyx":319
+ *         self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)
+ *         self._min_possible = DBL_MIN * self.gamma
+ *         self._store = _CollapsingLowestDenseStore(bin_limit)             # <<<<<<<<<<<<<<
+ *         self._negative_store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._zero_count = 0.0
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_bin_limit); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore), __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->_store);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_store));
+  __pyx_v_self->_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":320
+ *         self._min_possible = DBL_MIN * self.gamma
+ *         self._store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._negative_store = _CollapsingLowestDenseStore(bin_limit)             # <<<<<<<<<<<<<<
+ *         self._zero_count = 0.0
+ *         self._count = 0.0
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_bin_limit); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_self->_negative_store);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_negative_store));
+  __pyx_v_self->_negative_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":321
+ *         self._store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._negative_store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._zero_count = 0.0             # <<<<<<<<<<<<<<
+ *         self._count = 0.0
+ *         self._sum = 0.0
+ */
+  __pyx_v_self->_zero_count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":322
+ *         self._negative_store = _CollapsingLowestDenseStore(bin_limit)
+ *         self._zero_count = 0.0
+ *         self._count = 0.0             # <<<<<<<<<<<<<<
+ *         self._sum = 0.0
+ *         self._min = float("+inf")
+ */
+  __pyx_v_self->_count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":323
+ *         self._zero_count = 0.0
+ *         self._count = 0.0
+ *         self._sum = 0.0             # <<<<<<<<<<<<<<
+ *         self._min = float("+inf")
+ *         self._max = float("-inf")
+ */
+  __pyx_v_self->_sum = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":324
+ *         self._count = 0.0
+ *         self._sum = 0.0
+ *         self._min = float("+inf")             # <<<<<<<<<<<<<<
+ *         self._max = float("-inf")
+ * 
+ */
+  __pyx_t_6 = __Pyx_PyObject_AsDouble(__pyx_kp_s_inf); if (unlikely(__pyx_t_6 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 324, __pyx_L1_error)
+  __pyx_v_self->_min = __pyx_t_6;
+
+  /* "ddtrace/internal/_ddsketch.pyx":325
+ *         self._sum = 0.0
+ *         self._min = float("+inf")
+ *         self._max = float("-inf")             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __pyx_t_6 = __Pyx_PyObject_AsDouble(__pyx_kp_s_inf_2); if (unlikely(__pyx_t_6 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_v_self->_max = __pyx_t_6;
+
+  /* "ddtrace/internal/_ddsketch.pyx":308
+ *     cdef readonly double _max
+ * 
+ *     def __init__(self, double relative_accuracy, int bin_limit):             # <<<<<<<<<<<<<<
+ *         cdef double gamma_mantissa
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":328
+ * 
+ *     @property
+ *     def count(self):             # <<<<<<<<<<<<<<
+ *         return self._count
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":329
+ *     @property
+ *     def count(self):
+ *         return self._count             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":328
+ * 
+ *     @property
+ *     def count(self):             # <<<<<<<<<<<<<<
+ *         return self._count
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":332
+ * 
+ *     @property
+ *     def sum(self):             # <<<<<<<<<<<<<<
+ *         return self._sum
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":333
+ *     @property
+ *     def sum(self):
+ *         return self._sum             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_sum); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":332
+ * 
+ *     @property
+ *     def sum(self):             # <<<<<<<<<<<<<<
+ *         return self._sum
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.sum.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":336
+ * 
+ *     @property
+ *     def avg(self):             # <<<<<<<<<<<<<<
+ *         return self._sum / self._count
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":337
+ *     @property
+ *     def avg(self):
+ *         return self._sum / self._count             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int64_t _key(self, double value):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  if (unlikely(__pyx_v_self->_count == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 337, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->_sum / __pyx_v_self->_count)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":336
+ * 
+ *     @property
+ *     def avg(self):             # <<<<<<<<<<<<<<
+ *         return self._sum / self._count
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.avg.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":339
+ *         return self._sum / self._count
+ * 
+ *     cdef inline int64_t _key(self, double value):             # <<<<<<<<<<<<<<
+ *         return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)
+ * 
+ */
+
+static CYTHON_INLINE int64_t __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_value) {
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  double __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_key", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":340
+ * 
+ *     cdef inline int64_t _key(self, double value):
+ *         return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline double _value(self, int64_t key):
+ */
+  __pyx_t_1 = log(__pyx_v_value);
+  __pyx_t_2 = log(2.0);
+  if (unlikely(__pyx_t_2 == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 340, __pyx_L1_error)
+  }
+  __pyx_r = ((int64_t)ceil(((__pyx_t_1 / __pyx_t_2) * __pyx_v_self->_multiplier)));
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":339
+ *         return self._sum / self._count
+ * 
+ *     cdef inline int64_t _key(self, double value):             # <<<<<<<<<<<<<<
+ *         return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._key", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":342
+ *         return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)
+ * 
+ *     cdef inline double _value(self, int64_t key):             # <<<<<<<<<<<<<<
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+ * 
+ */
+
+static CYTHON_INLINE double __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int64_t __pyx_v_key) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_value", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":343
+ * 
+ *     cdef inline double _value(self, int64_t key):
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef add(self, double val, double weight=1.0):
+ */
+  if (unlikely(__pyx_v_self->_multiplier == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 343, __pyx_L1_error)
+  }
+  __pyx_t_1 = (1.0 + __pyx_v_self->gamma);
+  if (unlikely(__pyx_t_1 == 0)) {
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __PYX_ERR(0, 343, __pyx_L1_error)
+  }
+  __pyx_r = (pow(2.0, (__pyx_v_key / __pyx_v_self->_multiplier)) * (2.0 / __pyx_t_1));
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":342
+ *         return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)
+ * 
+ *     cdef inline double _value(self, int64_t key):             # <<<<<<<<<<<<<<
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._value", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":345
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+ * 
+ *     cpdef add(self, double val, double weight=1.0):             # <<<<<<<<<<<<<<
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:
+ */
+
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_val, int __pyx_skip_dispatch, struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add *__pyx_optional_args) {
+  double __pyx_v_weight = ((double)1.0);
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_weight = __pyx_optional_args->weight;
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_add); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3add)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 345, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 345, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 345, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":347
+ *     cpdef add(self, double val, double weight=1.0):
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("weight must be a positive float, got %r" % weight)
+ * 
+ */
+  __pyx_t_9 = ((__pyx_v_weight <= 0.0) != 0);
+  if (unlikely(__pyx_t_9)) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":348
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:
+ *             raise ValueError("weight must be a positive float, got %r" % weight)             # <<<<<<<<<<<<<<
+ * 
+ *         if val > self._min_possible:
+ */
+    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_weight_must_be_a_positive_float, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 348, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":347
+ *     cpdef add(self, double val, double weight=1.0):
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("weight must be a positive float, got %r" % weight)
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":350
+ *             raise ValueError("weight must be a positive float, got %r" % weight)
+ * 
+ *         if val > self._min_possible:             # <<<<<<<<<<<<<<
+ *             self._store.add(self._key(val), weight)
+ *         elif val < -self._min_possible:
+ */
+  __pyx_t_9 = ((__pyx_v_val > __pyx_v_self->_min_possible) != 0);
+  if (__pyx_t_9) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":351
+ * 
+ *         if val > self._min_possible:
+ *             self._store.add(self._key(val), weight)             # <<<<<<<<<<<<<<
+ *         elif val < -self._min_possible:
+ *             self._negative_store.add(self._key(-val), weight)
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_store->__pyx_vtab)->add(__pyx_v_self->_store, __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key(__pyx_v_self, __pyx_v_val), __pyx_v_weight); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 351, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":350
+ *             raise ValueError("weight must be a positive float, got %r" % weight)
+ * 
+ *         if val > self._min_possible:             # <<<<<<<<<<<<<<
+ *             self._store.add(self._key(val), weight)
+ *         elif val < -self._min_possible:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":352
+ *         if val > self._min_possible:
+ *             self._store.add(self._key(val), weight)
+ *         elif val < -self._min_possible:             # <<<<<<<<<<<<<<
+ *             self._negative_store.add(self._key(-val), weight)
+ *         else:
+ */
+  __pyx_t_9 = ((__pyx_v_val < (-__pyx_v_self->_min_possible)) != 0);
+  if (__pyx_t_9) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":353
+ *             self._store.add(self._key(val), weight)
+ *         elif val < -self._min_possible:
+ *             self._negative_store.add(self._key(-val), weight)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._zero_count += weight
+ */
+    __pyx_t_7 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_negative_store->__pyx_vtab)->add(__pyx_v_self->_negative_store, __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key(__pyx_v_self, (-__pyx_v_val)), __pyx_v_weight); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 353, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":352
+ *         if val > self._min_possible:
+ *             self._store.add(self._key(val), weight)
+ *         elif val < -self._min_possible:             # <<<<<<<<<<<<<<
+ *             self._negative_store.add(self._key(-val), weight)
+ *         else:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":355
+ *             self._negative_store.add(self._key(-val), weight)
+ *         else:
+ *             self._zero_count += weight             # <<<<<<<<<<<<<<
+ * 
+ *         self._count += weight
+ */
+  /*else*/ {
+    __pyx_v_self->_zero_count = (__pyx_v_self->_zero_count + __pyx_v_weight);
+  }
+  __pyx_L4:;
+
+  /* "ddtrace/internal/_ddsketch.pyx":357
+ *             self._zero_count += weight
+ * 
+ *         self._count += weight             # <<<<<<<<<<<<<<
+ *         self._sum += val * weight
+ *         if val < self._min:
+ */
+  __pyx_v_self->_count = (__pyx_v_self->_count + __pyx_v_weight);
+
+  /* "ddtrace/internal/_ddsketch.pyx":358
+ * 
+ *         self._count += weight
+ *         self._sum += val * weight             # <<<<<<<<<<<<<<
+ *         if val < self._min:
+ *             self._min = val
+ */
+  __pyx_v_self->_sum = (__pyx_v_self->_sum + (__pyx_v_val * __pyx_v_weight));
+
+  /* "ddtrace/internal/_ddsketch.pyx":359
+ *         self._count += weight
+ *         self._sum += val * weight
+ *         if val < self._min:             # <<<<<<<<<<<<<<
+ *             self._min = val
+ *         if val > self._max:
+ */
+  __pyx_t_9 = ((__pyx_v_val < __pyx_v_self->_min) != 0);
+  if (__pyx_t_9) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":360
+ *         self._sum += val * weight
+ *         if val < self._min:
+ *             self._min = val             # <<<<<<<<<<<<<<
+ *         if val > self._max:
+ *             self._max = val
+ */
+    __pyx_v_self->_min = __pyx_v_val;
+
+    /* "ddtrace/internal/_ddsketch.pyx":359
+ *         self._count += weight
+ *         self._sum += val * weight
+ *         if val < self._min:             # <<<<<<<<<<<<<<
+ *             self._min = val
+ *         if val > self._max:
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":361
+ *         if val < self._min:
+ *             self._min = val
+ *         if val > self._max:             # <<<<<<<<<<<<<<
+ *             self._max = val
+ * 
+ */
+  __pyx_t_9 = ((__pyx_v_val > __pyx_v_self->_max) != 0);
+  if (__pyx_t_9) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":362
+ *             self._min = val
+ *         if val > self._max:
+ *             self._max = val             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef clear(self):
+ */
+    __pyx_v_self->_max = __pyx_v_val;
+
+    /* "ddtrace/internal/_ddsketch.pyx":361
+ *         if val < self._min:
+ *             self._min = val
+ *         if val > self._max:             # <<<<<<<<<<<<<<
+ *             self._max = val
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":345
+ *         return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+ * 
+ *     cpdef add(self, double val, double weight=1.0):             # <<<<<<<<<<<<<<
+ *         """Add a value to the sketch."""
+ *         if weight <= 0.0:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.add", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_2add[] = "Add a value to the sketch.";
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_val;
+  double __pyx_v_weight;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("add (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_val,&__pyx_n_s_weight,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_val)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_weight);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "add") < 0)) __PYX_ERR(0, 345, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_val = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_val == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 345, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_weight = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_weight == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 345, __pyx_L3_error)
+    } else {
+      __pyx_v_weight = ((double)1.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("add", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 345, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.add", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_2add(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self), __pyx_v_val, __pyx_v_weight);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_2add(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_val, double __pyx_v_weight) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.weight = __pyx_v_weight;
+  __pyx_t_1 = __pyx_vtabptr_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch->add(__pyx_v_self, __pyx_v_val, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.add", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":364
+ *             self._max = val
+ * 
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         """Remove all the values of the sketch, to reuse it."""
+ *         self._store.clear()
+ */
+
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  double __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_clear); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5clear)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 364, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":366
+ *     cpdef clear(self):
+ *         """Remove all the values of the sketch, to reuse it."""
+ *         self._store.clear()             # <<<<<<<<<<<<<<
+ *         self._negative_store.clear()
+ *         self._zero_count = 0.0
+ */
+  ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_store->__pyx_vtab)->clear(__pyx_v_self->_store);
+
+  /* "ddtrace/internal/_ddsketch.pyx":367
+ *         """Remove all the values of the sketch, to reuse it."""
+ *         self._store.clear()
+ *         self._negative_store.clear()             # <<<<<<<<<<<<<<
+ *         self._zero_count = 0.0
+ *         self._count = 0.0
+ */
+  ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_negative_store->__pyx_vtab)->clear(__pyx_v_self->_negative_store);
+
+  /* "ddtrace/internal/_ddsketch.pyx":368
+ *         self._store.clear()
+ *         self._negative_store.clear()
+ *         self._zero_count = 0.0             # <<<<<<<<<<<<<<
+ *         self._count = 0.0
+ *         self._sum = 0.0
+ */
+  __pyx_v_self->_zero_count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":369
+ *         self._negative_store.clear()
+ *         self._zero_count = 0.0
+ *         self._count = 0.0             # <<<<<<<<<<<<<<
+ *         self._sum = 0.0
+ *         self._min = float("+inf")
+ */
+  __pyx_v_self->_count = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":370
+ *         self._zero_count = 0.0
+ *         self._count = 0.0
+ *         self._sum = 0.0             # <<<<<<<<<<<<<<
+ *         self._min = float("+inf")
+ *         self._max = float("-inf")
+ */
+  __pyx_v_self->_sum = 0.0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":371
+ *         self._count = 0.0
+ *         self._sum = 0.0
+ *         self._min = float("+inf")             # <<<<<<<<<<<<<<
+ *         self._max = float("-inf")
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_AsDouble(__pyx_kp_s_inf); if (unlikely(__pyx_t_5 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_v_self->_min = __pyx_t_5;
+
+  /* "ddtrace/internal/_ddsketch.pyx":372
+ *         self._sum = 0.0
+ *         self._min = float("+inf")
+ *         self._max = float("-inf")             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):
+ */
+  __pyx_t_5 = __Pyx_PyObject_AsDouble(__pyx_kp_s_inf_2); if (unlikely(__pyx_t_5 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L1_error)
+  __pyx_v_self->_max = __pyx_t_5;
+
+  /* "ddtrace/internal/_ddsketch.pyx":364
+ *             self._max = val
+ * 
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         """Remove all the values of the sketch, to reuse it."""
+ *         self._store.clear()
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4clear[] = "Remove all the values of the sketch, to reuse it.";
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("clear (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4clear(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4clear(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_clear(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":374
+ *         self._max = float("-inf")
+ * 
+ *     cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):             # <<<<<<<<<<<<<<
+ *         """Merge the given sketch into this one."""
+ *         if sketch.gamma != self.gamma:
+ */
+
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_7merge(PyObject *__pyx_v_self, PyObject *__pyx_v_sketch); /*proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_sketch, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  double __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("merge", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_merge); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_7merge)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_sketch)) : __Pyx_PyObject_CallOneArg(__pyx_t_3, ((PyObject *)__pyx_v_sketch));
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":376
+ *     cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):
+ *         """Merge the given sketch into this one."""
+ *         if sketch.gamma != self.gamma:             # <<<<<<<<<<<<<<
+ *             raise ValueError(
+ *                 "Cannot merge two DDSketches with different parameters, got %r and %r" % (self.gamma, sketch.gamma)
+ */
+  __pyx_t_5 = ((__pyx_v_sketch->gamma != __pyx_v_self->gamma) != 0);
+  if (unlikely(__pyx_t_5)) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":378
+ *         if sketch.gamma != self.gamma:
+ *             raise ValueError(
+ *                 "Cannot merge two DDSketches with different parameters, got %r and %r" % (self.gamma, sketch.gamma)             # <<<<<<<<<<<<<<
+ *             )
+ * 
+ */
+    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->gamma); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_sketch->gamma); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+    __pyx_t_1 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_Cannot_merge_two_DDSketches_with, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":377
+ *         """Merge the given sketch into this one."""
+ *         if sketch.gamma != self.gamma:
+ *             raise ValueError(             # <<<<<<<<<<<<<<
+ *                 "Cannot merge two DDSketches with different parameters, got %r and %r" % (self.gamma, sketch.gamma)
+ *             )
+ */
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 377, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":376
+ *     cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):
+ *         """Merge the given sketch into this one."""
+ *         if sketch.gamma != self.gamma:             # <<<<<<<<<<<<<<
+ *             raise ValueError(
+ *                 "Cannot merge two DDSketches with different parameters, got %r and %r" % (self.gamma, sketch.gamma)
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":381
+ *             )
+ * 
+ *         if sketch._count == 0:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  __pyx_t_5 = ((__pyx_v_sketch->_count == 0.0) != 0);
+  if (__pyx_t_5) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":382
+ * 
+ *         if sketch._count == 0:
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         self._store.merge(sketch._store)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":381
+ *             )
+ * 
+ *         if sketch._count == 0:             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":384
+ *             return
+ * 
+ *         self._store.merge(sketch._store)             # <<<<<<<<<<<<<<
+ *         self._negative_store.merge(sketch._negative_store)
+ *         self._zero_count += sketch._zero_count
+ */
+  __pyx_t_3 = ((PyObject *)__pyx_v_sketch->_store);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_6 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_store->__pyx_vtab)->merge(__pyx_v_self->_store, ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_3)); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":385
+ * 
+ *         self._store.merge(sketch._store)
+ *         self._negative_store.merge(sketch._negative_store)             # <<<<<<<<<<<<<<
+ *         self._zero_count += sketch._zero_count
+ *         self._count += sketch._count
+ */
+  __pyx_t_3 = ((PyObject *)__pyx_v_sketch->_negative_store);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_6 = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_negative_store->__pyx_vtab)->merge(__pyx_v_self->_negative_store, ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_3)); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":386
+ *         self._store.merge(sketch._store)
+ *         self._negative_store.merge(sketch._negative_store)
+ *         self._zero_count += sketch._zero_count             # <<<<<<<<<<<<<<
+ *         self._count += sketch._count
+ *         self._sum += sketch._sum
+ */
+  __pyx_v_self->_zero_count = (__pyx_v_self->_zero_count + __pyx_v_sketch->_zero_count);
+
+  /* "ddtrace/internal/_ddsketch.pyx":387
+ *         self._negative_store.merge(sketch._negative_store)
+ *         self._zero_count += sketch._zero_count
+ *         self._count += sketch._count             # <<<<<<<<<<<<<<
+ *         self._sum += sketch._sum
+ *         if sketch._min < self._min:
+ */
+  __pyx_v_self->_count = (__pyx_v_self->_count + __pyx_v_sketch->_count);
+
+  /* "ddtrace/internal/_ddsketch.pyx":388
+ *         self._zero_count += sketch._zero_count
+ *         self._count += sketch._count
+ *         self._sum += sketch._sum             # <<<<<<<<<<<<<<
+ *         if sketch._min < self._min:
+ *             self._min = sketch._min
+ */
+  __pyx_v_self->_sum = (__pyx_v_self->_sum + __pyx_v_sketch->_sum);
+
+  /* "ddtrace/internal/_ddsketch.pyx":389
+ *         self._count += sketch._count
+ *         self._sum += sketch._sum
+ *         if sketch._min < self._min:             # <<<<<<<<<<<<<<
+ *             self._min = sketch._min
+ *         if sketch._max > self._max:
+ */
+  __pyx_t_5 = ((__pyx_v_sketch->_min < __pyx_v_self->_min) != 0);
+  if (__pyx_t_5) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":390
+ *         self._sum += sketch._sum
+ *         if sketch._min < self._min:
+ *             self._min = sketch._min             # <<<<<<<<<<<<<<
+ *         if sketch._max > self._max:
+ *             self._max = sketch._max
+ */
+    __pyx_t_7 = __pyx_v_sketch->_min;
+    __pyx_v_self->_min = __pyx_t_7;
+
+    /* "ddtrace/internal/_ddsketch.pyx":389
+ *         self._count += sketch._count
+ *         self._sum += sketch._sum
+ *         if sketch._min < self._min:             # <<<<<<<<<<<<<<
+ *             self._min = sketch._min
+ *         if sketch._max > self._max:
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":391
+ *         if sketch._min < self._min:
+ *             self._min = sketch._min
+ *         if sketch._max > self._max:             # <<<<<<<<<<<<<<
+ *             self._max = sketch._max
+ * 
+ */
+  __pyx_t_5 = ((__pyx_v_sketch->_max > __pyx_v_self->_max) != 0);
+  if (__pyx_t_5) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":392
+ *             self._min = sketch._min
+ *         if sketch._max > self._max:
+ *             self._max = sketch._max             # <<<<<<<<<<<<<<
+ * 
+ *     def get_quantile_value(self, double quantile):
+ */
+    __pyx_t_7 = __pyx_v_sketch->_max;
+    __pyx_v_self->_max = __pyx_t_7;
+
+    /* "ddtrace/internal/_ddsketch.pyx":391
+ *         if sketch._min < self._min:
+ *             self._min = sketch._min
+ *         if sketch._max > self._max:             # <<<<<<<<<<<<<<
+ *             self._max = sketch._max
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":374
+ *         self._max = float("-inf")
+ * 
+ *     cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):             # <<<<<<<<<<<<<<
+ *         """Merge the given sketch into this one."""
+ *         if sketch.gamma != self.gamma:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.merge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_7merge(PyObject *__pyx_v_self, PyObject *__pyx_v_sketch); /*proto*/
+static char __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6merge[] = "Merge the given sketch into this one.";
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_7merge(PyObject *__pyx_v_self, PyObject *__pyx_v_sketch) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("merge (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sketch), __pyx_ptype_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, 1, "sketch", 0))) __PYX_ERR(0, 374, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6merge(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self), ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_sketch));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6merge(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_sketch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("merge", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_merge(__pyx_v_self, __pyx_v_sketch, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.merge", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":394
+ *             self._max = sketch._max
+ * 
+ *     def get_quantile_value(self, double quantile):             # <<<<<<<<<<<<<<
+ *         """Return the approximate value at the specified quantile, or ``None``
+ *         if the sketch is empty.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_9get_quantile_value(PyObject *__pyx_v_self, PyObject *__pyx_arg_quantile); /*proto*/
+static char __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_8get_quantile_value[] = "Return the approximate value at the specified quantile, or ``None``\n        if the sketch is empty.\n        ";
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_9get_quantile_value(PyObject *__pyx_v_self, PyObject *__pyx_arg_quantile) {
+  double __pyx_v_quantile;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_quantile_value (wrapper)", 0);
+  assert(__pyx_arg_quantile); {
+    __pyx_v_quantile = __pyx_PyFloat_AsDouble(__pyx_arg_quantile); if (unlikely((__pyx_v_quantile == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 394, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.get_quantile_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_8get_quantile_value(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self), ((double)__pyx_v_quantile));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_8get_quantile_value(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, double __pyx_v_quantile) {
+  double __pyx_v_rank;
+  int64_t __pyx_v_key;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_quantile_value", 0);
+
+  /* "ddtrace/internal/_ddsketch.pyx":401
+ *         cdef int64_t key
+ * 
+ *         if quantile < 0 or quantile > 1 or self._count == 0:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_quantile < 0.0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_quantile > 1.0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->_count == 0.0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":402
+ * 
+ *         if quantile < 0 or quantile > 1 or self._count == 0:
+ *             return None             # <<<<<<<<<<<<<<
+ * 
+ *         rank = quantile * (self._count - 1)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":401
+ *         cdef int64_t key
+ * 
+ *         if quantile < 0 or quantile > 1 or self._count == 0:             # <<<<<<<<<<<<<<
+ *             return None
+ * 
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":404
+ *             return None
+ * 
+ *         rank = quantile * (self._count - 1)             # <<<<<<<<<<<<<<
+ *         if rank < self._negative_store.count:
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ */
+  __pyx_v_rank = (__pyx_v_quantile * (__pyx_v_self->_count - 1.0));
+
+  /* "ddtrace/internal/_ddsketch.pyx":405
+ * 
+ *         rank = quantile * (self._count - 1)
+ *         if rank < self._negative_store.count:             # <<<<<<<<<<<<<<
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ *             return -self._value(key)
+ */
+  __pyx_t_1 = ((__pyx_v_rank < __pyx_v_self->_negative_store->count) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":406
+ *         rank = quantile * (self._count - 1)
+ *         if rank < self._negative_store.count:
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)             # <<<<<<<<<<<<<<
+ *             return -self._value(key)
+ *         elif rank < self._zero_count + self._negative_store.count:
+ */
+    __pyx_v_key = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_negative_store->__pyx_vtab)->key_at_rank(__pyx_v_self->_negative_store, ((__pyx_v_self->_negative_store->count - __pyx_v_rank) - 1.0), 0);
+
+    /* "ddtrace/internal/_ddsketch.pyx":407
+ *         if rank < self._negative_store.count:
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ *             return -self._value(key)             # <<<<<<<<<<<<<<
+ *         elif rank < self._zero_count + self._negative_store.count:
+ *             return 0
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyFloat_FromDouble((-__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value(__pyx_v_self, __pyx_v_key))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 407, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":405
+ * 
+ *         rank = quantile * (self._count - 1)
+ *         if rank < self._negative_store.count:             # <<<<<<<<<<<<<<
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ *             return -self._value(key)
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":408
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ *             return -self._value(key)
+ *         elif rank < self._zero_count + self._negative_store.count:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)
+ */
+  __pyx_t_1 = ((__pyx_v_rank < (__pyx_v_self->_zero_count + __pyx_v_self->_negative_store->count)) != 0);
+  if (__pyx_t_1) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":409
+ *             return -self._value(key)
+ *         elif rank < self._zero_count + self._negative_store.count:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)
+ *         return self._value(key)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":408
+ *             key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+ *             return -self._value(key)
+ *         elif rank < self._zero_count + self._negative_store.count:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":410
+ *         elif rank < self._zero_count + self._negative_store.count:
+ *             return 0
+ *         key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)             # <<<<<<<<<<<<<<
+ *         return self._value(key)
+ * 
+ */
+  __pyx_v_key = ((struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_v_self->_store->__pyx_vtab)->key_at_rank(__pyx_v_self->_store, ((__pyx_v_rank - __pyx_v_self->_zero_count) - __pyx_v_self->_negative_store->count), 1);
+
+  /* "ddtrace/internal/_ddsketch.pyx":411
+ *             return 0
+ *         key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)
+ *         return self._value(key)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bytes serialize(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value(__pyx_v_self, __pyx_v_key)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":394
+ *             self._max = sketch._max
+ * 
+ *     def get_quantile_value(self, double quantile):             # <<<<<<<<<<<<<<
+ *         """Return the approximate value at the specified quantile, or ``None``
+ *         if the sketch is empty.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.get_quantile_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":413
+ *         return self._value(key)
+ * 
+ *     cpdef bytes serialize(self):             # <<<<<<<<<<<<<<
+ *         """Serialize the sketch to a ``DDSketch`` protobuf message."""
+ *         cdef size_t positive_size = _store_proto_size(self._store)
+ */
+
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11serialize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_serialize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, int __pyx_skip_dispatch) {
+  size_t __pyx_v_positive_size;
+  size_t __pyx_v_negative_size;
+  size_t __pyx_v_size;
+  char *__pyx_v_buf;
+  char *__pyx_v_end;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  char const *__pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("serialize", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_serialize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11serialize)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 413, __pyx_L1_error)
+        __pyx_r = ((PyObject*)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":415
+ *     cpdef bytes serialize(self):
+ *         """Serialize the sketch to a ``DDSketch`` protobuf message."""
+ *         cdef size_t positive_size = _store_proto_size(self._store)             # <<<<<<<<<<<<<<
+ *         cdef size_t negative_size = _store_proto_size(self._negative_store)
+ *         # mapping (field 1) only holds gamma, the offset and the interpolation
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->_store);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_positive_size = __pyx_f_7ddtrace_8internal_9_ddsketch__store_proto_size(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":416
+ *         """Serialize the sketch to a ``DDSketch`` protobuf message."""
+ *         cdef size_t positive_size = _store_proto_size(self._store)
+ *         cdef size_t negative_size = _store_proto_size(self._negative_store)             # <<<<<<<<<<<<<<
+ *         # mapping (field 1) only holds gamma, the offset and the interpolation
+ *         # have their default values.
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->_negative_store);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_negative_size = __pyx_f_7ddtrace_8internal_9_ddsketch__store_proto_size(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":423
+ *             + 1 + _varint_size(positive_size) + positive_size
+ *             + 1 + _varint_size(negative_size) + negative_size
+ *             + 9             # <<<<<<<<<<<<<<
+ *         )
+ *         cdef char *buf = <char *>malloc(size)
+ */
+  __pyx_v_size = ((((((12 + __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size(__pyx_v_positive_size)) + __pyx_v_positive_size) + 1) + __pyx_f_7ddtrace_8internal_9_ddsketch__varint_size(__pyx_v_negative_size)) + __pyx_v_negative_size) + 9);
+
+  /* "ddtrace/internal/_ddsketch.pyx":425
+ *             + 9
+ *         )
+ *         cdef char *buf = <char *>malloc(size)             # <<<<<<<<<<<<<<
+ *         cdef char *end
+ * 
+ */
+  __pyx_v_buf = ((char *)malloc(__pyx_v_size));
+
+  /* "ddtrace/internal/_ddsketch.pyx":428
+ *         cdef char *end
+ * 
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+ */
+  __pyx_t_5 = ((__pyx_v_buf == NULL) != 0);
+  if (unlikely(__pyx_t_5)) {
+
+    /* "ddtrace/internal/_ddsketch.pyx":429
+ * 
+ *         if buf == NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         try:
+ *             buf[0] = 0x0A
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 429, __pyx_L1_error)
+
+    /* "ddtrace/internal/_ddsketch.pyx":428
+ *         cdef char *end
+ * 
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+ */
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":430
+ *         if buf == NULL:
+ *             raise MemoryError()
+ *         try:             # <<<<<<<<<<<<<<
+ *             buf[0] = 0x0A
+ *             buf[1] = 9
+ */
+  /*try:*/ {
+
+    /* "ddtrace/internal/_ddsketch.pyx":431
+ *             raise MemoryError()
+ *         try:
+ *             buf[0] = 0x0A             # <<<<<<<<<<<<<<
+ *             buf[1] = 9
+ *             buf[2] = 0x09
+ */
+    (__pyx_v_buf[0]) = 0x0A;
+
+    /* "ddtrace/internal/_ddsketch.pyx":432
+ *         try:
+ *             buf[0] = 0x0A
+ *             buf[1] = 9             # <<<<<<<<<<<<<<
+ *             buf[2] = 0x09
+ *             end = _write_double(buf + 3, self.gamma)
+ */
+    (__pyx_v_buf[1]) = 9;
+
+    /* "ddtrace/internal/_ddsketch.pyx":433
+ *             buf[0] = 0x0A
+ *             buf[1] = 9
+ *             buf[2] = 0x09             # <<<<<<<<<<<<<<
+ *             end = _write_double(buf + 3, self.gamma)
+ *             end = _write_store_proto(end, 0x12, self._store)
+ */
+    (__pyx_v_buf[2]) = 0x09;
+
+    /* "ddtrace/internal/_ddsketch.pyx":434
+ *             buf[1] = 9
+ *             buf[2] = 0x09
+ *             end = _write_double(buf + 3, self.gamma)             # <<<<<<<<<<<<<<
+ *             end = _write_store_proto(end, 0x12, self._store)
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)
+ */
+    __pyx_v_end = __pyx_f_7ddtrace_8internal_9_ddsketch__write_double((__pyx_v_buf + 3), __pyx_v_self->gamma);
+
+    /* "ddtrace/internal/_ddsketch.pyx":435
+ *             buf[2] = 0x09
+ *             end = _write_double(buf + 3, self.gamma)
+ *             end = _write_store_proto(end, 0x12, self._store)             # <<<<<<<<<<<<<<
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)
+ *             if self._zero_count:
+ */
+    __pyx_t_1 = ((PyObject *)__pyx_v_self->_store);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v_end = __pyx_f_7ddtrace_8internal_9_ddsketch__write_store_proto(__pyx_v_end, 0x12, ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1));
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":436
+ *             end = _write_double(buf + 3, self.gamma)
+ *             end = _write_store_proto(end, 0x12, self._store)
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)             # <<<<<<<<<<<<<<
+ *             if self._zero_count:
+ *                 end[0] = 0x21
+ */
+    __pyx_t_1 = ((PyObject *)__pyx_v_self->_negative_store);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v_end = __pyx_f_7ddtrace_8internal_9_ddsketch__write_store_proto(__pyx_v_end, 0x1A, ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1));
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "ddtrace/internal/_ddsketch.pyx":437
+ *             end = _write_store_proto(end, 0x12, self._store)
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)
+ *             if self._zero_count:             # <<<<<<<<<<<<<<
+ *                 end[0] = 0x21
+ *                 end = _write_double(end + 1, self._zero_count)
+ */
+    __pyx_t_5 = (__pyx_v_self->_zero_count != 0);
+    if (__pyx_t_5) {
+
+      /* "ddtrace/internal/_ddsketch.pyx":438
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)
+ *             if self._zero_count:
+ *                 end[0] = 0x21             # <<<<<<<<<<<<<<
+ *                 end = _write_double(end + 1, self._zero_count)
+ *             return PyBytes_FromStringAndSize(buf, end - buf)
+ */
+      (__pyx_v_end[0]) = 0x21;
+
+      /* "ddtrace/internal/_ddsketch.pyx":439
+ *             if self._zero_count:
+ *                 end[0] = 0x21
+ *                 end = _write_double(end + 1, self._zero_count)             # <<<<<<<<<<<<<<
+ *             return PyBytes_FromStringAndSize(buf, end - buf)
+ *         finally:
+ */
+      __pyx_v_end = __pyx_f_7ddtrace_8internal_9_ddsketch__write_double((__pyx_v_end + 1), __pyx_v_self->_zero_count);
+
+      /* "ddtrace/internal/_ddsketch.pyx":437
+ *             end = _write_store_proto(end, 0x12, self._store)
+ *             end = _write_store_proto(end, 0x1A, self._negative_store)
+ *             if self._zero_count:             # <<<<<<<<<<<<<<
+ *                 end[0] = 0x21
+ *                 end = _write_double(end + 1, self._zero_count)
+ */
+    }
+
+    /* "ddtrace/internal/_ddsketch.pyx":440
+ *                 end[0] = 0x21
+ *                 end = _write_double(end + 1, self._zero_count)
+ *             return PyBytes_FromStringAndSize(buf, end - buf)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(buf)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_buf, (__pyx_v_end - __pyx_v_buf)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 440, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+    goto __pyx_L4_return;
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":442
+ *             return PyBytes_FromStringAndSize(buf, end - buf)
+ *         finally:
+ *             free(buf)             # <<<<<<<<<<<<<<
+ */
+  /*finally:*/ {
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __pyx_t_6 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_8 = __pyx_filename;
+      {
+        free(__pyx_v_buf);
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+      }
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_ErrRestore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_8;
+      goto __pyx_L1_error;
+    }
+    __pyx_L4_return: {
+      __pyx_t_15 = __pyx_r;
+      __pyx_r = 0;
+      free(__pyx_v_buf);
+      __pyx_r = __pyx_t_15;
+      __pyx_t_15 = 0;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "ddtrace/internal/_ddsketch.pyx":413
+ *         return self._value(key)
+ * 
+ *     cpdef bytes serialize(self):             # <<<<<<<<<<<<<<
+ *         """Serialize the sketch to a ``DDSketch`` protobuf message."""
+ *         cdef size_t positive_size = _store_proto_size(self._store)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.serialize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11serialize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_10serialize[] = "Serialize the sketch to a ``DDSketch`` protobuf message.";
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11serialize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("serialize (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_10serialize(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_10serialize(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("serialize", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_serialize(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.serialize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":296
+ *     """
+ * 
+ *     cdef readonly double relative_accuracy             # <<<<<<<<<<<<<<
+ *     cdef readonly double gamma
+ *     cdef double _multiplier
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->relative_accuracy); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.relative_accuracy.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":297
+ * 
+ *     cdef readonly double relative_accuracy
+ *     cdef readonly double gamma             # <<<<<<<<<<<<<<
+ *     cdef double _multiplier
+ *     cdef double _min_possible
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->gamma); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.gamma.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":302
+ *     cdef _CollapsingLowestDenseStore _store
+ *     cdef _CollapsingLowestDenseStore _negative_store
+ *     cdef readonly double _zero_count             # <<<<<<<<<<<<<<
+ *     cdef readonly double _count
+ *     cdef readonly double _sum
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_zero_count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._zero_count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":303
+ *     cdef _CollapsingLowestDenseStore _negative_store
+ *     cdef readonly double _zero_count
+ *     cdef readonly double _count             # <<<<<<<<<<<<<<
+ *     cdef readonly double _sum
+ *     cdef readonly double _min
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":304
+ *     cdef readonly double _zero_count
+ *     cdef readonly double _count
+ *     cdef readonly double _sum             # <<<<<<<<<<<<<<
+ *     cdef readonly double _min
+ *     cdef readonly double _max
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_sum); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._sum.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":305
+ *     cdef readonly double _count
+ *     cdef readonly double _sum
+ *     cdef readonly double _min             # <<<<<<<<<<<<<<
+ *     cdef readonly double _max
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_min); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._min.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "ddtrace/internal/_ddsketch.pyx":306
+ *     cdef readonly double _sum
+ *     cdef readonly double _min
+ *     cdef readonly double _max             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, double relative_accuracy, int bin_limit):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max___get__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max___get__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch._max.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_12__reduce_cython__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_12__reduce_cython__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self._count, self._max, self._min, self._min_possible, self._multiplier, self._negative_store, self._store, self._sum, self._zero_count, self.gamma, self.relative_accuracy)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->_count); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_max); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->_min); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->_min_possible); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->_multiplier); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_self->_sum); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_self->_zero_count); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_self->gamma); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_self->relative_accuracy); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = PyTuple_New(11); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_10, 3, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_10, 4, __pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_negative_store));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->_negative_store));
+  PyTuple_SET_ITEM(__pyx_t_10, 5, ((PyObject *)__pyx_v_self->_negative_store));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_store));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->_store));
+  PyTuple_SET_ITEM(__pyx_t_10, 6, ((PyObject *)__pyx_v_self->_store));
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_10, 7, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_10, 8, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_10, 9, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_10, 10, __pyx_t_9);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __pyx_t_9 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_10);
+  __pyx_t_10 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self._count, self._max, self._min, self._min_possible, self._multiplier, self._negative_store, self._store, self._sum, self._zero_count, self.gamma, self.relative_accuracy)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_10 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_v__dict = __pyx_t_10;
+  __pyx_t_10 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self._count, self._max, self._min, self._min_possible, self._multiplier, self._negative_store, self._store, self._sum, self._zero_count, self.gamma, self.relative_accuracy)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_11 = (__pyx_v__dict != Py_None);
+  __pyx_t_12 = (__pyx_t_11 != 0);
+  if (__pyx_t_12) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_v__dict);
+    __pyx_t_9 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_9));
+    __pyx_t_9 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self._negative_store is not None or self._store is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self._count, self._max, self._min, self._min_possible, self._multiplier, self._negative_store, self._store, self._sum, self._zero_count, self.gamma, self.relative_accuracy)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self._negative_store is not None or self._store is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, None), state
+ */
+  /*else*/ {
+    __pyx_t_11 = (((PyObject *)__pyx_v_self->_negative_store) != Py_None);
+    __pyx_t_13 = (__pyx_t_11 != 0);
+    if (!__pyx_t_13) {
+    } else {
+      __pyx_t_12 = __pyx_t_13;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_13 = (((PyObject *)__pyx_v_self->_store) != Py_None);
+    __pyx_t_11 = (__pyx_t_13 != 0);
+    __pyx_t_12 = __pyx_t_11;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_12;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self._negative_store is not None or self._store is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, None), state
+ *     else:
+ */
+  __pyx_t_12 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_12) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self._negative_store is not None or self._store is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_pyx_unpickle_LogCollapsingLowe); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = PyTuple_New(3); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_267530379);
+    __Pyx_GIVEREF(__pyx_int_267530379);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_int_267530379);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_10, 2, Py_None);
+    __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_10);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_state);
+    __pyx_t_9 = 0;
+    __pyx_t_10 = 0;
+    __pyx_r = __pyx_t_8;
+    __pyx_t_8 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self._negative_store is not None or self._store is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, None), state
+ *     else:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_pyx_unpickle_LogCollapsingLowe); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = PyTuple_New(3); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_267530379);
+    __Pyx_GIVEREF(__pyx_int_267530379);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_int_267530379);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_v_state);
+    __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_10);
+    __pyx_t_8 = 0;
+    __pyx_t_10 = 0;
+    __pyx_r = __pyx_t_9;
+    __pyx_t_9 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_14__setstate_cython__(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_14__setstate_cython__(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_LogCollapsingLowestDenseDDSketch, (type(self), 0xff2308b, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_LogCollapsingLowestDenseDDSketch(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_1__pyx_unpickle_LogCollapsingLowestDenseDDSketch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_7ddtrace_8internal_9_ddsketch_1__pyx_unpickle_LogCollapsingLowestDenseDDSketch = {"__pyx_unpickle_LogCollapsingLowestDenseDDSketch", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7ddtrace_8internal_9_ddsketch_1__pyx_unpickle_LogCollapsingLowestDenseDDSketch, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_7ddtrace_8internal_9_ddsketch_1__pyx_unpickle_LogCollapsingLowestDenseDDSketch(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_LogCollapsingLowestDenseDDSketch (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_LogCollapsingLowestDenseDDSketch", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_LogCollapsingLowestDenseDDSketch", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_LogCollapsingLowestDenseDDSketch") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_LogCollapsingLowestDenseDDSketch", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.__pyx_unpickle_LogCollapsingLowestDenseDDSketch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_LogCollapsingLowestDenseDDSketch", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xff2308b, 0x1df2c12, 0x103dcba):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__3, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xff2308b, 0x1df2c12, 0x103dcba):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xff2308b, 0x1df2c12, 0x103dcba):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xff2308b, 0x1df2c12, 0x103dcba):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xff2308b, 0x1df2c12, 0x103dcba) = (_count, _max, _min, _min_possible, _multiplier, _negative_store, _store, _sum, _zero_count, gamma, relative_accuracy))" % __pyx_checksum)
+ *     __pyx_result = LogCollapsingLowestDenseDDSketch.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_LogCollapsingLowestDenseDDSketch(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.__pyx_unpickle_LogCollapsingLowestDenseDDSketch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_7ddtrace_8internal_9_ddsketch___pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  double __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[11])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_count = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_max = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_min = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_min_possible = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_multiplier = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->_negative_store);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->_negative_store));
+  __pyx_v___pyx_result->_negative_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 6, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->_store);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->_store));
+  __pyx_v___pyx_result->_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 7, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_sum = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 8, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->_zero_count = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 9, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->gamma = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 10, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->relative_accuracy = __pyx_t_2;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[11])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 > 11) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  __pyx_t_3 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[11])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_update); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 11, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[11])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(<LogCollapsingLowestDenseDDSketch> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state(LogCollapsingLowestDenseDDSketch __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result._count = __pyx_state[0]; __pyx_result._max = __pyx_state[1]; __pyx_result._min = __pyx_state[2]; __pyx_result._min_possible = __pyx_state[3]; __pyx_result._multiplier = __pyx_state[4]; __pyx_result._negative_store = __pyx_state[5]; __pyx_result._store = __pyx_state[6]; __pyx_result._sum = __pyx_state[7]; __pyx_result._zero_count = __pyx_state[8]; __pyx_result.gamma = __pyx_state[9]; __pyx_result.relative_accuracy = __pyx_state[10]
+ *     if len(__pyx_state) > 11 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("ddtrace.internal._ddsketch.__pyx_unpickle_LogCollapsingLowestDenseDDSketch__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+
+static PyObject *__pyx_tp_new_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+  if (unlikely(__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_5__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_7__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "ddtrace.internal._ddsketch._CollapsingLowestDenseStore", /*tp_name*/
+  sizeof(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "Dense store of bins that collapses its lowest bins beyond the bin limit.", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+
+static PyObject *__pyx_tp_new_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+  p->_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)Py_None); Py_INCREF(Py_None);
+  p->_negative_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch(PyObject *o) {
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *p = (struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->_store);
+  Py_CLEAR(p->_negative_store);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *p = (struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)o;
+  if (p->_store) {
+    e = (*v)(((PyObject *)p->_store), a); if (e) return e;
+  }
+  if (p->_negative_store) {
+    e = (*v)(((PyObject *)p->_negative_store), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *p = (struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *)o;
+  tmp = ((PyObject*)p->_store);
+  p->_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_negative_store);
+  p->_negative_store = ((struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5count_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_sum(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3sum_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_avg(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3avg_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_relative_accuracy(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_17relative_accuracy_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_gamma(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5gamma_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__zero_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11_zero_count_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6_count_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__sum(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_sum_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__min(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_min_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__max(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4_max_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch[] = {
+  {"add", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_3add, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_2add},
+  {"clear", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_5clear, METH_NOARGS, __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_4clear},
+  {"merge", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_7merge, METH_O, __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_6merge},
+  {"get_quantile_value", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_9get_quantile_value, METH_O, __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_8get_quantile_value},
+  {"serialize", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_11serialize, METH_NOARGS, __pyx_doc_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_10serialize},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_13__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_15__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch[] = {
+  {(char *)"count", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_count, 0, (char *)0, 0},
+  {(char *)"sum", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_sum, 0, (char *)0, 0},
+  {(char *)"avg", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_avg, 0, (char *)0, 0},
+  {(char *)"relative_accuracy", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_relative_accuracy, 0, (char *)0, 0},
+  {(char *)"gamma", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_gamma, 0, (char *)0, 0},
+  {(char *)"_zero_count", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__zero_count, 0, (char *)0, 0},
+  {(char *)"_count", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__count, 0, (char *)0, 0},
+  {(char *)"_sum", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__sum, 0, (char *)0, 0},
+  {(char *)"_min", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__min, 0, (char *)0, 0},
+  {(char *)"_max", __pyx_getprop_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__max, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "ddtrace.internal._ddsketch.LogCollapsingLowestDenseDDSketch", /*tp_name*/
+  sizeof(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "DDSketch with a logarithmic mapping whose lowest bins are collapsed\n    when the number of bins exceeds ``bin_limit``.\n    ", /*tp_doc*/
+  __pyx_tp_traverse_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_traverse*/
+  __pyx_tp_clear_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__ddsketch(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__ddsketch},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_ddsketch",
+    __pyx_k_Compiled_implementation_of_the_D, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_s_Cannot_merge_two_DDSketches_with, __pyx_k_Cannot_merge_two_DDSketches_with, sizeof(__pyx_k_Cannot_merge_two_DDSketches_with), 0, 0, 1, 0},
+  {&__pyx_n_s_CollapsingLowestDenseStore, __pyx_k_CollapsingLowestDenseStore, sizeof(__pyx_k_CollapsingLowestDenseStore), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_LogCollapsingLowestDenseDDSketch, __pyx_k_LogCollapsingLowestDenseDDSketch, sizeof(__pyx_k_LogCollapsingLowestDenseDDSketch), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Relative_accuracy_must_be_betwee, __pyx_k_Relative_accuracy_must_be_betwee, sizeof(__pyx_k_Relative_accuracy_must_be_betwee), 0, 0, 1, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_add, __pyx_k_add, sizeof(__pyx_k_add), 0, 0, 1, 1},
+  {&__pyx_n_s_bin_limit, __pyx_k_bin_limit, sizeof(__pyx_k_bin_limit), 0, 0, 1, 1},
+  {&__pyx_n_s_clear, __pyx_k_clear, sizeof(__pyx_k_clear), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_ddtrace_internal__ddsketch, __pyx_k_ddtrace_internal__ddsketch, sizeof(__pyx_k_ddtrace_internal__ddsketch), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_kp_s_inf, __pyx_k_inf, sizeof(__pyx_k_inf), 0, 0, 1, 0},
+  {&__pyx_kp_s_inf_2, __pyx_k_inf_2, sizeof(__pyx_k_inf_2), 0, 0, 1, 0},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_merge, __pyx_k_merge, sizeof(__pyx_k_merge), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_LogCollapsingLowe, __pyx_k_pyx_unpickle_LogCollapsingLowe, sizeof(__pyx_k_pyx_unpickle_LogCollapsingLowe), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_relative_accuracy, __pyx_k_relative_accuracy, sizeof(__pyx_k_relative_accuracy), 0, 0, 1, 1},
+  {&__pyx_n_s_serialize, __pyx_k_serialize, sizeof(__pyx_k_serialize), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_val, __pyx_k_val, sizeof(__pyx_k_val), 0, 0, 1, 1},
+  {&__pyx_n_s_weight, __pyx_k_weight, sizeof(__pyx_k_weight), 0, 0, 1, 1},
+  {&__pyx_kp_s_weight_must_be_a_positive_float, __pyx_k_weight_must_be_a_positive_float, sizeof(__pyx_k_weight_must_be_a_positive_float), 0, 0, 1, 0},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 312, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_267530379, __pyx_int_31403026, __pyx_int_17030330); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_LogCollapsingLowestDenseDDSketch(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__4 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_codeobj__5 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__4, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_LogCollapsingLowe, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__5)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_17030330 = PyInt_FromLong(17030330L); if (unlikely(!__pyx_int_17030330)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_31403026 = PyInt_FromLong(31403026L); if (unlikely(!__pyx_int_31403026)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_267530379 = PyInt_FromLong(267530379L); if (unlikely(!__pyx_int_267530379)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore = &__pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.clear = (void (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_clear;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._resize = (int (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__resize;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._new_length = (int64_t (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__new_length;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._shift_bins = (void (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__shift_bins;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._center_bins = (void (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__center_bins;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._adjust = (void (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__adjust;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore._extend_range = (int (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore__extend_range;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.add = (int (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, int64_t, double))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_add;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.copy = (int (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_copy;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.merge = (int (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_merge;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.key_at_rank = (int64_t (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore *, double, int))__pyx_f_7ddtrace_8internal_9_ddsketch_27_CollapsingLowestDenseStore_key_at_rank;
+  if (PyType_Ready(&__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.tp_dictoffset && __pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore.tp_dict, __pyx_vtabptr_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CollapsingLowestDenseStore, (PyObject *)&__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_ptype_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore = &__pyx_type_7ddtrace_8internal_9_ddsketch__CollapsingLowestDenseStore;
+  __pyx_vtabptr_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch = &__pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch._key = (int64_t (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, double))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__key;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch._value = (double (*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int64_t))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch__value;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.add = (PyObject *(*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add *__pyx_optional_args))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_add;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.clear = (PyObject *(*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_clear;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.merge = (PyObject *(*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_merge;
+  __pyx_vtable_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.serialize = (PyObject *(*)(struct __pyx_obj_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch *, int __pyx_skip_dispatch))__pyx_f_7ddtrace_8internal_9_ddsketch_32LogCollapsingLowestDenseDDSketch_serialize;
+  if (PyType_Ready(&__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.tp_dictoffset && __pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch.tp_dict, __pyx_vtabptr_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_LogCollapsingLowestDenseDDSketch, (PyObject *)&__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_ptype_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch = &__pyx_type_7ddtrace_8internal_9_ddsketch_LogCollapsingLowestDenseDDSketch;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_ddsketch(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_ddsketch(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__ddsketch(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__ddsketch(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__ddsketch(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_ddsketch' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__ddsketch(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_ddsketch", __pyx_methods, __pyx_k_Compiled_implementation_of_the_D, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_ddtrace__internal___ddsketch) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "ddtrace.internal._ddsketch")) {
+      if (unlikely(PyDict_SetItemString(modules, "ddtrace.internal._ddsketch", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "ddtrace/internal/_ddsketch.pyx":28
+ * 
+ * 
+ * cdef int64_t CHUNK_SIZE = 128             # <<<<<<<<<<<<<<
+ * 
+ * # Sentinels playing the role of the infinite keys of an empty store
+ */
+  __pyx_v_7ddtrace_8internal_9_ddsketch_CHUNK_SIZE = 0x80;
+
+  /* "ddtrace/internal/_ddsketch.pyx":31
+ * 
+ * # Sentinels playing the role of the infinite keys of an empty store
+ * cdef int64_t NO_MIN_KEY = 0x7FFFFFFFFFFFFFFF             # <<<<<<<<<<<<<<
+ * cdef int64_t NO_MAX_KEY = -NO_MIN_KEY - 1
+ * 
+ */
+  __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MIN_KEY = 0x7FFFFFFFFFFFFFFF;
+
+  /* "ddtrace/internal/_ddsketch.pyx":32
+ * # Sentinels playing the role of the infinite keys of an empty store
+ * cdef int64_t NO_MIN_KEY = 0x7FFFFFFFFFFFFFFF
+ * cdef int64_t NO_MAX_KEY = -NO_MIN_KEY - 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_v_7ddtrace_8internal_9_ddsketch_NO_MAX_KEY = ((-__pyx_v_7ddtrace_8internal_9_ddsketch_NO_MIN_KEY) - 1);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_LogCollapsingLowestDenseDDSketch(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_7ddtrace_8internal_9_ddsketch_1__pyx_unpickle_LogCollapsingLowestDenseDDSketch, NULL, __pyx_n_s_ddtrace_internal__ddsketch); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_LogCollapsingLowe, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "ddtrace/internal/_ddsketch.pyx":1
+ * """Compiled implementation of the DDSketch used for the stats computed by the tracer.             # <<<<<<<<<<<<<<
+ * 
+ * ``LogCollapsingLowestDenseDDSketch`` mirrors the class of the same name from
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init ddtrace.internal._ddsketch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init ddtrace.internal._ddsketch");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* DivInt[int64_t] */
+static CYTHON_INLINE int64_t __Pyx_div_int64_t(int64_t a, int64_t b) {
+    int64_t q = a / b;
+    int64_t r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* pyobject_as_double */
+static double __Pyx__PyObject_AsDouble(PyObject* obj) {
+    PyObject* float_value;
+#if !CYTHON_USE_TYPE_SLOTS
+    float_value = PyNumber_Float(obj);  if ((0)) goto bad;
+#else
+    PyNumberMethods *nb = Py_TYPE(obj)->tp_as_number;
+    if (likely(nb) && likely(nb->nb_float)) {
+        float_value = nb->nb_float(obj);
+        if (likely(float_value) && unlikely(!PyFloat_Check(float_value))) {
+            PyErr_Format(PyExc_TypeError,
+                "__float__ returned non-float (type %.200s)",
+                Py_TYPE(float_value)->tp_name);
+            Py_DECREF(float_value);
+            goto bad;
+        }
+    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        float_value = PyFloat_FromString(obj);
+#else
+        float_value = PyFloat_FromString(obj, 0);
+#endif
+    } else {
+        PyObject* args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        PyTuple_SET_ITEM(args, 0, obj);
+        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
+        PyTuple_SET_ITEM(args, 0, 0);
+        Py_DECREF(args);
+    }
+#endif
+    if (likely(float_value)) {
+        double value = PyFloat_AS_DOUBLE(float_value);
+        Py_DECREF(float_value);
+        return value;
+    }
+bad:
+    return (double)-1;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int64_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 2 * PyLong_SHIFT) {
+                            return (int64_t) (((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 3 * PyLong_SHIFT) {
+                            return (int64_t) (((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 4 * PyLong_SHIFT) {
+                            return (int64_t) (((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) ((((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int64_t) -1;
+        }
+    } else {
+        int64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int64_t) -1;
+        val = __Pyx_PyInt_As_int64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int64_t");
+    return (int64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int64_t");
+    return (int64_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,17 @@
+from typing import Optional
+
+class LogCollapsingLowestDenseDDSketch(object):
+    relative_accuracy: float
+    gamma: float
+    def __init__(self, relative_accuracy: float, bin_limit: int) -> None: ...
+    @property
+    def count(self) -> float: ...
+    @property
+    def sum(self) -> float: ...
+    @property
+    def avg(self) -> float: ...
+    def add(self, val: float, weight: float = 1.0) -> None: ...
+    def clear(self) -> None: ...
+    def merge(self, sketch: LogCollapsingLowestDenseDDSketch) -> None: ...
+    def get_quantile_value(self, quantile: float) -> Optional[float]: ...
+    def serialize(self) -> bytes: ...
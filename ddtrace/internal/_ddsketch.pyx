@@ -0,0 +1,442 @@
+"""Compiled implementation of the DDSketch used for the stats computed by the tracer.
+
+``LogCollapsingLowestDenseDDSketch`` mirrors the class of the same name from
+the ``ddsketch`` package: it uses the same logarithmic mapping, the same dense
+store collapsing its lowest bins and the same growth policy, so that adding
+the same values to both sketches results in the same bins. The sketch is
+serialized directly to the ``DDSketch`` protobuf message, byte for byte as
+``DDSketchProto.to_proto(sketch).SerializeToString()`` would.
+"""
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.float cimport DBL_MIN
+from libc.math cimport ceil
+from libc.math cimport log
+from libc.math cimport log1p
+from libc.math cimport pow
+from libc.stdint cimport int32_t
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint32_t
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport free
+from libc.stdlib cimport malloc
+from libc.stdlib cimport realloc
+from libc.string cimport memcpy
+from libc.string cimport memmove
+from libc.string cimport memset
+
+
+cdef int64_t CHUNK_SIZE = 128
+
+# Sentinels playing the role of the infinite keys of an empty store
+cdef int64_t NO_MIN_KEY = 0x7FFFFFFFFFFFFFFF
+cdef int64_t NO_MAX_KEY = -NO_MIN_KEY - 1
+
+
+cdef inline int64_t _min3(int64_t a, int64_t b, int64_t c):
+    if b < a:
+        a = b
+    return c if c < a else a
+
+
+cdef inline int64_t _max3(int64_t a, int64_t b, int64_t c):
+    if b > a:
+        a = b
+    return c if c > a else a
+
+
+cdef class _CollapsingLowestDenseStore(object):
+    """Dense store of bins that collapses its lowest bins beyond the bin limit."""
+
+    cdef double *bins
+    cdef int64_t length
+    cdef int64_t offset
+    cdef int64_t min_key
+    cdef int64_t max_key
+    cdef int64_t bin_limit
+    cdef double count
+    cdef bint is_collapsed
+
+    def __cinit__(self, int64_t bin_limit):
+        self.bins = NULL
+        self.length = 0
+        self.offset = 0
+        self.min_key = NO_MIN_KEY
+        self.max_key = NO_MAX_KEY
+        self.bin_limit = bin_limit
+        self.count = 0.0
+        self.is_collapsed = False
+
+    def __dealloc__(self):
+        free(self.bins)
+
+    cdef void clear(self):
+        # Keep the bins allocated, they are reallocated when the store grows
+        # again.
+        self.length = 0
+        self.offset = 0
+        self.min_key = NO_MIN_KEY
+        self.max_key = NO_MAX_KEY
+        self.count = 0.0
+        self.is_collapsed = False
+
+    cdef int _resize(self, int64_t length) except -1:
+        cdef double *bins = <double *>realloc(self.bins, length * sizeof(double))
+        if bins == NULL:
+            raise MemoryError()
+        memset(bins + self.length, 0, (length - self.length) * sizeof(double))
+        self.bins = bins
+        self.length = length
+        return 0
+
+    cdef int64_t _new_length(self, int64_t new_min_key, int64_t new_max_key):
+        cdef int64_t length = (new_max_key - new_min_key + CHUNK_SIZE) // CHUNK_SIZE * CHUNK_SIZE
+        return length if length < self.bin_limit else self.bin_limit
+
+    cdef void _shift_bins(self, int64_t shift):
+        if shift > 0:
+            if shift < self.length:
+                memmove(self.bins + shift, self.bins, (self.length - shift) * sizeof(double))
+                memset(self.bins, 0, shift * sizeof(double))
+            else:
+                memset(self.bins, 0, self.length * sizeof(double))
+        elif shift < 0:
+            if -shift < self.length:
+                memmove(self.bins, self.bins - shift, (self.length + shift) * sizeof(double))
+                memset(self.bins + self.length + shift, 0, -shift * sizeof(double))
+            else:
+                memset(self.bins, 0, self.length * sizeof(double))
+        self.offset -= shift
+
+    cdef void _center_bins(self, int64_t new_min_key, int64_t new_max_key):
+        cdef int64_t middle_key = new_min_key + (new_max_key - new_min_key + 1) // 2
+        self._shift_bins(self.offset + self.length // 2 - middle_key)
+
+    cdef void _adjust(self, int64_t new_min_key, int64_t new_max_key):
+        cdef int64_t shift, start, end, i
+        cdef double collapsed_count
+
+        if new_max_key - new_min_key + 1 > self.length:
+            # The range of keys is too wide, the lowest bins need to be collapsed.
+            new_min_key = new_max_key - self.length + 1
+            if new_min_key >= self.max_key:
+                # Put everything in the first bin
+                self.offset = new_min_key
+                self.min_key = new_min_key
+                memset(self.bins, 0, self.length * sizeof(double))
+                self.bins[0] = self.count
+            else:
+                shift = self.offset - new_min_key
+                if shift < 0:
+                    start = self.min_key - self.offset
+                    end = new_min_key - self.offset
+                    collapsed_count = 0.0
+                    for i in range(start, end):
+                        collapsed_count += self.bins[i]
+                        self.bins[i] = 0.0
+                    self.bins[end] += collapsed_count
+                self.min_key = new_min_key
+                self._shift_bins(shift)
+            self.max_key = new_max_key
+            self.is_collapsed = True
+        else:
+            self._center_bins(new_min_key, new_max_key)
+            self.min_key = new_min_key
+            self.max_key = new_max_key
+
+    cdef int _extend_range(self, int64_t key, int64_t second_key) except -1:
+        cdef int64_t new_min_key = _min3(key, second_key, self.min_key)
+        cdef int64_t new_max_key = _max3(key, second_key, self.max_key)
+        cdef int64_t new_length
+
+        if self.length == 0:
+            self._resize(self._new_length(new_min_key, new_max_key))
+            self.offset = new_min_key
+            self._adjust(new_min_key, new_max_key)
+        elif new_min_key >= self.min_key and new_max_key < self.offset + self.length:
+            self.min_key = new_min_key
+            self.max_key = new_max_key
+        else:
+            new_length = self._new_length(new_min_key, new_max_key)
+            if new_length > self.length:
+                self._resize(new_length)
+            self._adjust(new_min_key, new_max_key)
+        return 0
+
+    cdef int add(self, int64_t key, double weight) except -1:
+        cdef int64_t index
+        if key < self.min_key:
+            if self.is_collapsed:
+                index = 0
+            else:
+                self._extend_range(key, key)
+                index = 0 if self.is_collapsed else key - self.offset
+        else:
+            if key > self.max_key:
+                self._extend_range(key, key)
+            index = key - self.offset
+        self.bins[index] += weight
+        self.count += weight
+        return 0
+
+    cdef int copy(self, _CollapsingLowestDenseStore store) except -1:
+        if store.length > self.length:
+            self._resize(store.length)
+        if store.length:
+            memcpy(self.bins, store.bins, store.length * sizeof(double))
+        self.length = store.length
+        self.offset = store.offset
+        self.min_key = store.min_key
+        self.max_key = store.max_key
+        self.bin_limit = store.bin_limit
+        self.count = store.count
+        self.is_collapsed = store.is_collapsed
+        return 0
+
+    cdef int merge(self, _CollapsingLowestDenseStore store) except -1:
+        cdef int64_t start, end, key
+        cdef double collapsed_count
+
+        if store.count == 0:
+            return 0
+        if self.count == 0:
+            return self.copy(store)
+
+        if store.min_key < self.min_key or store.max_key > self.max_key:
+            self._extend_range(store.min_key, store.max_key)
+
+        start = store.min_key - store.offset
+        end = min(self.min_key, store.max_key + 1) - store.offset
+        if end > start:
+            collapsed_count = 0.0
+            for key in range(start, end):
+                collapsed_count += store.bins[key]
+            self.bins[0] += collapsed_count
+        else:
+            end = start
+
+        for key in range(end + store.offset, store.max_key + 1):
+            self.bins[key - self.offset] += store.bins[key - store.offset]
+
+        self.count += store.count
+        return 0
+
+    cdef int64_t key_at_rank(self, double rank, bint lower):
+        cdef double running_count = 0.0
+        cdef int64_t i
+        for i in range(self.length):
+            running_count += self.bins[i]
+            if (lower and running_count > rank) or (not lower and running_count >= rank + 1):
+                return i + self.offset
+        return self.max_key
+
+
+cdef inline size_t _varint_size(uint64_t value):
+    cdef size_t size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+cdef inline char *_write_varint(char *buf, uint64_t value):
+    while value >= 0x80:
+        buf[0] = <char>((value & 0x7F) | 0x80)
+        value >>= 7
+        buf += 1
+    buf[0] = <char>value
+    return buf + 1
+
+
+cdef inline char *_write_double(char *buf, double value):
+    cdef uint64_t bits
+    cdef int i
+    memcpy(&bits, &value, sizeof(double))
+    for i in range(8):
+        buf[i] = <char>((bits >> (8 * i)) & 0xFF)
+    return buf + 8
+
+
+cdef inline uint32_t _zigzag32(int64_t value):
+    cdef int32_t n = <int32_t>value
+    return <uint32_t>((n << 1) ^ (n >> 31))
+
+
+cdef size_t _store_proto_size(_CollapsingLowestDenseStore store):
+    """Return the size of the ``Store`` protobuf message of the store."""
+    cdef size_t size = 0
+    if store.length:
+        # contiguousBinCounts (packed repeated double, field 2)
+        size += 1 + _varint_size(8 * store.length) + 8 * store.length
+    if store.offset:
+        # contiguousBinIndexOffset (sint32, field 3)
+        size += 1 + _varint_size(_zigzag32(store.offset))
+    return size
+
+
+cdef char *_write_store_proto(char *buf, char tag, _CollapsingLowestDenseStore store):
+    cdef int64_t i
+    buf[0] = tag
+    buf = _write_varint(buf + 1, _store_proto_size(store))
+    if store.length:
+        buf[0] = 0x12
+        buf = _write_varint(buf + 1, 8 * store.length)
+        for i in range(store.length):
+            buf = _write_double(buf, store.bins[i])
+    if store.offset:
+        buf[0] = 0x18
+        buf = _write_varint(buf + 1, _zigzag32(store.offset))
+    return buf
+
+
+cdef class LogCollapsingLowestDenseDDSketch(object):
+    """DDSketch with a logarithmic mapping whose lowest bins are collapsed
+    when the number of bins exceeds ``bin_limit``.
+    """
+
+    cdef readonly double relative_accuracy
+    cdef readonly double gamma
+    cdef double _multiplier
+    cdef double _min_possible
+    cdef _CollapsingLowestDenseStore _store
+    cdef _CollapsingLowestDenseStore _negative_store
+    cdef readonly double _zero_count
+    cdef readonly double _count
+    cdef readonly double _sum
+    cdef readonly double _min
+    cdef readonly double _max
+
+    def __init__(self, double relative_accuracy, int bin_limit):
+        cdef double gamma_mantissa
+
+        if relative_accuracy <= 0 or relative_accuracy >= 1:
+            raise ValueError("Relative accuracy must be between 0 and 1, got %r" % relative_accuracy)
+
+        gamma_mantissa = 2 * relative_accuracy / (1 - relative_accuracy)
+        self.relative_accuracy = relative_accuracy
+        self.gamma = 1 + gamma_mantissa
+        self._multiplier = 1 / log1p(gamma_mantissa) * log(2.0)
+        self._min_possible = DBL_MIN * self.gamma
+        self._store = _CollapsingLowestDenseStore(bin_limit)
+        self._negative_store = _CollapsingLowestDenseStore(bin_limit)
+        self._zero_count = 0.0
+        self._count = 0.0
+        self._sum = 0.0
+        self._min = float("+inf")
+        self._max = float("-inf")
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def avg(self):
+        return self._sum / self._count
+
+    cdef inline int64_t _key(self, double value):
+        return <int64_t>ceil(log(value) / log(2.0) * self._multiplier)
+
+    cdef inline double _value(self, int64_t key):
+        return pow(2.0, key / self._multiplier) * (2.0 / (1 + self.gamma))
+
+    cpdef add(self, double val, double weight=1.0):
+        """Add a value to the sketch."""
+        if weight <= 0.0:
+            raise ValueError("weight must be a positive float, got %r" % weight)
+
+        if val > self._min_possible:
+            self._store.add(self._key(val), weight)
+        elif val < -self._min_possible:
+            self._negative_store.add(self._key(-val), weight)
+        else:
+            self._zero_count += weight
+
+        self._count += weight
+        self._sum += val * weight
+        if val < self._min:
+            self._min = val
+        if val > self._max:
+            self._max = val
+
+    cpdef clear(self):
+        """Remove all the values of the sketch, to reuse it."""
+        self._store.clear()
+        self._negative_store.clear()
+        self._zero_count = 0.0
+        self._count = 0.0
+        self._sum = 0.0
+        self._min = float("+inf")
+        self._max = float("-inf")
+
+    cpdef merge(self, LogCollapsingLowestDenseDDSketch sketch):
+        """Merge the given sketch into this one."""
+        if sketch.gamma != self.gamma:
+            raise ValueError(
+                "Cannot merge two DDSketches with different parameters, got %r and %r" % (self.gamma, sketch.gamma)
+            )
+
+        if sketch._count == 0:
+            return
+
+        self._store.merge(sketch._store)
+        self._negative_store.merge(sketch._negative_store)
+        self._zero_count += sketch._zero_count
+        self._count += sketch._count
+        self._sum += sketch._sum
+        if sketch._min < self._min:
+            self._min = sketch._min
+        if sketch._max > self._max:
+            self._max = sketch._max
+
+    def get_quantile_value(self, double quantile):
+        """Return the approximate value at the specified quantile, or ``None``
+        if the sketch is empty.
+        """
+        cdef double rank
+        cdef int64_t key
+
+        if quantile < 0 or quantile > 1 or self._count == 0:
+            return None
+
+        rank = quantile * (self._count - 1)
+        if rank < self._negative_store.count:
+            key = self._negative_store.key_at_rank(self._negative_store.count - rank - 1, False)
+            return -self._value(key)
+        elif rank < self._zero_count + self._negative_store.count:
+            return 0
+        key = self._store.key_at_rank(rank - self._zero_count - self._negative_store.count, True)
+        return self._value(key)
+
+    cpdef bytes serialize(self):
+        """Serialize the sketch to a ``DDSketch`` protobuf message."""
+        cdef size_t positive_size = _store_proto_size(self._store)
+        cdef size_t negative_size = _store_proto_size(self._negative_store)
+        # mapping (field 1) only holds gamma, the offset and the interpolation
+        # have their default values.
+        cdef size_t size = (
+            11
+            + 1 + _varint_size(positive_size) + positive_size
+            + 1 + _varint_size(negative_size) + negative_size
+            + 9
+        )
+        cdef char *buf = <char *>malloc(size)
+        cdef char *end
+
+        if buf == NULL:
+            raise MemoryError()
+        try:
+            buf[0] = 0x0A
+            buf[1] = 9
+            buf[2] = 0x09
+            end = _write_double(buf + 3, self.gamma)
+            end = _write_store_proto(end, 0x12, self._store)
+            end = _write_store_proto(end, 0x1A, self._negative_store)
+            if self._zero_count:
+                end[0] = 0x21
+                end = _write_double(end + 1, self._zero_count)
+            return PyBytes_FromStringAndSize(buf, end - buf)
+        finally:
+            free(buf)
@@ -16,6 +16,10 @@ class BufferFull(Exception):
 class BufferItemTooLarge(Exception):
     pass
 
+class EncodedBuffer(object):
+    def __len__(self) -> int: ...
+    def tobytes(self) -> bytes: ...
+
 class BufferedEncoder(object):
     max_size: int
     max_item_size: int
@@ -23,6 +27,7 @@ class BufferedEncoder(object):
     def __len__(self) -> int: ...
     def put(self, item: Any) -> None: ...
     def encode(self) -> Optional[bytes]: ...
+    def encode_buffer(self) -> Optional[Union[bytes, EncodedBuffer]]: ...
     @property
     def size(self) -> int: ...
 
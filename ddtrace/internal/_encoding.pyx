@@ -1,6 +1,7 @@
 from cpython cimport *
 from cpython.bytearray cimport PyByteArray_CheckExact
 from libc cimport stdint
+from libc.string cimport memcpy
 from libc.string cimport strlen
 
 import threading
@@ -22,6 +23,9 @@ from ..constants import ORIGIN_KEY
 
 DEF MSGPACK_ARRAY_LENGTH_PREFIX_SIZE = 5
 DEF MSGPACK_STRING_TABLE_LENGTH_PREFIX_SIZE = 6
+DEF PACKER_INITIAL_BUFFER_SIZE = 1024 * 1024
+# Copies larger than this are done without holding the GIL
+DEF NOGIL_COPY_MIN_SIZE = 64 * 1024
 
 
 cdef extern from "Python.h":
@@ -154,6 +158,130 @@ cdef inline int pack_text(msgpack_packer *pk, object text) except? -1:
     raise TypeError("Unhandled text type: %r" % type(text))
 
 
+cdef inline void copy_memory(char *dst, const char *src, size_t n):
+    if n < NOGIL_COPY_MIN_SIZE:
+        memcpy(dst, src, n)
+    else:
+        # Let other threads (e.g. the ones putting traces in the encoder) run
+        # while large payloads are being copied.
+        with nogil:
+            memcpy(dst, src, n)
+
+
+cdef class _SpareBuffer(object):
+    """Keeps at most one packer buffer around once the payload that owned it
+    has been released, so that the next flush does not need to allocate (and
+    grow) a new buffer.
+    """
+    cdef char *buf
+    cdef size_t size
+
+    def __dealloc__(self):
+        PyMem_Free(self.buf)
+        self.buf = NULL
+
+    cdef void give(self, char *buf, size_t size):
+        if self.buf == NULL:
+            self.buf = buf
+            self.size = size
+        else:
+            PyMem_Free(buf)
+
+    cdef char * take(self, size_t min_size, size_t *size) except NULL:
+        cdef char *buf = self.buf
+
+        if buf != NULL and self.size >= min_size:
+            size[0] = self.size
+            self.buf = NULL
+            return buf
+
+        size[0] = max(<size_t> PACKER_INITIAL_BUFFER_SIZE, min_size)
+        buf = <char*> PyMem_Malloc(size[0])
+        if buf == NULL:
+            raise MemoryError("Unable to allocate internal buffer.")
+        return buf
+
+
+cdef class EncodedBuffer(object):
+    """Read-only view over an encoded payload.
+
+    The payload implements the buffer protocol, so it can be passed to
+    ``memoryview``, ``socket.sendall`` or as the body of an ``httplib``
+    request without being copied into a ``bytes`` object. The memory is
+    handed back to the encoder that produced it when the payload is garbage
+    collected.
+    """
+    cdef char *_buf
+    cdef size_t _buf_size
+    cdef Py_ssize_t _offset
+    cdef Py_ssize_t _length
+    cdef _SpareBuffer _spare
+
+    def __dealloc__(self):
+        if self._buf == NULL:
+            return
+        if self._spare is not None:
+            self._spare.give(self._buf, self._buf_size)
+        else:
+            PyMem_Free(self._buf)
+        self._buf = NULL
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, self._buf + self._offset, self._length, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+    def __len__(self):
+        return self._length
+
+    def tobytes(self):
+        """Return a copy of the payload as a bytes object."""
+        cdef object data = PyBytes_FromStringAndSize(NULL, self._length)
+        copy_memory(PyBytes_AS_STRING(data), self._buf + self._offset, self._length)
+        return data
+
+    cdef int extend(self, EncodedBuffer other) except -1:
+        """Append the content of another payload to this one."""
+        cdef size_t end = self._offset + self._length
+        cdef size_t size = end + other._length
+        cdef char *buf
+
+        if size > self._buf_size:
+            buf = <char*> PyMem_Realloc(self._buf, size)
+            if buf == NULL:
+                raise MemoryError("Unable to grow payload buffer.")
+            self._buf = buf
+            self._buf_size = size
+
+        copy_memory(self._buf + end, other._buf + other._offset, other._length)
+        self._length += other._length
+        return 0
+
+
+cdef EncodedBuffer detach_buffer(msgpack_packer *pk, _SpareBuffer spare, size_t offset, size_t keep):
+    """Hand the buffer of the packer over to a new EncodedBuffer and give the
+    packer a spare one. The first ``keep`` bytes are copied over to the new
+    buffer.
+    """
+    cdef size_t size
+    cdef char *buf = spare.take(keep, &size)
+    cdef EncodedBuffer payload = EncodedBuffer.__new__(EncodedBuffer)
+
+    if keep:
+        memcpy(buf, pk.buf, keep)
+
+    payload._buf = pk.buf
+    payload._buf_size = pk.buf_size
+    payload._offset = offset
+    payload._length = pk.length - offset
+    payload._spare = spare
+
+    pk.buf = buf
+    pk.buf_size = size
+    return payload
+
+
 cdef class StringTable(object):
     cdef dict _table
     cdef stdint.uint32_t _next_id
@@ -169,15 +297,16 @@ cdef class StringTable(object):
     cdef stdint.uint32_t _index(self, object string) except? -1:
         cdef stdint.uint32_t _id
         cdef int ret
+        cdef PyObject *found
 
         if string is None:
             return 0
 
-        ret = PyDict_Contains(self._table, string)
-        if ret == -1:
-            return ret
-        if ret:
-            return PyLong_AsLong(<object>PyDict_GetItem(self._table, string))
+        # DEV: Span tag keys repeat across spans, so most strings are already
+        # in the table. Look them up once, reusing the hash cached on the string.
+        found = PyDict_GetItem(self._table, string)
+        if found is not NULL:
+            return PyLong_AsLong(<object>found)
 
         _id = self._next_id
         ret = PyDict_SetItem(self._table, string, PyLong_FromLong(_id))
@@ -225,8 +354,10 @@ cdef class MsgpackStringTable(StringTable):
     cdef stdint.uint32_t _sp_id
     cdef object _lock
     cdef size_t _reset_size
+    cdef _SpareBuffer _spare
 
     def __init__(self, max_size):
+        self._spare = _SpareBuffer()
         self.pk.buf_size = min(max_size, 1 << 20)
         self.pk.buf = <char*> PyMem_Malloc(self.pk.buf_size)
         if self.pk.buf == NULL:
@@ -273,7 +404,10 @@ cdef class MsgpackStringTable(StringTable):
             self.pk.length = self._sp_len
             self._next_id = self._sp_id
 
-    cdef get_bytes(self):
+    cdef int _update_prefix(self):
+        """Update the table size and root array size prefixes and return the
+        offset of the payload in the buffer, or -1 on error.
+        """
         cdef int ret
         cdef stdint.uint32_t table_size = self._next_id
         cdef int offset = MSGPACK_STRING_TABLE_LENGTH_PREFIX_SIZE - array_prefix_size(table_size)
@@ -284,16 +418,33 @@ cdef class MsgpackStringTable(StringTable):
             self.pk.length = offset
             ret = msgpack_pack_array(&self.pk, table_size)
             if ret:
-                return None
+                self.pk.length = old_pos
+                return -1
             # Add root array size prefix
             self.pk.length = offset = offset - 1
             ret = msgpack_pack_array(&self.pk, 2)
-            if ret:
-                return None
             self.pk.length = old_pos
+            if ret:
+                return -1
+
+        return offset
+
+    cdef get_bytes(self):
+        cdef int offset = self._update_prefix()
+        if offset < 0:
+            return None
 
         return PyBytes_FromStringAndSize(self.pk.buf + offset, self.pk.length - offset)
 
+    cdef get_buffer(self):
+        cdef int offset = self._update_prefix()
+        if offset < 0:
+            return None
+
+        # The reset state of the table (i.e. the prefixes and the strings
+        # that are always present) is carried over to the new buffer.
+        return detach_buffer(&self.pk, self._spare, offset, self._reset_size)
+
     @property
     def size(self):
         with self._lock:
@@ -328,6 +479,13 @@ cdef class MsgpackStringTable(StringTable):
             finally:
                 self.reset()
 
+    cpdef flush_buffer(self):
+        with self._lock:
+            try:
+                return self.get_buffer()
+            finally:
+                self.reset()
+
 
 cdef class BufferedEncoder(object):
     content_type: str = None
@@ -349,6 +507,12 @@ cdef class BufferedEncoder(object):
     def encode(self):
         raise NotImplementedError()
 
+    def encode_buffer(self):
+        """Like ``encode`` but the result is only guaranteed to implement the
+        buffer protocol, which allows encoders to avoid copying the payload.
+        """
+        return self.encode()
+
 
 cdef class ListBufferedEncoder(BufferedEncoder):
     cdef list _buffer
@@ -401,9 +565,11 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
 
     cdef msgpack_packer pk
     cdef stdint.uint32_t _count
+    cdef _SpareBuffer _spare
 
     def __cinit__(self, size_t max_size, size_t max_item_size):
-        cdef int buf_size = 1024*1024
+        cdef int buf_size = PACKER_INITIAL_BUFFER_SIZE
+        self._spare = _SpareBuffer()
         self.pk.buf = <char*> PyMem_Malloc(buf_size)
         if self.pk.buf == NULL:
             raise MemoryError("Unable to allocate internal buffer.")
@@ -432,11 +598,27 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
         self.pk.length = MSGPACK_ARRAY_LENGTH_PREFIX_SIZE  # Leave room for array length prefix
 
     cpdef encode(self):
+        cdef EncodedBuffer payload = self.encode_buffer()
+
+        if payload is None:
+            return None
+
+        # DEV: The payload is no longer referenced by the encoder, so it can
+        # be copied without blocking any concurrent put.
+        return payload.tobytes()
+
+    cpdef encode_buffer(self):
+        cdef object buffers
+
         with self._lock:
             if not self._count:
                 return None
 
-            return self.flush()
+            buffers = self._detach_buffers()
+
+        # DEV: The encoder buffers have been swapped with fresh ones, so the
+        # payload can be assembled without blocking any concurrent put.
+        return self._join_buffers(buffers)
 
     cdef inline int _update_array_len(self):
         """Update traces array size prefix"""
@@ -530,6 +712,20 @@ cdef class MsgpackEncoderBase(BufferedEncoder):
     cpdef flush(self):
         raise NotImplementedError()
 
+    cpdef flush_buffer(self):
+        raise NotImplementedError()
+
+    cdef object _detach_buffers(self):
+        """Swap the buffers of the encoder with fresh ones and return them.
+
+        The caller is responsible for holding the lock of the encoder.
+        """
+        raise NotImplementedError()
+
+    cpdef object _join_buffers(self, object buffers):
+        """Return the payload made of the buffers detached from the encoder."""
+        return buffers
+
     cdef int pack_span(self, object span, void *dd_origin) except? -1:
         raise NotImplementedError()
 
@@ -542,6 +738,16 @@ cdef class MsgpackEncoderV03(MsgpackEncoderBase):
             finally:
                 self._reset_buffer()
 
+    cpdef flush_buffer(self):
+        with self._lock:
+            return self._detach_buffers()
+
+    cdef object _detach_buffers(self):
+        try:
+            return detach_buffer(&self.pk, self._spare, self._update_array_len(), 0)
+        finally:
+            self._reset_buffer()
+
     cdef void * get_dd_origin_ref(self, str dd_origin):
         return string_to_buff(dd_origin)
 
@@ -726,6 +932,36 @@ cdef class MsgpackEncoderV05(MsgpackEncoderBase):
             finally:
                 self._reset_buffer()
 
+    cpdef flush_buffer(self):
+        cdef object buffers
+
+        with self._lock:
+            buffers = self._detach_buffers()
+
+        return self._join_buffers(buffers)
+
+    cdef object _detach_buffers(self):
+        cdef EncodedBuffer traces
+
+        try:
+            traces = detach_buffer(&self.pk, self._spare, self._update_array_len(), 0)
+            return self._st.flush_buffer(), traces
+        finally:
+            self._reset_buffer()
+
+    cpdef object _join_buffers(self, object buffers):
+        cdef EncodedBuffer payload
+        cdef EncodedBuffer traces
+
+        payload, traces = buffers
+        if payload is None:
+            return None
+
+        # DEV: Both the string table and the traces buffers have been swapped
+        # with fresh ones, so they can be concatenated without holding the lock.
+        payload.extend(traces)
+        return payload
+
     @property
     def size(self):
         """Return the size in bytes of the encoder buffer."""
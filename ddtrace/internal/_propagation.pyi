@@ -0,0 +1,13 @@
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+class HeaderExtractor(object):
+    def __init__(self, header_names: Dict[str, str]) -> None: ...
+    def extract(self, headers: Mapping[str, str]) -> Dict[str, str]: ...
+
+def parse_traceparent(tp: Text) -> Optional[Tuple[str, int, int, int, Optional[str]]]: ...
+def parse_tracestate(ts: Text) -> Tuple[Optional[str], Optional[str]]: ...
+def decode_tracestate_dd(dd: Text) -> Tuple[Optional[int], Dict[str, str], Optional[str]]: ...
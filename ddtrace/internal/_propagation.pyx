@@ -0,0 +1,205 @@
+"""Parsing of the HTTP headers used for the distributed tracing context propagation.
+
+These functions are the hot path of ``ddtrace.propagation.http.HTTPPropagator.extract``.
+"""
+from libc.stdint cimport uint64_t
+from libc.string cimport memset
+
+from .compat import ensure_text
+
+
+IF PY_MAJOR_VERSION >= 3:
+    cdef extern from "Python.h":
+        bint PyUnicode_IS_ASCII(object o)
+        void *PyUnicode_DATA(object o)
+        Py_ssize_t PyUnicode_GET_LENGTH(object o)
+
+
+DEF MAX_HEADER_NAME_LENGTH = 63
+
+
+cdef inline int _char_bit(unsigned char c):
+    """Return the bit of a character of a header name in a 64 bits mask."""
+    if c'A' <= c <= c'Z':
+        c += 32
+    if c'a' <= c <= c'z':
+        return c - 97
+    if c'0' <= c <= c'9':
+        return c - 22
+    if c == c'-':
+        return 36
+    if c == c'_':
+        return 37
+    return -1
+
+
+cdef class HeaderExtractor(object):
+    """Extract the propagation headers from the headers of a request.
+
+    ``header_names`` maps every lowercase name a propagation header can have,
+    e.g. its WSGI name, to its name. Most of the headers of a request are not
+    propagation headers: they are skipped without being lowercased when their
+    length, first and last characters do not match any of these names.
+    """
+
+    cdef dict _header_names
+    cdef uint64_t _first_chars[MAX_HEADER_NAME_LENGTH + 1]
+    cdef uint64_t _last_chars[MAX_HEADER_NAME_LENGTH + 1]
+
+    def __cinit__(self, dict header_names):
+        cdef Py_ssize_t length
+        self._header_names = header_names
+        memset(self._first_chars, 0, sizeof(self._first_chars))
+        memset(self._last_chars, 0, sizeof(self._last_chars))
+        for name in header_names:
+            length = len(name)
+            if not 0 < length <= MAX_HEADER_NAME_LENGTH:
+                raise ValueError("Invalid header name: %r" % name)
+            self._first_chars[length] |= (<uint64_t>1) << _char_bit(ord(name[0]))
+            self._last_chars[length] |= (<uint64_t>1) << _char_bit(ord(name[length - 1]))
+
+    cdef bint _may_match(self, name):
+        cdef Py_ssize_t length
+        cdef unsigned char *data
+        cdef int bit
+        IF PY_MAJOR_VERSION >= 3:
+            if type(name) is unicode and PyUnicode_IS_ASCII(name):
+                length = PyUnicode_GET_LENGTH(name)
+                if not 0 < length <= MAX_HEADER_NAME_LENGTH:
+                    return False
+                data = <unsigned char *>PyUnicode_DATA(name)
+                bit = _char_bit(data[0])
+                if bit < 0 or not self._first_chars[length] & ((<uint64_t>1) << bit):
+                    return False
+                bit = _char_bit(data[length - 1])
+                return bit >= 0 and self._last_chars[length] & ((<uint64_t>1) << bit)
+        return True
+
+    def extract(self, headers):
+        """Return the propagation headers found in ``headers`` by their names.
+
+        The value of a header sent with its name takes precedence over the
+        values of the header sent with any other name, e.g. in uppercase.
+        """
+        cdef dict extracted = {}
+        cdef set exact = set()
+        for name, value in headers.items():
+            if not self._may_match(name):
+                continue
+            # Names are most often sent as is
+            header = self._header_names.get(name)
+            if header is not None and name == header:
+                exact.add(header)
+                extracted[header] = value
+                continue
+            header = self._header_names.get(name.lower())
+            if header is not None and header not in exact:
+                extracted[header] = value
+        return extracted
+
+
+cdef inline int _hex_digit(Py_UCS4 c):
+    if u"0" <= c <= u"9":
+        return <int>c - 48
+    if u"a" <= c <= u"f":
+        return <int>c - 87
+    return -1
+
+
+cdef bint _parse_hex(unicode s, Py_ssize_t start, Py_ssize_t end, uint64_t *value):
+    cdef uint64_t v = 0
+    cdef int digit
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        digit = _hex_digit(s[i])
+        if digit < 0:
+            return False
+        v = (v << 4) | digit
+    value[0] = v
+    return True
+
+
+def parse_traceparent(tp):
+    """Parse a ``traceparent`` header value.
+
+    Return the version, trace id, span id, trace flags and any additional
+    values of the traceparent, or ``None`` if it is malformed.
+    """
+    cdef unicode s = ensure_text(tp)
+    cdef Py_ssize_t length = len(s)
+    cdef uint64_t version, trace_id_high, trace_id_low, span_id, trace_flags
+
+    # 2 hex version, 32 hex trace id, 16 hex span id and 2 hex trace flags
+    # delimited by dashes
+    if length < 55 or s[2] != u"-" or s[35] != u"-" or s[52] != u"-":
+        return None
+    if not (
+        _parse_hex(s, 0, 2, &version)
+        and _parse_hex(s, 3, 19, &trace_id_high)
+        and _parse_hex(s, 19, 35, &trace_id_low)
+        and _parse_hex(s, 36, 52, &span_id)
+        and _parse_hex(s, 53, 55, &trace_flags)
+    ):
+        return None
+
+    future_values = None
+    if length > 55:
+        # Future versions can add values, delimited by a dash
+        if length == 56 or s[55] != u"-" or u"\n" in s[56:]:
+            return None
+        future_values = s[55:]
+
+    return s[0:2], (<object>trace_id_high << 64) | trace_id_low, span_id, trace_flags, future_values
+
+
+def parse_tracestate(ts):
+    """Parse a ``tracestate`` header value.
+
+    Return the value with the whitespaces around its list members trimmed and
+    the value of its ``dd`` list member, or ``None`` for the value if it
+    contains characters outside of the printable ASCII range.
+    """
+    cdef unicode s = ensure_text(ts)
+    cdef list members = [member.strip() for member in s.split(u",")]
+    cdef unicode normalized = u",".join(members)
+    cdef Py_UCS4 c
+
+    for c in normalized:
+        if <int>c < 0x20 or <int>c > 0x7E:
+            return None, None
+
+    dd = None
+    for member in members:
+        if member.startswith(u"dd="):
+            dd = member[3:]
+    return normalized, dd
+
+
+def decode_tracestate_dd(dd):
+    """Decode the value of the ``dd`` list member of a ``tracestate`` header.
+
+    Return the sampling priority, the propagated tags and the origin. A
+    ``ValueError`` is raised if the value is malformed.
+    """
+    sampling_priority = None
+    origin = None
+    cdef dict tags = {}
+
+    for item in dd.split(u";"):
+        # Values can contain colons
+        key, sep, value = item.partition(u":")
+        if not sep:
+            raise ValueError("Invalid tracestate dd list member item: %r" % item)
+        if key == u"s":
+            sampling_priority = value
+        elif key == u"o":
+            origin = value
+        elif key.startswith(u"t."):
+            # "=" is encoded as "~" in the tracestate
+            tags[u"_dd.p." + key[2:]] = value.replace(u"~", u"=")
+
+    if sampling_priority is not None:
+        sampling_priority = int(sampling_priority)
+    if origin:
+        origin = origin.replace(u"~", u"=")
+    return sampling_priority, tags, origin
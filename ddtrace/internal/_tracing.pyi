@@ -0,0 +1,16 @@
+from typing import Optional
+
+from ddtrace import Tracer
+from ddtrace.span import Span
+
+def start_child_span(
+    tracer: Tracer,
+    parent: Span,
+    name: str,
+    service: Optional[str],
+    resource: Optional[str],
+    span_type: Optional[str],
+    activate: bool,
+    span_api: str,
+) -> Optional[Span]: ...
+def on_span_finish(tracer: Tracer, span: Span) -> None: ...
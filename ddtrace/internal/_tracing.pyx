@@ -0,0 +1,119 @@
+"""Compiled versions of the hot paths of the tracer.
+
+These functions mirror the Python implementation in ``ddtrace.tracer`` and
+must be kept in sync with it.
+"""
+import logging
+
+# DEV: Use relative imports, see the comment about the shadowing of
+# ``ddtrace.constants`` in ``_encoding.pyx``.
+from .. import config
+from ..constants import ENV_KEY
+from ..constants import VERSION_KEY
+from .constants import SAMPLING_DECISION_TRACE_TAG_KEY
+from .logger import get_logger
+from .processor import SpanProcessor
+from .utils import _get_metas_to_propagate
+
+
+log = get_logger("ddtrace.tracer")
+
+cdef int DEBUG = logging.DEBUG
+
+
+def start_child_span(tracer, parent, name, service, resource, span_type, bint activate, span_api):
+    """Start a span that is a local child of the ``parent`` span.
+
+    This is the common case of ``Tracer._start_span``. ``None`` is returned,
+    and the span must be started by ``Tracer._start_span``, when functions
+    are registered with ``Tracer.on_start_span`` or span processors are
+    registered with ``SpanProcessor.register``.
+    """
+    if SpanProcessor.__processors__ or tracer._hooks._hooks.get(type(tracer).start_span):
+        return None
+
+    context = parent.context
+    trace_id = context.trace_id
+    if not trace_id:
+        return None
+
+    if service is None:
+        service = parent.service
+    service = config.service_mapping.get(service, service)
+
+    span = tracer._new_span(
+        name=name,
+        context=context,
+        trace_id=trace_id,
+        parent_id=context.span_id,
+        service=service,
+        resource=resource,
+        span_type=span_type,
+        span_api=span_api,
+        on_finish=[tracer._on_span_finish],
+    )
+    span.sampled = parent.sampled
+    span._parent = parent
+    local_root = parent._local_root
+    span._local_root = span if local_root is None else local_root
+
+    if context._meta:
+        meta = span._meta
+        for k, v in _get_metas_to_propagate(context):
+            if k != SAMPLING_DECISION_TRACE_TAG_KEY:
+                meta[k] = v
+
+    tags = tracer._tags
+    if tags:
+        span.set_tags(tags)
+
+    if config.env:
+        span.set_tag_str(ENV_KEY, config.env)
+
+    if config.version:
+        root_span = tracer.current_root_span()
+        if (root_span is None and service == config.service) or (
+            root_span and root_span.service == service and root_span.get_tag(VERSION_KEY) is not None
+        ):
+            span.set_tag_str(VERSION_KEY, config.version)
+
+    if activate:
+        tracer.context_provider.activate(span)
+
+    services = tracer._services
+    if service and service not in services and tracer._is_span_internal(span):
+        services.add(service)
+
+    if tracer.enabled:
+        for p in tracer._span_processors:
+            p.on_span_start(span)
+        for p in tracer._deferred_processors:
+            p.on_span_start(span)
+
+    return span
+
+
+def on_span_finish(tracer, span):
+    """Run the span processors on a span that has finished."""
+    cdef bint enabled = tracer.enabled
+    parent = span._parent
+
+    # DEV: Getting the current span also moves the active span of the context
+    # provider away from the finished span, so it must always be done.
+    active = tracer.current_span()
+    # Debug check: if the finishing span has a parent and its parent
+    # is not the next active span then this is an error in synchronous tracing.
+    if parent is not None and active is not parent:
+        log.debug("span %r closing after its parent %r, this is an error when not using async", span, parent)
+
+    # Only call span processors if the tracer is enabled
+    if enabled:
+        for p in tracer._span_processors:
+            p.on_span_finish(span)
+        for p in SpanProcessor.__processors__:
+            p.on_span_finish(span)
+        for p in tracer._deferred_processors:
+            p.on_span_finish(span)
+
+    if log.isEnabledFor(DEBUG):
+        log.debug("finishing span %s (enabled:%s)", span._pprint(), enabled)
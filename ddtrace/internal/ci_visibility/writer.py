@@ -90,6 +90,10 @@ class CIVisibilityWriter(HTTPWriter):
         use_evp=False,  # type: bool
         coverage_enabled=False,  # type: bool
         itr_suite_skipping_mode=False,  # type: bool
+        compression=None,  # type: Optional[str]
+        compression_level=None,  # type: Optional[int]
+        spool_dir=None,  # type: Optional[str]
+        spool_max_bytes=None,  # type: Optional[int]
     ):
         if processing_interval is None:
             processing_interval = config._trace_writer_interval_seconds
@@ -132,6 +136,10 @@ class CIVisibilityWriter(HTTPWriter):
             sync_mode=sync_mode,
             reuse_connections=reuse_connections,
             headers=headers,
+            compression=compression,
+            compression_level=compression_level,
+            spool_dir=spool_dir,
+            spool_max_bytes=spool_max_bytes,
         )
 
     def stop(self, timeout=None):
@@ -0,0 +1,82 @@
+import functools
+import typing
+import zlib
+
+from ddtrace.internal.logger import get_logger
+
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+log = get_logger(__name__)
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+# A window size of 16 + MAX_WBITS makes zlib write a gzip header and trailer.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def gzip_compress(payload, level=DEFAULT_GZIP_LEVEL):
+    # type: (typing.Any, int) -> bytes
+    """Compress a bytes-like object into a gzip member.
+
+    The payload is streamed into the compressor without copying it first, so
+    this also accepts buffers such as the ones returned by the msgpack
+    encoders.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(payload) + compressor.flush()
+
+
+def zstd_compress(payload, level=DEFAULT_ZSTD_LEVEL):
+    # type: (typing.Any, int) -> bytes
+    """Compress a bytes-like object into a zstd frame.
+
+    Requires the ``zstandard`` package.
+    """
+    if zstandard is None:
+        raise RuntimeError("the zstandard package is required for zstd compression")
+    return zstandard.ZstdCompressor(level=level).compress(payload)
+
+
+_COMPRESSORS = {
+    GZIP: gzip_compress,
+    ZSTD: zstd_compress,
+}  # type: typing.Dict[str, typing.Callable[..., bytes]]
+
+
+def get_compressor(encoding, level=None):
+    # type: (typing.Optional[str], typing.Optional[int]) -> typing.Optional[typing.Callable[[typing.Any], bytes]]
+    """Return the function that compresses payloads with the given content encoding.
+
+    Returns ``None`` if no encoding is given, or if the encoding is not
+    supported in this environment, in which case payloads should be sent
+    uncompressed.
+    """
+    if not encoding or encoding == "none":
+        return None
+
+    try:
+        compress = _COMPRESSORS[encoding]
+    except KeyError:
+        log.warning(
+            "unsupported compression %r, sending payloads uncompressed. The supported compressions are: %s",
+            encoding,
+            ", ".join(sorted(_COMPRESSORS)),
+        )
+        return None
+
+    if compress is zstd_compress and zstandard is None:
+        log.warning("zstd compression requires the zstandard package, sending payloads uncompressed")
+        return None
+
+    if level is None:
+        return compress
+    return functools.partial(compress, level=level)
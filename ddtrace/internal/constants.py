@@ -35,6 +35,33 @@ DEFAULT_BUFFER_SIZE = 8 << 20  # 8 MB
 DEFAULT_MAX_PAYLOAD_SIZE = 8 << 20  # 8 MB
 DEFAULT_PROCESSING_INTERVAL = 1.0
 DEFAULT_REUSE_CONNECTIONS = False
+DEFAULT_ASYNC_ENCODING_QUEUE_SIZE = 10000
+DEFAULT_SPOOL_MAX_BYTES = 64 << 20  # 64 MB
+DEFAULT_SPOOL_REPLAY_RATE = 1 << 20  # 1 MB/s
+DEFAULT_STATS_MAX_AGGREGATION_KEYS = 2000
+DEFAULT_DATA_STREAMS_MAX_PATHWAYS = 2000
+# The tags identifying the peer called by client, producer and consumer spans,
+# as used by the Datadog Agent to compute stats
+DEFAULT_STATS_PEER_TAGS = (
+    "_dd.base_service",
+    "peer.service",
+    "peer.hostname",
+    "out.host",
+    "db.instance",
+    "db.name",
+    "db.system",
+    "network.destination.name",
+    "server.address",
+    "messaging.destination",
+    "messaging.kafka.bootstrap.servers",
+    "rpc.service",
+    "aws.queue.name",
+    "bucketname",
+    "queuename",
+    "streamname",
+    "tablename",
+    "topicname",
+)
 BLOCKED_RESPONSE_HTML = """
 <!DOCTYPE html><html lang="en"><head> <meta charset="UTF-8"> <meta name="viewport"
 content="width=device-width,initial-scale=1"> <title>You've been blocked</title>
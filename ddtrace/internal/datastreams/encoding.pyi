@@ -0,0 +1,8 @@
+from typing import Tuple
+
+MAX_VAR_LEN_64: int
+
+def encode_var_int_64(v: int) -> bytes: ...
+def decode_var_int_64(b: bytes) -> Tuple[int, bytes]: ...
+def encode_var_uint_64(v: int) -> bytes: ...
+def decode_var_uint_64(b: bytes) -> Tuple[int, bytes]: ...
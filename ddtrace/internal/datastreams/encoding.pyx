@@ -0,0 +1,53 @@
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+
+
+MAX_VAR_LEN_64 = 9
+
+DEF _MAX_VAR_LEN_64 = 9
+
+
+def encode_var_int_64(int64_t v):
+    # type: (int) -> bytes
+    # Zigzag encoding of the signed value
+    return encode_var_uint_64(((<uint64_t>v) << 1) ^ <uint64_t>(v >> 63))
+
+
+def decode_var_int_64(bytes b not None):
+    # type: (bytes) -> Tuple[int, bytes]
+    cdef uint64_t v
+    v, b = decode_var_uint_64(b)
+    return <int64_t>(v >> 1) ^ -<int64_t>(v & 1), b
+
+
+def encode_var_uint_64(uint64_t v):
+    # type: (int) -> bytes
+    cdef unsigned char buf[_MAX_VAR_LEN_64 + 1]
+    cdef Py_ssize_t n = 0
+    for _ in range(_MAX_VAR_LEN_64):
+        if v < 0x80:
+            break
+        buf[n] = (v & 0xFF) | 0x80
+        n += 1
+        v >>= 7
+    buf[n] = v & 0xFF
+    return (<char *>buf)[: n + 1]
+
+
+def decode_var_uint_64(bytes b not None):
+    # type: (bytes) -> Tuple[int, bytes]
+    cdef const unsigned char *data = b
+    cdef Py_ssize_t size = len(b)
+    cdef uint64_t x = 0
+    cdef uint64_t n
+    cdef int s = 0
+    cdef Py_ssize_t i
+    for i in range(_MAX_VAR_LEN_64):
+        if size <= i:
+            raise EOFError()
+        n = data[i]
+        if n < 0x80 or i == _MAX_VAR_LEN_64 - 1:
+            return x | n << s, b[i + 1 :]
+        x |= (n & 0x7F) << s
+        s += 7
+    raise EOFError
@@ -0,0 +1,5 @@
+FNV_64_PRIME: int
+FNV1_64_INIT: int
+
+def fnv1_64(data: bytes) -> int: ...
+def fnv1_64_uint64_pair(first: int, second: int) -> int: ...
@@ -0,0 +1,45 @@
+"""
+Implementation of Fowler/Noll/Vo hash algorithm.
+See http://isthe.com/chongo/tech/comp/fnv/
+"""
+from libc.stdint cimport uint64_t
+
+
+FNV_64_PRIME = 0x100000001B3
+FNV1_64_INIT = 0xCBF29CE484222325
+
+cdef uint64_t _FNV_64_PRIME = 0x100000001B3ULL
+cdef uint64_t _FNV1_64_INIT = 0xCBF29CE484222325ULL
+
+
+cdef inline uint64_t _fnv1_64_bytes(uint64_t hval, const unsigned char *data, Py_ssize_t size):
+    cdef Py_ssize_t i
+    for i in range(size):
+        # Multiplications are modulo 2 ** 64
+        hval = (hval * _FNV_64_PRIME) ^ data[i]
+    return hval
+
+
+cdef inline uint64_t _fnv1_64_uint64(uint64_t hval, uint64_t value):
+    cdef int i
+    # Hash the little endian bytes of the value
+    for i in range(8):
+        hval = (hval * _FNV_64_PRIME) ^ ((value >> (8 * i)) & 0xFF)
+    return hval
+
+
+def fnv1_64(bytes data not None):
+    # type: (bytes) -> int
+    """
+    Returns the 64 bit FNV-1 hash value for the given data.
+    """
+    return _fnv1_64_bytes(_FNV1_64_INIT, data, len(data))
+
+
+def fnv1_64_uint64_pair(uint64_t first, uint64_t second):
+    # type: (int, int) -> int
+    """
+    Returns the 64 bit FNV-1 hash value for the given integers, packed as little
+    endian unsigned 64 bit integers.
+    """
+    return _fnv1_64_uint64(_fnv1_64_uint64(_FNV1_64_INIT, first), second)
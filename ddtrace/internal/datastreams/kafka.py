@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from ddtrace import config
 from ddtrace.internal import core
 from ddtrace.internal.datastreams.processor import PROPAGATION_KEY
@@ -25,6 +27,27 @@ def dsm_kafka_message_consume(instance, message):
     ctx.set_checkpoint(["direction:in", "group:" + group, "topic:" + topic, "type:kafka"])
 
 
+def dsm_kafka_messages_consume(instance, messages):
+    from . import data_streams_processor as processor
+
+    group = instance._group_id
+
+    # Set the checkpoints of the messages of each topic in a single batch
+    pathways_by_topic = defaultdict(list)
+    for message in messages:
+        if message.error() is not None:
+            continue
+        pathway = None
+        for key, value in message.headers() or []:
+            if key == PROPAGATION_KEY:
+                pathway = value
+        pathways_by_topic[message.topic()].append(pathway)
+
+    for topic, pathways in pathways_by_topic.items():
+        processor().set_checkpoints(pathways, ["direction:in", "group:" + group, "topic:" + topic, "type:kafka"])
+
+
 if config._data_streams_enabled:
     core.on("kafka.produce.start", dsm_kafka_message_produce)
     core.on("kafka.consume.start", dsm_kafka_message_consume)
+    core.on("kafka.consume_messages.start", dsm_kafka_messages_consume)
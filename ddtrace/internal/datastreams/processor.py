@@ -1,7 +1,6 @@
 # coding: utf-8
 import base64
 from collections import defaultdict
-import gzip
 import os
 import struct
 import threading
@@ -9,47 +8,34 @@ import time
 import typing
 from typing import DefaultDict
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
-from ddsketch import LogCollapsingLowestDenseDDSketch
-from ddsketch.pb.proto import DDSketchProto
 import six
 
 import ddtrace
 from ddtrace import config
 from ddtrace.internal.utils.retry import fibonacci_backoff_with_jitter
 
+from .._ddsketch import LogCollapsingLowestDenseDDSketch
 from .._encoding import packb
-from ..agent import get_connection
 from ..compat import get_connection_response
+from ..compression import gzip_compress
 from ..forksafe import Lock
 from ..hostname import get_hostname
 from ..logger import get_logger
 from ..periodic import PeriodicService
+from ..utils.cache import cached
+from ..utils.http import connection_pool
 from ..writer import _human_size
 from .encoding import decode_var_int_64
 from .encoding import encode_var_int_64
 from .fnv import fnv1_64
-
-
-if six.PY3:
-
-    def gzip_compress(payload):
-        return gzip.compress(payload, 1)
-
-
-else:
-    import StringIO
-
-    def gzip_compress(payload):
-        compressed_data = StringIO.StringIO()
-        gzipper = gzip.GzipFile(fileobj=compressed_data, mode="wb", compresslevel=1)
-        gzipper.write(payload)
-        gzipper.close()
-        return compressed_data.getvalue()
+from .fnv import fnv1_64_uint64_pair
 
 
 """
@@ -79,6 +65,23 @@ PathwayAggrKey = typing.Tuple[
 ]
 
 
+@cached()
+def _compute_node_hash(node):
+    # type: (typing.Tuple[str, ...]) -> int
+    """Return the hash of a node of a pathway, given by its service, env and edge tags."""
+    return fnv1_64(b"".join(six.ensure_binary(s, encoding="utf-8") for s in node))
+
+
+def _decode_pathway(data):
+    # type: (bytes) -> Tuple[int, float, float]
+    """Return the hash, the start time and the current edge start time of an encoded pathway."""
+    hash_value = struct.unpack("<Q", data[:8])[0]
+    data = data[8:]
+    pathway_start_ms, data = decode_var_int_64(data)
+    current_edge_start_ms, data = decode_var_int_64(data)
+    return hash_value, float(pathway_start_ms) / 1e3, float(current_edge_start_ms) / 1e3
+
+
 class PathwayStats(object):
     """Aggregated pathway statistics."""
 
@@ -88,17 +91,36 @@ class PathwayStats(object):
         self.full_pathway_latency = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
         self.edge_latency = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
 
+    def clear(self):
+        # type: () -> None
+        self.full_pathway_latency.clear()
+        self.edge_latency.clear()
+
 
 PartitionKey = NamedTuple("PartitionKey", [("topic", str), ("partition", int)])
 ConsumerPartitionKey = NamedTuple("ConsumerPartitionKey", [("group", str), ("topic", str), ("partition", int)])
-Bucket = NamedTuple(
-    "Bucket",
-    [
-        ("pathway_stats", DefaultDict[PathwayAggrKey, PathwayStats]),
-        ("latest_produce_offsets", DefaultDict[PartitionKey, int]),
-        ("latest_commit_offsets", DefaultDict[ConsumerPartitionKey, int]),
-    ],
-)
+
+
+class Bucket(object):
+    """Pathway statistics and Kafka offsets of a time bucket."""
+
+    __slots__ = ("pathway_stats", "latest_produce_offsets", "latest_commit_offsets")
+
+    def __init__(self):
+        # type: () -> None
+        self.pathway_stats = {}  # type: Dict[PathwayAggrKey, PathwayStats]
+        self.latest_produce_offsets = {}  # type: Dict[PartitionKey, int]
+        self.latest_commit_offsets = {}  # type: Dict[ConsumerPartitionKey, int]
+
+    def clear(self):
+        # type: () -> None
+        self.pathway_stats.clear()
+        self.latest_produce_offsets.clear()
+        self.latest_commit_offsets.clear()
+
+
+# The number of flushed buckets kept to be reused
+_MAX_FREE_BUCKETS = 2
 
 
 class DataStreamsProcessor(PeriodicService):
@@ -115,9 +137,16 @@ class DataStreamsProcessor(PeriodicService):
         self._timeout = timeout
         # Have the bucket size match the interval in which flushes occur.
         self._bucket_size_ns = int(interval * 1e9)  # type: int
-        self._buckets = defaultdict(
-            lambda: Bucket(defaultdict(PathwayStats), defaultdict(int), defaultdict(int))
-        )  # type: DefaultDict[int, Bucket]
+        self._buckets = {}  # type: Dict[int, Bucket]
+        # The number of pathways and of Kafka partitions of a bucket is capped
+        # to bound its memory. The checkpoints of the pathways and the offsets
+        # of the partitions that do not fit are dropped and counted.
+        self._max_pathways = config._data_streams_max_pathways
+        self._overflow_checkpoints = 0
+        self._overflow_offsets = 0
+        # The buckets and the pathway statistics are reused after a flush
+        self._free_buckets = []  # type: List[Bucket]
+        self._free_pathway_stats = []  # type: List[PathwayStats]
         self._headers = {
             "Datadog-Meta-Lang": "python",
             "Datadog-Meta-Tracer-Version": ddtrace.__version__,
@@ -160,33 +189,89 @@ class DataStreamsProcessor(PeriodicService):
             return
 
         now_ns = int(now_sec * 1e9)
+        aggr_key = (",".join(edge_tags), hash_value, parent_hash)
 
         with self._lock:
-            # Align the span into the corresponding stats bucket
-            bucket_time_ns = now_ns - (now_ns % self._bucket_size_ns)
-            aggr_key = (",".join(edge_tags), hash_value, parent_hash)
-            stats = self._buckets[bucket_time_ns].pathway_stats[aggr_key]
+            stats = self._get_pathway_stats(self._get_bucket(now_ns), aggr_key)
+            if stats is None:
+                self._overflow_checkpoints += 1
+                return
             stats.full_pathway_latency.add(full_pathway_latency_sec)
             stats.edge_latency.add(edge_latency_sec)
-            self._buckets[bucket_time_ns].pathway_stats[aggr_key] = stats
+
+    def _on_checkpoints_creation(self, edge_tags, now_sec, latencies):
+        # type: (List[str], float, Dict[Tuple[int, int], List[Tuple[float, float]]]) -> None
+        """Record the edge and full pathway latencies of a batch of checkpoints by hash and parent hash."""
+        if not self._enabled:
+            return
+
+        now_ns = int(now_sec * 1e9)
+        joined_edge_tags = ",".join(edge_tags)
+
+        with self._lock:
+            bucket = self._get_bucket(now_ns)
+            for (hash_value, parent_hash), checkpoint_latencies in latencies.items():
+                stats = self._get_pathway_stats(bucket, (joined_edge_tags, hash_value, parent_hash))
+                if stats is None:
+                    self._overflow_checkpoints += len(checkpoint_latencies)
+                    continue
+                for edge_latency_sec, full_pathway_latency_sec in checkpoint_latencies:
+                    stats.full_pathway_latency.add(full_pathway_latency_sec)
+                    stats.edge_latency.add(edge_latency_sec)
+
+    def _get_bucket(self, now_ns):
+        # type: (int) -> Bucket
+        """Return the bucket of the given time.
+
+        The caller is responsible for holding the lock of the processor.
+        """
+        # Align the checkpoint into the corresponding stats bucket
+        bucket_time_ns = now_ns - (now_ns % self._bucket_size_ns)
+        bucket = self._buckets.get(bucket_time_ns)
+        if bucket is None:
+            bucket = self._buckets[bucket_time_ns] = self._free_buckets.pop() if self._free_buckets else Bucket()
+        return bucket
+
+    def _get_pathway_stats(self, bucket, aggr_key):
+        # type: (Bucket, PathwayAggrKey) -> Optional[PathwayStats]
+        """Return the statistics of a pathway in a bucket, or ``None`` if the bucket is full.
+
+        The caller is responsible for holding the lock of the processor.
+        """
+        stats = bucket.pathway_stats.get(aggr_key)
+        if stats is None:
+            if len(bucket.pathway_stats) >= self._max_pathways:
+                return None
+            stats = bucket.pathway_stats[aggr_key] = (
+                self._free_pathway_stats.pop() if self._free_pathway_stats else PathwayStats()
+            )
+        return stats
+
+    def _track_offset(self, offsets, key, offset):
+        # type: (Dict[typing.Any, int], typing.Any, int) -> None
+        """Track the latest offset of a partition in a bucket, unless the bucket is full.
+
+        The caller is responsible for holding the lock of the processor.
+        """
+        latest_offset = offsets.get(key)
+        if latest_offset is None:
+            if len(offsets) >= self._max_pathways:
+                self._overflow_offsets += 1
+                return
+            latest_offset = 0
+        offsets[key] = max(offset, latest_offset)
 
     def track_kafka_produce(self, topic, partition, offset, now_sec):
         now_ns = int(now_sec * 1e9)
         key = PartitionKey(topic, partition)
         with self._lock:
-            bucket_time_ns = now_ns - (now_ns % self._bucket_size_ns)
-            self._buckets[bucket_time_ns].latest_produce_offsets[key] = max(
-                offset, self._buckets[bucket_time_ns].latest_produce_offsets[key]
-            )
+            self._track_offset(self._get_bucket(now_ns).latest_produce_offsets, key, offset)
 
     def track_kafka_commit(self, group, topic, partition, offset, now_sec):
         now_ns = int(now_sec * 1e9)
         key = ConsumerPartitionKey(group, topic, partition)
         with self._lock:
-            bucket_time_ns = now_ns - (now_ns % self._bucket_size_ns)
-            self._buckets[bucket_time_ns].latest_commit_offsets[key] = max(
-                offset, self._buckets[bucket_time_ns].latest_commit_offsets[key]
-            )
+            self._track_offset(self._get_bucket(now_ns).latest_commit_offsets, key, offset)
 
     def _serialize_buckets(self):
         # type: () -> List[Dict]
@@ -204,8 +289,8 @@ class DataStreamsProcessor(PeriodicService):
                     u"EdgeTags": [six.ensure_text(tag) for tag in edge_tags.split(",")],
                     u"Hash": hash_value,
                     u"ParentHash": parent_hash,
-                    u"PathwayLatency": DDSketchProto.to_proto(stat_aggr.full_pathway_latency).SerializeToString(),
-                    u"EdgeLatency": DDSketchProto.to_proto(stat_aggr.edge_latency).SerializeToString(),
+                    u"PathwayLatency": stat_aggr.full_pathway_latency.serialize(),
+                    u"EdgeLatency": stat_aggr.edge_latency.serialize(),
                 }
                 bucket_aggr_stats.append(serialized_bucket)
             for consumer_key, offset in bucket.latest_commit_offsets.items():
@@ -240,18 +325,27 @@ class DataStreamsProcessor(PeriodicService):
                 }
             )
 
-        # Clear out buckets that have been serialized
+        # Clear out buckets that have been serialized, to reuse them
         for key in serialized_bucket_keys:
-            del self._buckets[key]
+            bucket = self._buckets.pop(key)
+            for stats in bucket.pathway_stats.values():
+                if len(self._free_pathway_stats) >= self._max_pathways:
+                    break
+                stats.clear()
+                self._free_pathway_stats.append(stats)
+            if len(self._free_buckets) < _MAX_FREE_BUCKETS:
+                bucket.clear()
+                self._free_buckets.append(bucket)
 
         return serialized_buckets
 
     def _flush_stats(self, payload):
         # type: (bytes) -> None
         try:
-            conn = get_connection(self._agent_url, self._timeout)
-            conn.request("POST", self._endpoint, payload, self._headers)
-            resp = get_connection_response(conn)
+            with connection_pool.connection(self._agent_url, self._timeout) as conn:
+                conn.request("POST", self._endpoint, payload, self._headers)
+                resp = get_connection_response(conn)
+                body = resp.read()
         except Exception:
             log.error("failed to submit pathway stats to the Datadog agent at %s", self._agent_endpoint, exc_info=True)
             raise
@@ -264,7 +358,7 @@ class DataStreamsProcessor(PeriodicService):
                     "failed to send data stream stats payload, %s (%s) (%s) response from Datadog agent at %s",
                     resp.status,
                     resp.reason,
-                    resp.read(),
+                    body,
                     self._agent_endpoint,
                 )
             else:
@@ -275,6 +369,17 @@ class DataStreamsProcessor(PeriodicService):
 
         with self._lock:
             serialized_stats = self._serialize_buckets()
+            overflow_checkpoints, self._overflow_checkpoints = self._overflow_checkpoints, 0
+            overflow_offsets, self._overflow_offsets = self._overflow_offsets, 0
+
+        if overflow_checkpoints or overflow_offsets:
+            log.warning(
+                "dropped %d checkpoints and %d Kafka offsets of data streams exceeding the limit of %d pathways "
+                "or partitions per bucket, see DD_DATA_STREAMS_MAX_PATHWAYS",
+                overflow_checkpoints,
+                overflow_offsets,
+                self._max_pathways,
+            )
 
         if not serialized_stats:
             log.debug("No data streams reported. Skipping flushing.")
@@ -292,7 +397,7 @@ class DataStreamsProcessor(PeriodicService):
             raw_payload[u"Version"] = six.ensure_text(config.version)
 
         payload = packb(raw_payload)
-        compressed = gzip_compress(payload)
+        compressed = gzip_compress(payload, 1)
         try:
             self._flush_stats_with_backoff(compressed)
         except Exception:
@@ -306,15 +411,11 @@ class DataStreamsProcessor(PeriodicService):
     def decode_pathway(self, data):
         # type: (bytes) -> DataStreamsCtx
         try:
-            hash_value = struct.unpack("<Q", data[:8])[0]
-            data = data[8:]
-            pathway_start_ms, data = decode_var_int_64(data)
-            current_edge_start_ms, data = decode_var_int_64(data)
-            ctx = DataStreamsCtx(self, hash_value, float(pathway_start_ms) / 1e3, float(current_edge_start_ms) / 1e3)
+            ctx = DataStreamsCtx(self, *_decode_pathway(data))
             # reset context of current thread every time we decode
             self._current_context.value = ctx
             return ctx
-        except (EOFError, TypeError):
+        except (EOFError, TypeError, struct.error):
             return self.new_pathway()
 
     def decode_pathway_b64(self, data):
@@ -349,6 +450,58 @@ class DataStreamsProcessor(PeriodicService):
         ctx.set_checkpoint(tags, now_sec=now_sec)
         return ctx
 
+    def set_checkpoints(self, encoded_pathways, tags, now_sec=None):
+        # type: (Iterable[Optional[bytes]], List[str], Optional[float]) -> DataStreamsCtx
+        """
+        Set a checkpoint with the same tags on each pathway of a batch, e.g. on the pathways of the messages
+        returned by a Kafka ``consume`` call.
+
+        This is equivalent to decoding each pathway and setting a checkpoint on it, but the hashes are computed
+        once per parent hash and the latencies are recorded under a single acquisition of the lock.
+
+        :param encoded_pathways: the encoded pathways, ``None`` for a message without pathway
+        :param tags: a list of tags identifying the pathway and direction
+        :param now_sec: The time in seconds to count as "now" when computing latencies
+        :return: the context of the last pathway, which becomes the current context
+        """
+        if not now_sec:
+            now_sec = time.time()
+        tags = sorted(tags)
+        direction = next((t for t in tags if t.startswith("direction:")), "")
+        ctx = self.new_pathway(now_sec)
+        hash_values = {}  # type: Dict[int, int]
+        latencies = defaultdict(list)  # type: DefaultDict[Tuple[int, int], List[Tuple[float, float]]]
+        parent_hash = 0
+        pathway_start_sec = now_sec
+
+        for data in encoded_pathways:
+            try:
+                parent_hash, pathway_start_sec, current_edge_start_sec = _decode_pathway(data)  # type: ignore[arg-type]
+            except (EOFError, TypeError, struct.error):
+                parent_hash, pathway_start_sec, current_edge_start_sec = 0, now_sec, now_sec
+            if not direction:
+                # A decoded pathway has no previous direction: without a direction, the checkpoint is seen as a
+                # loop and restarts the pathway, as in DataStreamsCtx.set_checkpoint
+                ctx.closest_opposite_direction_edge_start = current_edge_start_sec
+                parent_hash, pathway_start_sec, current_edge_start_sec = 0, now_sec, now_sec
+
+            hash_value = hash_values.get(parent_hash)
+            if hash_value is None:
+                hash_value = hash_values[parent_hash] = ctx._compute_hash(tags, parent_hash)
+            latencies[(hash_value, parent_hash)].append((now_sec - current_edge_start_sec, now_sec - pathway_start_sec))
+
+        if latencies:
+            # Leave the context in the state of the last pathway after its checkpoint
+            ctx.hash = hash_value
+            ctx.pathway_start_sec = pathway_start_sec
+            if direction:
+                ctx.previous_direction = direction
+                ctx.closest_opposite_direction_hash = parent_hash
+            self._on_checkpoints_creation(tags, now_sec, latencies)
+            self._current_context.value = ctx
+
+        return ctx
+
 
 class DataStreamsCtx:
     def __init__(self, processor, hash_value, pathway_start_sec, current_edge_start_sec):
@@ -380,21 +533,8 @@ class DataStreamsCtx:
         return data_streams_context
 
     def _compute_hash(self, tags, parent_hash):
-        if six.PY3:
-
-            def get_bytes(s):
-                return bytes(s, encoding="utf-8")
-
-        else:
-
-            def get_bytes(s):
-                return bytes(s)
-
-        b = get_bytes(self.service) + get_bytes(self.env)
-        for t in tags:
-            b += get_bytes(t)
-        node_hash = fnv1_64(b)
-        return fnv1_64(struct.pack("<Q", node_hash) + struct.pack("<Q", parent_hash))
+        node_hash = _compute_node_hash((self.service, self.env) + tuple(tags))
+        return fnv1_64_uint64_pair(node_hash, parent_hash)
 
     def set_checkpoint(self, tags, now_sec=None, edge_start_sec_override=None, pathway_start_sec_override=None):
         """
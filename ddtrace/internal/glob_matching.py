@@ -1,6 +1,16 @@
+import functools
+import operator
+import re
+from typing import TYPE_CHECKING
+
 from .utils.cache import cachedmethod
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
+    from typing import Pattern
+
+
 class GlobMatcher(object):
     """This is a backtracking implementation of the glob matching algorithm.
     The glob pattern language supports `*` as a multiple character wildcard which includes matches on `""`
@@ -49,3 +59,51 @@ class GlobMatcher(object):
 
             return False
         return True
+
+
+def _compile_segment(segment, suffix=""):
+    # type: (str, str) -> Pattern[str]
+    return re.compile("(?s)" + "".join("." if char == "?" else re.escape(char) for char in segment) + suffix)
+
+
+def compile_glob(pattern):
+    # type: (str) -> Callable[[str], bool]
+    """Return a function that matches a subject against the glob ``pattern``,
+    with the same semantics as :class:`GlobMatcher` but without a cache.
+
+    The pattern is split on ``*`` into segments of fixed length. The first and
+    last segments are anchored to the start and the end of the subject, and
+    the others are searched from left to right, so no backtracking over the
+    whole pattern is needed.
+    """
+    segments = pattern.split("*")
+    if len(segments) == 1:
+        if "?" not in pattern:
+            return functools.partial(operator.eq, pattern)
+        return _compile_segment(pattern, r"\Z").match  # type: ignore[return-value]
+
+    head, tail = segments[0], segments[-1]
+    middle = [(_compile_segment(segment), len(segment)) for segment in segments[1:-1] if segment]
+    if not head and not tail and not middle:
+        return lambda subject: True
+
+    head_match = _compile_segment(head).match
+    tail_match = _compile_segment(tail).match
+    min_length = len(head) + len(tail) + sum(length for _, length in middle)
+
+    def match(subject):
+        # type: (str) -> bool
+        if len(subject) < min_length:
+            return False
+        end = len(subject) - len(tail)
+        if (head and not head_match(subject)) or (tail and not tail_match(subject, end)):
+            return False
+        pos = len(head)
+        for segment, length in middle:
+            found = segment.search(subject, pos, end)
+            if found is None:
+                return False
+            pos = found.start() + length
+        return True
+
+    return match
@@ -1,7 +1,25 @@
+import errno
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
 from ddtrace.internal.compat import httplib
 from ddtrace.internal.compat import parse
 
 
+# Raised when the server closed the connection without sending a status line
+_RemoteDisconnected = getattr(httplib, "RemoteDisconnected", httplib.BadStatusLine)
+
+
+def _is_disconnected(exc):
+    # type: (BaseException) -> bool
+    """Whether the exception means that the server closed the connection before responding."""
+    if isinstance(exc, _RemoteDisconnected):
+        return True
+    return isinstance(exc, (IOError, OSError)) and getattr(exc, "errno", None) in (errno.ECONNRESET, errno.EPIPE)
+
+
 class BasePathMixin(httplib.HTTPConnection, object):
     """
     Mixin for HTTPConnection to insert a base path to requested URLs
@@ -24,13 +42,67 @@ class BasePathMixin(httplib.HTTPConnection, object):
         return obj
 
 
-class HTTPConnection(BasePathMixin, httplib.HTTPConnection):
+class KeepAliveMixin(httplib.HTTPConnection, object):
+    """
+    Mixin for HTTPConnection to resend a request on a new connection when the
+    server closed the kept-alive connection it was sent on before responding
+    """
+
+    _dd_request = None  # type: Optional[Tuple[str, str, Any, Optional[int], Dict[str, str], Dict[str, Any]]]
+
+    def request(self, method, url, body=None, headers=None, **kwargs):
+        headers = headers or {}
+        # Only requests sent on an already open socket are resent, provided
+        # that their body can be sent again.
+        self._dd_request = None
+        if self.sock is not None:
+            try:
+                # File-like bodies are rewound before they are sent again
+                offset = body.tell() if hasattr(body, "read") else None
+            except Exception:
+                pass
+            else:
+                self._dd_request = (method, url, body, offset, headers, kwargs)
+        try:
+            super(KeepAliveMixin, self).request(method, url, body, headers, **kwargs)
+        except Exception as e:
+            if not self._resend(e):
+                raise
+
+    def getresponse(self, *args, **kwargs):
+        try:
+            response = super(KeepAliveMixin, self).getresponse(*args, **kwargs)
+        except Exception as e:
+            if not self._resend(e):
+                raise
+            response = super(KeepAliveMixin, self).getresponse(*args, **kwargs)
+        self._dd_request = None
+        return response
+
+    def _resend(self, exc):
+        # type: (Exception) -> bool
+        """Send the last request again on a new socket if the server closed the previous one.
+
+        Returns ``False`` if the request cannot be sent again.
+        """
+        request, self._dd_request = self._dd_request, None
+        if request is None or not _is_disconnected(exc):
+            return False
+        method, url, body, offset, headers, kwargs = request
+        if offset is not None:
+            body.seek(offset)
+        self.close()
+        super(KeepAliveMixin, self).request(method, url, body, headers, **kwargs)
+        return True
+
+
+class HTTPConnection(BasePathMixin, KeepAliveMixin, httplib.HTTPConnection):
     """
     httplib.HTTPConnection wrapper to add a base path to requested URLs
     """
 
 
-class HTTPSConnection(BasePathMixin, httplib.HTTPSConnection):
+class HTTPSConnection(BasePathMixin, KeepAliveMixin, httplib.HTTPSConnection):
     """
     httplib.HTTPSConnection wrapper to add a base path to requested URLs
     """
@@ -1,10 +1,10 @@
 # coding: utf-8
 from collections import defaultdict
 import os
+import threading
 import typing
+import weakref
 
-from ddsketch import LogCollapsingLowestDenseDDSketch
-from ddsketch.pb.proto import DDSketchProto
 import six
 
 import ddtrace
@@ -13,14 +13,17 @@ from ddtrace.internal.utils.retry import fibonacci_backoff_with_jitter
 from ddtrace.span import _is_top_level
 
 from . import SpanProcessor
+from ...constants import SPAN_KIND
 from ...constants import SPAN_MEASURED_KEY
+from ...ext import SpanKind
+from .._ddsketch import LogCollapsingLowestDenseDDSketch
 from .._encoding import packb
-from ..agent import get_connection
 from ..compat import get_connection_response
 from ..forksafe import Lock
 from ..hostname import get_hostname
 from ..logger import get_logger
 from ..periodic import PeriodicService
+from ..utils.http import connection_pool
 from ..writer import _human_size
 
 
@@ -29,6 +32,7 @@ if typing.TYPE_CHECKING:  # pragma: no cover
     from typing import Dict
     from typing import List
     from typing import Optional
+    from typing import Tuple
     from typing import Union
 
     from ddtrace import Span
@@ -57,8 +61,44 @@ SpanAggrKey = typing.Tuple[
     str,  # type
     int,  # http status code
     bool,  # synthetics request
+    str,  # span kind
+    typing.Tuple[str, ...],  # peer tags
+    str,  # gRPC status code
 ]
 
+# The spans of the keys that do not fit in a bucket anymore are aggregated
+# under this key.
+_OVERFLOW_AGGR_KEY = ("_dd.stats.overflow", "", "", "", 0, False, "", (), "")  # type: SpanAggrKey
+
+# The kinds of spans that are aggregated by their peer tags
+_PEER_TAGS_SPAN_KINDS = frozenset((SpanKind.CLIENT, SpanKind.PRODUCER, SpanKind.CONSUMER))
+
+_GRPC_STATUS_CODE_TAGS = ("rpc.grpc.status_code", "grpc.code", "rpc.grpc.status.code", "grpc.status.code")
+_GRPC_STATUS_CODES = {
+    name: str(code)
+    for code, name in enumerate(
+        (
+            "OK",
+            "CANCELLED",
+            "UNKNOWN",
+            "INVALID_ARGUMENT",
+            "DEADLINE_EXCEEDED",
+            "NOT_FOUND",
+            "ALREADY_EXISTS",
+            "PERMISSION_DENIED",
+            "RESOURCE_EXHAUSTED",
+            "FAILED_PRECONDITION",
+            "ABORTED",
+            "OUT_OF_RANGE",
+            "UNIMPLEMENTED",
+            "INTERNAL",
+            "UNAVAILABLE",
+            "DATA_LOSS",
+            "UNAUTHENTICATED",
+        )
+    )
+}
+
 
 class SpanAggrStats(object):
     """Aggregated span statistics."""
@@ -75,16 +115,101 @@ class SpanAggrStats(object):
         self.ok_distribution = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
         self.err_distribution = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
 
+    def merge(self, stats):
+        # type: (SpanAggrStats) -> None
+        """Add the statistics aggregated by a thread to these ones."""
+        self.hits += stats.hits
+        self.top_level_hits += stats.top_level_hits
+        self.errors += stats.errors
+        self.duration += stats.duration
+        self.ok_distribution.merge(stats.ok_distribution)
+        self.err_distribution.merge(stats.err_distribution)
+
+
+def _new_buckets():
+    # type: () -> DefaultDict[int, DefaultDict[SpanAggrKey, SpanAggrStats]]
+    return defaultdict(lambda: defaultdict(SpanAggrStats))
+
+
+class _ThreadStats(object):
+    """The span statistics aggregated by a thread since the last flush.
+
+    The durations are added to sketches of the thread, so the memory used does
+    not grow with the number of spans. The lock is only contended when the
+    statistics are collected for a flush.
+    """
+
+    __slots__ = ("buckets", "lock", "owner")
 
-def _span_aggr_key(span):
-    # type: (Span) -> SpanAggrKey
-    """Return a hashable key that can be used to aggregate similar spans."""
+    def __init__(self, owner):
+        # type: (_ThreadStatsOwner) -> None
+        self.buckets = _new_buckets()
+        # DEV: The tracer creates a new stats processor in a forked process,
+        # so the locks of the threads of the parent process are never used
+        # there and do not need to be fork-safe.
+        self.lock = threading.Lock()
+        self.owner = weakref.ref(owner)
+
+
+class _ThreadStatsOwner(object):
+    """The thread-local reference to the statistics of a thread.
+
+    It is released with the thread-local storage of the thread, i.e. when the
+    thread, or the greenlet, is gone. Unlike ``Thread.is_alive``, this also
+    works for the threads that were not started by the threading module.
+    """
+
+    __slots__ = ("stats", "__weakref__")
+
+    def __init__(self):
+        # type: () -> None
+        self.stats = _ThreadStats(self)
+
+
+def _grpc_status_code(meta):
+    # type: (Dict[str, str]) -> str
+    """Return the numeric gRPC status code of a span, or an empty string."""
+    for tag in _GRPC_STATUS_CODE_TAGS:
+        code = meta.get(tag)
+        if code:
+            break
+    else:
+        return ""
+
+    if code.isdigit():
+        return code
+    # The gRPC integration sets the name of the code, e.g. "StatusCode.OK"
+    return _GRPC_STATUS_CODES.get(code.upper().rpartition(".")[2], "")
+
+
+def _span_aggr_key(span, peer_tags=()):
+    # type: (Span, Tuple[str, ...]) -> SpanAggrKey
+    """Return a hashable key that can be used to aggregate similar spans.
+
+    The ``peer_tags`` of client, producer and consumer spans are part of the key.
+    """
+    meta = span._meta
     service = span.service or ""
     resource = span.resource or ""
     _type = span.span_type or ""
-    status_code = span.get_tag("http.status_code") or 0
+    status_code = meta.get("http.status_code") or 0
     synthetics = span.context.dd_origin == "synthetics"
-    return span.name, service, resource, _type, int(status_code), synthetics
+    span_kind = meta.get(SPAN_KIND) or ""
+    if peer_tags and span_kind in _PEER_TAGS_SPAN_KINDS:
+        span_peer_tags = tuple("%s:%s" % (tag, meta[tag]) for tag in peer_tags if meta.get(tag))
+    else:
+        span_peer_tags = ()
+    return (
+        span.name,
+        service,
+        resource,
+        _type,
+        int(status_code),
+        synthetics,
+        span_kind,
+        span_peer_tags,
+        _grpc_status_code(meta),
+    )
 
 
 class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
@@ -101,9 +226,15 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         self._timeout = timeout
         # Have the bucket size match the interval in which flushes occur.
         self._bucket_size_ns = int(interval * 1e9)  # type: int
-        self._buckets = defaultdict(
-            lambda: defaultdict(SpanAggrStats)
-        )  # type: DefaultDict[int, DefaultDict[SpanAggrKey, SpanAggrStats]]
+        self._buckets = _new_buckets()
+        self._peer_tags = tuple(config._trace_stats_peer_tags) if config._trace_stats_peer_tags_enabled else ()
+        # The maximum number of aggregation keys per bucket, the spans of any
+        # other key are aggregated under ``_OVERFLOW_AGGR_KEY``.
+        self._max_aggregation_keys = config._trace_stats_max_aggregation_keys
+        # Spans are aggregated by each thread, and the statistics of all the
+        # threads are merged in the buckets above before they are flushed.
+        self._thread_local = threading.local()
+        self._thread_stats = []  # type: List[_ThreadStats]
         self._headers = {
             "Datadog-Meta-Lang": "python",
             "Datadog-Meta-Tracer-Version": ddtrace.__version__,
@@ -133,23 +264,78 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         if not is_top_level and not _is_measured(span):
             return
 
-        with self._lock:
-            # Align the span into the corresponding stats bucket
-            assert span.duration_ns is not None
-            span_end_ns = span.start_ns + span.duration_ns
-            bucket_time_ns = span_end_ns - (span_end_ns % self._bucket_size_ns)
-            aggr_key = _span_aggr_key(span)
-            stats = self._buckets[bucket_time_ns][aggr_key]
+        try:
+            thread_stats = self._thread_local.owner.stats
+        except AttributeError:
+            owner = self._thread_local.owner = _ThreadStatsOwner()
+            thread_stats = owner.stats
+            with self._lock:
+                self._thread_stats.append(thread_stats)
+
+        # Align the span into the corresponding stats bucket
+        duration = span.duration_ns
+        assert duration is not None
+        span_end_ns = span.start_ns + duration
+        bucket_time_ns = span_end_ns - (span_end_ns % self._bucket_size_ns)
+        aggr_key = _span_aggr_key(span, self._peer_tags)
+
+        with thread_stats.lock:
+            bucket = thread_stats.buckets[bucket_time_ns]
+            stats = bucket.get(aggr_key)
+            if stats is None:
+                # DEV: The number of keys of a thread is capped as well, to
+                # bound the memory used by its sketches.
+                if len(bucket) >= self._max_aggregation_keys:
+                    aggr_key = _OVERFLOW_AGGR_KEY
+                stats = bucket[aggr_key]
 
             stats.hits += 1
-            stats.duration += span.duration_ns
+            stats.duration += duration
             if is_top_level:
                 stats.top_level_hits += 1
             if span.error:
                 stats.errors += 1
-                stats.err_distribution.add(span.duration_ns)
+                stats.err_distribution.add(duration)
             else:
-                stats.ok_distribution.add(span.duration_ns)
+                stats.ok_distribution.add(duration)
+
+    def _merge_thread_stats(self, thread_stats):
+        # type: (_ThreadStats) -> None
+        """Move the statistics aggregated by a thread to the buckets.
+
+        The caller is responsible for holding the lock of the processor.
+        """
+        with thread_stats.lock:
+            buckets, thread_stats.buckets = thread_stats.buckets, _new_buckets()
+
+        for bucket_time_ns, bucket in buckets.items():
+            merged_bucket = self._buckets[bucket_time_ns]
+            for aggr_key, stats in bucket.items():
+                merged_stats = merged_bucket.get(aggr_key)
+                if merged_stats is not None:
+                    merged_stats.merge(stats)
+                elif len(merged_bucket) < self._max_aggregation_keys:
+                    # DEV: The thread no longer references its statistics
+                    merged_bucket[aggr_key] = stats
+                else:
+                    merged_bucket[_OVERFLOW_AGGR_KEY].merge(stats)
+
+    def _merge_all_thread_stats(self):
+        # type: () -> None
+        """Move the statistics aggregated by all the threads to the buckets.
+
+        The caller is responsible for holding the lock of the processor.
+        """
+        alive = []
+        for thread_stats in self._thread_stats:
+            # DEV: A thread that is gone cannot aggregate any new span, so its
+            # statistics can be dropped once merged. This is checked before
+            # merging, since the thread could still aggregate spans until then.
+            is_alive = thread_stats.owner() is not None
+            self._merge_thread_stats(thread_stats)
+            if is_alive:
+                alive.append(thread_stats)
+        self._thread_stats = alive
 
     def _serialize_buckets(self):
         # type: () -> List[Dict]
@@ -164,7 +350,7 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
             serialized_bucket_keys.append(bucket_time_ns)
 
             for aggr_key, stat_aggr in bucket.items():
-                name, service, resource, _type, http_status, synthetics = aggr_key
+                name, service, resource, _type, http_status, synthetics, span_kind, peer_tags, grpc_status = aggr_key
                 serialized_bucket = {
                     u"Name": six.ensure_text(name),
                     u"Resource": six.ensure_text(resource),
@@ -174,13 +360,19 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
                     u"TopLevelHits": stat_aggr.top_level_hits,
                     u"Duration": stat_aggr.duration,
                     u"Errors": stat_aggr.errors,
-                    u"OkSummary": DDSketchProto.to_proto(stat_aggr.ok_distribution).SerializeToString(),
-                    u"ErrorSummary": DDSketchProto.to_proto(stat_aggr.err_distribution).SerializeToString(),
+                    u"OkSummary": stat_aggr.ok_distribution.serialize(),
+                    u"ErrorSummary": stat_aggr.err_distribution.serialize(),
                 }
                 if service:
                     serialized_bucket[u"Service"] = six.ensure_text(service)
                 if _type:
                     serialized_bucket[u"Type"] = six.ensure_text(_type)
+                if span_kind:
+                    serialized_bucket[u"SpanKind"] = six.ensure_text(span_kind)
+                if peer_tags:
+                    serialized_bucket[u"PeerTags"] = [six.ensure_text(tag) for tag in peer_tags]
+                if grpc_status:
+                    serialized_bucket[u"GRPCStatusCode"] = six.ensure_text(grpc_status)
                 bucket_aggr_stats.append(serialized_bucket)
             serialized_buckets.append(
                 {
@@ -199,9 +391,10 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
     def _flush_stats(self, payload):
         # type: (bytes) -> None
         try:
-            conn = get_connection(self._agent_url, self._timeout)
-            conn.request("PUT", self._endpoint, payload, self._headers)
-            resp = get_connection_response(conn)
+            with connection_pool.connection(self._agent_url, self._timeout) as conn:
+                conn.request("PUT", self._endpoint, payload, self._headers)
+                resp = get_connection_response(conn)
+                body = resp.read()
         except Exception:
             log.error("failed to submit span stats to the Datadog agent at %s", self._agent_endpoint, exc_info=True)
             raise
@@ -217,7 +410,7 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
                     "failed to send stats payload, %s (%s) (%s) response from Datadog agent at %s",
                     resp.status,
                     resp.reason,
-                    resp.read(),
+                    body,
                     self._agent_endpoint,
                 )
             else:
@@ -227,6 +420,7 @@ class SpanStatsProcessorV06(PeriodicService, SpanProcessor):
         # type: (...) -> None
 
         with self._lock:
+            self._merge_all_thread_stats()
             serialized_stats = self._serialize_buckets()
 
         if not serialized_stats:
@@ -2,7 +2,6 @@ import abc
 from collections import defaultdict
 from threading import Lock
 from threading import RLock
-from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
@@ -24,9 +23,12 @@ from ddtrace.internal.processor import SpanProcessor
 from ddtrace.internal.sampling import SpanSamplingRule
 from ddtrace.internal.sampling import is_single_span_sampled
 from ddtrace.internal.schema import schematize_service_name
+from ddtrace.internal.service import ServiceStatus
 from ddtrace.internal.service import ServiceStatusError
+from ddtrace.internal.span_pool import SpanPool
 from ddtrace.internal.telemetry import telemetry_writer
 from ddtrace.internal.telemetry.constants import TELEMETRY_NAMESPACE_TAG_TRACER
+from ddtrace.internal.telemetry.metrics_namespaces import CountMetricHandle
 from ddtrace.internal.writer import TraceWriter
 from ddtrace.span import Span
 from ddtrace.span import _get_64_highest_order_bits_as_hex
@@ -41,6 +43,26 @@ except ImportError:
 log = get_logger(__name__)
 
 
+class _SpanCountMetrics(dict):
+    """Handles of a span count telemetry metric by span api, e.g. otel, opentracing or datadog."""
+
+    def __init__(self, metric_name):
+        # type: (str) -> None
+        super(_SpanCountMetrics, self).__init__()
+        self.metric_name = metric_name
+
+    def __missing__(self, span_api):
+        # type: (str) -> CountMetricHandle
+        handle = self[span_api] = telemetry_writer.count_metric_handle(
+            TELEMETRY_NAMESPACE_TAG_TRACER, self.metric_name, (("integration_name", span_api),)
+        )
+        return handle
+
+
+_SPANS_CREATED = _SpanCountMetrics("spans_created")
+_SPANS_FINISHED = _SpanCountMetrics("spans_finished")
+
+
 @attr.s
 class TraceProcessor(six.with_metaclass(abc.ABCMeta)):
     def __attrs_post_init__(self):
@@ -178,6 +200,7 @@ class SpanAggregator(SpanProcessor):
     _partial_flush_min_spans = attr.ib(type=int)
     _trace_processors = attr.ib(type=Iterable[TraceProcessor])
     _writer = attr.ib(type=TraceWriter)
+    _span_pool = attr.ib(default=None, type=Optional[SpanPool])
     _traces = attr.ib(
         factory=lambda: defaultdict(lambda: SpanAggregator._Trace()),
         init=False,
@@ -188,71 +211,81 @@ class SpanAggregator(SpanProcessor):
         _lock = attr.ib(init=False, factory=RLock, repr=False, type=Union[RLock, Lock])
     else:
         _lock = attr.ib(init=False, factory=Lock, repr=False, type=Union[RLock, Lock])
-    # Tracks the number of spans created and tags each count with the api that was used
-    # ex: otel api, opentracing api, datadog api
-    _span_metrics = attr.ib(
-        init=False,
-        factory=lambda: {
-            "spans_created": defaultdict(int),
-            "spans_finished": defaultdict(int),
-        },
-        type=Dict[str, DefaultDict],
-    )
 
     def on_span_start(self, span):
         # type: (Span) -> None
+        _SPANS_CREATED[span._span_api].increment()
         with self._lock:
             trace = self._traces[span.trace_id]
             trace.spans.append(span)
-            self._span_metrics["spans_created"][span._span_api] += 1
-            self._queue_span_count_metrics("spans_created", "integration_name")
 
     def on_span_finish(self, span):
         # type: (Span) -> None
+        _SPANS_FINISHED[span._span_api].increment()
         with self._lock:
-            self._span_metrics["spans_finished"][span._span_api] += 1
-            trace = self._traces[span.trace_id]
-            trace.num_finished += 1
-            should_partial_flush = self._partial_flush_enabled and trace.num_finished >= self._partial_flush_min_spans
-            if trace.num_finished == len(trace.spans) or should_partial_flush:
-                trace_spans = trace.spans
-                trace.spans = []
-                if trace.num_finished < len(trace_spans):
-                    finished = []
-                    for s in trace_spans:
-                        if s.finished:
-                            finished.append(s)
-                        else:
-                            trace.spans.append(s)
-                else:
-                    finished = trace_spans
-
-                num_finished = len(finished)
-
-                if should_partial_flush:
-                    log.debug("Partially flushing %d spans for trace %d", num_finished, span.trace_id)
-                    finished[0].set_metric("_dd.py.partial_flush", num_finished)
-
-                trace.num_finished -= num_finished
-
-                if len(trace.spans) == 0:
-                    del self._traces[span.trace_id]
-
-                spans = finished  # type: Optional[List[Span]]
-                for tp in self._trace_processors:
-                    try:
-                        if spans is None:
-                            return
-                        spans = tp.process_trace(spans)
-                    except Exception:
-                        log.error("error applying processor %r", tp, exc_info=True)
-
-                self._queue_span_count_metrics("spans_finished", "integration_name")
-                self._writer.write(spans)
-                return
-
-            log.debug("trace %d has %d spans, %d finished", span.trace_id, len(trace.spans), trace.num_finished)
-            return None
+            finished = self._pop_finished_spans(self._traces, span)
+            if finished is None:
+                return None
+
+            spans = finished  # type: Optional[List[Span]]
+            for tp in self._trace_processors:
+                try:
+                    if spans is None:
+                        return
+                    spans = tp.process_trace(spans)
+                except Exception:
+                    log.error("error applying processor %r", tp, exc_info=True)
+
+            self._writer.write(spans)
+            self._release_spans(spans)
+
+    def _release_spans(self, spans):
+        # type: (Optional[List[Span]]) -> None
+        """Give the spans handed over to the writer back to the span pool."""
+        # DEV: Only the traces that the writer took are released. The spans
+        # of a trace dropped by a processor, or that the writer failed to
+        # take, may still be referenced by whatever dropped them.
+        if self._span_pool is not None and spans is not None:
+            self._span_pool.release(spans)
+
+    def _pop_finished_spans(self, traces, span):
+        # type: (DefaultDict[int, SpanAggregator._Trace], Span) -> Optional[List[Span]]
+        """Record that ``span`` has finished and return the spans of its trace
+        that are ready to be flushed, or ``None`` if the trace is not ready yet.
+
+        The caller is responsible for holding the lock that guards ``traces``.
+        """
+        trace = traces[span.trace_id]
+        trace.num_finished += 1
+        should_partial_flush = self._partial_flush_enabled and trace.num_finished >= self._partial_flush_min_spans
+        if trace.num_finished == len(trace.spans) or should_partial_flush:
+            trace_spans = trace.spans
+            trace.spans = []
+            if trace.num_finished < len(trace_spans):
+                finished = []
+                for s in trace_spans:
+                    if s.finished:
+                        finished.append(s)
+                    else:
+                        trace.spans.append(s)
+            else:
+                finished = trace_spans
+
+            num_finished = len(finished)
+
+            if should_partial_flush:
+                log.debug("Partially flushing %d spans for trace %d", num_finished, span.trace_id)
+                finished[0].set_metric("_dd.py.partial_flush", num_finished)
+
+            trace.num_finished -= num_finished
+
+            if len(trace.spans) == 0:
+                del traces[span.trace_id]
+
+            return finished
+
+        log.debug("trace %d has %d spans, %d finished", span.trace_id, len(trace.spans), trace.num_finished)
+        return None
 
     def shutdown(self, timeout):
         # type: (Optional[float]) -> None
@@ -264,15 +297,11 @@ class SpanAggregator(SpanProcessor):
             before exiting or :obj:`None` to block until flushing has successfully completed (default: :obj:`None`)
         :type timeout: :obj:`int` | :obj:`float` | :obj:`None`
         """
-        if self._span_metrics["spans_created"] or self._span_metrics["spans_finished"]:
-            # on_span_start queue span created counts in batches of 100. This ensures all remaining counts are sent
-            # before the tracer is shutdown.
-            self._queue_span_count_metrics("spans_created", "integration_name", None)
-            # on_span_finish(...) queues span finish metrics in batches of 100.
-            # This ensures all remaining counts are sent before the tracer is shutdown.
-            self._queue_span_count_metrics("spans_finished", "integration_name", None)
+        if telemetry_writer._collect_metric_handles() and (
+            telemetry_writer.status == ServiceStatus.RUNNING or telemetry_writer.enable()
+        ):
             # The telemetry metrics writer can be shutdown before the tracer.
-            # This ensures all tracer metrics always sent.
+            # This ensures all the span count metrics are always sent.
             telemetry_writer.periodic(True)
 
         try:
@@ -281,17 +310,69 @@ class SpanAggregator(SpanProcessor):
             # It's possible the writer never got started in the first place :(
             pass
 
-    def _queue_span_count_metrics(self, metric_name, tag_name, min_count=100):
-        # type: (str, str, Optional[int]) -> None
-        """Queues a telemetry count metric for span created and span finished"""
-        # perf: telemetry_metrics_writer.add_count_metric(...) is an expensive operation.
-        # We should avoid calling this method on every invocation of span finish and span start.
-        if min_count is None or sum(self._span_metrics[metric_name].values()) >= min_count:
-            for tag_value, count in self._span_metrics[metric_name].items():
-                telemetry_writer.add_count_metric(
-                    TELEMETRY_NAMESPACE_TAG_TRACER, metric_name, count, tags=((tag_name, tag_value),)
-                )
-            self._span_metrics[metric_name] = defaultdict(int)
+
+@attr.s
+class ShardedSpanAggregator(SpanAggregator):
+    """SpanAggregator that spreads pending traces over ``num_shards`` shards
+    keyed by trace_id.
+
+    Each shard has its own lock which is only held while the bookkeeping of
+    the trace is updated. Trace processors and ``writer.write`` are run
+    outside of any lock, so threads finishing spans of different traces do
+    not serialize on a single lock.
+    """
+
+    @attr.s
+    class _Shard(object):
+        traces = attr.ib(
+            factory=lambda: defaultdict(lambda: SpanAggregator._Trace()),
+            type=DefaultDict[int, "SpanAggregator._Trace"],
+            repr=False,
+        )
+        lock = attr.ib(factory=Lock, repr=False, type=Lock)
+
+    _num_shards = attr.ib(type=int, default=16)
+    _shards = attr.ib(init=False, repr=False, type=List["ShardedSpanAggregator._Shard"])
+
+    @_shards.default
+    def _default_shards(self):
+        # type: () -> List[ShardedSpanAggregator._Shard]
+        return [self._Shard() for _ in range(max(self._num_shards, 1))]
+
+    def _get_shard(self, trace_id):
+        # type: (int) -> ShardedSpanAggregator._Shard
+        return self._shards[trace_id % len(self._shards)]
+
+    def on_span_start(self, span):
+        # type: (Span) -> None
+        _SPANS_CREATED[span._span_api].increment()
+        shard = self._get_shard(span.trace_id)
+        with shard.lock:
+            shard.traces[span.trace_id].spans.append(span)
+
+    def on_span_finish(self, span):
+        # type: (Span) -> None
+        _SPANS_FINISHED[span._span_api].increment()
+        shard = self._get_shard(span.trace_id)
+        with shard.lock:
+            finished = self._pop_finished_spans(shard.traces, span)
+            if finished is None:
+                return None
+
+        # DEV: The spans of a flushed chunk are no longer referenced by the
+        # shard, so the processors and the writer can run without holding
+        # any lock.
+        spans = finished  # type: Optional[List[Span]]
+        for tp in self._trace_processors:
+            try:
+                if spans is None:
+                    return
+                spans = tp.process_trace(spans)
+            except Exception:
+                log.error("error applying processor %r", tp, exc_info=True)
+
+        self._writer.write(spans)
+        self._release_spans(spans)
 
 
 @attr.s
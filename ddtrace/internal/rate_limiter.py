@@ -1,15 +1,20 @@
 from __future__ import division
 
+from collections import deque
+import itertools
 import random
 import threading
 from typing import Any
 from typing import Callable
+from typing import Deque
+from typing import Iterator
 from typing import Optional
 
 import attr
 
 from ..internal import compat
 from ..internal.constants import DEFAULT_SAMPLING_RATE_LIMIT
+from ..settings import _config as config
 
 
 class RateLimiter(object):
@@ -173,6 +178,117 @@ class RateLimiter(object):
     __str__ = __repr__
 
 
+# The time after which the tokens taken by a thread from a
+# PerThreadRateLimiter are given back to the other threads
+_LEASE_NS = 10000000  # 10ms
+
+
+@attr.s(slots=True)
+class _TokenLease(object):
+    """The tokens taken by a thread from a :class:`PerThreadRateLimiter`."""
+
+    tokens = attr.ib(type=int)
+    expires_ns = attr.ib(type=int)
+    _taken = attr.ib(type=Iterator[int], init=False, factory=itertools.count)
+
+    def take(self, timestamp_ns):
+        # type: (int) -> bool
+        """Take a token, if the lease has not expired and has tokens left."""
+        # DEV: next() on a count is atomic and the tokens are read after it,
+        # so no token can be taken once the lease has been revoked, even by
+        # another thread.
+        return timestamp_ns < self.expires_ns and next(self._taken) < self.tokens
+
+    def revoke(self):
+        # type: () -> int
+        """Revoke the lease and return the number of tokens left."""
+        tokens = self.tokens
+        self.tokens = 0
+        return max(0, tokens - next(self._taken))
+
+
+class _ThreadLeases(threading.local):
+    lease = None  # type: Optional[_TokenLease]
+    denied_until_ns = 0  # type: float
+
+
+class PerThreadRateLimiter(RateLimiter):
+    """
+    A token bucket rate limiter that hands out tokens to each thread in batches
+
+    Each thread takes the tokens of up to 10ms of the rate limit at once from
+    the shared bucket, and uses them without taking the lock. The leases are
+    also tracked by the shared bucket, so the tokens that a thread has not used
+    after 10ms are given back by the next thread that takes the lock, even if
+    the thread has exited. When the shared bucket is empty, a thread does not
+    check it again until a new token is expected. The number of allowed
+    requests never exceeds the one of :class:`RateLimiter`, and the
+    ``effective_rate`` is computed the same way.
+    """
+
+    __slots__ = ("_batch_size", "_leases", "_granted")
+
+    def __init__(self, rate_limit):
+        # type: (int) -> None
+        super(PerThreadRateLimiter, self).__init__(rate_limit)
+        self._batch_size = max(1, int(rate_limit * _LEASE_NS / 1e9))
+        self._leases = _ThreadLeases()
+        # The leases granted to all the threads, by expiry
+        self._granted = deque()  # type: Deque[_TokenLease]
+
+    def _is_allowed(self, timestamp_ns):
+        # type: (int) -> bool
+        if self.rate_limit <= 0:
+            return super(PerThreadRateLimiter, self)._is_allowed(timestamp_ns)
+
+        leases = self._leases
+        lease = leases.lease
+        if lease is not None and lease.take(timestamp_ns):
+            return True
+
+        if timestamp_ns < leases.denied_until_ns:
+            return False
+
+        with self._lock:
+            # Give back the tokens left from the lease of this thread, and
+            # from the expired leases of any thread
+            tokens = self.tokens
+            if lease is not None:
+                tokens += lease.revoke()
+            granted = self._granted
+            while granted and granted[0].expires_ns <= timestamp_ns:
+                tokens += granted.popleft().revoke()
+            self.tokens = min(self.max_tokens, tokens)
+
+            self._replenish(timestamp_ns)
+
+            if self.tokens < 1:
+                leases.lease = None
+                # DEV: We are comparing nanoseconds, so 1e9 is 1 second
+                leases.denied_until_ns = timestamp_ns + (1 - self.tokens) * 1e9 / self.rate_limit
+                return False
+
+            tokens = min(self._batch_size, int(self.tokens))
+            self.tokens -= tokens
+
+            # DEV: The lease is created with the token taken by this request
+            # already used.
+            lease = leases.lease = _TokenLease(tokens - 1, timestamp_ns + _LEASE_NS)
+            granted.append(lease)
+
+        return True
+
+
+def new_rate_limiter(rate_limit):
+    # type: (int) -> RateLimiter
+    """Return the rate limiter to use for the given rate limit, as configured
+    with ``DD_TRACE_RATE_LIMITER_PER_THREAD``.
+    """
+    if config._trace_rate_limiter_per_thread:
+        return PerThreadRateLimiter(rate_limit)
+    return RateLimiter(rate_limit)
+
+
 class RateLimitExceeded(Exception):
     pass
 
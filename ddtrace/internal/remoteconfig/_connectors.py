@@ -1,26 +1,41 @@
-from ctypes import c_char
 import json
-import multiprocessing
+import mmap
 import os
-import sys
+import struct
+import tempfile
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Mapping
+from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
-from ddtrace.internal.compat import PY2
-from ddtrace.internal.compat import to_unicode
 from ddtrace.internal.logger import get_logger
 
 
 log = get_logger(__name__)
 
-# Size of the shared variable. It's calculated based on Remote Config Payloads. At 2023-04-26 we measure on stagging
-# RC payloads and the max size of a multiprocess.array was 139.002 (sys.getsizeof(data.value)) and
-# max len 138.969 (len(data.value))
-SHARED_MEMORY_SIZE = 603432
+# Initial size of the shared memory segment. The segment grows when the data written to it does not fit.
+SHARED_MEMORY_INITIAL_SIZE = 1 << 16
+
+# Shared memory lives in RAM on Linux, other platforms use a temporary file cached by the kernel
+_SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Header of the segment: sequence number, shared data counter, number of entries and size of the data
+_HEADER = struct.Struct("<QQQQ")
+# Header of an entry: kind, version, size of the key and size of the value
+_ENTRY = struct.Struct("<BQII")
+
+# Kinds of the entries of the segment
+_METADATA = 0
+# The config, when it is not a dict
+_CONFIG = 1
+# An item of the config, when it is a dict, e.g. the rules of a product
+_CONFIG_ITEM = 2
 
 SharedDataType = Mapping[str, Any]
+_EntryKey = Tuple[int, str]
 
 
 class UUIDEncoder(json.JSONEncoder):
@@ -33,68 +48,133 @@ class UUIDEncoder(json.JSONEncoder):
 
 
 class PublisherSubscriberConnector(object):
-    """ "PublisherSubscriberConnector is the bridge between Publisher and Subscriber class that uses an array of chars
-    to share information between processes. `multiprocessing.Array``, as far as we know, was the most efficient way to
-    share information. We compare this approach with: Multiprocess Manager, Multiprocess Value, Multiprocess Queues
+    """PublisherSubscriberConnector is the bridge between Publisher and Subscriber class that uses a shared memory
+    segment to share information between processes.
+
+    The segment is a memory mapped temporary file, inherited by the forked processes, that grows with the data written
+    to it. The metadata, and each item of the config when it is a dict, are written as separate entries with the
+    version of their last change: the Publisher only serializes the entries that changed since its last write, and the
+    Subscribers only deserialize the entries that changed since their last read.
+
+    The segment has a single writer. Its header holds a sequence number, odd while the writer updates the segment, for
+    the readers to detect and retry the reads that raced with a write at their next poll.
     """
 
     def __init__(self):
-        self.data = multiprocessing.Array(c_char, SHARED_MEMORY_SIZE, lock=False)
-        # Checksum attr validates if the Publisher send new data
-        self.checksum = -1
-        # shared_data_counter attr validates if the Subscriber send new data
+        self._file = tempfile.TemporaryFile(dir=_SHARED_MEMORY_DIR)
+        os.ftruncate(self._file.fileno(), SHARED_MEMORY_INITIAL_SIZE)
+        self.data = mmap.mmap(self._file.fileno(), SHARED_MEMORY_INITIAL_SIZE)
+        # Entries written by the Publisher: the value, version and serialized value of each entry
+        self._written = {}  # type: Dict[_EntryKey, Tuple[Any, int, bytes]]
+        # Entries read by the Subscriber: the version and deserialized value of each entry
+        self._read = {}  # type: Dict[_EntryKey, Tuple[int, Any]]
+        # shared_data_counter attr validates if the Publisher send new data
         self.shared_data_counter = 0
 
     @staticmethod
-    def _hash_config(config_raw, metadata_raw):
-        # type: (Any, Any) -> int
-        return hash(str(config_raw) + str(metadata_raw))
+    def _entries(metadata, config_raw):
+        # type: (Any, Any) -> List[Tuple[_EntryKey, Any]]
+        entries = [((_METADATA, ""), metadata)]  # type: List[Tuple[_EntryKey, Any]]
+        if isinstance(config_raw, dict):
+            entries.extend(((_CONFIG_ITEM, key), value) for key, value in config_raw.items())
+        else:
+            entries.append(((_CONFIG, ""), config_raw))
+        return entries
+
+    @staticmethod
+    def serialize(value):
+        # type: (Any) -> bytes
+        return json.dumps(value, cls=UUIDEncoder).encode("utf-8")
+
+    def _map(self, size):
+        # type: (int) -> mmap.mmap
+        # The previous mapping is not closed, it can still be in use by another thread
+        self.data = mmap.mmap(self._file.fileno(), size)
+        return self.data
 
     def read(self):
         # type: () -> SharedDataType
-        config_raw = to_unicode(self.data.value)
-        config = json.loads(config_raw) if config_raw else {}
-        if config:
-            shared_data_counter = config["shared_data_counter"]
-            if shared_data_counter > self.shared_data_counter:
-                self.shared_data_counter += 1
-                return config
-        return {}
+        """Return the data written since the last read, or an empty dict.
+
+        The values of the entries that did not change since the last read are the ones it returned.
+        """
+        data = self.data
+        sequence, shared_data_counter, n_entries, data_size = _HEADER.unpack_from(data)
+        if sequence & 1 or shared_data_counter <= self.shared_data_counter:
+            return {}
+        if _HEADER.size + data_size > len(data):
+            # The Publisher grew the segment
+            data = self._map(os.fstat(self._file.fileno()).st_size)
+
+        # Copy the entries that changed before checking that the Publisher did not update them meanwhile
+        entries = []  # type: List[Tuple[_EntryKey, int, Optional[bytes]]]
+        offset = _HEADER.size
+        try:
+            for _ in range(n_entries):
+                kind, version, key_size, value_size = _ENTRY.unpack_from(data, offset)
+                offset += _ENTRY.size
+                key = (kind, data[offset : offset + key_size].decode("utf-8"))
+                offset += key_size
+                read = self._read.get(key)
+                value = data[offset : offset + value_size] if read is None or read[0] != version else None
+                offset += value_size
+                entries.append((key, version, value))
+        except (struct.error, ValueError):
+            # The Publisher updated the segment meanwhile
+            pass
+        if _HEADER.unpack_from(data)[0] != sequence:
+            return {}
+
+        read_entries = {}  # type: Dict[_EntryKey, Tuple[int, Any]]
+        for key, version, value in entries:
+            read_entries[key] = (version, json.loads(value.decode("utf-8"))) if value is not None else self._read[key]
+        self._read = read_entries
+        self.shared_data_counter = shared_data_counter
+
+        config = {}  # type: Any
+        metadata = None
+        for (kind, key), (_, value) in read_entries.items():
+            if kind == _METADATA:
+                metadata = value
+            elif kind == _CONFIG:
+                config = value
+            else:
+                config[key] = value
+        return {"metadata": metadata, "config": config, "shared_data_counter": shared_data_counter}
 
     def write(self, metadata, config_raw):
         # type: (Any, Any) -> None
-        last_checksum = self._hash_config(config_raw, metadata)
-        if last_checksum != self.checksum:
-            data_len = len(self.data.value)
-            if data_len >= (SHARED_MEMORY_SIZE - 1000):
-                log.warning("Datadog Remote Config shared data is %s/%s", data_len, SHARED_MEMORY_SIZE)
-            data = self.serialize(metadata, config_raw, self.shared_data_counter + 1)
-            self.data.value = data
-            log.debug(
-                "[%s][P: %s] write message of size %s and len %s",
-                os.getpid(),
-                os.getppid(),
-                sys.getsizeof(self.data.value),
-                data_len,
-            )
-            self.checksum = last_checksum
+        """Write the data, unless it did not change since the last write."""
+        shared_data_counter = _HEADER.unpack_from(self.data)[1] + 1
+        changed = False
+        written = {}  # type: Dict[_EntryKey, Tuple[Any, int, bytes]]
+        for key, value in self._entries(metadata, config_raw):
+            previous = self._written.get(key)
+            if previous is not None and type(previous[0]) is type(value) and previous[0] == value:
+                written[key] = previous
+            else:
+                written[key] = (value, shared_data_counter, self.serialize(value))
+                changed = True
+        if not changed and len(written) == len(self._written):
+            return
 
-    @staticmethod
-    def serialize(metadata, config_raw, shared_data_counter):
-        # type: (Any, Dict[str, Any], int) -> bytes
-        if PY2:
-            data = bytes(
-                json.dumps(
-                    {"metadata": metadata, "config": config_raw, "shared_data_counter": shared_data_counter},
-                    cls=UUIDEncoder,
-                )
-            )
-        else:
-            data = bytes(
-                json.dumps(
-                    {"metadata": metadata, "config": config_raw, "shared_data_counter": shared_data_counter},
-                    cls=UUIDEncoder,
-                ),
-                encoding="utf-8",
-            )
-        return data
+        chunks = []  # type: List[bytes]
+        for (kind, key), (_, version, serialized) in written.items():
+            encoded_key = key.encode("utf-8")
+            chunks.extend((_ENTRY.pack(kind, version, len(encoded_key), len(serialized)), encoded_key, serialized))
+        data = b"".join(chunks)
+
+        segment = self.data
+        size = len(segment)
+        if _HEADER.size + len(data) > size:
+            while _HEADER.size + len(data) > size:
+                size <<= 1
+            os.ftruncate(self._file.fileno(), size)
+            segment = self._map(size)
+
+        sequence = _HEADER.unpack_from(segment)[0] + 1
+        struct.pack_into("<Q", segment, 0, sequence)
+        segment[_HEADER.size : _HEADER.size + len(data)] = data
+        _HEADER.pack_into(segment, 0, sequence + 1, shared_data_counter, len(written), len(data))
+        self._written = written
+        log.debug("[%s][P: %s] write message of size %s", os.getpid(), os.getppid(), len(data))
@@ -12,6 +12,7 @@ from typing import Mapping
 from typing import Optional
 from typing import Set
 from typing import TYPE_CHECKING
+from typing import Tuple
 import uuid
 
 import attr
@@ -26,6 +27,7 @@ from ddtrace.internal.hostname import get_hostname
 from ddtrace.internal.logger import get_logger
 from ddtrace.internal.remoteconfig.constants import REMOTE_CONFIG_AGENT_ENDPOINT
 from ddtrace.internal.runtime import container
+from ddtrace.internal.utils.http import connection_pool
 from ddtrace.internal.utils.time import parse_isoformat
 
 from ..utils.formats import parse_tags_str
@@ -36,7 +38,6 @@ from ._pubsub import PubSub
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Callable
     from typing import MutableMapping
-    from typing import Tuple
     from typing import Union
 
 log = get_logger(__name__)
@@ -149,6 +150,8 @@ def _load_json(data):
 
 AppliedConfigType = Dict[str, ConfigMetadata]
 TargetsType = Dict[str, ConfigMetadata]
+# Content of the target files of the applied configurations, with their SHA256 hash
+TargetFilesCacheType = Dict[str, Tuple[str, Any]]
 
 
 class RemoteConfigClient(object):
@@ -206,14 +209,27 @@ class RemoteConfigClient(object):
             obj = _load_json(raw)
             return self.converter.structure_attrs_fromdict(obj, cls)
 
+        # The agent sends the same signed targets until they change
+        last_signed_targets = [None, None]  # type: List[Any]
+
+        def base64_to_signed_targets(val, cls):
+            if val != last_signed_targets[0]:
+                last_signed_targets[1] = base64_to_struct(val, cls)
+                last_signed_targets[0] = val
+            return last_signed_targets[1]
+
         self.converter.register_structure_hook(SignedRoot, base64_to_struct)
-        self.converter.register_structure_hook(SignedTargets, base64_to_struct)
+        self.converter.register_structure_hook(SignedTargets, base64_to_signed_targets)
 
         self._products = dict()  # type: MutableMapping[str, PubSub]
         self._applied_configs = dict()  # type: AppliedConfigType
         self._last_targets_version = 0
         self._last_error = None  # type: Optional[str]
         self._backend_state = None  # type: Optional[str]
+        self._target_files_cache = dict()  # type: TargetFilesCacheType
+        # Targets version, client configurations and products of the last response whose configurations were all
+        # applied. A response with the same ones has nothing to apply.
+        self._last_applied_state = None  # type: Optional[Tuple[int, frozenset, frozenset]]
 
     def renew_id(self):
         # called after the process is forked to declare a new id
@@ -261,15 +277,13 @@ class RemoteConfigClient(object):
             log.debug(
                 "[%s][P: %s] Requesting RC data from products: %s", os.getpid(), os.getppid(), str(self._products)
             )  # noqa: G200
-            conn = agent.get_connection(self.agent_url, timeout=ddtrace.config._agent_timeout_seconds)
-            conn.request("POST", REMOTE_CONFIG_AGENT_ENDPOINT, payload, self._headers)
-            resp = conn.getresponse()
-            data = resp.read()
+            with connection_pool.connection(self.agent_url, timeout=ddtrace.config._agent_timeout_seconds) as conn:
+                conn.request("POST", REMOTE_CONFIG_AGENT_ENDPOINT, payload, self._headers)
+                resp = conn.getresponse()
+                data = resp.read()
         except OSError as e:
             log.debug("Unexpected connection error in remote config client request: %s", str(e))  # noqa: G200
             return None
-        finally:
-            conn.close()
 
         if resp.status == 404:
             # Remote configuration is not enabled or unsupported by the agent
@@ -421,9 +435,16 @@ class RemoteConfigClient(object):
                 if applied_config == config:
                     continue
 
-                config_content = self._extract_target_file(payload, target, config)
-                if config_content is None:
-                    continue
+                cached = self._target_files_cache.get(target)
+                if cached is not None and cached[0] == config.sha256_hash:
+                    # The content was already decoded and checked against the same hash
+                    config_content = cached[1]
+                else:
+                    config_content = self._extract_target_file(payload, target, config)
+                    if config_content is None:
+                        continue
+                    if config.sha256_hash is not None:
+                        self._target_files_cache[target] = (config.sha256_hash, config_content)
 
                 try:
                     log.debug("[%s][P: %s] Load new configuration: %s. content", os.getpid(), os.getppid(), target)
@@ -495,6 +516,12 @@ class RemoteConfigClient(object):
             return
 
         client_configs = {k: v for k, v in targets.items() if k in payload.client_configs}
+        state = (last_targets_version, frozenset(client_configs), frozenset(self._products.items()))
+        if state == self._last_applied_state and not payload.target_files:
+            # Nothing changed since the configurations were applied
+            self._backend_state = backend_state
+            return
+
         log.debug(
             "[%s][P: %s] Retrieved client configs last version %s: %s",
             os.getpid(),
@@ -518,6 +545,18 @@ class RemoteConfigClient(object):
         self._last_targets_version = last_targets_version
         self._applied_configs = applied_configs
         self._backend_state = backend_state
+        self._target_files_cache = {
+            target: cached for target, cached in self._target_files_cache.items() if target in applied_configs
+        }
+        self._last_applied_state = (
+            state
+            if all(
+                target in applied_configs
+                for target, config in client_configs.items()
+                if config.product_name in self._products
+            )
+            else None
+        )
 
         self._add_apply_config_to_cache()
 
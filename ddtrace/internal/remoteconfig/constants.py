@@ -1,2 +1,4 @@
 ASM_FEATURES_PRODUCT = "ASM_FEATURES"
 REMOTE_CONFIG_AGENT_ENDPOINT = "v0.7/config"
+# Products whose updates, e.g. the IPs to block, must be applied as soon as possible
+URGENT_PRODUCTS = frozenset(("ASM", "ASM_DATA", "ASM_DD"))
@@ -9,6 +9,7 @@ from ddtrace.internal.logger import get_logger
 from ddtrace.internal.remoteconfig._pubsub import PubSub
 from ddtrace.internal.remoteconfig.client import RemoteConfigClient
 from ddtrace.internal.remoteconfig.constants import REMOTE_CONFIG_AGENT_ENDPOINT
+from ddtrace.internal.remoteconfig.constants import URGENT_PRODUCTS
 from ddtrace.internal.remoteconfig.utils import get_poll_interval_seconds
 from ddtrace.internal.service import ServiceStatus
 from ddtrace.internal.utils.time import StopWatch
@@ -23,6 +24,12 @@ class RemoteConfigPoller(periodic.PeriodicService):
 
     This implements a finite-state machine that allows checking the agent for
     the expected endpoint, which could be enabled after the client is started.
+
+    When a maximum polling interval greater than the polling interval is
+    configured, the agent is polled less and less often while the
+    configurations do not change, up to the maximum polling interval, unless
+    products with urgent updates are registered. The polling interval is reset after a change and
+    when a product is registered.
     """
 
     _worker_lock = forksafe.Lock()
@@ -64,12 +71,29 @@ class RemoteConfigPoller(periodic.PeriodicService):
             "See: https://docs.datadoghq.com/agent/guide/how_remote_config_works/",
         )
 
+    def _reset_interval(self):
+        # type: () -> None
+        self.interval = ddconfig._remote_config_poll_interval
+
+    def _back_off(self):
+        # type: () -> None
+        # DEV: The registered products are looked up rather than iterated, since
+        # they can be registered by other threads meanwhile.
+        if any(product in self._client._products for product in URGENT_PRODUCTS):
+            self._reset_interval()
+            return
+        self.interval = max(
+            min(self.interval * 2, ddconfig._remote_config_max_poll_interval), ddconfig._remote_config_poll_interval
+        )
+
     def _online(self):
         # type: () -> None
+        targets_version = self._client._last_targets_version
         with StopWatch() as sw:
             if not self._client.request():
                 # An error occurred, so we transition back to the agent check
                 self._state = self._agent_check
+                self._reset_interval()
                 return
 
         elapsed = sw.elapsed()
@@ -79,6 +103,12 @@ class RemoteConfigPoller(periodic.PeriodicService):
             log_level = logging.DEBUG
         log.log(log_level, "request config in %.5fs to %s", elapsed, self._client.agent_url)
 
+        if self._client._last_targets_version != targets_version:
+            # Other changes often follow a change
+            self._reset_interval()
+        else:
+            self._back_off()
+
     def periodic(self):
         # type: () -> None
         return self._state()
@@ -165,6 +195,8 @@ class RemoteConfigPoller(periodic.PeriodicService):
 
             if enabled:
                 self._client.register_product(product, pubsub_instance)
+                # The configurations of the product are yet to be received
+                self._reset_interval()
                 if not self._client.is_subscriber_running(pubsub_instance):
                     pubsub_instance.start_subscriber()
         except Exception:
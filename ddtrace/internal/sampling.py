@@ -18,16 +18,18 @@ from ddtrace.constants import _SINGLE_SPAN_SAMPLING_MAX_PER_SEC
 from ddtrace.constants import _SINGLE_SPAN_SAMPLING_MAX_PER_SEC_NO_LIMIT
 from ddtrace.constants import _SINGLE_SPAN_SAMPLING_MECHANISM
 from ddtrace.constants import _SINGLE_SPAN_SAMPLING_RATE
+from ddtrace.internal.compat import pattern_type
 from ddtrace.internal.constants import SAMPLING_DECISION_TRACE_TAG_KEY
 from ddtrace.internal.constants import _CATEGORY_TO_PRIORITIES
 from ddtrace.internal.constants import _KEEP_PRIORITY_INDEX
 from ddtrace.internal.constants import _REJECT_PRIORITY_INDEX
 from ddtrace.internal.glob_matching import GlobMatcher
+from ddtrace.internal.glob_matching import compile_glob
 from ddtrace.internal.logger import get_logger
 from ddtrace.sampling_rule import SamplingRule
 from ddtrace.settings import _config as config
 
-from .rate_limiter import RateLimiter
+from .rate_limiter import new_rate_limiter
 
 
 log = get_logger(__name__)
@@ -40,13 +42,17 @@ except ImportError:
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Any
+    from typing import Callable
     from typing import Dict
     from typing import List
     from typing import Text
+    from typing import Tuple
 
     from ddtrace.context import Context
     from ddtrace.span import Span
 
+    from .rate_limiter import RateLimiter
+
 # Big prime number to make hashing better distributed
 KNUTH_FACTOR = 1111111111111111111
 MAX_SPAN_ID = 2 ** 64
@@ -128,7 +134,7 @@ class SpanSamplingRule:
         self._sampling_id_threshold = self._sample_rate * MAX_SPAN_ID
 
         self._max_per_second = max_per_second
-        self._limiter = RateLimiter(max_per_second)
+        self._limiter = new_rate_limiter(max_per_second)
 
         # we need to create matchers for the service and/or name pattern provided
         self._service_matcher = GlobMatcher(service) if service is not None else None
@@ -308,12 +314,119 @@ def _set_priority(span, priority):
     span.sampled = priority > 0  # Positive priorities mean it was kept
 
 
-def _get_highest_precedence_rule_matching(span, rules):
-    # type: (Span, List[SamplingRule]) -> Optional[SamplingRule]
-    if not rules:
-        return None
+# Key of the rule index for the rules that do not match the service or the name
+# of a span exactly.
+_ANY = object()
 
-    for rule in rules:
-        if rule.matches(span):
-            return rule
-    return None
+# The methods of SamplingRule that decide if a span matches a rule
+_MATCHING_METHODS = ("matches", "glob_matches", "tag_match", "_matches", "_pattern_matches")
+
+
+def _overrides_matching(rule):
+    # type: (SamplingRule) -> bool
+    if any(method in rule.__dict__ for method in _MATCHING_METHODS):
+        return True
+    for klass in type(rule).__mro__:
+        if klass is SamplingRule:
+            return False
+        if any(method in klass.__dict__ for method in _MATCHING_METHODS):
+            return True
+    return True
+
+
+def _is_exact(pattern):
+    # type: (Any) -> bool
+    if pattern is SamplingRule.NO_RULE or callable(pattern) or isinstance(pattern, pattern_type):
+        return False
+    try:
+        hash(pattern)
+    except TypeError:
+        return False
+    return True
+
+
+def _compile_rule(rule):
+    # type: (SamplingRule) -> Tuple[Any, Any, Callable[[Span], bool]]
+    """Return the service and the name that the rule matches exactly, or
+    ``_ANY``, and a function that tells if a span with this service and name
+    matches the rule.
+    """
+    if _overrides_matching(rule):
+        return _ANY, _ANY, rule.matches
+
+    service = rule.service if _is_exact(rule.service) else _ANY
+    name = rule.name if _is_exact(rule.name) else _ANY
+    resource = rule.resource
+    # Regular expressions and functions are evaluated by the rule itself,
+    # which caches their results.
+    legacy = any(
+        pattern is not SamplingRule.NO_RULE and not _is_exact(pattern)
+        for pattern in (rule.service, rule.name, resource)
+    )
+    tag_matchers = [(key, compile_glob(matcher.pattern)) for key, matcher in rule._tag_value_matchers.items()]
+
+    def match(span):
+        # type: (Span) -> bool
+        if tag_matchers:
+            meta = span._meta
+            tag_match = False
+            for key, tag_value_matcher in tag_matchers:
+                value = meta.get(key)
+                if value is None:
+                    return False
+                # DEV: Like in SamplingRule.tag_match, the match of the last
+                # tag decides once all the tags are found.
+                tag_match = tag_value_matcher(value)
+            if not tag_match:
+                return False
+        if legacy:
+            return rule._matches((span.service, span.name, span.resource))
+        return resource is SamplingRule.NO_RULE or span.resource == resource
+
+    return service, name, match
+
+
+class SamplingRuleIndex(object):
+    """The sampling rules of a sampler, indexed to find the first rule that
+    matches a span without evaluating all the rules.
+
+    The rules are indexed by the service and the name that they match
+    exactly, so only the rules that can match the service and the name of a
+    span are evaluated, in their original order. The patterns of the rules are
+    read once, when the index is built.
+    """
+
+    def __init__(self, rules):
+        # type: (List[SamplingRule]) -> None
+        self.rules = list(rules)
+        self._compiled = [_compile_rule(rule) + (rule,) for rule in self.rules]
+        self._services = {service for service, _, _, _ in self._compiled if service is not _ANY}
+        self._names = {name for _, name, _, _ in self._compiled if name is not _ANY}
+        self._candidates = {}  # type: Dict[Tuple[Any, Any], List[Tuple[Callable[[Span], bool], SamplingRule]]]
+
+    def _get_candidates(self, key):
+        # type: (Tuple[Any, Any]) -> List[Tuple[Callable[[Span], bool], SamplingRule]]
+        service, name = key
+        candidates = [
+            (match, rule)
+            for rule_service, rule_name, match, rule in self._compiled
+            if (rule_service is _ANY or rule_service == service) and (rule_name is _ANY or rule_name == name)
+        ]
+        # DEV: There is at most one entry per service and name of the rules
+        self._candidates[key] = candidates
+        return candidates
+
+    def match(self, span):
+        # type: (Span) -> Optional[SamplingRule]
+        """Return the first rule that matches the span, if any."""
+        service = span.service
+        name = span.name
+        key = (service if service in self._services else _ANY, name if name in self._names else _ANY)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = self._get_candidates(key)
+
+        for match, rule in candidates:
+            if match(span):
+                return rule
+        return None
@@ -0,0 +1,191 @@
+from collections import deque
+import sys
+import typing
+import weakref
+
+from ddtrace import config
+from ddtrace.internal import forksafe
+from ddtrace.internal._rand import rand64bits as _rand64bits
+from ddtrace.internal._rand import rand128bits as _rand128bits
+from ddtrace.internal.compat import PYTHON_INTERPRETER
+from ddtrace.internal.compat import PYTHON_VERSION_INFO
+from ddtrace.internal.compat import time_ns
+from ddtrace.internal.constants import SPAN_API_DATADOG
+from ddtrace.span import Span
+
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable
+    from typing import Deque
+    from typing import Dict
+    from typing import List
+    from typing import Optional
+
+    from ddtrace.context import Context
+
+
+# Whether spans can be recycled on this interpreter. The checks below rely on
+# the reference counts of CPython, and are only enabled on the versions they
+# are tested with.
+IS_SUPPORTED = PYTHON_INTERPRETER == "CPython" and PYTHON_VERSION_INFO < (3, 12)
+
+# The references to a span of a released trace while it is checked: the
+# trace list, the loop variable and the argument of ``sys.getrefcount``.
+_TRACE_SPAN_REFS = 3
+# The references to a container held by a span while it is checked: the span
+# slot and the argument of ``sys.getrefcount``.
+_SLOT_REFS = 2
+
+
+class SpanPool(object):
+    """A pool of finished spans that are reused for new spans.
+
+    Only the traces given to :meth:`release`, i.e. the traces that have been
+    handed over to the writer, are recycled, and only once nothing but the
+    trace itself references their spans. Until then, e.g. while application
+    code still holds a span or while the writer has not encoded the trace yet,
+    the spans are left alone and are eventually garbage collected as usual.
+    """
+
+    def __init__(self, max_size):
+        # type: (int) -> None
+        self.max_size = max_size
+        self._lock = forksafe.Lock()
+        self._free = []  # type: List[Span]
+        self._released = deque(maxlen=max_size)  # type: Deque[List[Span]]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._free)
+
+    def release(self, trace):
+        # type: (List[Span]) -> None
+        """Give the spans of a trace that has been handed over to the writer
+        back to the pool.
+        """
+        # DEV: The spans are not checked here since the caller is still
+        # running code, e.g. the ``finish`` of the last span, that references
+        # them.
+        self._released.append(trace)
+
+    def acquire(
+        self,
+        name,  # type: str
+        service=None,  # type: Optional[str]
+        resource=None,  # type: Optional[str]
+        span_type=None,  # type: Optional[str]
+        trace_id=None,  # type: Optional[int]
+        parent_id=None,  # type: Optional[int]
+        context=None,  # type: Optional[Context]
+        on_finish=None,  # type: Optional[List[Callable[[Span], None]]]
+        span_api=SPAN_API_DATADOG,  # type: str
+    ):
+        # type: (...) -> Span
+        """Return a span initialized like ``Span(...)`` with the same arguments."""
+        with self._lock:
+            if not self._free:
+                self._recycle()
+            span = self._free.pop() if self._free else None
+
+        if span is None:
+            return Span(
+                name=name,
+                service=service,
+                resource=resource,
+                span_type=span_type,
+                trace_id=trace_id,
+                parent_id=parent_id,
+                context=context,
+                on_finish=on_finish,
+                span_api=span_api,
+            )
+
+        # DEV: Keep in sync with Span.__init__
+        span.name = name
+        span.service = service
+        span._resource[0] = resource or name
+        span.span_type = span_type
+        span._span_api = span_api
+        span.error = 0
+        span.start_ns = time_ns()
+        span.duration_ns = None
+        if trace_id is not None:
+            span.trace_id = trace_id
+        elif config._128_bit_trace_id_enabled:
+            span.trace_id = _rand128bits()
+        else:
+            span.trace_id = _rand64bits()
+        span.span_id = _rand64bits()
+        span.parent_id = parent_id
+        span._on_finish_callbacks = [] if on_finish is None else on_finish
+        span.sampled = True
+        span._context = context._with_span(span) if context else None
+        return span
+
+    def _recycle(self):
+        # type: () -> None
+        """Move the spans of the oldest released trace to the free list, if
+        nothing else references them anymore.
+
+        The pool lock must be held.
+        """
+        try:
+            trace = self._released.popleft()
+        except IndexError:
+            return
+
+        # The trace is referenced by the local variable and by the argument
+        # of getrefcount. Any other reference means that the trace is still in
+        # use, e.g. it is queued for encoding.
+        # DEV: A trace that is still in use is checked again later. The oldest
+        # released traces are dropped once there are too many of them.
+        if sys.getrefcount(trace) > 2:
+            self._released.append(trace)
+            return
+
+        # The spans of a trace reference their parent and their local root,
+        # so these references are expected. A trace is only recycled as a
+        # whole so that no span that is still in use can reach a recycled one.
+        # DEV: Only the ids are kept so that no local variable holds an extra
+        # reference to a span of the trace.
+        internal_refs = {}  # type: Dict[int, int]
+        for span in trace:
+            for ref_id in (id(span._parent), id(span._local_root)):
+                internal_refs[ref_id] = internal_refs.get(ref_id, 0) + 1
+        for span in trace:
+            if sys.getrefcount(span) > _TRACE_SPAN_REFS + internal_refs.get(id(span), 0) or weakref.getweakrefcount(
+                span
+            ):
+                self._released.append(trace)
+                return
+
+        for span in trace:
+            if len(self._free) >= self.max_size:
+                break
+            _reset_span(span)
+            self._free.append(span)
+
+
+def _reset_span(span):
+    # type: (Span) -> None
+    """Drop everything a finished span references, reusing its containers
+    unless something else references them.
+    """
+    span._parent = None
+    span._local_root = None
+    span._context = None
+    span._store = None
+    span._ignored_exceptions = None
+
+    if sys.getrefcount(span._meta) > _SLOT_REFS:
+        span._meta = {}
+    else:
+        span._meta.clear()
+    if sys.getrefcount(span._metrics) > _SLOT_REFS:
+        span._metrics = {}
+    else:
+        span._metrics.clear()
+    # DEV: The resource list of a root span is kept by the profiler to read
+    # the final resource of the trace.
+    if sys.getrefcount(span._resource) > _SLOT_REFS:
+        span._resource = [None]
@@ -1,4 +1,5 @@
 from collections import defaultdict
+import itertools
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -7,6 +8,7 @@ from typing import Type
 from ddtrace.internal import forksafe
 from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_DISTRIBUTION
 from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_GENERATE_METRICS
+from ddtrace.internal.telemetry.metrics import CountMetric
 from ddtrace.internal.telemetry.metrics import DistributionMetric
 from ddtrace.internal.telemetry.metrics import Metric
 from ddtrace.internal.telemetry.metrics import MetricTagType
@@ -15,6 +17,55 @@ from ddtrace.internal.telemetry.metrics import MetricTagType
 NamespaceMetricType = Dict[str, Dict[str, Dict[str, Any]]]
 
 
+class CountMetricHandle(object):
+    """Handle of a count metric whose namespace, name and tags are resolved once.
+
+    Incrementing the metric takes no lock: ``itertools.count`` is incremented
+    atomically in CPython. Points of other values than 1 are added under a
+    lock. The points are aggregated when the metrics are flushed.
+    """
+
+    __slots__ = ("namespace", "name", "tags", "_count", "_flushed_count", "_value", "_lock")
+
+    def __init__(self, namespace, name, tags=None):
+        # type: (str, str, MetricTagType) -> None
+        self.namespace = namespace
+        self.name = name
+        self.tags = tags
+        self._count = itertools.count()
+        self._flushed_count = 0
+        self._value = 0.0
+        self._lock = forksafe.Lock()  # type: forksafe.ResetObject
+
+    def increment(self):
+        # type: () -> None
+        next(self._count)
+
+    def add_point(self, value=1.0):
+        # type: (float) -> None
+        if value == 1:
+            next(self._count)
+        else:
+            with self._lock:
+                self._value += value
+
+    def _flush(self):
+        # type: () -> float
+        """Return the sum of the points added since the last flush.
+
+        The caller is responsible for not flushing the handle concurrently.
+        """
+        count = next(self._count)
+        value = count - self._flushed_count  # type: float
+        # The flush incremented the count too
+        self._flushed_count = count + 1
+        if self._value:
+            with self._lock:
+                value += self._value
+                self._value = 0.0
+        return value
+
+
 class MetricNamespace:
     def __init__(self):
         # type: () -> None
@@ -23,10 +74,46 @@ class MetricNamespace:
             TELEMETRY_TYPE_GENERATE_METRICS: defaultdict(dict),
             TELEMETRY_TYPE_DISTRIBUTION: defaultdict(dict),
         }  # type: Dict[str, Dict[str, Dict[int, Metric]]]
+        self._count_metric_handles = {}  # type: Dict[int, CountMetricHandle]
+
+    def count_metric_handle(self, namespace, name, tags=None):
+        # type: (str, str, MetricTagType) -> CountMetricHandle
+        """Return the handle of a count metric, to add points to it without looking the metric up."""
+        metric_id = Metric.get_id(name, namespace, tags, CountMetric.metric_type)
+        with self._lock:
+            handle = self._count_metric_handles.get(metric_id)
+            if handle is None:
+                handle = self._count_metric_handles[metric_id] = CountMetricHandle(namespace, name, tags)
+            return handle
+
+    def _collect_handles(self):
+        # type: () -> bool
+        """Add the points of the count metric handles to the metrics to flush.
+
+        The caller is responsible for holding the lock of the namespace.
+        Return whether any point was added.
+        """
+        collected = False
+        for handle in self._count_metric_handles.values():
+            value = handle._flush()
+            if value:
+                self._add_metric(CountMetric, handle.namespace, handle.name, value, handle.tags)
+                collected = True
+        return collected
+
+    def collect_handles(self):
+        # type: () -> bool
+        """Add the points of the count metric handles to the metrics to flush.
+
+        Return whether any point was added.
+        """
+        with self._lock:
+            return self._collect_handles()
 
     def flush(self):
         # type: () -> Dict
         with self._lock:
+            self._collect_handles()
             namespace_metrics = self._metrics_data
             self._metrics_data = {
                 TELEMETRY_TYPE_GENERATE_METRICS: defaultdict(dict),
@@ -40,17 +127,22 @@ class MetricNamespace:
         Telemetry Metrics are stored in DD dashboards, check the metrics in datadoghq.com/metric/explorer.
         The metric will store in dashboard as "dd.instrumentation_telemetry_data." + namespace + "." + name
         """
+        with self._lock:
+            self._add_metric(metric_class, namespace, name, value, tags, interval)
+
+    def _add_metric(self, metric_class, namespace, name, value=1.0, tags=None, interval=None):
+        # type: (Type[Metric], str, str, float, MetricTagType, Optional[float]) -> None
+        """The caller is responsible for holding the lock of the namespace."""
         metric_id = Metric.get_id(name, namespace, tags, metric_class.metric_type)
         if metric_class is DistributionMetric:
             metrics_type_payload = TELEMETRY_TYPE_DISTRIBUTION
         else:
             metrics_type_payload = TELEMETRY_TYPE_GENERATE_METRICS
 
-        with self._lock:
-            existing_metric = self._metrics_data[metrics_type_payload][namespace].get(metric_id)
-            if existing_metric:
-                existing_metric.add_point(value)
-            else:
-                new_metric = metric_class(namespace, name, tags=tags, common=True, interval=interval)
-                new_metric.add_point(value)
-                self._metrics_data[metrics_type_payload][namespace][metric_id] = new_metric
+        existing_metric = self._metrics_data[metrics_type_payload][namespace].get(metric_id)
+        if existing_metric:
+            existing_metric.add_point(value)
+        else:
+            new_metric = metric_class(namespace, name, tags=tags, common=True, interval=interval)
+            new_metric.add_point(value)
+            self._metrics_data[metrics_type_payload][namespace][metric_id] = new_metric
@@ -21,16 +21,18 @@ from ...settings.dynamic_instrumentation import config as di_config
 from ...settings.exception_debugging import config as ed_config
 from ...settings.peer_service import _ps_config
 from ...settings.profiling import config as profiling_config
-from ..agent import get_connection
 from ..agent import get_trace_url
 from ..compat import get_connection_response
 from ..compat import httplib
+from ..compression import gzip_compress
 from ..encoding import JSONEncoderV2
 from ..logger import get_logger
 from ..periodic import PeriodicService
 from ..runtime import get_runtime_id
 from ..service import ServiceStatus
+from ..service import ServiceStatusError
 from ..utils.formats import asbool
+from ..utils.http import connection_pool
 from ..utils.time import StopWatch
 from ..utils.version import _pep440_to_semver
 from .constants import TELEMETRY_128_BIT_TRACEID_GENERATION_ENABLED
@@ -92,6 +94,7 @@ from .metrics import DistributionMetric
 from .metrics import GaugeMetric
 from .metrics import MetricTagType
 from .metrics import RateMetric
+from .metrics_namespaces import CountMetricHandle
 from .metrics_namespaces import MetricNamespace
 from .metrics_namespaces import NamespaceMetricType
 
@@ -132,23 +135,22 @@ class _TelemetryClient:
         # type: (Dict) -> Optional[httplib.HTTPResponse]
         """Sends a telemetry request to the trace agent"""
         resp = None
-        conn = None
         try:
             rb_json = self._encoder.encode(request)
             headers = self.get_headers(request)
-            with StopWatch() as sw:
-                conn = get_connection(self._agent_url)
+            if config._telemetry_compression_enabled:
+                rb_json = gzip_compress(rb_json.encode("utf-8"))
+                headers["Content-Encoding"] = "gzip"
+            with StopWatch() as sw, connection_pool.connection(self._agent_url) as conn:
                 conn.request("POST", self._endpoint, rb_json, headers)
                 resp = get_connection_response(conn)
+                resp.read()
             if resp.status < 300:
                 log.debug("sent %d in %.5fs to %s. response: %s", len(rb_json), sw.elapsed(), self.url, resp.status)
             else:
                 log.debug("failed to send telemetry to the Datadog Agent at %s. response: %s", self.url, resp.status)
         except Exception:
             log.debug("failed to send telemetry to the Datadog Agent at %s.", self.url)
-        finally:
-            if conn is not None:
-                conn.close()
         return resp
 
     def get_headers(self, request):
@@ -194,6 +196,9 @@ class TelemetryWriter(PeriodicService):
         self._forked = False  # type: bool
         self._events_queue = []  # type: List[Dict]
         self._configuration_queue = {}  # type: Dict[str, Dict]
+        # Configurations and dependencies already reported to the agent, only their changes are sent afterwards
+        self._reported_configurations = {}  # type: Dict[str, Dict]
+        self._reported_dependencies = set()  # type: Set[Tuple[str, str]]
         self._lock = forksafe.Lock()  # type: forksafe.ResetObject
         self.started = False
         forksafe.register(self._fork_writer)
@@ -216,7 +221,11 @@ class TelemetryWriter(PeriodicService):
             return True
 
         if self._is_periodic:
-            self.start()
+            try:
+                self.start()
+            except ServiceStatusError:
+                # Another thread started the service concurrently
+                return True
             atexit.register(self.app_shutdown)
             return True
 
@@ -250,7 +259,6 @@ class TelemetryWriter(PeriodicService):
                 "tracer_time": int(time.time()),
                 "runtime_id": get_runtime_id(),
                 "api_version": "v2",
-                "seq_id": next(self._sequence),
                 "debug": self._debug,
                 "application": get_application(config.service, config.version, config.env),
                 "host": get_host_info(),
@@ -362,7 +370,7 @@ class TelemetryWriter(PeriodicService):
         )
 
         payload = {
-            "configuration": self._flush_configuration_queue(),
+            "configuration": self._flush_configuration_queue(report_all=True),
             "error": {
                 "code": self._error[0],
                 "message": self._error[1],
@@ -409,11 +417,19 @@ class TelemetryWriter(PeriodicService):
             self._integrations_queue = dict()
         return integrations
 
-    def _flush_configuration_queue(self):
-        # type: () -> List[Dict]
-        """Flushes and returns a list of all queued configurations"""
+    def _flush_configuration_queue(self, report_all=False):
+        # type: (bool) -> List[Dict]
+        """
+        Flushes and returns a list of the queued configurations that changed since they were last reported,
+        or of all queued configurations if ``report_all`` is set
+        """
         with self._lock:
-            configurations = list(self._configuration_queue.values())
+            configurations = [
+                c
+                for name, c in self._configuration_queue.items()
+                if report_all or self._reported_configurations.get(name) != c
+            ]
+            self._reported_configurations.update(self._configuration_queue)
             self._configuration_queue = {}
         return configurations
 
@@ -448,9 +464,14 @@ class TelemetryWriter(PeriodicService):
 
     def _app_dependencies_loaded_event(self):
         # type: () -> None
-        """Adds a Telemetry event which sends a list of installed python packages to the agent"""
-        payload = {"dependencies": get_dependencies()}
-        self.add_event(payload, "app-dependencies-loaded")
+        """Adds a Telemetry event which sends the list of installed python packages not reported yet to the agent"""
+        with self._lock:
+            dependencies = [
+                d for d in get_dependencies() if (d["name"], d["version"]) not in self._reported_dependencies
+            ]
+            self._reported_dependencies.update((d["name"], d["version"]) for d in dependencies)
+        if dependencies:
+            self.add_event({"dependencies": dependencies}, "app-dependencies-loaded")
 
     def add_log(self, level, message, stack_trace="", tags=None):
         # type: (str, str, str, Optional[Dict]) -> None
@@ -519,6 +540,21 @@ class TelemetryWriter(PeriodicService):
                 tags,
             )
 
+    def count_metric_handle(self, namespace, name, tags=None):
+        # type: (str, str, MetricTagType) -> CountMetricHandle
+        """
+        Returns the handle of a count metric. Resolve it once, e.g. at import time, to add points to the metric
+        without locking. Points are queued when the metrics are flushed.
+        """
+        return self._namespace.count_metric_handle(namespace, name, tags)
+
+    def _collect_metric_handles(self):
+        # type: () -> bool
+        """
+        Queues the points of the count metric handles. Returns whether any point was queued.
+        """
+        return self._namespace.collect_handles()
+
     def add_distribution_metric(self, namespace, name, value=1.0, tags=None):
         # type: (str,str, float, MetricTagType) -> None
         """
@@ -592,8 +628,26 @@ class TelemetryWriter(PeriodicService):
             self._app_heartbeat_event()
 
         telemetry_events = self._flush_events_queue()
-        for telemetry_event in telemetry_events:
-            self._client.send_event(telemetry_event)
+        if len(telemetry_events) > 1:
+            # Coalesce the events into a single request
+            telemetry_event = self._message_batch_event(telemetry_events)
+        elif telemetry_events:
+            telemetry_event = telemetry_events[0]
+        else:
+            return
+        # Sequence numbers are allocated to the requests that are sent rather than to the
+        # queued events, so that the batched events do not leave gaps in the sequence.
+        telemetry_event["seq_id"] = next(self._sequence)
+        self._client.send_event(telemetry_event)
+
+    def _message_batch_event(self, events):
+        # type: (List[Dict]) -> Dict
+        """Returns a message-batch event with the payloads of the given events"""
+        # The last event has the latest time
+        batch = events[-1].copy()
+        batch["payload"] = [{"request_type": e["request_type"], "payload": e["payload"]} for e in events]
+        batch["request_type"] = "message-batch"
+        return batch
 
     def start(self, *args, **kwargs):
         # type: (...) -> None
@@ -3,9 +3,10 @@ from typing import Any
 
 from .compat import httplib
 from .http import BasePathMixin
+from .http import KeepAliveMixin
 
 
-class UDSHTTPConnection(BasePathMixin, httplib.HTTPConnection):
+class UDSHTTPConnection(BasePathMixin, KeepAliveMixin, httplib.HTTPConnection):
     """An HTTP connection established over a Unix Domain Socket."""
 
     # It's "important" to keep the hostname and port arguments here; while there are not used by the connection
@@ -1,12 +1,17 @@
+from collections import defaultdict
 from contextlib import contextmanager
 from json import loads
 import logging
 import os
 import re
+import select
 from typing import Any
 from typing import Callable
 from typing import ContextManager
+from typing import DefaultDict
+from typing import Dict
 from typing import Generator
+from typing import List
 from typing import Optional
 from typing import Pattern
 from typing import Tuple
@@ -14,6 +19,7 @@ from typing import Union
 
 from ddtrace.constants import USER_ID_KEY
 from ddtrace.internal import compat
+from ddtrace.internal import forksafe
 from ddtrace.internal.compat import parse
 from ddtrace.internal.constants import BLOCKED_RESPONSE_HTML
 from ddtrace.internal.constants import BLOCKED_RESPONSE_JSON
@@ -140,9 +146,8 @@ def connector(url, **kwargs):
     @contextmanager
     def _connector_context():
         # type: () -> Generator[Union[compat.httplib.HTTPConnection, compat.httplib.HTTPSConnection], None, None]
-        connection = get_connection(url, **kwargs)
-        yield connection
-        connection.close()
+        with connection_pool.connection(url, **kwargs) as connection:
+            yield connection
 
     return _connector_context
 
@@ -288,6 +293,136 @@ def get_connection(url, timeout=DEFAULT_TIMEOUT):
     raise ValueError("Unsupported protocol '%s'" % parsed.scheme)
 
 
+class ConnectionPool(object):
+    """Process-wide pool of keep-alive HTTP connections, keyed by URL.
+
+    Connections are handed out with :meth:`get` and given back with
+    :meth:`put` once the response has been read. Connections that have been
+    idle for longer than ``idle_timeout`` seconds, or that have been closed by
+    the server, are discarded instead of being reused. The server can still
+    close a connection right after it is handed out, in which case the
+    request is sent again on a new connection, see
+    :class:`ddtrace.internal.http.KeepAliveMixin`. The pool is emptied in
+    forked children, which must open their own connections.
+
+    The pool counts the connections created, reused and discarded, and the
+    total time in milliseconds connections were leased for, which can be
+    collected with :meth:`flush_metrics`.
+    """
+
+    def __init__(self, max_idle_connections=4, idle_timeout=10.0):
+        # type: (int, float) -> None
+        self.max_idle_connections = max_idle_connections
+        self.idle_timeout = idle_timeout
+        self._lock = forksafe.Lock()
+        self._idle = defaultdict(list)  # type: DefaultDict[str, List[Tuple[ConnectionType, float]]]
+        self._metrics = defaultdict(int)  # type: DefaultDict[str, int]
+
+    def _after_fork(self):
+        # type: () -> None
+        # The connections are shared with the parent process and must not be
+        # used by the child. Dropping them only releases the child's copies of
+        # the sockets.
+        self._idle = defaultdict(list)
+        self._metrics = defaultdict(int)
+
+    @staticmethod
+    def _is_dropped(conn):
+        # type: (ConnectionType) -> bool
+        # An idle connection becomes readable when the server closes it.
+        if conn.sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except Exception:
+            return True
+        return bool(readable)
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT):
+        # type: (str, float) -> ConnectionType
+        """Return a connection to the given URL, reusing an idle one if possible."""
+        now = compat.monotonic()
+        with self._lock:
+            idle = self._idle.get(url)
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used > self.idle_timeout or self._is_dropped(conn):
+                    self._metrics["http.connections.discarded"] += 1
+                    conn.close()
+                    continue
+                self._metrics["http.connections.reused"] += 1
+                conn.timeout = timeout
+                conn.sock.settimeout(timeout)
+                conn._dd_acquired_at = now  # type: ignore[union-attr]
+                return conn
+            self._metrics["http.connections.created"] += 1
+
+        # DEV: The connection is only opened by its first request, so that
+        # connection errors are raised where they were before pooling.
+        conn = get_connection(url, timeout)
+        conn._dd_acquired_at = now  # type: ignore[union-attr]
+        return conn
+
+    def put(self, url, conn):
+        # type: (str, ConnectionType) -> None
+        """Give back a connection obtained with :meth:`get`.
+
+        The connection is closed instead if its last response has not been
+        fully read, or if the server asked to close it.
+        """
+        now = compat.monotonic()
+        response = getattr(conn, "_HTTPConnection__response", None)
+        reusable = conn.sock is not None and (response is None or response.isclosed())
+
+        with self._lock:
+            acquired_at = getattr(conn, "_dd_acquired_at", None)
+            if acquired_at is not None:
+                self._metrics["http.connections.lease.ms"] += int((now - acquired_at) * 1000)
+            idle = self._idle[url]
+            if reusable and len(idle) < self.max_idle_connections:
+                idle.append((conn, now))
+                return
+            self._metrics["http.connections.discarded"] += 1
+        conn.close()
+
+    @contextmanager
+    def connection(self, url, timeout=DEFAULT_TIMEOUT):
+        # type: (str, float) -> Generator[ConnectionType, None, None]
+        """Context manager that returns the connection to the pool on exit.
+
+        The connection is closed if an exception is raised while it is used.
+        """
+        conn = self.get(url, timeout)
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            with self._lock:
+                self._metrics["http.connections.discarded"] += 1
+            raise
+        self.put(url, conn)
+
+    def clear(self):
+        # type: () -> None
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, defaultdict(list)
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def flush_metrics(self):
+        # type: () -> Dict[str, int]
+        """Return and reset the connection metrics collected since the last call."""
+        with self._lock:
+            metrics, self._metrics = self._metrics, defaultdict(int)
+        return dict(metrics)
+
+
+connection_pool = ConnectionPool()
+forksafe.register(connection_pool._after_fork)
+
+
 def verify_url(url):
     # type: (str) -> parse.ParseResult
     """Validates that the given URL can be used as an intake
@@ -0,0 +1,247 @@
+from collections import deque
+from contextlib import contextmanager
+import mmap
+import os
+import typing
+
+import attr
+
+from .. import forksafe
+from ..compat import parse
+from ..logger import get_logger
+
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from typing import Deque
+
+
+log = get_logger(__name__)
+
+_SUFFIX = ".payload"
+
+
+def _process_exists(pid):
+    # type: (int) -> bool
+    try:
+        from ddtrace.vendor import psutil
+
+        return psutil.pid_exists(pid)
+    except Exception:
+        # Assume the process is running rather than taking over its payloads
+        return True
+
+
+@attr.s(slots=True, frozen=True)
+class SpooledPayload(object):
+    """An encoded payload stored in a :class:`PayloadSpool`."""
+
+    path = attr.ib(type=str)
+    endpoint = attr.ib(type=str)
+    count = attr.ib(type=int)
+    size = attr.ib(type=int)
+    # The content encoding of the payload, empty if it is not compressed
+    encoding = attr.ib(type=str, default="")
+
+
+class PayloadSpool(object):
+    """A bounded on-disk queue of encoded payloads.
+
+    Each payload is written to its own file in ``directory`` and read back
+    through a read-only memory map, so that replaying a payload does not
+    require loading it in memory first. When adding a payload would exceed
+    ``max_bytes``, the oldest payloads are evicted first.
+
+    Each process has its own spool, in a ``<name>-<pid>`` directory. The
+    payloads left on disk by a process, e.g. before the application restarted,
+    are taken over by the next process with the same spool name with
+    :meth:`recover`.
+    """
+
+    def __init__(self, directory, max_bytes):
+        # type: (str, int) -> None
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = deque()  # type: Deque[SpooledPayload]
+        self._size = 0
+        self._seq = 0
+        self._lock = forksafe.Lock()
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._entries)
+
+    @property
+    def size(self):
+        # type: () -> int
+        """The total size of the spooled payloads, in bytes."""
+        return self._size
+
+    def push(self, payload, endpoint, count, encoding=""):
+        # type: (typing.Any, str, int, str) -> typing.List[SpooledPayload]
+        """Store a bytes-like payload for the given endpoint, compressed with the given content encoding, if any.
+
+        Returns the payloads that were evicted to make room for it. Raises
+        ``ValueError`` if the payload is larger than the spool itself.
+        """
+        size = len(payload)
+        if size > self.max_bytes:
+            raise ValueError("payload of %d bytes is larger than the spool limit of %d bytes" % (size, self.max_bytes))
+
+        with self._lock:
+            evicted = self._evict(size)
+
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            path = self._next_path(endpoint, count, encoding)
+            with open(path, "wb") as f:
+                f.write(payload)
+
+            self._entries.append(
+                SpooledPayload(path=path, endpoint=endpoint, count=count, size=size, encoding=encoding)
+            )
+            self._size += size
+            return evicted
+
+    def recover(self):
+        # type: () -> typing.Tuple[typing.List[SpooledPayload], typing.List[SpooledPayload]]
+        """Take over the payloads left on disk by the processes with the same spool name that exited.
+
+        The payloads are added to the spool, oldest first, before the ones
+        already in it. Returns the recovered payloads and the payloads that were
+        evicted to make room for them.
+        """
+        root, name = os.path.split(self.directory)
+        prefix = name.rpartition("-")[0] + "-"
+        try:
+            names = os.listdir(root)
+        except OSError:
+            return [], []
+
+        found = []  # type: typing.List[typing.Tuple[float, str, str, int, str]]
+        max_seq = 0
+        orphans = []
+        for dirname in names:
+            pid = dirname[len(prefix) :]
+            if not dirname.startswith(prefix) or not pid.isdigit():
+                continue
+            directory = os.path.join(root, dirname)
+            # The spool of this process can be left by a previous process with the same pid, e.g. in a container
+            if directory != self.directory:
+                if _process_exists(int(pid)):
+                    continue
+                orphans.append(directory)
+            try:
+                filenames = os.listdir(directory)
+            except OSError:
+                continue
+            for filename in filenames:
+                if not filename.endswith(_SUFFIX):
+                    continue
+                try:
+                    seq, count, encoding, endpoint = filename[: -len(_SUFFIX)].split("-", 3)
+                    path = os.path.join(directory, filename)
+                    found.append((os.path.getmtime(path), path, parse.unquote(endpoint), int(count), encoding))
+                    if directory == self.directory:
+                        # Do not overwrite these files with the new ones
+                        max_seq = max(max_seq, int(seq))
+                except (OSError, ValueError):
+                    log.debug("ignoring unexpected spool file %s", filename, exc_info=True)
+
+        with self._lock:
+            known = {entry.path for entry in self._entries}
+            self._seq = max(self._seq, max_seq)
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            recovered = []
+            for _, path, endpoint, count, encoding in sorted(found):
+                if path in known:
+                    continue
+                new_path = self._next_path(endpoint, count, encoding)
+                try:
+                    # Another process can take over the same payload: only one of the renames succeeds
+                    os.rename(path, new_path)
+                    size = os.path.getsize(new_path)
+                except OSError:
+                    continue
+                recovered.append(
+                    SpooledPayload(path=new_path, endpoint=endpoint, count=count, size=size, encoding=encoding)
+                )
+
+            # The recovered payloads are older than the ones already spooled
+            self._entries.extendleft(reversed(recovered))
+            self._size += sum(entry.size for entry in recovered)
+            evicted = self._evict(0)
+
+        for directory in orphans:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                # Not empty
+                pass
+        return [entry for entry in recovered if entry not in evicted], evicted
+
+    def pop(self):
+        # type: () -> typing.Optional[SpooledPayload]
+        """Take the oldest payload out of the spool.
+
+        The file of the payload is kept until it is given to :meth:`discard`,
+        or it can be put back at the front of the spool with :meth:`restore`.
+        """
+        with self._lock:
+            if not self._entries:
+                return None
+            entry = self._entries.popleft()
+            self._size -= entry.size
+            return entry
+
+    def restore(self, entry):
+        # type: (SpooledPayload) -> None
+        """Put back a payload taken with :meth:`pop` at the front of the spool."""
+        with self._lock:
+            self._entries.appendleft(entry)
+            self._size += entry.size
+
+    def discard(self, entry):
+        # type: (SpooledPayload) -> None
+        """Delete the file of a payload taken with :meth:`pop`."""
+        self._unlink(entry)
+
+    @contextmanager
+    def read(self, entry):
+        # type: (SpooledPayload) -> typing.Iterator[typing.Any]
+        """Map the file of a spooled payload in memory, read-only."""
+        with open(entry.path, "rb") as f:
+            payload = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield payload
+        finally:
+            payload.close()
+
+    def _evict(self, size):
+        # type: (int) -> typing.List[SpooledPayload]
+        """Drop the oldest payloads until ``size`` more bytes fit in the spool. The lock must be held."""
+        evicted = []
+        while self._entries and self._size + size > self.max_bytes:
+            entry = self._entries.popleft()
+            self._size -= entry.size
+            self._unlink(entry)
+            evicted.append(entry)
+        return evicted
+
+    def _next_path(self, endpoint, count, encoding):
+        # type: (str, int, str) -> str
+        """Return the path of a new payload. The lock must be held."""
+        self._seq += 1
+        # DEV: The endpoint comes last since it can contain dashes
+        return os.path.join(
+            self.directory,
+            "%012d-%d-%s-%s%s" % (self._seq, count, encoding, parse.quote(endpoint, safe=""), _SUFFIX),
+        )
+
+    @staticmethod
+    def _unlink(entry):
+        # type: (SpooledPayload) -> None
+        try:
+            os.remove(entry.path)
+        except OSError:
+            log.debug("failed to remove spooled payload %s", entry.path, exc_info=True)
@@ -1,6 +1,7 @@
 import abc
 import binascii
 from collections import defaultdict
+from collections import deque
 import logging
 import os
 import sys
@@ -12,6 +13,7 @@ from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import TextIO
+from typing import Union
 
 import six
 
@@ -27,15 +29,19 @@ from ...constants import KEEP_SPANS_RATE_KEY
 from ...internal.telemetry import telemetry_writer
 from ...internal.utils.formats import parse_tags_str
 from ...internal.utils.http import Response
+from ...internal.utils.http import connection_pool
 from ...internal.utils.time import StopWatch
 from .._encoding import BufferFull
 from .._encoding import BufferItemTooLarge
+from .._encoding import EncodedBuffer
 from ..agent import get_connection
+from ..compression import get_compressor
 from ..constants import _HTTPLIB_NO_TRACE_REQUEST
 from ..encoding import JSONEncoderV2
 from ..logger import get_logger
 from ..runtime import container
 from ..sma import SimpleMovingAverage
+from .spool import PayloadSpool
 from .writer_client import AgentWriterClientV3
 from .writer_client import AgentWriterClientV4
 from .writer_client import WRITER_CLIENTS
@@ -43,6 +49,7 @@ from .writer_client import WriterClientBase
 
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Deque
     from typing import Tuple
 
     from ddtrace import Span
@@ -54,6 +61,10 @@ log = get_logger(__name__)
 
 LOG_ERR_INTERVAL = 60
 
+# The maximum number of traces waiting for the periodic thread to spool a full
+# buffer. The traces that do not fit are dropped.
+SPILL_QUEUE_SIZE = 1000
+
 
 class NoEncodableSpansError(Exception):
     pass
@@ -157,6 +168,11 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         sync_mode=False,  # type: bool
         reuse_connections=None,  # type: Optional[bool]
         headers=None,  # type: Optional[Dict[str, str]]
+        async_encoding=None,  # type: Optional[bool]
+        compression=None,  # type: Optional[str]
+        compression_level=None,  # type: Optional[int]
+        spool_dir=None,  # type: Optional[str]
+        spool_max_bytes=None,  # type: Optional[int]
     ):
         # type: (...) -> None
 
@@ -192,6 +208,50 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             config._trace_writer_connection_reuse if reuse_connections is None else reuse_connections
         )
 
+        if async_encoding is None:
+            async_encoding = config._trace_writer_async_encoding
+        # When async encoding is enabled, finished traces are queued and
+        # encoded by the periodic thread instead of the thread that finished
+        # them. This does not apply in sync mode, where there is no periodic
+        # thread.
+        self._encoding_queue = (
+            deque() if async_encoding and not sync_mode else None
+        )  # type: Optional[Deque[Tuple[WriterClientBase, List[Span]]]]
+        self._encoding_queue_size = config._trace_writer_async_encoding_queue_size
+
+        if compression is None:
+            compression = config._trace_writer_compression
+        if compression_level is None:
+            compression_level = config._trace_writer_compression_level
+        self._compress = get_compressor(compression, compression_level)
+        self._compression = compression if self._compress is not None else None
+
+        if spool_dir is None:
+            spool_dir = config._trace_writer_spool_dir
+        if spool_max_bytes is None:
+            spool_max_bytes = config._trace_writer_spool_max_bytes
+        # When a spool directory is configured, the payloads that cannot be
+        # sent, or that do not fit in the buffer, are stored on disk and sent
+        # again once the intake is reachable. Each process has its own spool.
+        self._spool = (
+            PayloadSpool(
+                os.path.join(spool_dir, "%s-%d" % (self.__class__.__name__.lower(), os.getpid())), spool_max_bytes
+            )
+            if spool_dir
+            else None
+        )  # type: Optional[PayloadSpool]
+        self._spool_replay_rate = config._trace_writer_spool_replay_rate
+        self._spool_recovered = False
+        self._send_failed = False
+        # The traces that do not fit in a full buffer are queued for the
+        # periodic thread to spool the buffer, rather than spooling it on the
+        # thread that finished them. In sync mode the buffer is spooled right
+        # away since there is no periodic thread.
+        self._spill_queue = (
+            deque() if self._spool is not None and not sync_mode else None
+        )  # type: Optional[Deque[Tuple[WriterClientBase, List[Span]]]]
+        self._spill_queue_size = SPILL_QUEUE_SIZE
+
     def _intake_endpoint(self, client=None):
         return "{}/{}".format(self._intake_url(client), client.ENDPOINT if client else self._endpoint)
 
@@ -222,7 +282,12 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
     def _set_drop_rate(self):
         dropped = sum(
             counts
-            for metric in ("encoder.dropped.traces", "buffer.dropped.traces", "http.dropped.traces")
+            for metric in (
+                "encoder.dropped.traces",
+                "buffer.dropped.traces",
+                "http.dropped.traces",
+                "spool.dropped.traces",
+            )
             for _tags, counts in self._metrics[metric].items()
         )
         accepted = sum(counts for _tags, counts in self._metrics["writer.accepted.traces"].items())
@@ -251,13 +316,18 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
                 self._conn = None
 
     def _put(self, data, headers, client, no_trace):
-        # type: (bytes, Dict[str, str], WriterClientBase, bool) -> Response
+        # type: (Union[bytes, EncodedBuffer], Dict[str, str], WriterClientBase, bool) -> Response
         sw = StopWatch()
         sw.start()
+        intake_url = self._intake_url(client)
         with self._conn_lck:
             if self._conn is None:
-                log.debug("creating new intake connection to %s with timeout %d", self.intake_url, self._timeout)
-                self._conn = get_connection(self._intake_url(client), self._timeout)
+                if self._reuse_connections:
+                    log.debug("getting pooled intake connection to %s with timeout %d", intake_url, self._timeout)
+                    self._conn = connection_pool.get(intake_url, self._timeout)
+                else:
+                    log.debug("creating new intake connection to %s with timeout %d", intake_url, self._timeout)
+                    self._conn = get_connection(intake_url, self._timeout)
                 setattr(self._conn, _HTTPLIB_NO_TRACE_REQUEST, no_trace)
             try:
                 log.debug("Sending request: %s %s %s", self.HTTP_METHOD, client.ENDPOINT, headers)
@@ -285,18 +355,36 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
                 # Reset the connection if reusing connections is disabled.
                 if not self._reuse_connections:
                     self._reset_connection()
-
-    def _get_finalized_headers(self, count, client):
-        # type: (int, WriterClientBase) -> dict
+                elif self._conn is not None:
+                    # Give the connection back to the shared pool so that the
+                    # other components talking to the agent can reuse it.
+                    connection_pool.put(intake_url, self._conn)
+                    self._conn = None
+
+    def _get_finalized_headers(self, count, client, encoding=None):
+        # type: (int, WriterClientBase, Optional[str]) -> dict
         headers = self._headers.copy()
         headers.update({"Content-Type": client.encoder.content_type})  # type: ignore[attr-defined]
+        # DEV: An empty encoding is given for uncompressed payloads
+        if encoding is None:
+            encoding = self._compression
+        if encoding:
+            headers["Content-Encoding"] = encoding
         if hasattr(client, "_headers"):
             headers.update(client._headers)
         return headers
 
-    def _send_payload(self, payload, count, client):
+    def _should_spool(self, response):
+        # type: (Response) -> bool
+        """Whether the payload of a response is spooled, if enabled, to be sent again later.
+
+        These statuses are returned by an intake that is restarting or overloaded.
+        """
+        return self._spool is not None and (response.status == 429 or response.status >= 500)
+
+    def _send_payload(self, payload, count, client, encoding=None):
         # type: (...) -> Response
-        headers = self._get_finalized_headers(count, client)
+        headers = self._get_finalized_headers(count, client, encoding)
 
         self._metrics_dist("http.requests")
 
@@ -307,27 +395,32 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         else:
             self._metrics_dist("http.sent.bytes", len(payload))
 
-        if response.status not in (404, 415) and response.status >= 400:
-            msg = "failed to send traces to intake at %s: HTTP error status %s, reason %s"
-            log_args = (
-                self._intake_endpoint(client),
-                response.status,
-                response.reason,
-            )  # type: Tuple[Any, Any, Any]
-            # Append the payload if requested
-            if config._trace_writer_log_err_payload:
-                msg += ", payload %s"
-                # If the payload is bytes then hex encode the value before logging
-                if isinstance(payload, six.binary_type):
-                    log_args += (binascii.hexlify(payload).decode(),)  # type: ignore
-                else:
-                    log_args += (payload,)  # type: ignore
-
-            log.error(msg, *log_args)
-            self._metrics_dist("http.dropped.bytes", len(payload))
-            self._metrics_dist("http.dropped.traces", count)
+        if response.status not in (404, 415) and response.status >= 400 and not self._should_spool(response):
+            self._log_error_response(payload, count, client, response)
         return response
 
+    def _log_error_response(self, payload, count, client, response):
+        # type: (Any, int, WriterClientBase, Response) -> None
+        """Log an error response of the intake, whose payload is dropped."""
+        msg = "failed to send traces to intake at %s: HTTP error status %s, reason %s"
+        log_args = (
+            self._intake_endpoint(client),
+            response.status,
+            response.reason,
+        )  # type: Tuple[Any, Any, Any]
+        # Append the payload if requested
+        if config._trace_writer_log_err_payload:
+            msg += ", payload %s"
+            # If the payload is bytes then hex encode the value before logging
+            if isinstance(payload, (six.binary_type, EncodedBuffer)):
+                log_args += (binascii.hexlify(payload).decode(),)  # type: ignore
+            else:
+                log_args += (payload,)  # type: ignore
+
+        log.error(msg, *log_args)
+        self._metrics_dist("http.dropped.bytes", len(payload))
+        self._metrics_dist("http.dropped.traces", count)
+
     def write(self, spans=None):
         for client in self._clients:
             self._write_with_client(client, spans=spans)
@@ -351,6 +444,43 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         self._metrics_dist("writer.accepted.traces")
         self._set_keep_rate(spans)
 
+        if self._encoding_queue is not None:
+            self._queue_for_encoding(client, spans)
+        else:
+            self._encode_with_client(client, spans, spill=self._spill_queue is None)
+
+    def _queue_for_encoding(self, client, spans):
+        # type: (WriterClientBase, List[Span]) -> None
+        # DEV: The length check and the append are not atomic, so the queue
+        # can exceed its size by a few traces under contention.
+        if len(self._encoding_queue) >= self._encoding_queue_size:  # type: ignore[arg-type]
+            log.warning(
+                "trace encoding queue (%d traces) is full, dropping trace (writer status: %s)",
+                self._encoding_queue_size,
+                self.status.value,
+            )
+            self._metrics_dist("buffer.dropped.traces", 1, tags=("reason:full",))
+            return
+        self._encoding_queue.append((client, spans))  # type: ignore[union-attr]
+
+    def _encode_queued_traces(self):
+        # type: () -> None
+        """Encode the traces queued by application threads."""
+        # The traces waiting for the buffer to be spooled are the oldest ones.
+        for queue in (self._spill_queue, self._encoding_queue):
+            if queue is None:
+                continue
+            # Only drain what has been queued so far so that this method
+            # returns even if traces keep being queued.
+            for _ in range(len(queue)):
+                try:
+                    client, spans = queue.popleft()
+                except IndexError:
+                    break
+                self._encode_with_client(client, spans)
+
+    def _encode_with_client(self, client, spans, spill=True):
+        # type: (WriterClientBase, List[Span], bool) -> None
         try:
             client.encoder.put(spans)
         except BufferItemTooLarge as e:
@@ -363,6 +493,14 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("buffer.dropped.traces", 1, tags=("reason:t_too_big",))
             self._metrics_dist("buffer.dropped.bytes", payload_size, tags=("reason:t_too_big",))
         except BufferFull as e:
+            if not spill and self._spill_queue is not None and len(self._spill_queue) < self._spill_queue_size:
+                # Leave the spooling of the buffer to the periodic thread.
+                self._spill_queue.append((client, spans))
+                return
+            if spill and self._spill_buffer(client):
+                # The buffer is empty now, so the trace can be encoded again.
+                self._encode_with_client(client, spans, spill=False)
+                return
             payload_size = e.args[0]
             log.warning(
                 "trace buffer (%s traces %db/%db) cannot fit trace of size %db, dropping (writer status: %s)",
@@ -380,8 +518,148 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("buffer.accepted.traces", 1)
             self._metrics_dist("buffer.accepted.spans", len(spans))
 
+    def _spill_buffer(self, client):
+        # type: (WriterClientBase) -> bool
+        """Move the traces in the buffer of a client to the spool to make room for new traces."""
+        if self._spool is None or client.encoder.size > self._spool.max_bytes:
+            return False
+
+        n_traces = len(client.encoder)
+        try:
+            encoded = client.encoder.encode_buffer()
+            if encoded is None:
+                return False
+            if self._compress is not None:
+                encoded = self._compress(encoded)
+        except Exception:
+            log.error("failed to encode trace with encoder %r", client.encoder, exc_info=True)
+            self._metrics_dist("encoder.dropped.traces", n_traces)
+            return False
+
+        if not self._spool_payload(encoded, n_traces, client):
+            self._metrics_dist("buffer.dropped.traces", n_traces, tags=("reason:full",))
+            self._metrics_dist("buffer.dropped.bytes", len(encoded), tags=("reason:full",))
+            return False
+        log.debug("trace buffer is full, spooled %d traces to %s", n_traces, self._spool.directory)
+        return True
+
+    def _spool_payload(self, payload, count, client):
+        # type: (Any, int, WriterClientBase) -> bool
+        """Store a payload in the spool, if enabled, to send it later."""
+        if self._spool is None or not count:
+            # Payloads without traces are not worth sending again.
+            return False
+        try:
+            evicted = self._spool.push(payload, client.ENDPOINT, count, self._compression or "")
+        except Exception:
+            log.warning("failed to spool %d traces to %s", count, self._spool.directory, exc_info=True)
+            return False
+
+        for entry in evicted:
+            self._metrics_dist("spool.dropped.traces", entry.count, tags=("reason:full",))
+            self._metrics_dist("spool.dropped.bytes", entry.size, tags=("reason:full",))
+        self._metrics_dist("spool.accepted.traces", count)
+        self._metrics_dist("spool.accepted.bytes", len(payload))
+        return True
+
+    def _replay_spool(self):
+        # type: () -> None
+        """Send the spooled payloads again, oldest first.
+
+        The payloads sent on each flush are limited by the replay rate, but at
+        least one payload is sent, so that the spool drains even when a payload
+        is larger than the budget. If the last payload could not be sent, only
+        one payload is sent to check whether the intake is reachable again.
+        """
+        if self._spool is None:
+            return
+
+        if not self._spool_recovered:
+            self._spool_recovered = True
+            self._recover_spool()
+
+        budget = 0 if self._send_failed else self._spool_replay_rate * self.interval
+        sent = 0
+        while sent == 0 or sent < budget:
+            entry = self._spool.pop()
+            if entry is None:
+                return
+
+            client = next((c for c in self._clients if c.ENDPOINT == entry.endpoint), None)
+            if client is None:
+                # The API version was downgraded since the payload was encoded.
+                self._spool.discard(entry)
+                self._metrics_dist("spool.dropped.traces", entry.count, tags=("reason:incompatible",))
+                continue
+
+            try:
+                with self._spool.read(entry) as payload:
+                    try:
+                        # The payload is sent with the compression it was
+                        # spooled with, which can differ from the current one
+                        # after a restart.
+                        response = self._send_payload(payload, entry.count, client, entry.encoding)
+                    except Exception:
+                        log.debug(
+                            "failed to replay %d spooled traces to intake at %s",
+                            entry.count,
+                            self._intake_endpoint(client),
+                            exc_info=True,
+                        )
+                        self._metrics_dist("http.errors", tags=("type:err",))
+                        self._spool.restore(entry)
+                        self._send_failed = True
+                        return
+                    if self._should_spool(response):
+                        log.debug(
+                            "failed to replay %d spooled traces to intake at %s: HTTP error status %s",
+                            entry.count,
+                            self._intake_endpoint(client),
+                            response.status,
+                        )
+                        self._spool.restore(entry)
+                        self._send_failed = True
+                        return
+            except (EnvironmentError, ValueError):
+                log.warning("failed to read spooled payload %s, dropping %d traces", entry.path, entry.count)
+                self._spool.discard(entry)
+                self._metrics_dist("spool.dropped.traces", entry.count, tags=("reason:io",))
+                continue
+
+            self._spool.discard(entry)
+            self._send_failed = False
+            self._metrics_dist("spool.replayed.traces", entry.count)
+            sent += entry.size
+
+    def _recover_spool(self):
+        # type: () -> None
+        """Take over the payloads spooled by the previous processes, e.g. before the application restarted."""
+        spool = self._spool
+        if spool is None:
+            return
+        try:
+            recovered, evicted = spool.recover()
+        except Exception:
+            log.warning("failed to recover spooled payloads from %s", spool.directory, exc_info=True)
+            return
+        for entry in evicted:
+            self._metrics_dist("spool.dropped.traces", entry.count, tags=("reason:full",))
+            self._metrics_dist("spool.dropped.bytes", entry.size, tags=("reason:full",))
+        if recovered:
+            log.debug(
+                "recovered %d spooled payloads (%d traces) in %s",
+                len(recovered),
+                sum(entry.count for entry in recovered),
+                spool.directory,
+            )
+
     def flush_queue(self, raise_exc=False):
         try:
+            self._encode_queued_traces()
+            self._replay_spool()
+            if config.health_metrics_enabled:
+                for name, count in connection_pool.flush_metrics().items():
+                    self._metrics_dist(name, count)
             for client in self._clients:
                 self._flush_queue_with_client(client, raise_exc=raise_exc)
         finally:
@@ -392,7 +670,10 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
         # type: (WriterClientBase, bool) -> None
         n_traces = len(client.encoder)
         try:
-            encoded = client.encoder.encode()
+            # DEV: The encoded payload may be a view over the encoder's own
+            # buffer, which is handed back to the encoder once the payload is
+            # released at the end of this method.
+            encoded = client.encoder.encode_buffer()
             if encoded is None:
                 return
         except Exception:
@@ -400,14 +681,33 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self._metrics_dist("encoder.dropped.traces", n_traces)
             return
 
+        if self._compress is not None:
+            try:
+                encoded = self._compress(encoded)
+            except Exception:
+                log.error("failed to compress payload with %s", self._compression, exc_info=True)
+                self._metrics_dist("encoder.dropped.traces", n_traces)
+                return
+
         try:
-            self._send_payload_with_backoff(encoded, n_traces, client)
+            response = self._send_payload_with_backoff(encoded, n_traces, client)
         except Exception:
+            self._send_failed = True
             self._metrics_dist("http.errors", tags=("type:err",))
-            self._metrics_dist("http.dropped.bytes", len(encoded))
-            self._metrics_dist("http.dropped.traces", n_traces)
+            spooled = self._spool_payload(encoded, n_traces, client)
+            if not spooled:
+                self._metrics_dist("http.dropped.bytes", len(encoded))
+                self._metrics_dist("http.dropped.traces", n_traces)
             if raise_exc:
                 six.reraise(*sys.exc_info())
+            elif spooled:
+                log.warning(
+                    "failed to send %d traces to intake at %s after %d retries, spooling them to %s",
+                    n_traces,
+                    self._intake_endpoint(client),
+                    self.RETRY_ATTEMPTS,
+                    self._spool.directory,  # type: ignore[union-attr]
+                )
             else:
                 log.error(
                     "failed to send, dropping %d traces to intake at %s after %d retries",
@@ -415,6 +715,21 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
                     self._intake_endpoint(client),
                     self.RETRY_ATTEMPTS,
                 )
+        else:
+            if self._should_spool(response):
+                self._send_failed = True
+                if self._spool_payload(encoded, n_traces, client):
+                    log.warning(
+                        "failed to send %d traces to intake at %s: HTTP error status %s, spooling them to %s",
+                        n_traces,
+                        self._intake_endpoint(client),
+                        response.status,
+                        self._spool.directory,  # type: ignore[union-attr]
+                    )
+                else:
+                    self._log_error_response(encoded, n_traces, client, response)
+            else:
+                self._send_failed = False
         finally:
             if config.health_metrics_enabled and self.dogstatsd:
                 namespace = self.STATSD_NAMESPACE
@@ -445,6 +760,11 @@ class HTTPWriter(periodic.PeriodicService, TraceWriter):
             self.periodic()
         finally:
             self._reset_connection()
+            if self._spool is not None and len(self._spool):
+                # The spooled payloads are sent by the next process, e.g. once the application restarted.
+                log.warning(
+                    "leaving %d spooled trace payloads in %s on shutdown", len(self._spool), self._spool.directory
+                )
 
 
 class AgentResponse(object):
@@ -482,6 +802,11 @@ class AgentWriter(HTTPWriter):
         reuse_connections=None,  # type: Optional[bool]
         headers=None,  # type: Optional[Dict[str, str]]
         response_callback=None,  # type: Optional[Callable[[AgentResponse], None]]
+        async_encoding=None,  # type: Optional[bool]
+        compression=None,  # type: Optional[str]
+        compression_level=None,  # type: Optional[int]
+        spool_dir=None,  # type: Optional[str]
+        spool_max_bytes=None,  # type: Optional[int]
     ):
         # type: (...) -> None
         if processing_interval is None:
@@ -549,6 +874,11 @@ class AgentWriter(HTTPWriter):
             sync_mode=sync_mode,
             reuse_connections=reuse_connections,
             headers=_headers,
+            async_encoding=async_encoding,
+            compression=compression,
+            compression_level=compression_level,
+            spool_dir=spool_dir,
+            spool_max_bytes=spool_max_bytes,
         )
 
     def recreate(self):
@@ -591,9 +921,9 @@ class AgentWriter(HTTPWriter):
             return payload
         raise ValueError()
 
-    def _send_payload(self, payload, count, client):
+    def _send_payload(self, payload, count, client, encoding=None):
         # type: (...) -> Response
-        response = super(AgentWriter, self)._send_payload(payload, count, client)
+        response = super(AgentWriter, self)._send_payload(payload, count, client, encoding)
         if response.status in [404, 415]:
             log.debug("calling endpoint '%s' but received %s; downgrading API", client.ENDPOINT, response.status)
             try:
@@ -607,7 +937,7 @@ class AgentWriter(HTTPWriter):
                 )
             else:
                 if payload is not None:
-                    self._send_payload(payload, count, client)
+                    self._send_payload(payload, count, client, encoding)
         elif response.status < 400:
             if self._response_cb:
                 raw_resp = response.get_json()
@@ -635,8 +965,8 @@ class AgentWriter(HTTPWriter):
         except service.ServiceStatusError:
             pass
 
-    def _get_finalized_headers(self, count, client):
-        # type: (int, WriterClientBase) -> dict
-        headers = super(AgentWriter, self)._get_finalized_headers(count, client)
+    def _get_finalized_headers(self, count, client, encoding=None):
+        # type: (int, WriterClientBase, Optional[str]) -> dict
+        headers = super(AgentWriter, self)._get_finalized_headers(count, client, encoding)
         headers["X-Datadog-Trace-Count"] = str(count)
         return headers
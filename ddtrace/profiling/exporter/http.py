@@ -23,6 +23,7 @@ from ddtrace.internal import runtime
 from ddtrace.internal.processor.endpoint_call_counter import EndpointCallCounterProcessor
 from ddtrace.internal.runtime import container
 from ddtrace.internal.utils.formats import parse_tags_str
+from ddtrace.internal.utils.http import connection_pool
 from ddtrace.internal.utils.retry import fibonacci_backoff_with_jitter
 from ddtrace.profiling import exporter
 from ddtrace.profiling import recorder
@@ -224,8 +225,11 @@ class PprofHTTPExporter(pprof.PprofExporter):
         )
         headers["Content-Type"] = content_type
 
-        client = agent.get_connection(self.endpoint, self.timeout)
-        self._upload(client, self.endpoint_path, body, headers)
+        client = connection_pool.get(self.endpoint, self.timeout)
+        try:
+            self._upload(client, self.endpoint_path, body, headers)
+        finally:
+            connection_pool.put(self.endpoint, client)
 
         return profile, libs
 
@@ -235,9 +239,9 @@ class PprofHTTPExporter(pprof.PprofExporter):
             response = client.getresponse()
             response.read()  # reading is mandatory
         except (http_client.HTTPException, EnvironmentError) as e:
-            raise exporter.ExportError("HTTP upload request failed: %s" % e)
-        finally:
+            # The connection is reopened by the next attempt
             client.close()
+            raise exporter.ExportError("HTTP upload request failed: %s" % e)
 
         if 200 <= response.status < 300:
             return
@@ -1,4 +1,3 @@
-import re
 from typing import Dict
 from typing import FrozenSet
 from typing import List
@@ -13,6 +12,10 @@ from ..constants import AUTO_KEEP
 from ..constants import AUTO_REJECT
 from ..constants import USER_KEEP
 from ..context import Context
+from ..internal._propagation import HeaderExtractor
+from ..internal._propagation import decode_tracestate_dd
+from ..internal._propagation import parse_traceparent
+from ..internal._propagation import parse_tracestate
 from ..internal._tagset import TagsetDecodeError
 from ..internal._tagset import TagsetEncodeError
 from ..internal._tagset import TagsetMaxSizeDecodeError
@@ -77,21 +80,27 @@ _POSSIBLE_HTTP_HEADER_B3_FLAGS = _possible_header(_HTTP_HEADER_B3_FLAGS)
 _POSSIBLE_HTTP_HEADER_TRACEPARENT = _possible_header(_HTTP_HEADER_TRACEPARENT)
 _POSSIBLE_HTTP_HEADER_TRACESTATE = _possible_header(_HTTP_HEADER_TRACESTATE)
 
-
-# https://www.w3.org/TR/trace-context/#traceparent-header-field-values
-# Future proofing: The traceparent spec is additive, future traceparent versions may contain more than 4 values
-# The regex below matches the version, trace id, span id, sample flag, and end-string/future values (if version>00)
-_TRACEPARENT_HEX_REGEX = re.compile(
-    r"""
-     ^                  # Start of string
-     ([a-f0-9]{2})-     # 2 character hex version
-     ([a-f0-9]{32})-    # 32 character hex trace id
-     ([a-f0-9]{16})-    # 16 character hex span id
-     ([a-f0-9]{2})      # 2 character hex sample flag
-     (-.+)?             # optional, start of any additional values
-     $                  # end of string
-     """,
-    re.VERBOSE,
+# Extract all the headers used by the propagators in a single pass, by any of
+# the names they can have
+_HEADER_EXTRACTOR = HeaderExtractor(
+    {
+        name: header
+        for header in (
+            HTTP_HEADER_TRACE_ID,
+            HTTP_HEADER_PARENT_ID,
+            HTTP_HEADER_SAMPLING_PRIORITY,
+            HTTP_HEADER_ORIGIN,
+            _HTTP_HEADER_TAGS,
+            _HTTP_HEADER_B3_SINGLE,
+            _HTTP_HEADER_B3_TRACE_ID,
+            _HTTP_HEADER_B3_SPAN_ID,
+            _HTTP_HEADER_B3_SAMPLED,
+            _HTTP_HEADER_B3_FLAGS,
+            _HTTP_HEADER_TRACEPARENT,
+            _HTTP_HEADER_TRACESTATE,
+        )
+        for name in _possible_header(header)
+    }
 )
 
 
@@ -184,6 +193,15 @@ class _DatadogMultiHeader:
         if "_dd.propagation_error" in span_context._meta:
             return
 
+        # The encoded tags are reused until the tags of the trace change
+        values = span_context._propagation_values()
+        values_key = (_HTTP_HEADER_TAGS, config._x_datadog_tags_max_length)
+        encoded_tags = values.get(values_key)
+        if encoded_tags is not None:
+            if encoded_tags:
+                headers[_HTTP_HEADER_TAGS] = encoded_tags
+            return
+
         # Only propagate trace tags which means ignoring the _dd.origin
         tags_to_encode = {
             # DEV: Context._meta is a _MetaDictType but we need Dict[str, str]
@@ -192,9 +210,11 @@ class _DatadogMultiHeader:
             if _DatadogMultiHeader._is_valid_datadog_trace_tag_key(k)
         }  # type: Dict[Text, Text]
 
-        if tags_to_encode:
+        if not tags_to_encode:
+            values[values_key] = ""
+        else:
             try:
-                headers[_HTTP_HEADER_TAGS] = encode_tagset_values(
+                headers[_HTTP_HEADER_TAGS] = values[values_key] = encode_tagset_values(
                     tags_to_encode, max_size=config._x_datadog_tags_max_length
                 )
             except TagsetMaxSizeEncodeError:
@@ -608,17 +628,13 @@ class _TraceContext:
         Otherwise we extract the trace-id, span-id, and sampling priority from the
         traceparent header.
         """
-        valid_tp_values = _TRACEPARENT_HEX_REGEX.match(tp.strip())
-        if valid_tp_values is None:
+        # https://www.w3.org/TR/trace-context/#traceparent-header-field-values
+        # Future proofing: The traceparent spec is additive, future traceparent versions may contain more than 4 values
+        tp_values = parse_traceparent(tp.strip())
+        if tp_values is None:
             raise ValueError("Invalid traceparent version: %s" % tp)
 
-        (
-            version,
-            trace_id_hex,
-            span_id_hex,
-            trace_flags_hex,
-            future_vals,
-        ) = valid_tp_values.groups()  # type: Tuple[str, str, str, str, Optional[str]]
+        version, trace_id, span_id, trace_flags, future_vals = tp_values
 
         if version == "ff":
             # https://www.w3.org/TR/trace-context/#version
@@ -629,16 +645,12 @@ class _TraceContext:
         elif version == "00" and future_vals is not None:
             raise ValueError("Traceparents with the version `00` should contain 4 values delimited by a dash: %s" % tp)
 
-        trace_id = _hex_id_to_dd_id(trace_id_hex)
-        span_id = _hex_id_to_dd_id(span_id_hex)
-
         # All 0s are invalid values
         if trace_id == 0:
             raise ValueError("0 value for trace_id is invalid")
         if span_id == 0:
             raise ValueError("0 value for span_id is invalid")
 
-        trace_flags = _hex_id_to_dd_id(trace_flags_hex)
         # there's currently only one trace flag, which denotes sampling priority
         # was set to keep "01" or drop "00"
         # trace flags is a bit field: https://www.w3.org/TR/trace-context/#trace-flags
@@ -656,31 +668,12 @@ class _TraceContext:
         dd = None
         for list_mem in ts_l:
             if list_mem.startswith("dd="):
-                # cut out dd= before turning into dict
-                list_mem = list_mem[3:]
-                # since tags can have a value with a :, we need to only split on the first instance of :
-                dd = dict(item.split(":", 1) for item in list_mem.split(";"))
-
-        # parse out values
-        if dd:
-            sampling_priority_ts = dd.get("s")
-            if sampling_priority_ts is not None:
-                sampling_priority_ts_int = int(sampling_priority_ts)
-            else:
-                sampling_priority_ts_int = None
-
-            origin = dd.get("o")
-            if origin:
-                # we encode "=" as "~" in tracestate so need to decode here
-                origin = _TraceContext.decode_tag_val(origin)
-            # need to convert from t. to _dd.p.
-            other_propagated_tags = {
-                "_dd.p.%s" % k[2:]: _TraceContext.decode_tag_val(v) for (k, v) in dd.items() if k.startswith("t.")
-            }
-
-            return sampling_priority_ts_int, other_propagated_tags, origin
-        else:
+                # cut out dd= before decoding
+                dd = list_mem[3:]
+
+        if dd is None:
             return None, {}, None
+        return decode_tracestate_dd(dd)
 
     @staticmethod
     def _get_sampling_priority(traceparent_sampled, tracestate_sampling_priority):
@@ -727,17 +720,16 @@ class _TraceContext:
         if ts:
             # whitespace is allowed, but whitespace to start or end values should be trimmed
             # e.g. "foo=1 \t , \t bar=2, \t baz=3" -> "foo=1,bar=2,baz=3"
-            ts_l = [member.strip() for member in ts.split(",")]
-            ts = ",".join(ts_l)
             # the value MUST contain only ASCII characters in the
             # range of 0x20 to 0x7E
-            if re.search(r"[^\x20-\x7E]+", ts):
+            normalized_ts, dd = parse_tracestate(ts)
+            if normalized_ts is None:
                 log.debug("received invalid tracestate header: %r", ts)
             else:
                 # store tracestate so we keep other vendor data for injection, even if dd ends up being invalid
-                meta[W3C_TRACESTATE_KEY] = ts
+                meta[W3C_TRACESTATE_KEY] = ts = normalized_ts
                 try:
-                    tracestate_values = _TraceContext._get_tracestate_values(ts_l)
+                    tracestate_values = decode_tracestate_dd(dd) if dd is not None else (None, {}, None)
                 except (TypeError, ValueError):
                     log.debug("received invalid dd header value in tracestate: %r ", ts)
                     tracestate_values = None
@@ -855,7 +847,9 @@ class HTTPPropagator(object):
             return Context()
 
         try:
-            normalized_headers = {name.lower(): v for name, v in headers.items()}
+            normalized_headers = _HEADER_EXTRACTOR.extract(headers)
+            if not normalized_headers:
+                return Context()
 
             # loop through the extract propagation styles specified in order
             for prop_style in config._propagation_style_extract:
@@ -17,11 +17,17 @@ from ddtrace.internal.utils.deprecations import DDTraceDeprecationWarning
 from ddtrace.vendor.debtcollector import deprecate
 
 from ..internal import gitmetadata
+from ..internal.constants import DEFAULT_ASYNC_ENCODING_QUEUE_SIZE
 from ..internal.constants import DEFAULT_BUFFER_SIZE
+from ..internal.constants import DEFAULT_DATA_STREAMS_MAX_PATHWAYS
 from ..internal.constants import DEFAULT_MAX_PAYLOAD_SIZE
 from ..internal.constants import DEFAULT_PROCESSING_INTERVAL
 from ..internal.constants import DEFAULT_REUSE_CONNECTIONS
 from ..internal.constants import DEFAULT_SAMPLING_RATE_LIMIT
+from ..internal.constants import DEFAULT_SPOOL_MAX_BYTES
+from ..internal.constants import DEFAULT_SPOOL_REPLAY_RATE
+from ..internal.constants import DEFAULT_STATS_MAX_AGGREGATION_KEYS
+from ..internal.constants import DEFAULT_STATS_PEER_TAGS
 from ..internal.constants import DEFAULT_TIMEOUT
 from ..internal.constants import PROPAGATION_STYLE_ALL
 from ..internal.constants import PROPAGATION_STYLE_B3
@@ -244,6 +250,7 @@ class Config(object):
 
         self._trace_sample_rate = os.getenv("DD_TRACE_SAMPLE_RATE")
         self._trace_rate_limit = int(os.getenv("DD_TRACE_RATE_LIMIT", default=DEFAULT_SAMPLING_RATE_LIMIT))
+        self._trace_rate_limiter_per_thread = asbool(os.getenv("DD_TRACE_RATE_LIMITER_PER_THREAD", default=False))
         self._trace_sampling_rules = os.getenv("DD_TRACE_SAMPLING_RULES")
         self._partial_flush_enabled = asbool(os.getenv("DD_TRACE_PARTIAL_FLUSH_ENABLED", default=True))
         self._partial_flush_min_spans = int(os.getenv("DD_TRACE_PARTIAL_FLUSH_MIN_SPANS", default=500))
@@ -258,6 +265,10 @@ class Config(object):
                 "DD_REMOTE_CONFIG_POLL_INTERVAL_SECONDS", default=os.getenv("DD_REMOTECONFIG_POLL_SECONDS", default=5.0)
             )
         )
+        # The polling interval only backs off when a greater maximum is configured
+        self._remote_config_max_poll_interval = float(
+            os.getenv("DD_REMOTE_CONFIG_MAX_POLL_INTERVAL_SECONDS", default=self._remote_config_poll_interval)
+        )
         self._trace_api = os.getenv("DD_TRACE_API_VERSION")
         self._trace_writer_buffer_size = int(
             os.getenv("DD_TRACE_WRITER_BUFFER_SIZE_BYTES", default=DEFAULT_BUFFER_SIZE)
@@ -272,6 +283,20 @@ class Config(object):
             os.getenv("DD_TRACE_WRITER_REUSE_CONNECTIONS", DEFAULT_REUSE_CONNECTIONS)
         )
         self._trace_writer_log_err_payload = asbool(os.environ.get("_DD_TRACE_WRITER_LOG_ERROR_PAYLOADS", False))
+        self._trace_writer_async_encoding = asbool(os.getenv("DD_TRACE_WRITER_ASYNC_ENCODING", default=False))
+        self._trace_writer_async_encoding_queue_size = int(
+            os.getenv("DD_TRACE_WRITER_ASYNC_ENCODING_QUEUE_SIZE", default=DEFAULT_ASYNC_ENCODING_QUEUE_SIZE)
+        )
+        self._trace_writer_compression = os.getenv("DD_TRACE_WRITER_COMPRESSION", default="none").strip().lower()
+        _compression_level = os.getenv("DD_TRACE_WRITER_COMPRESSION_LEVEL")
+        self._trace_writer_compression_level = int(_compression_level) if _compression_level else None
+        self._trace_writer_spool_dir = os.getenv("DD_TRACE_WRITER_SPOOL_DIR") or None
+        self._trace_writer_spool_max_bytes = int(
+            os.getenv("DD_TRACE_WRITER_SPOOL_MAX_BYTES", default=DEFAULT_SPOOL_MAX_BYTES)
+        )
+        self._trace_writer_spool_replay_rate = int(
+            os.getenv("DD_TRACE_WRITER_SPOOL_REPLAY_RATE", default=DEFAULT_SPOOL_REPLAY_RATE)
+        )
 
         self._trace_agent_hostname = os.environ.get("DD_AGENT_HOST", os.environ.get("DD_TRACE_AGENT_HOSTNAME"))
         self._trace_agent_port = os.environ.get("DD_AGENT_PORT", os.environ.get("DD_TRACE_AGENT_PORT"))
@@ -326,6 +351,7 @@ class Config(object):
 
         self._telemetry_enabled = asbool(os.getenv("DD_INSTRUMENTATION_TELEMETRY_ENABLED", True))
         self._telemetry_heartbeat_interval = float(os.getenv("DD_TELEMETRY_HEARTBEAT_INTERVAL", "60"))
+        self._telemetry_compression_enabled = asbool(os.getenv("DD_TELEMETRY_COMPRESSION_ENABLED", default=False))
 
         self._runtime_metrics_enabled = asbool(os.getenv("DD_RUNTIME_METRICS_ENABLED", False))
 
@@ -371,7 +397,19 @@ class Config(object):
                 "DD_TRACE_COMPUTE_STATS", os.getenv("DD_TRACE_STATS_COMPUTATION_ENABLED", trace_compute_stats_default)
             )
         )
+        self._trace_stats_peer_tags_enabled = asbool(os.getenv("DD_TRACE_STATS_PEER_TAGS_ENABLED", False))
+        self._trace_stats_peer_tags = [
+            tag.strip()
+            for tag in os.getenv("DD_TRACE_STATS_PEER_TAGS", ",".join(DEFAULT_STATS_PEER_TAGS)).split(",")
+            if tag.strip()
+        ]
+        self._trace_stats_max_aggregation_keys = int(
+            os.getenv("DD_TRACE_STATS_MAX_AGGREGATION_KEYS", DEFAULT_STATS_MAX_AGGREGATION_KEYS)
+        )
         self._data_streams_enabled = asbool(os.getenv("DD_DATA_STREAMS_ENABLED", False))
+        self._data_streams_max_pathways = int(
+            os.getenv("DD_DATA_STREAMS_MAX_PATHWAYS", DEFAULT_DATA_STREAMS_MAX_PATHWAYS)
+        )
         self._appsec_enabled = asbool(os.getenv(APPSEC_ENV, False))
         self._automatic_login_events_mode = os.getenv(APPSEC.AUTOMATIC_USER_EVENTS_TRACKING, "safe")
         self._user_model_login_field = os.getenv(APPSEC.USER_MODEL_LOGIN_FIELD, default="")
@@ -423,6 +461,8 @@ class Config(object):
             os.environ["OTEL_PYTHON_CONTEXT"] = "ddcontextvars_context"
         self._ddtrace_bootstrapped = False
         self._span_aggregator_rlock = asbool(os.getenv("DD_TRACE_SPAN_AGGREGATOR_RLOCK", True))
+        self._span_aggregator_shards = int(os.getenv("DD_TRACE_SPAN_AGGREGATOR_SHARDS", default=0))
+        self._span_pool_size = int(os.getenv("DD_TRACE_SPAN_POOL_SIZE", default=0))
 
         self._iast_redaction_enabled = asbool(os.getenv("DD_IAST_REDACTION_ENABLED", default=True))
         self._iast_redaction_name_pattern = os.getenv(
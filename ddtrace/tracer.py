@@ -32,6 +32,8 @@ from .internal import compat
 from .internal import debug
 from .internal import forksafe
 from .internal import hostname
+from .internal._tracing import on_span_finish as _on_span_finish
+from .internal._tracing import start_child_span as _start_child_span
 from .internal.atexit import register_on_exit_signal
 from .internal.constants import SAMPLING_DECISION_TRACE_TAG_KEY
 from .internal.constants import SPAN_API_DATADOG
@@ -41,6 +43,7 @@ from .internal.logger import hasHandlers
 from .internal.processor import SpanProcessor
 from .internal.processor.trace import BaseServiceProcessor
 from .internal.processor.trace import PeerServiceProcessor
+from .internal.processor.trace import ShardedSpanAggregator
 from .internal.processor.trace import SpanAggregator
 from .internal.processor.trace import SpanSamplingProcessor
 from .internal.processor.trace import TopLevelSpanProcessor
@@ -54,6 +57,8 @@ from .internal.serverless import in_azure_function_consumption_plan
 from .internal.serverless import in_gcp_function
 from .internal.serverless.mini_agent import maybe_start_serverless_mini_agent
 from .internal.service import ServiceStatusError
+from .internal.span_pool import IS_SUPPORTED as _SPAN_POOL_SUPPORTED
+from .internal.span_pool import SpanPool
 from .internal.utils.http import verify_url
 from .internal.writer import AgentResponse
 from .internal.writer import AgentWriter
@@ -140,6 +145,7 @@ def _default_span_processors_factory(
     single_span_sampling_rules,  # type: List[SpanSamplingRule]
     agent_url,  # type: str
     profiling_span_processor,  # type: EndpointCallCounterProcessor
+    span_pool=None,  # type: Optional[SpanPool]
 ):
     # type: (...) -> Tuple[List[SpanProcessor], Optional[Any], List[SpanProcessor]]
     # FIXME: type should be AppsecSpanProcessor but we have a cyclic import here
@@ -191,14 +197,24 @@ def _default_span_processors_factory(
         span_processors.append(SpanSamplingProcessor(single_span_sampling_rules))
 
     # These need to run after all the other processors
-    deferred_processors = [
-        SpanAggregator(
+    if config._span_aggregator_shards > 0:
+        span_aggregator = ShardedSpanAggregator(
             partial_flush_enabled=partial_flush_enabled,
             partial_flush_min_spans=partial_flush_min_spans,
             trace_processors=trace_processors,
             writer=trace_writer,
+            span_pool=span_pool,
+            num_shards=config._span_aggregator_shards,
+        )  # type: SpanAggregator
+    else:
+        span_aggregator = SpanAggregator(
+            partial_flush_enabled=partial_flush_enabled,
+            partial_flush_min_spans=partial_flush_min_spans,
+            trace_processors=trace_processors,
+            writer=trace_writer,
+            span_pool=span_pool,
         )
-    ]  # type: List[SpanProcessor]
+    deferred_processors = [span_aggregator]  # type: List[SpanProcessor]
     return span_processors, appsec_processor, deferred_processors
 
 
@@ -275,6 +291,12 @@ class Tracer(object):
         self._appsec_processor = None
         self._iast_enabled = config._iast_enabled
         self._endpoint_call_counter_span_processor = EndpointCallCounterProcessor()
+        # Finished spans are only recycled on the interpreters where their
+        # reference count tells whether they are still in use.
+        self._span_pool = (
+            SpanPool(config._span_pool_size) if config._span_pool_size > 0 and _SPAN_POOL_SUPPORTED else None
+        )  # type: Optional[SpanPool]
+        self._new_span = self._span_pool.acquire if self._span_pool is not None else Span
         self._span_processors, self._appsec_processor, self._deferred_processors = _default_span_processors_factory(
             self._filters,
             self._writer,
@@ -286,6 +308,7 @@ class Tracer(object):
             self._single_span_sampling_rules,
             self._agent_url,
             self._endpoint_call_counter_span_processor,
+            self._span_pool,
         )
         if config._data_streams_enabled:
             # Inline the import to avoid pulling in ddsketch or protobuf
@@ -522,6 +545,7 @@ class Tracer(object):
                 self._single_span_sampling_rules,
                 self._agent_url,
                 self._endpoint_call_counter_span_processor,
+                self._span_pool,
             )
 
         if context_provider is not None:
@@ -587,6 +611,7 @@ class Tracer(object):
             self._single_span_sampling_rules,
             self._agent_url,
             self._endpoint_call_counter_span_processor,
+            self._span_pool,
         )
 
         self._new_process = True
@@ -672,6 +697,12 @@ class Tracer(object):
                     self.context_provider.activate(new_ctx)
                 child_of = new_ctx
 
+        elif type(child_of) is Span:
+            # Fast path for the common case of a local child span
+            span = _start_child_span(self, child_of, name, service, resource, span_type, activate, span_api)
+            if span is not None:
+                return span
+
         parent = None  # type: Optional[Span]
         if child_of is not None:
             if isinstance(child_of, Context):
@@ -702,7 +733,7 @@ class Tracer(object):
 
         if trace_id:
             # child_of a non-empty context, so either a local child span or from a remote context
-            span = Span(
+            span = self._new_span(
                 name=name,
                 context=context,
                 trace_id=trace_id,
@@ -727,7 +758,7 @@ class Tracer(object):
                     span._meta[k] = v
         else:
             # this is the root span of a new trace
-            span = Span(
+            span = self._new_span(
                 name=name,
                 context=context,
                 service=service,
@@ -785,19 +816,7 @@ class Tracer(object):
 
     def _on_span_finish(self, span):
         # type: (Span) -> None
-        active = self.current_span()
-        # Debug check: if the finishing span has a parent and its parent
-        # is not the next active span then this is an error in synchronous tracing.
-        if span._parent is not None and active is not span._parent:
-            log.debug("span %r closing after its parent %r, this is an error when not using async", span, span._parent)
-
-        # Only call span processors if the tracer is enabled
-        if self.enabled:
-            for p in chain(self._span_processors, SpanProcessor.__processors__, self._deferred_processors):
-                p.on_span_finish(span)
-
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("finishing span %s (enabled:%s)", span._pprint(), self.enabled)
+        _on_span_finish(self, span)
 
     def _log_compat(self, level, msg):
         """Logs a message for the given level.
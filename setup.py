@@ -607,6 +607,31 @@ setup(
                 sources=["ddtrace/internal/_tagset.pyx"],
                 language="c",
             ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._ddsketch",
+                sources=["ddtrace/internal/_ddsketch.pyx"],
+                language="c",
+            ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._propagation",
+                sources=["ddtrace/internal/_propagation.pyx"],
+                language="c",
+            ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal.datastreams.fnv",
+                sources=["ddtrace/internal/datastreams/fnv.pyx"],
+                language="c",
+            ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal.datastreams.encoding",
+                sources=["ddtrace/internal/datastreams/encoding.pyx"],
+                language="c",
+            ),
+            Cython.Distutils.Extension(
+                "ddtrace.internal._tracing",
+                sources=["ddtrace/internal/_tracing.pyx"],
+                language="c",
+            ),
             Extension(
                 "ddtrace.internal._encoding",
                 ["ddtrace/internal/_encoding.pyx"],
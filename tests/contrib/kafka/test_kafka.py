@@ -323,6 +323,41 @@ def test_data_streams_kafka(dsm_processor, consumer, producer, kafka_topic):
     )
 
 
+def test_data_streams_kafka_consume(dsm_processor, consumer, producer, kafka_topic):
+    PAYLOAD = bytes("data streams", encoding="utf-8") if six.PY3 else bytes("data streams")
+    try:
+        del dsm_processor._current_context.value
+    except AttributeError:
+        pass
+    for _ in range(3):
+        producer.produce(kafka_topic, PAYLOAD, key="test_key_2")
+    producer.flush()
+    messages = []
+    while len(messages) < 3:
+        messages.extend(consumer.consume(num_messages=3, timeout=1.0))
+    buckets = dsm_processor._buckets
+    assert len(buckets) == 1
+    first = list(buckets.values())[0].pathway_stats
+    produce_stats = [
+        (hash_value, stats)
+        for (edge_tags, hash_value, parent_hash), stats in first.items()
+        if edge_tags == "direction:out,topic:{},type:kafka".format(kafka_topic) and parent_hash == 0
+    ]
+    assert len(produce_stats) == 1
+    produce_hash, stats = produce_stats[0]
+    assert stats.full_pathway_latency._count == 3
+    # The checkpoints of the consumed messages are the children of the produce checkpoint
+    consume_stats = [
+        stats
+        for (edge_tags, _, parent_hash), stats in first.items()
+        if edge_tags == "direction:in,group:test_group,topic:{},type:kafka".format(kafka_topic)
+        and parent_hash == produce_hash
+    ]
+    assert len(consume_stats) == 1
+    assert consume_stats[0].full_pathway_latency._count == 3
+    assert consume_stats[0].edge_latency._count == 3
+
+
 def _generate_in_subprocess(random_topic):
     import six
 
@@ -1,5 +1,13 @@
+import struct
+
+import pytest
+
 from ddtrace.internal.datastreams.encoding import decode_var_int_64
+from ddtrace.internal.datastreams.encoding import decode_var_uint_64
 from ddtrace.internal.datastreams.encoding import encode_var_int_64
+from ddtrace.internal.datastreams.encoding import encode_var_uint_64
+from ddtrace.internal.datastreams.fnv import fnv1_64
+from ddtrace.internal.datastreams.fnv import fnv1_64_uint64_pair
 from ddtrace.internal.datastreams.processor import DataStreamsProcessor
 
 
@@ -13,6 +21,34 @@ def test_encoding():
     assert len(b) == 0
 
 
+@pytest.mark.parametrize("n", [0, 1, -1, 63, -64, 64, 1679672748000, (1 << 62) - 1, -(1 << 62)])
+def test_encoding_signed(n):
+    decoded, b = decode_var_int_64(encode_var_int_64(n) + b"next")
+    assert decoded == n
+    assert b == b"next"
+
+
+def test_encoding_unsigned():
+    assert encode_var_uint_64(0) == b"\x00"
+    assert encode_var_uint_64(300) == b"\xac\x02"
+    assert encode_var_uint_64((1 << 63) - 1) == b"\xff" * 8 + b"\x7f"
+    # The 9th byte holds the last 8 bits
+    assert decode_var_uint_64(b"\xff" * 9 + b"next") == ((1 << 64) - 1, b"next")
+
+
+@pytest.mark.parametrize("data", [b"", b"\x80", b"\xff" * 8])
+def test_decoding_eof(data):
+    with pytest.raises(EOFError):
+        decode_var_uint_64(data)
+
+
+def test_fnv1_64():
+    assert fnv1_64(b"") == 0xCBF29CE484222325
+    assert fnv1_64(b"a") == 0xAF63BD4C8601B7BE
+    assert fnv1_64(b"foobar") == 0x340D8765A4DDA9C2
+    assert fnv1_64_uint64_pair(1, (1 << 64) - 1) == fnv1_64(struct.pack("<QQ", 1, (1 << 64) - 1))
+
+
 def test_pathway_encoding():
     processor = DataStreamsProcessor("")
     ctx = processor.new_pathway()
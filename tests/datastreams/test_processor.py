@@ -1,8 +1,11 @@
 import time
 
+import pytest
+
 from ddtrace.internal.datastreams.processor import ConsumerPartitionKey
 from ddtrace.internal.datastreams.processor import DataStreamsProcessor
 from ddtrace.internal.datastreams.processor import PartitionKey
+from tests.utils import override_global_config
 
 
 def test_data_streams_processor():
@@ -52,3 +55,96 @@ def test_kafka_offset_monitoring():
     assert processor._buckets[bucket_time_ns].latest_produce_offsets[PartitionKey("topic1", 1)] == 34
     assert processor._buckets[bucket_time_ns].latest_produce_offsets[PartitionKey("topic1", 2)] == 10
     assert processor._buckets[bucket_time_ns].latest_commit_offsets[ConsumerPartitionKey("group1", "topic1", 1)] == 14
+
+
+def test_data_streams_max_pathways():
+    with override_global_config(dict(_data_streams_max_pathways=3)):
+        processor = DataStreamsProcessor("http://localhost:8126")
+    now = time.time()
+    for i in range(5):
+        processor.on_checkpoint_creation(i, 0, ["direction:out", "topic:topic%d" % i, "type:kafka"], now, 1, 1)
+    processor.on_checkpoint_creation(0, 0, ["direction:out", "topic:topic0", "type:kafka"], now, 1, 1)
+    processor.set_checkpoints([None] * 4, ["direction:in", "topic:topic5", "type:kafka"], now)
+    for i in range(5):
+        processor.track_kafka_produce("topic%d" % i, 0, 10, now)
+        processor.track_kafka_commit("group1", "topic%d" % i, 0, 10, now)
+    processor.track_kafka_produce("topic0", 0, 20, now)
+
+    now_ns = int(now * 1e9)
+    bucket = processor._buckets[int(now_ns - (now_ns % 1e10))]
+    assert len(bucket.pathway_stats) == 3
+    assert bucket.pathway_stats[("direction:out,topic:topic0,type:kafka", 0, 0)].full_pathway_latency.count == 2
+    assert processor._overflow_checkpoints == 2 + 4
+    assert len(bucket.latest_produce_offsets) == len(bucket.latest_commit_offsets) == 3
+    assert bucket.latest_produce_offsets[PartitionKey("topic0", 0)] == 20
+    assert processor._overflow_offsets == 2 * 2
+
+
+def test_data_streams_buckets_reuse():
+    processor = DataStreamsProcessor("http://localhost:8126")
+    now = time.time()
+    processor.on_checkpoint_creation(1, 2, ["direction:out", "topic:topicA", "type:kafka"], now, 1, 1)
+    processor.track_kafka_produce("topic1", 1, 34, now)
+    with processor._lock:
+        serialized = processor._serialize_buckets()
+    bucket, stats = processor._free_buckets[0], processor._free_pathway_stats[0]
+    assert not processor._buckets
+    assert not bucket.pathway_stats and not bucket.latest_produce_offsets
+    assert stats.full_pathway_latency.count == stats.edge_latency.count == 0
+
+    processor.on_checkpoint_creation(1, 2, ["direction:out", "topic:topicA", "type:kafka"], now, 1, 1)
+    processor.track_kafka_produce("topic1", 1, 34, now)
+    now_ns = int(now * 1e9)
+    assert processor._buckets[int(now_ns - (now_ns % 1e10))] is bucket
+    assert bucket.pathway_stats[("direction:out,topic:topicA,type:kafka", 1, 2)] is stats
+    assert not processor._free_buckets and not processor._free_pathway_stats
+    with processor._lock:
+        assert processor._serialize_buckets() == serialized
+
+
+@pytest.mark.parametrize(
+    "tags",
+    [
+        ["direction:in", "group:group1", "topic:topicA", "type:kafka"],
+        # Checkpoints without direction restart their pathway
+        ["topic:topicA", "type:kafka"],
+    ],
+)
+def test_set_checkpoints(tags):
+    upstream = DataStreamsProcessor("http://localhost:8126")
+    pathways = []
+    for i in range(6):
+        ctx = upstream.new_pathway(now_sec=1000.0 + i)
+        ctx.set_checkpoint(["direction:out", "topic:topic%d" % (i % 2), "type:kafka"], now_sec=1001.0 + i)
+        pathways.append(ctx.encode())
+
+    batch_processor = DataStreamsProcessor("http://localhost:8126")
+    batch_ctx = batch_processor.set_checkpoints(pathways, tags, now_sec=1010.0)
+    assert batch_processor._current_context.value is batch_ctx
+
+    processor = DataStreamsProcessor("http://localhost:8126")
+    for pathway in pathways:
+        ctx = processor.decode_pathway(pathway)
+        ctx.set_checkpoint(tags, now_sec=1010.0)
+
+    # The batch is checkpointed like each of its pathways would be
+    del batch_ctx.__dict__["processor"], ctx.__dict__["processor"]
+    assert vars(batch_ctx) == vars(ctx)
+    [bucket] = processor._buckets.values()
+    [batch_bucket] = batch_processor._buckets.values()
+    assert len(batch_bucket.pathway_stats) == len(bucket.pathway_stats)
+    for key, stats in bucket.pathway_stats.items():
+        batch_stats = batch_bucket.pathway_stats[key]
+        assert batch_stats.full_pathway_latency.serialize() == stats.full_pathway_latency.serialize()
+        assert batch_stats.edge_latency.serialize() == stats.edge_latency.serialize()
+
+
+def test_set_checkpoints_invalid_pathways():
+    processor = DataStreamsProcessor("http://localhost:8126")
+    now = time.time()
+    ctx = processor.set_checkpoints([None, b"", b"\x00" * 8], ["direction:in", "topic:topicA", "type:kafka"], now)
+    assert ctx.hash == ctx._compute_hash(["direction:in", "topic:topicA", "type:kafka"], 0)
+    [bucket] = processor._buckets.values()
+    [stats] = bucket.pathway_stats.values()
+    assert stats.full_pathway_latency.count == 3
+    assert stats.full_pathway_latency.get_quantile_value(1) == 0
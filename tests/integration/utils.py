@@ -23,6 +23,9 @@ class BadEncoder:
     def encode(self):
         return b"bad_payload"
 
+    def encode_buffer(self):
+        return self.encode()
+
     def encode_traces(self, traces):
         return b"bad_payload"
 
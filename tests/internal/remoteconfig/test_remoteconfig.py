@@ -22,6 +22,7 @@ from ddtrace.internal.remoteconfig.utils import get_poll_interval_seconds
 from ddtrace.internal.remoteconfig.worker import RemoteConfigPoller
 from ddtrace.internal.remoteconfig.worker import remoteconfig_poller
 from ddtrace.internal.service import ServiceStatus
+from ddtrace.settings import Config
 from tests.internal.test_utils_version import _assert_and_get_version_agent_format
 from tests.utils import override_env
 from tests.utils import override_global_config
@@ -51,7 +52,7 @@ def to_str(bytes_string):
         return str(bytes_string, encoding="utf-8")
 
 
-def get_mock_encoded_msg(msg):
+def get_mock_encoded_msg(msg, version=0):
     expires_date = datetime.datetime.strftime(
         datetime.datetime.now() + datetime.timedelta(days=1), "%Y-%m-%dT%H:%M:%SZ"
     )
@@ -65,12 +66,12 @@ def get_mock_encoded_msg(msg):
             "spec_version": "1.0.0",
             "targets": {
                 path: {
-                    "custom": {"c": [""], "v": 0},
+                    "custom": {"c": [""], "v": version},
                     "hashes": {"sha256": hashlib.sha256(msg).hexdigest()},
                     "length": 24,
                 }
             },
-            "version": 0,
+            "version": version,
         },
     }
     return {
@@ -267,6 +268,47 @@ def test_remote_configuration_ip_blocking(mock_send_request):
             }
 
 
+def test_remote_configuration_skip_unchanged_targets():
+    with override_global_config(dict(_remote_config_enabled=True)):
+        rc_client = RemoteConfigClient()
+        mock_pubsub = mock.MagicMock()
+        rc_client.register_product(ASM_FEATURES_PRODUCT, mock_pubsub)
+
+        response = get_mock_encoded_msg(b'{"asm":{"enabled":true}}')
+        rc_client._process_response(response)
+        mock_pubsub.append.assert_called_once_with({"asm": {"enabled": True}}, ANY, ANY)
+
+        # The agent does not send the target files of the applied configurations again
+        response["target_files"] = []
+        with mock.patch.object(rc_client, "_load_new_configurations") as mock_load_new_configurations:
+            rc_client._process_response(response)
+            mock_load_new_configurations.assert_not_called()
+
+        # Products registered since the configurations were applied can have new configurations
+        rc_client.register_product("ASM_DATA", mock.MagicMock())
+        with mock.patch.object(rc_client, "_load_new_configurations") as mock_load_new_configurations:
+            rc_client._process_response(response)
+            mock_load_new_configurations.assert_called_once()
+
+
+def test_remote_configuration_target_files_cache():
+    with override_global_config(dict(_remote_config_enabled=True)):
+        rc_client = RemoteConfigClient()
+        mock_pubsub = mock.MagicMock()
+        rc_client.register_product(ASM_FEATURES_PRODUCT, mock_pubsub)
+
+        rc_client._process_response(get_mock_encoded_msg(b'{"asm":{"enabled":true}}'))
+        content = mock_pubsub.append.call_args[0][0]
+
+        # A new version of the configuration with the same content is applied without its target file
+        response = get_mock_encoded_msg(b'{"asm":{"enabled":true}}', version=1)
+        response["target_files"] = []
+        rc_client._process_response(response)
+        assert mock_pubsub.append.call_count == 2
+        assert mock_pubsub.append.call_args[0][0] is content
+        assert [config.tuf_version for config in rc_client._applied_configs.values()] == [1]
+
+
 def test_remoteconfig_semver():
     _assert_and_get_version_agent_format(RemoteConfigClient()._client_tracer["tracer_version"])
 
@@ -296,3 +338,69 @@ def test_remote_configuration_check_remote_config_enable_in_agent_errors(mock_in
 
     # Check that the state is online if the agent supports remote config
     assert worker._state == worker._online if expected else worker._agent_check
+
+
+def test_remote_configuration_adaptive_poll_interval():
+    with override_global_config(dict(_remote_config_poll_interval=5.0, _remote_config_max_poll_interval=30.0)):
+        worker = RemoteConfigPoller()
+        worker._state = worker._online
+
+        def request(targets_version):
+            def _request():
+                worker._client._last_targets_version = targets_version
+                return True
+
+            return _request
+
+        # Back off while the configurations do not change
+        with mock.patch.object(worker._client, "request", side_effect=request(0)):
+            intervals = []
+            for _ in range(5):
+                worker.periodic()
+                intervals.append(worker.interval)
+            assert intervals == [10.0, 20.0, 30.0, 30.0, 30.0]
+
+        # Reset after a change
+        with mock.patch.object(worker._client, "request", side_effect=request(1)):
+            worker.periodic()
+            assert worker.interval == 5.0
+
+        # Reset when a product registers, and do not back off for products with urgent updates
+        worker.interval = 20.0
+        worker.register("ASM_DATA", mock.MagicMock(), skip_enabled=True)
+        assert worker.interval == 5.0
+        with mock.patch.object(worker._client, "request", side_effect=request(1)):
+            worker.periodic()
+            assert worker.interval == 5.0
+
+        # Reset after an error
+        worker.unregister("ASM_DATA")
+        worker.interval = 20.0
+        with mock.patch.object(worker._client, "request", return_value=False):
+            worker.periodic()
+            assert worker.interval == 5.0
+            assert worker._state == worker._agent_check
+
+
+def test_remote_configuration_fixed_poll_interval_by_default():
+    with override_env(dict(DD_REMOTE_CONFIG_POLL_INTERVAL_SECONDS="5")):
+        config = Config()
+    assert config._remote_config_max_poll_interval == 5.0
+
+    with override_global_config(
+        dict(
+            _remote_config_poll_interval=config._remote_config_poll_interval,
+            _remote_config_max_poll_interval=config._remote_config_max_poll_interval,
+        )
+    ):
+        worker = RemoteConfigPoller()
+        worker._state = worker._online
+
+        def _request():
+            worker._client._last_targets_version = 0
+            return True
+
+        with mock.patch.object(worker._client, "request", side_effect=_request):
+            for _ in range(3):
+                worker.periodic()
+                assert worker.interval == 5.0
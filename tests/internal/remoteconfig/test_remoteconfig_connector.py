@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+import os
+
 import pytest
 
 from ddtrace.internal.remoteconfig._connectors import PublisherSubscriberConnector
+from ddtrace.internal.remoteconfig._connectors import SHARED_MEMORY_INITIAL_SIZE
 
 
 @pytest.mark.parametrize(
@@ -11,12 +14,12 @@ from ddtrace.internal.remoteconfig._connectors import PublisherSubscriberConnect
         {"data": {"a": True}},
         {"data": {"😀": "🤣😅😁😇"}},
         [1, 2, 3, 4],
-        {1, 2, 3, 4},
     ],
 )
-def test_hash(data):
+def test_connector_unicode(data):
     connector = PublisherSubscriberConnector()
-    assert type(connector._hash_config(data, None)) is int
+    connector.write("", data)
+    assert connector.read() == {"config": data, "metadata": "", "shared_data_counter": 1}
 
 
 def test_connector():
@@ -69,3 +72,44 @@ global_connector = PublisherSubscriberConnector()
 def test_write_read(data, read_result):
     global_connector.write("", data)
     assert global_connector.read() == read_result
+
+
+def test_connector_large_data():
+    connector = PublisherSubscriberConnector()
+    subscriber = PublisherSubscriberConnector()
+    subscriber._file, subscriber.data = connector._file, connector.data
+    rules = [{"id": "rule-%d" % i, "conditions": ["a" * 100]} for i in range(10000)]
+    connector.write({}, {"rules": rules})
+    assert len(connector.data) > SHARED_MEMORY_INITIAL_SIZE
+    assert subscriber.read() == {"config": {"rules": rules}, "metadata": {}, "shared_data_counter": 1}
+
+
+def test_connector_only_reads_changed_items():
+    connector = PublisherSubscriberConnector()
+    connector.write({}, {"rules": [{"id": "a"}], "rules_data": [{"id": "b"}]})
+    config = connector.read()["config"]
+
+    connector.write({}, {"rules": [{"id": "a"}], "rules_data": [{"id": "c"}]})
+    new_config = connector.read()["config"]
+    assert new_config == {"rules": [{"id": "a"}], "rules_data": [{"id": "c"}]}
+    assert new_config["rules"] is config["rules"]
+
+    connector.write({}, {"rules_data": [{"id": "c"}]})
+    assert connector.read()["config"] == {"rules_data": [{"id": "c"}]}
+
+
+def test_connector_fork():
+    connector = PublisherSubscriberConnector()
+    connector.write({}, {"a": "b"})
+
+    pid = os.fork()
+    if pid == 0:
+        connector.write({}, {"a": "b", "rules": ["c" * SHARED_MEMORY_INITIAL_SIZE]})
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert connector.read() == {
+        "config": {"a": "b", "rules": ["c" * SHARED_MEMORY_INITIAL_SIZE]},
+        "metadata": {},
+        "shared_data_counter": 2,
+    }
@@ -0,0 +1,49 @@
+import zlib
+
+import pytest
+
+from ddtrace.internal import compression
+from ddtrace.internal.compression import get_compressor
+from ddtrace.internal.compression import gzip_compress
+
+
+def gzip_decompress(payload):
+    return zlib.decompress(payload, 16 + zlib.MAX_WBITS)
+
+
+@pytest.mark.parametrize("level", [1, 6, 9])
+def test_gzip_compress(level):
+    payload = b"foobar" * 1000
+    compressed = gzip_compress(payload, level)
+    assert len(compressed) < len(payload)
+    assert gzip_decompress(compressed) == payload
+
+
+def test_gzip_compress_buffer():
+    payload = bytearray(b"foobar" * 1000)
+    assert gzip_decompress(gzip_compress(memoryview(payload))) == payload
+
+
+@pytest.mark.parametrize("encoding", [None, "", "none"])
+def test_get_compressor_disabled(encoding):
+    assert get_compressor(encoding) is None
+
+
+def test_get_compressor_unsupported():
+    assert get_compressor("brotli") is None
+
+
+def test_get_compressor_level():
+    payload = b"foobar" * 1000
+    assert get_compressor("gzip")(payload) == gzip_compress(payload)
+    assert get_compressor("gzip", 1)(payload) == gzip_compress(payload, 1)
+
+
+def test_get_compressor_zstd():
+    if compression.zstandard is None:
+        assert get_compressor("zstd") is None
+        return
+
+    payload = b"foobar" * 1000
+    compressed = get_compressor("zstd", 1)(payload)
+    assert compression.zstandard.ZstdDecompressor().decompress(compressed) == payload
@@ -1,6 +1,7 @@
 import pytest
 
 from ddtrace.internal.glob_matching import GlobMatcher
+from ddtrace.internal.glob_matching import compile_glob
 
 
 @pytest.mark.parametrize(
@@ -28,8 +29,19 @@ from ddtrace.internal.glob_matching import GlobMatcher
         ("test/na{2}/string", "test/na{2}/string", True),
         ("*a*a*a*a*a*a", "aaaaaaaaaaaaaaaaaaaaaaaaaax", False),
         ("*a*a*a*a*a*a", "aaaaaaaarrrrrrraaaraaarararaarararaarararaaa", True),
+        ("", "", True),
+        ("", "a", False),
+        ("**", "", True),
+        ("a*a", "a", False),
+        ("a*b?d*e", "abcde", True),
+        ("a*b?d*e", "abxbcde", True),
+        ("a*b?d*e", "abcdxe", True),
+        ("a*b?d*e", "abde", False),
+        ("?*?", "a", False),
+        ("?*?", "a\nb", True),
     ],
 )
 def test_matching(pattern, string, result):
     glob_matcher = GlobMatcher(pattern)
     assert result == glob_matcher.match(string)
+    assert result == bool(compile_glob(pattern)(string))
@@ -1,6 +1,16 @@
+import socket
+import threading
+import time
+
 import httpretty
+import mock
 import pytest
+import six
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
 
+from ddtrace.internal import compat
+from ddtrace.internal.utils.http import ConnectionPool
 from ddtrace.internal.utils.http import connector
 
 
@@ -15,3 +25,166 @@ def test_connector(scheme):
             response = conn.getresponse()
             assert response.status == 200
             assert response.read() == b'{"hello": "world"}'
+
+
+class _KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class _ClosingHandler(_KeepAliveHandler):
+    def do_GET(self):
+        # Close the connection after the response without telling the client
+        _KeepAliveHandler.do_GET(self)
+        self.close_connection = True
+
+
+class _NoResponseHandler(_KeepAliveHandler):
+    def do_GET(self):
+        self.close_connection = True
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def _serve(handler):
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    t = threading.Thread(target=server.serve_forever)
+    t.daemon = True
+    t.start()
+    try:
+        yield "http://127.0.0.1:%d" % server.server_address[1]
+    finally:
+        server.shutdown()
+        t.join()
+
+
+@pytest.fixture
+def keep_alive_server():
+    for url in _serve(_KeepAliveHandler):
+        yield url
+
+
+@pytest.fixture
+def closing_server():
+    for url in _serve(_ClosingHandler):
+        yield url
+
+
+@pytest.fixture
+def no_response_server():
+    for url in _serve(_NoResponseHandler):
+        yield url
+
+
+def _get(pool, url):
+    with pool.connection(url) as conn:
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        assert response.read() == b"ok"
+        return conn
+
+
+def test_connection_pool_reuse(keep_alive_server):
+    pool = ConnectionPool()
+
+    conn = _get(pool, keep_alive_server)
+    assert _get(pool, keep_alive_server) is conn
+    assert pool.flush_metrics() == {
+        "http.connections.created": 1,
+        "http.connections.reused": 1,
+        "http.connections.lease.ms": mock.ANY,
+    }
+    assert pool.flush_metrics() == {}
+
+
+def test_connection_pool_response_not_read(keep_alive_server):
+    pool = ConnectionPool()
+
+    with pool.connection(keep_alive_server) as conn:
+        conn.request("GET", "/")
+        conn.getresponse()
+
+    # The connection cannot be reused until its response has been read
+    assert _get(pool, keep_alive_server) is not conn
+    assert pool.flush_metrics()["http.connections.discarded"] == 1
+
+
+def test_connection_pool_error(keep_alive_server):
+    pool = ConnectionPool()
+
+    with pytest.raises(ValueError):
+        with pool.connection(keep_alive_server) as conn:
+            raise ValueError()
+
+    assert conn.sock is None
+    assert _get(pool, keep_alive_server) is not conn
+
+
+def test_connection_pool_idle_timeout(keep_alive_server):
+    pool = ConnectionPool(idle_timeout=0)
+
+    conn = _get(pool, keep_alive_server)
+    time.sleep(0.01)
+    assert _get(pool, keep_alive_server) is not conn
+    assert conn.sock is None
+
+
+def test_connection_pool_dropped(keep_alive_server):
+    pool = ConnectionPool()
+
+    conn = _get(pool, keep_alive_server)
+    # Simulate the server closing the connection
+    conn.sock.shutdown(socket.SHUT_RD)
+    assert _get(pool, keep_alive_server) is not conn
+
+
+def test_connection_pool_after_fork(keep_alive_server):
+    pool = ConnectionPool()
+
+    conn = _get(pool, keep_alive_server)
+    pool._after_fork()
+    assert _get(pool, keep_alive_server) is not conn
+    conn.close()
+
+
+def test_connection_pool_closed_by_server(closing_server):
+    pool = ConnectionPool()
+
+    conn = _get(pool, closing_server)
+    # Simulate the server closing the connection after it is handed out again
+    with mock.patch.object(ConnectionPool, "_is_dropped", return_value=False):
+        # The request is sent again on a new socket
+        assert _get(pool, closing_server) is conn
+    assert pool.flush_metrics()["http.connections.reused"] == 1
+
+
+def test_connection_pool_closed_by_server_file_body(closing_server):
+    pool = ConnectionPool()
+
+    _get(pool, closing_server)
+    with mock.patch.object(ConnectionPool, "_is_dropped", return_value=False):
+        with pool.connection(closing_server) as conn:
+            body = six.BytesIO(b"payload")
+            conn.request("GET", "/", body, {"Content-Length": "7"})
+            assert conn.getresponse().read() == b"ok"
+            # The body was rewound before it was sent again
+            assert body.tell() == 7
+
+
+def test_connection_pool_new_connection_not_resent(no_response_server):
+    pool = ConnectionPool()
+
+    # Requests are only sent again when a kept-alive connection was closed
+    with pytest.raises(compat.httplib.BadStatusLine):
+        _get(pool, no_response_server)
@@ -67,12 +67,20 @@ class TelemetryTestSession(object):
     def get_events(self):
         """Get a list of the event payloads sent to the test agent
 
-        Results are in reverse order by ``seq_id``
+        Results are in reverse order by ``seq_id``, ``message-batch`` events are unpacked
         """
         status, body = self._request("GET", "/test/session/apmtelemetry?test_session_token=%s" % self.token)
         if status != 200:
             pytest.fail("Failed to fetch session events: %s" % self.token)
-        return sorted(json.loads(body.decode("utf-8")), key=lambda e: e["seq_id"], reverse=True)
+        events = []
+        for event in json.loads(body.decode("utf-8")):
+            if event["request_type"] == "message-batch":
+                # Unpack the batched events, with the fields of the batch
+                for i, message in enumerate(event["payload"]):
+                    events.append((event["seq_id"], i, dict(event, **message)))
+            else:
+                events.append((event["seq_id"], 0, event))
+        return [e for _, _, e in sorted(events, key=lambda e: e[:2], reverse=True)]
 
 
 @pytest.fixture
@@ -82,18 +82,17 @@ else:
 
     runtime_id = stdout.strip().decode("utf-8")
 
-    requests = test_agent_session.get_requests()
+    events = test_agent_session.get_events()
 
-    # We expect 2 events from the parent process to get sent, but none from the child process
-    assert len(requests) == 3
+    # We expect 3 events from the parent process to get sent, but none from the child process
+    assert len(events) == 3
     # Validate that the runtime id sent for every event is the parent processes runtime id
-    assert requests[0]["body"]["runtime_id"] == runtime_id
-    assert requests[0]["body"]["request_type"] == "app-closing"
-    assert requests[1]["body"]["runtime_id"] == runtime_id
-    assert requests[1]["body"]["request_type"] == "app-dependencies-loaded"
-    assert requests[1]["body"]["runtime_id"] == runtime_id
-    assert requests[2]["body"]["request_type"] == "app-started"
-    assert requests[2]["body"]["runtime_id"] == runtime_id
+    assert events[0]["runtime_id"] == runtime_id
+    assert events[0]["request_type"] == "app-closing"
+    assert events[1]["runtime_id"] == runtime_id
+    assert events[1]["request_type"] == "app-dependencies-loaded"
+    assert events[2]["request_type"] == "app-started"
+    assert events[2]["runtime_id"] == runtime_id
 
 
 def test_enable_fork_heartbeat(test_agent_session, run_python_code_in_subprocess):
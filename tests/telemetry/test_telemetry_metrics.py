@@ -1,4 +1,5 @@
 import sys
+import threading
 from time import sleep
 
 from mock.mock import ANY
@@ -9,6 +10,7 @@ from ddtrace.internal.telemetry.constants import TELEMETRY_NAMESPACE_TAG_TRACER
 from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_DISTRIBUTION
 from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_GENERATE_METRICS
 from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_LOGS
+from ddtrace.internal.telemetry.metrics_namespaces import MetricNamespace
 from tests.telemetry.test_writer import _get_request_body
 
 
@@ -87,6 +89,55 @@ def test_send_metric_flush_and_generate_metrics_series_is_restarted(telemetry_wr
     _assert_metric(test_agent_session, expected_series, seq_id=2)
 
 
+def test_send_count_metric_handle(telemetry_writer, test_agent_session, mock_time):
+    """Check the points of a count metric handle are aggregated with the points added to the metric"""
+    handle = telemetry_writer.count_metric_handle(TELEMETRY_NAMESPACE_TAG_TRACER, "test-metric", (("a", "b"),))
+    assert telemetry_writer.count_metric_handle(TELEMETRY_NAMESPACE_TAG_TRACER, "test-metric", (("a", "b"),)) is handle
+    handle.increment()
+    handle.add_point(2)
+    telemetry_writer.add_count_metric(TELEMETRY_NAMESPACE_TAG_TRACER, "test-metric", 3, (("a", "b"),))
+
+    expected_series = [
+        {
+            "common": True,
+            "metric": "test-metric",
+            "points": [[1642544540, 6.0]],
+            "tags": ["a:b"],
+            "type": "count",
+        },
+    ]
+
+    _assert_metric(test_agent_session, expected_series)
+
+
+def test_count_metric_handle_threads():
+    namespace = MetricNamespace()
+    handle = namespace.count_metric_handle(TELEMETRY_NAMESPACE_TAG_TRACER, "test-metric")
+
+    def increment():
+        for _ in range(10000):
+            handle.increment()
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    totals = []
+    while any(thread.is_alive() for thread in threads):
+        totals.extend(
+            metric._points[0][1]
+            for metric in namespace.flush()[TELEMETRY_TYPE_GENERATE_METRICS][TELEMETRY_NAMESPACE_TAG_TRACER].values()
+        )
+    for thread in threads:
+        thread.join()
+    totals.extend(
+        metric._points[0][1]
+        for metric in namespace.flush()[TELEMETRY_TYPE_GENERATE_METRICS][TELEMETRY_NAMESPACE_TAG_TRACER].values()
+    )
+
+    assert sum(totals) == 40000
+    assert not namespace.collect_handles()
+
+
 def test_send_metric_datapoint_equal_type_and_tags_yields_single_series(
     telemetry_writer, test_agent_session, mock_time
 ):
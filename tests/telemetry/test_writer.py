@@ -1,3 +1,5 @@
+import gzip
+import json
 import os
 import time
 from typing import Any
@@ -6,8 +8,10 @@ from typing import Dict
 import httpretty
 import mock
 import pytest
+import six
 from six import PY2
 
+from ddtrace.internal.telemetry.constants import TELEMETRY_TRACE_SAMPLING_RATE
 from ddtrace.internal.telemetry.data import get_application
 from ddtrace.internal.telemetry.data import get_dependencies
 from ddtrace.internal.telemetry.data import get_host_info
@@ -16,6 +20,7 @@ from ddtrace.internal.telemetry.writer import get_runtime_id
 from ddtrace.internal.utils.version import _pep440_to_semver
 from ddtrace.settings import _config as config
 from ddtrace.settings.config import DD_TRACE_OBFUSCATION_QUERY_STRING_REGEXP_DEFAULT
+from tests.utils import override_global_config
 
 
 def test_add_event(telemetry_writer, test_agent_session, mock_time):
@@ -387,6 +392,98 @@ def test_send_failing_request(mock_status, telemetry_writer):
         assert len(httpretty.latest_requests()) == 1
 
 
+def test_message_batch_event(telemetry_writer):
+    """asserts that the events queued between two flushes are sent in a single message-batch request"""
+    telemetry_writer.add_integration("integration-t", True, True, "")
+    telemetry_writer.add_configuration("appsec_enabled", True)
+    with mock.patch.object(telemetry_writer._client, "send_event") as send_event:
+        telemetry_writer.periodic()
+
+    send_event.assert_called_once()
+    event = send_event.call_args[0][0]
+    assert event["request_type"] == "message-batch"
+    assert [message["request_type"] for message in event["payload"]] == [
+        "app-integrations-change",
+        "app-client-configuration-change",
+    ]
+    assert event["payload"][1]["payload"] == {
+        "configuration": [{"name": "appsec_enabled", "origin": "unknown", "value": True}]
+    }
+    assert telemetry_writer._client.get_headers(event)["DD-Telemetry-Request-Type"] == "message-batch"
+
+
+def test_message_batch_event_seq_id(telemetry_writer):
+    """asserts that sequence numbers are allocated to the requests sent, without gaps for the batched events"""
+    telemetry_writer._restart_sequence()
+    telemetry_writer.add_integration("integration-t", True, True, "")
+    telemetry_writer.add_configuration("appsec_enabled", True)
+    with mock.patch.object(telemetry_writer._client, "send_event") as send_event:
+        telemetry_writer.periodic()
+        telemetry_writer.periodic()
+
+    assert [call[0][0]["request_type"] for call in send_event.call_args_list] == ["message-batch", "app-heartbeat"]
+    assert [call[0][0]["seq_id"] for call in send_event.call_args_list] == [1, 2]
+
+
+def test_compressed_payload(telemetry_writer):
+    """asserts that the request body is compressed with gzip when compression is enabled"""
+    with httpretty.enabled(), override_global_config(dict(_telemetry_compression_enabled=True)):
+        httpretty.register_uri(httpretty.POST, telemetry_writer._client.url, status=202)
+        telemetry_writer.app_shutdown()
+
+        request = httpretty.last_request()
+        assert request.headers["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.GzipFile(fileobj=six.BytesIO(request.body)).read().decode("utf-8"))
+        assert body["request_type"] == "app-closing"
+
+
+def test_app_client_configuration_changed_event_delta(telemetry_writer):
+    """asserts that only the configurations that changed since they were last reported are sent"""
+    telemetry_writer._app_started_event()
+    telemetry_writer.add_configuration("appsec_enabled", True)
+    telemetry_writer.add_configuration("DD_TRACE_PROPAGATION_STYLE_EXTRACT", "datadog")
+    with mock.patch.object(telemetry_writer._client, "send_event") as send_event:
+        telemetry_writer.periodic()
+        event = send_event.call_args[0][0]
+        assert event["request_type"] == "message-batch"
+        assert event["payload"][1]["request_type"] == "app-client-configuration-change"
+        assert len(event["payload"][1]["payload"]["configuration"]) == 2
+
+        # Reported configurations are not sent again, unless their value or origin changes
+        telemetry_writer.add_configuration("appsec_enabled", True)
+        telemetry_writer.add_configuration("DD_TRACE_PROPAGATION_STYLE_EXTRACT", "datadog", "env_var")
+        telemetry_writer.add_configuration(TELEMETRY_TRACE_SAMPLING_RATE, config._trace_sample_rate)
+        telemetry_writer.periodic()
+        event = send_event.call_args[0][0]
+        assert event["request_type"] == "app-client-configuration-change"
+        assert event["payload"]["configuration"] == [
+            {"name": "DD_TRACE_PROPAGATION_STYLE_EXTRACT", "origin": "env_var", "value": "datadog"}
+        ]
+
+        telemetry_writer.add_configuration("appsec_enabled", True)
+        telemetry_writer.periodic()
+        assert send_event.call_args[0][0]["request_type"] == "app-heartbeat"
+
+
+def test_app_dependencies_loaded_event_delta(telemetry_writer):
+    """asserts that the dependencies are only reported once"""
+    dependencies = get_dependencies()
+    new_dependency = {"name": "new-dependency", "version": "1.0.0"}
+
+    telemetry_writer._app_dependencies_loaded_event()
+    with mock.patch("ddtrace.internal.telemetry.writer.get_dependencies", return_value=dependencies):
+        telemetry_writer._app_dependencies_loaded_event()
+    with mock.patch("ddtrace.internal.telemetry.writer.get_dependencies", return_value=dependencies + [new_dependency]):
+        telemetry_writer._app_dependencies_loaded_event()
+
+    events = telemetry_writer._flush_events_queue()
+    assert len(events) == 2
+    assert sorted(events[0]["payload"]["dependencies"], key=lambda d: d["name"]) == sorted(
+        dependencies, key=lambda d: d["name"]
+    )
+    assert events[1]["payload"]["dependencies"] == [new_dependency]
+
+
 @pytest.mark.parametrize("telemetry_writer", [TelemetryWriter()])
 def test_telemetry_graceful_shutdown(telemetry_writer, test_agent_session, mock_time):
     telemetry_writer.start()
@@ -344,3 +344,33 @@ def test_tracestate(context, expected_tracestate):
 def test_dd_origin_character_set(ctx, expected_dd_origin):
     # type: (Context,Optional[str]) -> None
     assert ctx.dd_origin == expected_dd_origin
+
+
+def test_propagation_values_shared_by_trace():
+    parent = Span("parent", trace_id=123, span_id=1)
+    child = Span("child", trace_id=123, span_id=2, context=parent.context)
+    parent.context._meta["_dd.p.dm"] = "-4"
+
+    assert parent.context._tracestate == "dd=t.dm:-4"
+    assert child.context._propagation_values() is parent.context._propagation_values()
+    assert child.context._propagation_values()["tracestate"] == "dd=t.dm:-4"
+    assert child.context._traceparent == "00-0000000000000000000000000000007b-0000000000000002-00"
+
+
+def test_propagation_values_reset():
+    ctx = Context(trace_id=123, span_id=321, dd_origin="synthetics")
+    assert ctx._traceparent == "00-0000000000000000000000000000007b-0000000000000141-00"
+    assert ctx._tracestate == "dd=o:synthetics"
+
+    ctx.sampling_priority = 2
+    assert ctx._traceparent == "00-0000000000000000000000000000007b-0000000000000141-01"
+    assert ctx._tracestate == "dd=s:2;o:synthetics"
+
+    ctx.dd_origin = "rum"
+    assert ctx._tracestate == "dd=s:2;o:rum"
+
+    ctx._meta["_dd.p.test"] = "value"
+    assert ctx._tracestate == "dd=s:2;o:rum;t.test:value"
+
+    ctx.span_id = 322
+    assert ctx._traceparent == "00-0000000000000000000000000000007b-0000000000000142-01"
@@ -0,0 +1,83 @@
+import random
+
+from ddsketch import LogCollapsingLowestDenseDDSketch as PyLogCollapsingLowestDenseDDSketch
+from ddsketch.pb.proto import DDSketchProto
+import pytest
+
+from ddtrace.internal._ddsketch import LogCollapsingLowestDenseDDSketch
+
+
+def _values(seed):
+    rng = random.Random(seed)
+    return [
+        # Span durations in nanoseconds
+        [rng.randint(1, 10 ** 9) for _ in range(1000)],
+        # Latencies in seconds
+        [rng.expovariate(1) for _ in range(1000)],
+        # Negative values and zeros
+        [rng.uniform(-5, 5) for _ in range(1000)] + [0, 0.0],
+        # A range of values wider than the bin limit
+        [10 ** rng.uniform(-300, 300) for _ in range(3000)],
+        [2.0 ** i for i in range(-1000, 1000, 3)],
+        [1.0],
+        [],
+    ]
+
+
+def _sketches(values, bin_limit):
+    native = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=bin_limit)
+    vendored = PyLogCollapsingLowestDenseDDSketch(0.00775, bin_limit=bin_limit)
+    for value in values:
+        native.add(value)
+        vendored.add(value)
+    return native, vendored
+
+
+@pytest.mark.parametrize("bin_limit", [2048, 100, 10])
+def test_ddsketch_add(bin_limit):
+    for values in _values(0):
+        native, vendored = _sketches(values, bin_limit)
+        assert native.serialize() == DDSketchProto.to_proto(vendored).SerializeToString()
+        assert native.count == native._count == vendored.count
+        assert native.sum == vendored.sum
+        for quantile in (-1, 0, 0.25, 0.5, 0.75, 0.99, 1, 2):
+            assert native.get_quantile_value(quantile) == vendored.get_quantile_value(quantile)
+
+
+@pytest.mark.parametrize("bin_limit", [2048, 100, 10])
+def test_ddsketch_merge(bin_limit):
+    for values in _values(1):
+        for other_values in _values(2):
+            native, vendored = _sketches(values, bin_limit)
+            other_native, other_vendored = _sketches(other_values, bin_limit)
+            native.merge(other_native)
+            vendored.merge(other_vendored)
+            assert native.serialize() == DDSketchProto.to_proto(vendored).SerializeToString()
+            assert native.count == vendored.count
+            assert native.get_quantile_value(0.5) == vendored.get_quantile_value(0.5)
+
+
+@pytest.mark.parametrize("bin_limit", [2048, 10])
+def test_ddsketch_clear(bin_limit):
+    sketch = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=bin_limit)
+    for values in _values(3):
+        for value in values:
+            sketch.add(value)
+        sketch.clear()
+        assert sketch.count == 0
+        for value in values[:100]:
+            sketch.add(value)
+        native, _ = _sketches(values[:100], bin_limit)
+        assert sketch.serialize() == native.serialize()
+        sketch.clear()
+
+
+def test_ddsketch_errors():
+    with pytest.raises(ValueError):
+        LogCollapsingLowestDenseDDSketch(0, bin_limit=2048)
+
+    sketch = LogCollapsingLowestDenseDDSketch(0.00775, bin_limit=2048)
+    with pytest.raises(ValueError):
+        sketch.add(1, 0)
+    with pytest.raises(ValueError):
+        sketch.merge(LogCollapsingLowestDenseDDSketch(0.01, bin_limit=2048))
@@ -21,6 +21,7 @@ from ddtrace.ext import SpanTypes
 from ddtrace.ext.ci import CI_APP_TEST_ORIGIN
 from ddtrace.internal._encoding import BufferFull
 from ddtrace.internal._encoding import BufferItemTooLarge
+from ddtrace.internal._encoding import EncodedBuffer
 from ddtrace.internal._encoding import ListStringTable
 from ddtrace.internal._encoding import MsgpackStringTable
 from ddtrace.internal.compat import msgpack_type
@@ -329,6 +330,97 @@ def test_custom_msgpack_encode(encoding):
     assert decode(refencoder.encode_traces([[s]])) == decode(encoder.encode())
 
 
+@allencodings
+def test_msgpack_encode_buffer(encoding):
+    encoder = MSGPACK_ENCODERS[encoding](1 << 20, 1 << 20)
+    refencoder = MSGPACK_ENCODERS[encoding](1 << 20, 1 << 20)
+
+    assert encoder.encode_buffer() is None
+
+    trace = gen_trace(nspans=50)
+    encoder.put(trace)
+    refencoder.put(trace)
+    payload = encoder.encode_buffer()
+
+    assert isinstance(payload, EncodedBuffer)
+    assert len(payload) == len(memoryview(payload))
+    assert payload.tobytes() == bytes(memoryview(payload)) == refencoder.encode()
+    assert memoryview(payload).readonly
+
+    # The payload is not affected by the encoder filling and flushing its
+    # buffer again while the payload is still referenced.
+    payload_bytes = payload.tobytes()
+    for _ in range(3):
+        encoder.put(gen_trace(nspans=10))
+        assert encoder.encode() is not None
+        encoder.put(trace)
+        other = encoder.encode_buffer()
+        assert other.tobytes() == payload_bytes
+    assert payload.tobytes() == payload_bytes
+
+    del payload, other
+    encoder.put(trace)
+    assert decode(encoder.encode_buffer()) == decode(payload_bytes)
+
+
+def test_msgpack_encode_buffer_v05_put_not_blocked():
+    """The v0.5 payload is assembled without blocking the traces put meanwhile"""
+    put = threading.Event()
+
+    class Encoder(MsgpackEncoderV05):
+        def _join_buffers(self, buffers):
+            thread = threading.Thread(target=lambda: (self.put(gen_trace(nspans=10)), put.set()))
+            thread.start()
+            thread.join(5)
+            return super(Encoder, self)._join_buffers(buffers)
+
+    encoder = Encoder(1 << 20, 1 << 20)
+    refencoder = MsgpackEncoderV05(1 << 20, 1 << 20)
+    trace = gen_trace(nspans=50)
+    encoder.put(trace)
+    refencoder.put(trace)
+
+    payload = encoder.encode_buffer()
+    assert put.is_set()
+    assert decode(payload) == decode(refencoder.encode())
+    assert len(encoder) == 1
+
+
+@allencodings
+def test_msgpack_encode_concurrent_put(encoding):
+    """Traces put while other threads encode end up in exactly one payload"""
+    encoder = MSGPACK_ENCODERS[encoding](8 << 20, 8 << 20)
+    n_threads, n_traces = 4, 200
+    payloads = []
+    done = threading.Event()
+
+    def put():
+        for i in range(n_traces):
+            encoder.put([Span("span", service="svc-%d" % (i % 10)) for _ in range(5)])
+
+    def flush():
+        while not done.is_set():
+            payloads.append(encoder.encode())
+            payloads.append(encoder.encode_buffer())
+
+    flusher = threading.Thread(target=flush)
+    flusher.start()
+    putters = [threading.Thread(target=put) for _ in range(n_threads)]
+    for t in putters:
+        t.start()
+    for t in putters:
+        t.join()
+    done.set()
+    flusher.join()
+    payloads.append(encoder.encode())
+
+    traces = [trace for payload in payloads if payload is not None for trace in decode(payload)]
+    assert len(traces) == n_threads * n_traces
+    assert all(len(trace) == 5 for trace in traces)
+    services = {span[b"service"] if isinstance(span, dict) else span[0] for trace in traces for span in trace}
+    assert services == {("svc-%d" % i).encode() for i in range(10)}
+
+
 def span_type_span():
     s = Span("span_name")
     s.span_type = SpanTypes.WEB
@@ -549,6 +641,22 @@ def test_custom_msgpack_encode_v05():
     ]
 
 
+def test_custom_msgpack_encode_v05_tags_dict_subclass():
+    class Tags(dict):
+        pass
+
+    encoder = MsgpackEncoderV05(2 << 20, 2 << 20)
+    span = Span(name="v05-test")
+    span._meta = Tags(foo="bar")
+    span._metrics = Tags(baz=1)
+
+    encoder.put([span])
+    st, ts = decode(encoder.flush(), reconstruct=False)
+
+    assert ts[0][0][9] == {st.index(b"foo"): st.index(b"bar")}
+    assert ts[0][0][10] == {st.index(b"baz"): 1}
+
+
 def string_table_test(t, origin_key=False):
     assert len(t) == 1 + origin_key
 
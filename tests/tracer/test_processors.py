@@ -1,8 +1,12 @@
+import threading
+import time
 from typing import Any
 
 import attr
 import mock
+import msgpack
 import pytest
+from six.moves import _thread
 
 from ddtrace import Span
 from ddtrace import Tracer
@@ -19,6 +23,8 @@ from ddtrace.context import Context
 from ddtrace.ext import SpanTypes
 from ddtrace.internal.constants import HIGHER_ORDER_TRACE_ID_BITS
 from ddtrace.internal.processor.endpoint_call_counter import EndpointCallCounterProcessor
+from ddtrace.internal.processor.stats import SpanStatsProcessorV06
+from ddtrace.internal.processor.trace import ShardedSpanAggregator
 from ddtrace.internal.processor.trace import SpanAggregator
 from ddtrace.internal.processor.trace import SpanProcessor
 from ddtrace.internal.processor.trace import SpanSamplingProcessor
@@ -35,6 +41,9 @@ from ddtrace.internal.processor.truncator import NormalizeSpanProcessor
 from ddtrace.internal.processor.truncator import TruncateSpanProcessor
 from ddtrace.internal.sampling import SamplingMechanism
 from ddtrace.internal.sampling import SpanSamplingRule
+from ddtrace.internal.telemetry import telemetry_writer
+from ddtrace.internal.telemetry.constants import TELEMETRY_NAMESPACE_TAG_TRACER
+from ddtrace.internal.telemetry.constants import TELEMETRY_TYPE_GENERATE_METRICS
 from tests.utils import DummyTracer
 from tests.utils import DummyWriter
 from tests.utils import override_global_config
@@ -128,9 +137,10 @@ def test_aggregator_bad_processor():
     assert writer.pop() == [span]
 
 
-def test_aggregator_multi_span():
+@pytest.mark.parametrize("aggregator_cls", [SpanAggregator, ShardedSpanAggregator])
+def test_aggregator_multi_span(aggregator_cls):
     writer = DummyWriter()
-    aggr = SpanAggregator(partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer)
+    aggr = aggregator_cls(partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer)
 
     # Normal usage
     parent = Span("parent", on_finish=[aggr.on_span_finish])
@@ -161,9 +171,10 @@ def test_aggregator_multi_span():
     assert writer.pop() == [parent, child]
 
 
-def test_aggregator_partial_flush_0_spans():
+@pytest.mark.parametrize("aggregator_cls", [SpanAggregator, ShardedSpanAggregator])
+def test_aggregator_partial_flush_0_spans(aggregator_cls):
     writer = DummyWriter()
-    aggr = SpanAggregator(partial_flush_enabled=True, partial_flush_min_spans=0, trace_processors=[], writer=writer)
+    aggr = aggregator_cls(partial_flush_enabled=True, partial_flush_min_spans=0, trace_processors=[], writer=writer)
 
     # Normal usage
     parent = Span("parent", on_finish=[aggr.on_span_finish])
@@ -196,9 +207,10 @@ def test_aggregator_partial_flush_0_spans():
     assert child.get_metric("_dd.py.partial_flush") == 1
 
 
-def test_aggregator_partial_flush_2_spans():
+@pytest.mark.parametrize("aggregator_cls", [SpanAggregator, ShardedSpanAggregator])
+def test_aggregator_partial_flush_2_spans(aggregator_cls):
     writer = DummyWriter()
-    aggr = SpanAggregator(partial_flush_enabled=True, partial_flush_min_spans=2, trace_processors=[], writer=writer)
+    aggr = aggregator_cls(partial_flush_enabled=True, partial_flush_min_spans=2, trace_processors=[], writer=writer)
 
     # Normal usage
     parent = Span("parent", on_finish=[aggr.on_span_finish])
@@ -252,6 +264,109 @@ def test_aggregator_partial_flush_2_spans():
     assert parent.get_metric("_dd.py.partial_flush") is None
 
 
+def test_sharded_aggregator_processes_outside_of_lock():
+    """The trace processors and the writer are not called while a shard lock is held"""
+    writer = mock.Mock()
+    aggr = None
+
+    def assert_no_lock_held(*args):
+        assert not any(shard.lock.locked() for shard in aggr._shards)
+        return args[0]
+
+    proc = mock.Mock()
+    proc.process_trace.side_effect = assert_no_lock_held
+    writer.write.side_effect = assert_no_lock_held
+    aggr = ShardedSpanAggregator(
+        partial_flush_enabled=False,
+        partial_flush_min_spans=0,
+        trace_processors=[proc],
+        writer=writer,
+        num_shards=4,
+    )
+
+    span = Span("span", on_finish=[aggr.on_span_finish])
+    aggr.on_span_start(span)
+    span.finish()
+
+    proc.process_trace.assert_called_once_with([span])
+    writer.write.assert_called_once_with([span])
+
+
+def test_sharded_aggregator_multithreaded():
+    """Traces started and finished concurrently from many threads are all written in full"""
+    written = []
+    writer = mock.Mock()
+    writer.write.side_effect = written.append
+    aggr = ShardedSpanAggregator(
+        partial_flush_enabled=False,
+        partial_flush_min_spans=0,
+        trace_processors=[],
+        writer=writer,
+        num_shards=4,
+    )
+
+    def create_traces():
+        for _ in range(50):
+            root = Span("root", on_finish=[aggr.on_span_finish])
+            aggr.on_span_start(root)
+            for _ in range(4):
+                child = Span("child", trace_id=root.trace_id, parent_id=root.span_id, on_finish=[aggr.on_span_finish])
+                aggr.on_span_start(child)
+                child.finish()
+            root.finish()
+
+    threads = [threading.Thread(target=create_traces) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(written) == 8 * 50
+    assert all(len(trace) == 5 for trace in written)
+    assert all(len({s.trace_id for s in trace}) == 1 for trace in written)
+    assert all(not shard.traces for shard in aggr._shards)
+
+
+@pytest.mark.parametrize("aggregator_cls", [SpanAggregator, ShardedSpanAggregator])
+def test_aggregator_span_creation_metrics(aggregator_cls):
+    """Telemetry span count metrics are all sent on shutdown"""
+    aggr = aggregator_cls(
+        partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=DummyWriter()
+    )
+    telemetry_writer._namespace.flush()
+
+    with mock.patch.object(telemetry_writer, "enable", return_value=True), mock.patch.object(
+        telemetry_writer, "periodic"
+    ) as mock_periodic:
+        for _ in range(10):
+            span = Span("span", on_finish=[aggr.on_span_finish])
+            aggr.on_span_start(span)
+            span.finish()
+        aggr.on_span_start(Span("unfinished"))
+
+        aggr.shutdown(None)
+        mock_periodic.assert_called_once_with(True)
+
+    metrics = telemetry_writer._namespace.flush()[TELEMETRY_TYPE_GENERATE_METRICS][TELEMETRY_NAMESPACE_TAG_TRACER]
+    counts = {(metric.name, metric._tags): metric._points[0][1] for metric in metrics.values()}
+    assert counts == {
+        ("spans_created", (("integration_name", "datadog"),)): 11,
+        ("spans_finished", (("integration_name", "datadog"),)): 10,
+    }
+
+
+@pytest.mark.parametrize("shards,aggregator_cls", [(0, SpanAggregator), (8, ShardedSpanAggregator)])
+def test_tracer_span_aggregator_shards(shards, aggregator_cls):
+    with override_global_config(dict(_span_aggregator_shards=shards)):
+        tracer = Tracer()
+        tracer.configure(writer=DummyWriter())
+
+    (aggr,) = tracer._deferred_processors
+    assert type(aggr) is aggregator_cls
+    if shards:
+        assert len(aggr._shards) == shards
+
+
 def test_trace_top_level_span_processor_partial_flushing():
     """Parent span and child span have the same service name"""
     tracer = Tracer()
@@ -374,41 +489,6 @@ def test_span_normalizator():
     assert span.span_type == "x" * MAX_TYPE_LENGTH
 
 
-def test_span_creation_metrics():
-    """Test that telemetry metrics are queued in batches of 100 and the remainder is sent on shutdown"""
-    writer = DummyWriter()
-    aggr = SpanAggregator(partial_flush_enabled=False, partial_flush_min_spans=0, trace_processors=[], writer=writer)
-
-    with mock.patch("ddtrace.internal.processor.trace.telemetry_writer.add_count_metric") as mock_tm:
-        for _ in range(300):
-            span = Span("span", on_finish=[aggr.on_span_finish])
-            aggr.on_span_start(span)
-            span.finish()
-
-        span = Span("span", on_finish=[aggr.on_span_finish])
-        aggr.on_span_start(span)
-        span.finish()
-
-        mock_tm.assert_has_calls(
-            [
-                mock.call("tracers", "spans_created", 100, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_finished", 100, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_created", 100, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_finished", 100, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_created", 100, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_finished", 100, tags=(("integration_name", "datadog"),)),
-            ]
-        )
-        mock_tm.reset_mock()
-        aggr.shutdown(None)
-        mock_tm.assert_has_calls(
-            [
-                mock.call("tracers", "spans_created", 1, tags=(("integration_name", "datadog"),)),
-                mock.call("tracers", "spans_finished", 1, tags=(("integration_name", "datadog"),)),
-            ]
-        )
-
-
 def test_single_span_sampling_processor():
     """Test that single span sampling tags are applied to spans that should get sampled"""
 
@@ -684,3 +764,172 @@ def test_register_unregister_span_processor():
     with tracer.trace("test") as span:
         assert span.get_tag("on_start") is None
     assert span.get_tag("on_finish") is None
+
+
+def test_span_stats_processor_threads():
+    """SpanStatsProcessorV06 merges the stats aggregated by each thread when they are flushed"""
+    processor = SpanStatsProcessorV06("http://localhost:8126", interval=10.0)
+    processor.stop()
+    processor.join()
+
+    def finish_spans(n, error=False):
+        for _ in range(n):
+            span = Span("web.request", service="svc", resource="GET /", span_type=SpanTypes.WEB)
+            span._local_root = span
+            span.set_tag("http.status_code", "500" if error else "200")
+            span.error = int(error)
+            span.duration_ns = 1000
+            processor.on_span_finish(span)
+
+    threads = [threading.Thread(target=finish_spans, args=(100,)) for _ in range(4)]
+    threads.append(threading.Thread(target=finish_spans, args=(10, True)))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    finish_spans(50)
+
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    (payload,), _ = flush_stats.call_args
+    (bucket,) = msgpack.unpackb(payload)["Stats"]
+    stats = {s["HTTPStatusCode"]: s for s in bucket["Stats"]}
+    assert stats[200]["Hits"] == stats[200]["TopLevelHits"] == 450
+    assert stats[200]["Duration"] == 450 * 1000
+    assert stats[200]["Errors"] == 0
+    assert stats[500]["Hits"] == stats[500]["Errors"] == 10
+
+    # The stats of the threads that are gone are dropped once flushed
+    assert len(processor._thread_stats) == 1
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    flush_stats.assert_not_called()
+
+
+def test_span_stats_processor_dummy_threads():
+    """The stats of the threads not started by the threading module are dropped once they are gone"""
+    processor = SpanStatsProcessorV06("http://localhost:8126", interval=10.0)
+    processor.stop()
+    processor.join()
+    done = threading.Event()
+
+    def finish_spans():
+        # A thread started from C, or with _thread, is a _DummyThread that
+        # is always reported alive
+        assert threading.current_thread().is_alive()
+        for _ in range(10):
+            span = Span("web.request", service="svc", resource="GET /")
+            span._local_root = span
+            span.duration_ns = 1000
+            processor.on_span_finish(span)
+        done.set()
+
+    for _ in range(3):
+        done.clear()
+        _thread.start_new_thread(finish_spans, ())
+        assert done.wait(5)
+
+    # The thread-local storage of a thread is released shortly after it
+    # returns
+    deadline = time.time() + 5
+    while any(stats.owner() is not None for stats in processor._thread_stats) and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(processor._thread_stats) == 3
+
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    (payload,), _ = flush_stats.call_args
+    (bucket,) = msgpack.unpackb(payload)["Stats"]
+    (stats,) = bucket["Stats"]
+    assert stats["Hits"] == 30
+    assert processor._thread_stats == []
+
+
+def test_span_stats_processor_thread_sketches():
+    """The durations aggregated by a thread are only merged when the stats are flushed"""
+    with override_global_config(dict(_trace_stats_max_aggregation_keys=2)):
+        processor = SpanStatsProcessorV06("http://localhost:8126", interval=10.0)
+    processor.stop()
+    processor.join()
+
+    with mock.patch.object(processor, "_merge_thread_stats", wraps=processor._merge_thread_stats) as merge:
+        for i in range(5000):
+            span = Span("web.request", service="svc", resource="GET /%d" % (i % 3))
+            span._local_root = span
+            span.duration_ns = 1000 + i
+            processor.on_span_finish(span)
+        merge.assert_not_called()
+
+    (thread_stats,) = processor._thread_stats
+    (bucket,) = thread_stats.buckets.values()
+    # The spans of the keys over the limit are aggregated by the thread
+    # under the overflow key
+    assert sorted(stats.hits for stats in bucket.values()) == [1666, 1667, 1667]
+    assert sum(stats.ok_distribution.count for stats in bucket.values()) == 5000
+    assert not processor._buckets
+
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    (payload,), _ = flush_stats.call_args
+    (bucket,) = msgpack.unpackb(payload)["Stats"]
+    assert sorted(s["Resource"] for s in bucket["Stats"]) == ["", "GET /0", "GET /1"]
+    assert sum(s["Hits"] for s in bucket["Stats"]) == 5000
+    assert not thread_stats.buckets
+
+
+def test_span_stats_processor_peer_tags():
+    """Client spans are aggregated by their span kind, peer tags and gRPC status code"""
+    with override_global_config(dict(_trace_stats_peer_tags_enabled=True, _trace_stats_peer_tags=["peer.service"])):
+        processor = SpanStatsProcessorV06("http://localhost:8126", interval=10.0)
+    processor.stop()
+    processor.join()
+
+    for peer_service, kind, code in [
+        ("users", "client", "StatusCode.OK"),
+        ("users", "client", "0"),
+        ("users", "client", "StatusCode.NOT_FOUND"),
+        ("orders", "client", "StatusCode.OK"),
+        ("orders", "server", "StatusCode.OK"),
+    ]:
+        span = Span("grpc.request", service="svc", resource="/rpc")
+        span._local_root = span
+        span.set_tag_str("span.kind", kind)
+        span.set_tag_str("peer.service", peer_service)
+        span.set_tag_str("grpc.status.code", code)
+        span.duration_ns = 1000
+        processor.on_span_finish(span)
+
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    (payload,), _ = flush_stats.call_args
+    (bucket,) = msgpack.unpackb(payload)["Stats"]
+    stats = {(s["SpanKind"], tuple(s.get("PeerTags", ())), s["GRPCStatusCode"]): s["Hits"] for s in bucket["Stats"]}
+    assert stats == {
+        ("client", ("peer.service:users",), "0"): 2,
+        ("client", ("peer.service:users",), "5"): 1,
+        ("client", ("peer.service:orders",), "0"): 1,
+        ("server", (), "0"): 1,
+    }
+
+
+def test_span_stats_processor_max_aggregation_keys():
+    """The spans of the keys beyond the limit of a bucket are aggregated under a catch-all key"""
+    with override_global_config(dict(_trace_stats_max_aggregation_keys=3)):
+        processor = SpanStatsProcessorV06("http://localhost:8126", interval=10.0)
+    processor.stop()
+    processor.join()
+
+    for i in range(10):
+        span = Span("web.request", service="svc", resource="GET /%d" % (i % 5))
+        span._local_root = span
+        span.duration_ns = 1000
+        processor.on_span_finish(span)
+
+    with mock.patch.object(processor, "_flush_stats_with_backoff") as flush_stats:
+        processor.periodic()
+    (payload,), _ = flush_stats.call_args
+    (bucket,) = msgpack.unpackb(payload)["Stats"]
+    stats = {(s["Name"], s["Resource"]): s["Hits"] for s in bucket["Stats"]}
+    assert len(stats) == 4
+    assert stats[("_dd.stats.overflow", "")] == 4
+    assert sum(stats.values()) == 10
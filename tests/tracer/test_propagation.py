@@ -6,6 +6,8 @@ import os
 import pytest
 
 from ddtrace.context import Context
+from ddtrace.internal._propagation import parse_traceparent
+from ddtrace.internal._propagation import parse_tracestate
 from ddtrace.internal.constants import PROPAGATION_STYLE_B3
 from ddtrace.internal.constants import PROPAGATION_STYLE_B3_SINGLE_HEADER
 from ddtrace.internal.constants import PROPAGATION_STYLE_DATADOG
@@ -232,6 +234,30 @@ def test_inject_tags_disabled(tracer):
             assert _HTTP_HEADER_TAGS not in headers
 
 
+def test_inject_tags_updated(tracer):
+    """Ensure the encoded x-datadog-tags follow the changes of the trace tags."""
+    with tracer.trace("global_root_span") as span:
+        span.context._meta["_dd.p.test"] = "value"
+        headers = {}
+        HTTPPropagator.inject(span.context, headers)
+        assert "_dd.p.test=value" in headers[_HTTP_HEADER_TAGS].split(",")
+
+        with tracer.trace("child_span") as child:
+            headers = {}
+            HTTPPropagator.inject(child.context, headers)
+            assert "_dd.p.test=value" in headers[_HTTP_HEADER_TAGS].split(",")
+
+            child.context._meta["_dd.p.test"] = "other"
+            headers = {}
+            HTTPPropagator.inject(child.context, headers)
+            assert "_dd.p.test=other" in headers[_HTTP_HEADER_TAGS].split(",")
+
+            del child.context._meta["_dd.p.test"]
+            headers = {}
+            HTTPPropagator.inject(child.context, headers)
+            assert "_dd.p.test" not in headers[_HTTP_HEADER_TAGS]
+
+
 def test_inject_tags_previous_error(tracer):
     """When we have previously gotten an error, do not try to propagate tags"""
     # This value is valid
@@ -487,6 +513,38 @@ def test_WSGI_extract(tracer):
         }
 
 
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"HTTP_X_DATADOG_TRACE_ID": "1", "x-datadog-trace-id": "1234", "X-Datadog-Trace-Id": "2"},
+        {"x-datadog-trace-id": "1234", "X-Datadog-Trace-Id": "2", "HTTP_X_DATADOG_TRACE_ID": "1"},
+    ],
+)
+def test_extract_header_name_precedence(headers):
+    """The value of a header sent with its name takes precedence over the other names."""
+    headers["x-datadog-parent-id"] = "5678"
+
+    context = HTTPPropagator.extract(headers)
+
+    assert context.trace_id == 1234
+    assert context.span_id == 5678
+
+
+def test_extract_mixed_case_headers():
+    headers = {
+        "Content-Type": "text/plain",
+        "X-Datadog-Trace-Id": "1234",
+        "X-DATADOG-PARENT-ID": "5678",
+        b"x-datadog-origin": "synthetics",
+        "x-Ðatadog-trace-id": "1",
+    }
+
+    context = HTTPPropagator.extract(headers)
+
+    assert context.trace_id == 1234
+    assert context.span_id == 5678
+
+
 def test_extract_invalid_tags(tracer):
     # Malformed tags do not fail to extract the rest of the context
     headers = {
@@ -583,6 +641,44 @@ def test_get_wsgi_header(tracer):
     assert get_wsgi_header("x-datadog-trace-id") == "HTTP_X_DATADOG_TRACE_ID"
 
 
+@pytest.mark.parametrize(
+    "tp,expected",
+    [
+        (
+            "00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-01",
+            ("00", 171395628812617415352188477958425669623, 67667974448284343, 1, None),
+        ),
+        (
+            "01-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-01-what-the-future-looks-like",
+            ("01", 171395628812617415352188477958425669623, 67667974448284343, 1, "-what-the-future-looks-like"),
+        ),
+        ("ff-ffffffffffffffffffffffffffffffff-ffffffffffffffff-ff", ("ff", (1 << 128) - 1, (1 << 64) - 1, 255, None)),
+        ("00-80F198EE56343BA864FE8B2A57D3EFF7-00f067aa0ba902b7-01", None),
+        ("00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-1", None),
+        ("00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7_01", None),
+        ("00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-01-", None),
+        ("00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-01x", None),
+        ("00-80f198ee56343ba864fe8b2a57d3eff7-00f067aa0ba902b7-01-\n", None),
+        ("", None),
+    ],
+)
+def test_parse_traceparent(tp, expected):
+    assert parse_traceparent(tp) == expected
+
+
+@pytest.mark.parametrize(
+    "ts,expected",
+    [
+        ("dd=s:2;o:rum,congo=t61rcWkgMzE", ("dd=s:2;o:rum,congo=t61rcWkgMzE", "s:2;o:rum")),
+        (" congo=t61rcWkgMzE ,\tdd=s:1 ", ("congo=t61rcWkgMzE,dd=s:1", "s:1")),
+        ("congo=t61rcWkgMzE", ("congo=t61rcWkgMzE", None)),
+        ("dd=s:1,congo=☺", (None, None)),
+    ],
+)
+def test_parse_tracestate(ts, expected):
+    assert parse_tracestate(ts) == expected
+
+
 TRACE_ID = 171395628812617415352188477958425669623
 TRACE_ID_HEX = "80f198ee56343ba864fe8b2a57d3eff7"
 
@@ -1,12 +1,17 @@
 from __future__ import division
 
+import threading
+
 import mock
 import pytest
 
 from ddtrace.internal import compat
 from ddtrace.internal.rate_limiter import BudgetRateLimiterWithJitter
+from ddtrace.internal.rate_limiter import PerThreadRateLimiter
 from ddtrace.internal.rate_limiter import RateLimitExceeded
 from ddtrace.internal.rate_limiter import RateLimiter
+from ddtrace.internal.rate_limiter import new_rate_limiter
+from tests.utils import override_global_config
 
 
 def nanoseconds(x):
@@ -14,16 +19,21 @@ def nanoseconds(x):
     return range(0, int(1e9 * x), int(1e9))
 
 
-def test_rate_limiter_init():
-    limiter = RateLimiter(rate_limit=100)
+@pytest.fixture(params=[RateLimiter, PerThreadRateLimiter])
+def rate_limiter_cls(request):
+    return request.param
+
+
+def test_rate_limiter_init(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=100)
     assert limiter.rate_limit == 100
     assert limiter.tokens == 100
     assert limiter.max_tokens == 100
     assert limiter.last_update_ns <= compat.monotonic_ns()
 
 
-def test_rate_limiter_rate_limit_0():
-    limiter = RateLimiter(rate_limit=0)
+def test_rate_limiter_rate_limit_0(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=0)
     assert limiter.rate_limit == 0
     assert limiter.tokens == 0
     assert limiter.max_tokens == 0
@@ -34,8 +44,8 @@ def test_rate_limiter_rate_limit_0():
         assert limiter.is_allowed(now_ns + i) is False
 
 
-def test_rate_limiter_rate_limit_negative():
-    limiter = RateLimiter(rate_limit=-1)
+def test_rate_limiter_rate_limit_negative(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=-1)
     assert limiter.rate_limit == -1
     assert limiter.tokens == -1
     assert limiter.max_tokens == -1
@@ -47,8 +57,8 @@ def test_rate_limiter_rate_limit_negative():
 
 
 @pytest.mark.parametrize("rate_limit", [1, 10, 50, 100, 500, 1000])
-def test_rate_limiter_is_allowed(rate_limit):
-    limiter = RateLimiter(rate_limit=rate_limit)
+def test_rate_limiter_is_allowed(rate_limit, rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=rate_limit)
 
     def check_limit(time_ns):
         # Up to the allowed limit is allowed
@@ -68,8 +78,8 @@ def test_rate_limiter_is_allowed(rate_limit):
         check_limit(now + i)
 
 
-def test_rate_limiter_is_allowed_large_gap():
-    limiter = RateLimiter(rate_limit=100)
+def test_rate_limiter_is_allowed_large_gap(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=100)
 
     # Start time
     now_ns = compat.monotonic_ns()
@@ -82,8 +92,8 @@ def test_rate_limiter_is_allowed_large_gap():
         assert limiter.is_allowed(now_ns + (1e9 * 100)) is True
 
 
-def test_rate_limiter_is_allowed_small_gaps():
-    limiter = RateLimiter(rate_limit=100)
+def test_rate_limiter_is_allowed_small_gaps(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=100)
 
     # Start time
     now_ns = compat.monotonic_ns()
@@ -96,8 +106,8 @@ def test_rate_limiter_is_allowed_small_gaps():
         assert limiter.is_allowed(time_ns) is True
 
 
-def test_rate_liimter_effective_rate_rates():
-    limiter = RateLimiter(rate_limit=100)
+def test_rate_liimter_effective_rate_rates(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=100)
 
     # Static rate limit window
     starting_window_ns = compat.monotonic_ns()
@@ -127,8 +137,8 @@ def test_rate_liimter_effective_rate_rates():
         assert limiter.current_window_ns == window_ns
 
 
-def test_rate_limiter_effective_rate_starting_rate():
-    limiter = RateLimiter(rate_limit=1)
+def test_rate_limiter_effective_rate_starting_rate(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=1)
 
     now_ns = compat.monotonic_ns()
 
@@ -177,8 +187,8 @@ def test_rate_limiter_effective_rate_starting_rate():
     assert limiter.prev_window_rate == 0.5
 
 
-def test_rate_limiter_3():
-    limiter = RateLimiter(rate_limit=2)
+def test_rate_limiter_3(rate_limiter_cls):
+    limiter = rate_limiter_cls(rate_limit=2)
     for i in range(3):
         decision = limiter.is_allowed(compat.monotonic_ns())
         # the first two should be allowed, the third should not
@@ -188,6 +198,84 @@ def test_rate_limiter_3():
             assert decision is False
 
 
+def test_per_thread_rate_limiter_threads():
+    limiter = PerThreadRateLimiter(rate_limit=1000)
+    now_ns = compat.monotonic_ns()
+    allowed = []
+
+    def take(time_ns):
+        allowed.append(sum(limiter.is_allowed(time_ns) for _ in range(500)))
+
+    # The threads share the tokens of the rate limit
+    threads = [threading.Thread(target=take, args=(now_ns,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(allowed) == 1000
+
+
+def test_per_thread_rate_limiter_lease_expires():
+    limiter = PerThreadRateLimiter(rate_limit=1000)
+    now_ns = compat.monotonic_ns()
+
+    # The thread takes a batch of tokens for 10ms worth of rate limit
+    assert limiter.is_allowed(now_ns) is True
+    assert limiter.tokens == 990
+
+    # Once expired, the tokens left are given back to the other threads
+    assert limiter.is_allowed(now_ns + 2e7) is True
+    assert limiter.tokens == 990
+
+
+def test_per_thread_rate_limiter_exited_threads():
+    limiter = PerThreadRateLimiter(rate_limit=1000)
+    now_ns = compat.monotonic_ns()
+
+    # Each thread takes a batch of 10 tokens, uses one and exits
+    threads = [threading.Thread(target=limiter.is_allowed, args=(now_ns,)) for _ in range(50)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert limiter.tokens == 500
+
+    # Once expired, the tokens left by the threads are given back, on top of
+    # the 20 tokens replenished after 20ms
+    assert sum(limiter.is_allowed(now_ns + 20000000) for _ in range(2000)) == 970
+
+
+def test_per_thread_rate_limiter_revoked_lease():
+    limiter = PerThreadRateLimiter(rate_limit=1000)
+    now_ns = compat.monotonic_ns()
+    assert limiter.is_allowed(now_ns) is True
+    lease = limiter._leases.lease
+
+    # A revoked lease gives back the tokens left and cannot be used anymore
+    assert lease.take(now_ns) is True
+    assert lease.revoke() == 8
+    assert lease.take(now_ns) is False
+    assert lease.revoke() == 0
+
+
+def test_per_thread_rate_limiter_denied_until_next_token():
+    limiter = PerThreadRateLimiter(rate_limit=10)
+    now_ns = compat.monotonic_ns()
+    for _ in range(10):
+        assert limiter.is_allowed(now_ns) is True
+
+    with mock.patch.object(
+        PerThreadRateLimiter, "_replenish", autospec=True, side_effect=PerThreadRateLimiter._replenish
+    ) as replenish:
+        assert limiter.is_allowed(now_ns) is False
+        assert limiter.is_allowed(now_ns + 5e7) is False
+        assert replenish.call_count == 1
+
+        # The next token is available after 100ms
+        assert limiter.is_allowed(now_ns + 1e8) is True
+        assert replenish.call_count == 2
+
+
 @pytest.mark.parametrize("rate_limit", list(range(10)))
 def test_rate_limiter_with_jitter_expected_calls(rate_limit):
     limiter = BudgetRateLimiterWithJitter(limit_rate=rate_limit)
@@ -259,3 +347,11 @@ def test_rate_limiter_with_jitter_not_raise():
     limiter = BudgetRateLimiterWithJitter(limit_rate=1, raise_on_exceed=False)
 
     assert [limiter.limit(lambda: None) for _ in range(10)][1:] == [RateLimitExceeded] * 9
+
+
+@pytest.mark.parametrize("per_thread,expected", [(False, RateLimiter), (True, PerThreadRateLimiter)])
+def test_new_rate_limiter(per_thread, expected):
+    with override_global_config(dict(_trace_rate_limiter_per_thread=per_thread)):
+        limiter = new_rate_limiter(10)
+    assert type(limiter) is expected
+    assert limiter.rate_limit == 10
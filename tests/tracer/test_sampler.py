@@ -20,6 +20,7 @@ from ddtrace.internal.compat import iteritems
 from ddtrace.internal.rate_limiter import RateLimiter
 from ddtrace.internal.sampling import SAMPLING_DECISION_TRACE_TAG_KEY
 from ddtrace.internal.sampling import SamplingMechanism
+from ddtrace.internal.sampling import SamplingRuleIndex
 from ddtrace.internal.sampling import set_sampling_decision_maker
 from ddtrace.sampler import DatadogSampler
 from ddtrace.sampler import RateByServiceSampler
@@ -630,6 +631,88 @@ def test_sampling_rule_matches_exception():
         )
 
 
+def _span(name, service=None, resource=None, tags=None):
+    span = Span(name, service=service, resource=resource)
+    if tags:
+        span.set_tags(tags)
+    return span
+
+
+def test_sampling_rule_index():
+    class AlwaysMatch(SamplingRule):
+        def matches(self, span):
+            return True
+
+    rules = [
+        SamplingRule(sample_rate=0.1, service="svc", name="op", resource="res"),
+        SamplingRule(sample_rate=0.2, service="svc", tags={"env": "prod", "version": "v?"}),
+        SamplingRule(sample_rate=0.3, service=re.compile("^db-"), name="query"),
+        SamplingRule(sample_rate=0.4, name=lambda name: name.endswith(".request")),
+        SamplingRule(sample_rate=0.5, name="op", tags={"region": "us-*-1"}),
+        SamplingRule(sample_rate=0.6, service="other", resource=re.compile("GET .*")),
+        AlwaysMatch(sample_rate=0.7, service="nope"),
+        SamplingRule(sample_rate=0.8),
+    ]
+    index = SamplingRuleIndex(rules)
+
+    spans = []
+    for service in ("svc", "db-main", "other", "unknown", None):
+        for name in ("op", "query", "http.request", "unknown"):
+            for resource in ("res", "GET /", "unknown"):
+                for tags in ({}, {"env": "prod", "version": "v1"}, {"region": "us-east-1"}, {"env": "dev"}):
+                    spans.append(_span(name, service, resource, tags))
+
+    for span in spans:
+        # The index matches the same rule as evaluating the rules in order
+        expected = next((rule for rule in rules if rule.matches(span)), None)
+        assert index.match(span) is expected, span
+
+    assert index.match(Span("op", service="svc", resource="res")) is rules[0]
+    assert index.match(_span("op", "svc", tags={"env": "prod", "version": "v2"})) is rules[1]
+    assert index.match(_span("op", "svc", tags={"region": "us-west-1"})) is rules[4]
+    assert index.match(Span("anything", service="anything")) is rules[6]
+
+
+def test_sampling_rule_index_no_rules():
+    assert SamplingRuleIndex([]).match(Span("op")) is None
+    assert SamplingRuleIndex([SamplingRule(sample_rate=1, service="svc")]).match(Span("op")) is None
+
+
+def test_datadog_sampler_rules_changed():
+    rule_1 = SamplingRule(sample_rate=0, service="svc")
+    rule_2 = SamplingRule(sample_rate=1, service="svc")
+    sampler = DatadogSampler(rules=[rule_1])
+    span = Span("op", service="svc")
+
+    sampler.sample(span)
+    assert span.get_metric(SAMPLING_RULE_DECISION) == 0
+
+    # Assigning new rules updates the sampler
+    sampler.rules = [rule_2]
+    sampler.sample(span)
+    assert span.get_metric(SAMPLING_RULE_DECISION) == 1
+
+
+def test_datadog_sampler_rules_mutated():
+    rule_1 = SamplingRule(sample_rate=0, service="svc")
+    rule_2 = SamplingRule(sample_rate=1, service="other")
+    sampler = DatadogSampler(rules=[rule_1])
+    span = Span("op", service="other")
+
+    sampler.sample(span)
+    assert span.get_metric(SAMPLING_RULE_DECISION) is None
+
+    # Rules added to or removed from the list are taken into account
+    sampler.rules.append(rule_2)
+    sampler.sample(span)
+    assert span.get_metric(SAMPLING_RULE_DECISION) == 1
+
+    span = Span("op", service="other")
+    sampler.rules.remove(rule_2)
+    sampler.sample(span)
+    assert span.get_metric(SAMPLING_RULE_DECISION) is None
+
+
 @pytest.mark.subprocess(
     parametrize={"DD_TRACE_128_BIT_TRACEID_GENERATION_ENABLED": ["true", "false"]},
 )
@@ -0,0 +1,178 @@
+import weakref
+
+import mock
+import pytest
+
+from ddtrace import Tracer
+from ddtrace.context import Context
+from ddtrace.filters import TraceFilter
+from ddtrace.internal.span_pool import IS_SUPPORTED
+from ddtrace.internal.span_pool import SpanPool
+from ddtrace.span import Span
+from tests.utils import override_global_config
+
+
+pytestmark = pytest.mark.skipif(not IS_SUPPORTED, reason="The span pool is not supported on this interpreter")
+
+
+def _trace(pool):
+    # type: (SpanPool) -> list
+    root = pool.acquire("root", service="svc", on_finish=[lambda span: None])
+    root._local_root = root
+    child = pool.acquire("child", service="svc", trace_id=root.trace_id, parent_id=root.span_id)
+    child._parent = root
+    child._local_root = root
+    for span in (root, child):
+        span.set_tag("foo", "bar")
+        span.set_metric("baz", 1)
+        span.finish()
+    return [root, child]
+
+
+def test_span_pool_recycles_unreferenced_spans():
+    pool = SpanPool(10)
+    trace = _trace(pool)
+    ids = set(map(id, trace))
+    pool.release(trace)
+    del trace
+
+    span = pool.acquire("new", resource="res", context=Context(trace_id=1, span_id=2), trace_id=1, parent_id=2)
+    assert id(span) in ids
+    assert len(pool) == 1
+
+    # A recycled span is indistinguishable from a new one
+    assert span._on_finish_callbacks == []
+    fresh = Span("new", resource="res", context=Context(trace_id=1, span_id=2), trace_id=1, parent_id=2)
+    for attr in Span.__slots__:
+        if attr in ("span_id", "start_ns", "_context", "__weakref__"):
+            continue
+        assert getattr(span, attr) == getattr(fresh, attr), attr
+    assert span._context.trace_id == 1
+    assert span._context.span_id == span.span_id
+
+
+def test_span_pool_does_not_recycle_referenced_spans():
+    pool = SpanPool(10)
+    trace = _trace(pool)
+    child = trace[1]
+    pool.release(trace)
+    del trace
+
+    span = pool.acquire("new")
+    assert span is not child
+    assert len(pool) == 0
+    assert child.name == "child"
+    assert child._parent.name == "root"
+
+    # The trace is recycled once the span is no longer referenced
+    del child
+    pool.acquire("new")
+    assert len(pool) == 1
+
+
+def test_span_pool_does_not_recycle_weakly_referenced_spans():
+    pool = SpanPool(10)
+    trace = _trace(pool)
+    ref = weakref.ref(trace[0])
+    pool.release(trace)
+    del trace
+
+    pool.acquire("new")
+    assert len(pool) == 0
+    assert ref().name == "root"
+
+
+def test_span_pool_does_not_reuse_shared_containers():
+    pool = SpanPool(10)
+    trace = _trace(pool)
+    meta = trace[0]._meta
+    pool.release(trace)
+    del trace
+
+    pool.acquire("new")
+    assert len(pool) == 1
+    assert meta == {"foo": "bar"}
+
+
+def test_tracer_span_pool():
+    with override_global_config(dict(_span_pool_size=10)):
+        tracer = Tracer()
+    writer = mock.Mock()
+    tracer.configure(writer=writer)
+
+    roots = set()
+    for _ in range(5):
+        with tracer.trace("root") as root:
+            with tracer.trace("child"):
+                pass
+        roots.add(id(root))
+        (spans,), _ = writer.write.call_args
+        assert [s.name for s in spans] == ["root", "child"]
+        assert spans[1].parent_id == spans[0].span_id
+        assert spans[0].get_tag("runtime-id") is not None
+        del spans
+        writer.reset_mock()
+
+    # The root span is held by the test until the next trace starts, so at
+    # most every other trace reuses its spans.
+    assert len(roots) < 5
+
+
+def test_span_pool_on_finish():
+    pool = SpanPool(10)
+    pool.release(_trace(pool))
+
+    on_finish = [lambda span: None]
+    span = pool.acquire("new", on_finish=on_finish)
+    assert len(pool) == 1
+    # The callbacks are assigned like in Span.__init__
+    assert span._on_finish_callbacks is on_finish
+
+
+def test_tracer_span_pool_external_reference():
+    with override_global_config(dict(_span_pool_size=10)):
+        tracer = Tracer()
+    writer = mock.Mock()
+    tracer.configure(writer=writer)
+
+    with tracer.trace("held") as held:
+        held.set_tag("foo", "bar")
+    held_id = held.span_id
+
+    ids = set()
+    for _ in range(20):
+        with tracer.trace("root") as root:
+            with tracer.trace("child"):
+                pass
+        ids.add(id(root))
+        del root
+        writer.reset_mock()
+
+    # The spans of the other traces are recycled, but the span held by the
+    # application is left alone.
+    assert len(ids) < 20
+    assert id(held) not in ids
+    assert held.name == "held"
+    assert held.span_id == held_id
+    assert held.get_tag("foo") == "bar"
+
+
+def test_tracer_span_pool_dropped_trace():
+    with override_global_config(dict(_span_pool_size=10)):
+        tracer = Tracer()
+    writer = mock.Mock()
+    dropped = []
+
+    class DropTraces(TraceFilter):
+        def process_trace(self, trace):
+            dropped.append(trace)
+            return None
+
+    tracer.configure(writer=writer, settings={"FILTERS": [DropTraces()]})
+    with tracer.trace("root"):
+        pass
+
+    # Only the traces handed over to the writer are released to the pool
+    writer.write.assert_called_once_with(None)
+    assert len(tracer._span_pool._released) == 0
+    assert dropped[0][0].name == "root"
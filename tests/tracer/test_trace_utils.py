@@ -256,6 +256,16 @@ class TestHeaders(object):
         )
         assert span.get_tag("http.response.headers.content-type") == "some;value"
 
+    def test_tag_names_are_shared_between_spans(self, integration_config):
+        integration_config.http.trace_headers("x-request-id")
+        spans = [Span("some_span"), Span("some_span")]
+        for span in spans:
+            trace_utils._store_request_headers({"X-Request-Id": "abc"}, span, integration_config)
+
+        (key1,), (key2,) = (list(span.get_tags()) for span in spans)
+        assert key1 == "http.request.headers.x-request-id"
+        assert key1 is key2
+
 
 @pytest.mark.parametrize(
     "pin,config_val,default,global_service,expected",
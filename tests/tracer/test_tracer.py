@@ -35,6 +35,7 @@ from ddtrace.contrib.trace_utils import set_user
 from ddtrace.ext import user
 from ddtrace.internal import telemetry
 from ddtrace.internal._encoding import MsgpackEncoderV03
+from ddtrace.internal.processor import SpanProcessor
 from ddtrace.internal.serverless import has_aws_lambda_agent_extension
 from ddtrace.internal.serverless import in_aws_lambda
 from ddtrace.internal.writer import AgentWriter
@@ -1116,6 +1117,79 @@ def test_deregister_start_span_hooks():
     assert result == {}
 
 
+def test_start_child_span_fast_path():
+    from ddtrace.tracer import _start_child_span
+
+    def trace(t):
+        with t.trace("root", service="svc"):
+            with t.trace("parent", service="svc", resource="res") as parent:
+                with t.trace("child", span_type="web") as child:
+                    return parent, child
+
+    with override_global_config(dict(env="prod", version="1.0", service="svc")):
+        t = ddtrace.Tracer()
+        t.set_tags({"global": "tag"})
+        with mock.patch.object(sys.modules["ddtrace.tracer"], "_start_child_span", wraps=_start_child_span) as m:
+            parent, child = trace(t)
+        assert m.call_count == 2
+
+        # Starting spans with a start_span hook goes through the Python implementation
+        t.on_start_span(lambda span: None)
+        expected_parent, expected = trace(t)
+
+    assert child.parent_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert child._parent is parent
+    assert child._local_root is parent._local_root
+    assert child.service == "svc"
+    assert child.resource == "child"
+    assert child.span_type == "web"
+    assert child.sampled == parent.sampled
+    assert child.get_tags() == expected.get_tags()
+    assert child.get_metrics() == expected.get_metrics()
+    assert child.get_tag(VERSION_KEY) == "1.0"
+    assert child.get_tag(ENV_KEY) == "prod"
+    assert child.get_tag("global") == "tag"
+    assert "svc" in t._services
+
+
+def test_start_child_span_hooks():
+    t = ddtrace.Tracer()
+
+    started = []
+    t.on_start_span(started.append)
+
+    with t.trace("parent") as parent:
+        with t.trace("child") as child:
+            pass
+
+    assert started == [parent, child]
+
+
+def test_start_child_span_span_processor():
+    class MyProcessor(SpanProcessor):
+        def on_span_start(self, span):
+            started.append(span)
+
+        def on_span_finish(self, span):
+            finished.append(span)
+
+    started = []
+    finished = []
+    t = ddtrace.Tracer()
+    processor = MyProcessor()
+    processor.register()
+    try:
+        with t.trace("parent") as parent:
+            with t.trace("child") as child:
+                pass
+    finally:
+        processor.unregister()
+
+    assert started == [parent, child]
+    assert finished == [child, parent]
+
+
 @pytest.mark.subprocess(parametrize={"DD_TRACE_ENABLED": ["true", "false"]})
 def test_enable():
     import os
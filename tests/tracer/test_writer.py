@@ -5,6 +5,7 @@ import sys
 import tempfile
 import threading
 import time
+import zlib
 
 import mock
 import msgpack
@@ -23,9 +24,11 @@ from ddtrace.internal.encoding import MSGPACK_ENCODERS
 from ddtrace.internal.runtime import get_runtime_id
 from ddtrace.internal.uds import UDSHTTPConnection
 from ddtrace.internal.writer import AgentWriter
+from ddtrace.internal.writer import HTTPWriter
 from ddtrace.internal.writer import LogWriter
 from ddtrace.internal.writer import Response
 from ddtrace.internal.writer import _human_size
+from ddtrace.internal.writer.spool import PayloadSpool
 from ddtrace.span import Span
 from tests.utils import AnyInt
 from tests.utils import BaseTestCase
@@ -254,13 +257,48 @@ class AgentWriterTests(BaseTestCase):
             assert client_count == writer._metrics["buffer.dropped.traces"][("reason:full",)]
             assert [("reason:full",)] == list(writer._metrics["buffer.dropped.traces"].keys())
 
+    @mock.patch.object(HTTPWriter, "periodic")
+    def test_async_encoding(self, _):
+        with override_global_config(dict(_trace_writer_async_encoding=True)):
+            writer = self.WRITER_CLASS("http://asdf:1234")
+        for i in range(10):
+            writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
+
+        # Traces are only encoded by the writer thread
+        assert len(writer._encoding_queue) == 10 * len(writer._clients)
+        assert all(len(client.encoder) == 0 for client in writer._clients)
+
+        writer._encode_queued_traces()
+        assert len(writer._encoding_queue) == 0
+        assert any(len(client.encoder) == 10 for client in writer._clients)
+        writer.stop()
+        writer.join()
+
+    def test_async_encoding_sync_mode(self):
+        with override_global_config(dict(_trace_writer_async_encoding=True)):
+            writer = self.WRITER_CLASS("http://asdf:1234", sync_mode=True)
+        assert writer._encoding_queue is None
+
+    @mock.patch.object(HTTPWriter, "periodic")
+    def test_drop_reason_async_encoding_queue_full(self, _):
+        with override_global_config(dict(_trace_writer_async_encoding=True, _trace_writer_async_encoding_queue_size=5)):
+            writer = self.WRITER_CLASS("http://asdf:1234")
+        for i in range(10):
+            writer.write([Span(name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(5)])
+
+        client_count = len(writer._clients)
+        assert len(writer._encoding_queue) == 5
+        assert writer._metrics["buffer.dropped.traces"][("reason:full",)] == 10 * client_count - 5
+        writer.stop()
+        writer.join()
+
     def test_drop_reason_encoding_error(self):
         n_traces = 10
         statsd = mock.Mock()
         writer_encoder = mock.Mock()
         writer_encoder.__len__ = (lambda *args: n_traces).__get__(writer_encoder)
         writer_metrics_reset = mock.Mock()
-        writer_encoder.encode.side_effect = Exception
+        writer_encoder.encode_buffer.side_effect = Exception
         with override_global_config(dict(health_metrics_enabled=False)):
             writer = self.WRITER_CLASS("http://asdf:1234", dogstatsd=statsd, sync_mode=False)
             for client in writer._clients:
@@ -828,3 +866,190 @@ def test_trace_with_128bit_trace_ids():
     chunk_root = spans[0]
     assert chunk_root.trace_id >= 2 ** 64
     assert chunk_root._meta[HIGHER_ORDER_TRACE_ID_BITS] == "{:016x}".format(parent.trace_id >> 64)
+
+
+@pytest.mark.parametrize("writer_class", (AgentWriter, CIVisibilityWriter))
+def test_writer_compression(writer_class):
+    with override_env(dict(DD_API_KEY="foobar.baz")):
+        writer = writer_class("http://dne:1234", compression="gzip")
+        uncompressed_writer = writer_class("http://dne:1234", compression="none")
+
+    for w in (writer, uncompressed_writer):
+        w._put = mock.Mock(return_value=Response(status=200))
+        w._encoder.put([Span("foobar")])
+        w.flush_queue(raise_exc=True)
+
+    (payload, headers, _), _ = writer._put.call_args
+    assert headers["Content-Encoding"] == "gzip"
+    assert b"foobar" in zlib.decompress(payload, 16 + zlib.MAX_WBITS)
+
+    (_, headers, _), _ = uncompressed_writer._put.call_args
+    assert "Content-Encoding" not in headers
+
+
+@pytest.mark.parametrize("writer_class", (AgentWriter, CIVisibilityWriter))
+def test_writer_spool_failed_payloads(writer_class, tmpdir):
+    with override_env(dict(DD_API_KEY="foobar.baz")):
+        writer = writer_class("http://dne:1234", spool_dir=str(tmpdir))
+    writer._send_payload_with_backoff = mock.Mock(side_effect=OSError("agent unreachable"))
+    writer._put = mock.Mock(side_effect=OSError("agent unreachable"))
+
+    writer._encoder.put([Span("foobar")])
+    writer.flush_queue()
+    assert len(writer._spool) == 1
+    # The failed replay keeps the payload in the spool
+    writer.flush_queue()
+    assert len(writer._spool) == 1
+    assert writer._put.call_count == 1
+
+    payloads = []
+    writer._put = mock.Mock(side_effect=lambda data, *args, **kwargs: payloads.append(bytes(data)) or Response(200))
+    writer.flush_queue()
+    assert len(writer._spool) == 0
+    assert payloads and b"foobar" in payloads[0]
+    assert os.listdir(writer._spool.directory) == []
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_writer_spool_error_responses(status, tmpdir):
+    writer = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir))
+    writer._put = mock.Mock(return_value=Response(status=status))
+
+    writer._encoder.put([Span("foobar")])
+    writer.flush_queue()
+    assert len(writer._spool) == 1
+    assert "http.dropped.traces" not in writer._metrics
+
+    # The replay stops on error responses and keeps the payload in the spool
+    writer._encoder.put([Span("foobar")])
+    writer.flush_queue()
+    assert len(writer._spool) == 2
+    writer.flush_queue()
+    assert len(writer._spool) == 2
+    assert len(os.listdir(writer._spool.directory)) == 2
+
+    writer._put = mock.Mock(return_value=Response(status=200))
+    writer.flush_queue()
+    writer.flush_queue()
+    assert len(writer._spool) == 0
+    assert writer._put.call_count == 2
+
+
+def test_writer_spool_client_error_response(tmpdir):
+    writer = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir))
+    writer._put = mock.Mock(return_value=Response(status=400))
+
+    writer._encoder.put([Span("foobar")])
+    with mock.patch("ddtrace.internal.writer.writer.log") as log:
+        writer.flush_queue()
+    assert log.error.call_count == 1
+    assert len(writer._spool) == 0
+
+
+def test_writer_spool_recovered_after_restart(tmpdir):
+    writer = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir))
+    writer._put = mock.Mock(side_effect=OSError("agent unreachable"))
+    writer._send_payload_with_backoff = mock.Mock(side_effect=OSError("agent unreachable"))
+    for name in ("first", "second"):
+        writer._encoder.put([Span(name)])
+        writer.flush_queue()
+    writer.on_shutdown()
+    assert len(os.listdir(writer._spool.directory)) == 2
+
+    # Spools of exited processes are taken over, not the ones of running processes
+    exited = os.path.join(str(tmpdir), "agentwriter-%d" % (2 ** 22 + 1))
+    os.rename(writer._spool.directory, exited)
+    running = os.path.join(str(tmpdir), "agentwriter-%d" % os.getppid())
+    os.makedirs(running)
+    with open(os.path.join(running, "000000000001-1--v0.4%2Ftraces.payload"), "wb") as f:
+        f.write(b"running")
+
+    payloads = []
+    restarted = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir))
+    restarted._put = mock.Mock(side_effect=lambda data, *args, **kwargs: payloads.append(bytes(data)) or Response(200))
+    restarted._encoder.put([Span("third")])
+    restarted.flush_queue()
+
+    assert [msgpack.unpackb(payload)[0][0]["name"] for payload in payloads] == ["first", "second", "third"]
+    assert not os.path.exists(exited)
+    assert os.listdir(running) == ["000000000001-1--v0.4%2Ftraces.payload"]
+    assert os.listdir(restarted._spool.directory) == []
+
+
+def test_writer_spool_recovered_with_its_compression(tmpdir):
+    writer = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir), compression="gzip")
+    writer._put = mock.Mock(return_value=Response(status=503))
+    writer._encoder.put([Span("compressed")])
+    writer.flush_queue()
+    writer.on_shutdown()
+    exited = os.path.join(str(tmpdir), "agentwriter-%d" % (2 ** 22 + 1))
+    os.rename(writer._spool.directory, exited)
+
+    # The payloads spooled before a restart are sent with the compression they
+    # were spooled with, not the current one.
+    restarted = AgentWriter("http://dne:1234", api_version="v0.4", spool_dir=str(tmpdir), compression="none")
+    requests = []
+    restarted._put = mock.Mock(
+        side_effect=lambda data, headers, *args, **kwargs: requests.append((bytes(data), headers)) or Response(200)
+    )
+    restarted._encoder.put([Span("uncompressed")])
+    restarted.flush_queue()
+
+    assert len(requests) == 2
+    payload, headers = requests[0]
+    assert headers["Content-Encoding"] == "gzip"
+    assert msgpack.unpackb(zlib.decompress(payload, 16 + zlib.MAX_WBITS))[0][0]["name"] == "compressed"
+    payload, headers = requests[1]
+    assert "Content-Encoding" not in headers
+    assert msgpack.unpackb(payload)[0][0]["name"] == "uncompressed"
+
+
+def test_writer_spill_queue_size(tmpdir):
+    writer = AgentWriter("http://dne:1234", buffer_size=1024, api_version="v0.4", spool_dir=str(tmpdir))
+    writer._spill_queue_size = 2
+
+    for i in range(20):
+        writer._encode_with_client(writer._clients[0], [Span("span-%d" % i, resource="x" * 100)], spill=False)
+    assert len(writer._spill_queue) == 2
+    assert writer._metrics["buffer.dropped.traces"][("reason:full",)] > 0
+
+
+def test_writer_spool_full_buffer(tmpdir):
+    writer = AgentWriter("http://dne:1234", buffer_size=1024, api_version="v0.4", spool_dir=str(tmpdir))
+    payloads = []
+    writer._put = mock.Mock(side_effect=lambda data, *args, **kwargs: payloads.append(bytes(data)) or Response(200))
+
+    for i in range(20):
+        # As encoded by the application threads
+        writer._encode_with_client(writer._clients[0], [Span("span-%d" % i, resource="x" * 100)], spill=False)
+    # The buffer is spooled by the periodic thread, not the application threads
+    assert len(writer._spool) == 0
+    assert len(writer._spill_queue) > 0
+    assert "buffer.dropped.traces" not in writer._metrics
+
+    writer.flush_queue()
+    writer.flush_queue()
+    writer.flush_queue()
+    assert len(writer._spool) == 0
+    traces = sum(len(msgpack.unpackb(payload)) for payload in payloads)
+    assert traces == 20
+
+
+def test_payload_spool_eviction(tmpdir):
+    spool = PayloadSpool(str(tmpdir), max_bytes=10)
+
+    assert spool.push(b"aaaa", "v0.4/traces", 1) == []
+    assert spool.push(b"bbbb", "v0.4/traces", 2) == []
+    evicted = spool.push(b"cccc", "v0.4/traces", 3)
+    assert [entry.count for entry in evicted] == [1]
+    assert len(spool) == 2 and spool.size == 8
+    with pytest.raises(ValueError):
+        spool.push(b"x" * 11, "v0.4/traces", 1)
+
+    entry = spool.pop()
+    with spool.read(entry) as payload:
+        assert payload[:] == b"bbbb"
+    spool.restore(entry)
+    assert spool.pop() == entry
+    spool.discard(entry)
+    assert len(os.listdir(str(tmpdir))) == 1
@@ -127,6 +127,8 @@ def override_global_config(values):
         "_user_model_name_field",
         "_remote_config_enabled",
         "_remote_config_poll_interval",
+        "_remote_config_max_poll_interval",
+        "_telemetry_compression_enabled",
         "_sampling_rules",
         "_sampling_rules_file",
         "_trace_sample_rate",
@@ -138,6 +140,20 @@ def override_global_config(values):
         "_trace_writer_interval_seconds",
         "_trace_writer_connection_reuse",
         "_trace_writer_log_err_payload",
+        "_trace_writer_async_encoding",
+        "_trace_writer_async_encoding_queue_size",
+        "_trace_writer_compression",
+        "_trace_writer_compression_level",
+        "_trace_writer_spool_dir",
+        "_trace_writer_spool_max_bytes",
+        "_trace_writer_spool_replay_rate",
+        "_span_aggregator_shards",
+        "_span_pool_size",
+        "_trace_rate_limiter_per_thread",
+        "_trace_stats_peer_tags_enabled",
+        "_trace_stats_peer_tags",
+        "_trace_stats_max_aggregation_keys",
+        "_data_streams_max_pathways",
     ]
 
     # Grab the current values of all keys